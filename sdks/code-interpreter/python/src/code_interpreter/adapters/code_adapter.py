@@ -20,11 +20,9 @@ Provides the concrete implementation of Codes by wrapping auto-generated
 API clients and handling SSE streaming for real-time code execution.
 """
 
-import json
 import logging
 
 import httpx
-from opensandbox.adapters.converter.event_node import EventNode
 from opensandbox.adapters.converter.exception_converter import (
     ExceptionConverter,
 )
@@ -35,9 +33,15 @@ from opensandbox.adapters.converter.response_handler import (
     handle_api_error,
     require_parsed,
 )
+from opensandbox.adapters.converter.sse import aiter_stream_events
 from opensandbox.config import ConnectionConfig
 from opensandbox.exceptions import InvalidArgumentException, SandboxApiException
-from opensandbox.models.execd import Execution, ExecutionHandlers
+from opensandbox.models.execd import (
+    Execution,
+    ExecutionHandlers,
+    ExecutionLogs,
+    OutputRetention,
+)
 from opensandbox.models.sandboxes import SandboxEndpoint
 
 from code_interpreter.adapters.converter.code_execution_converter import (
@@ -239,6 +243,7 @@ class CodesAdapter(Codes):
         language: str | None = None,
         context: CodeContext | None = None,
         handlers: ExecutionHandlers | None = None,
+        output_retention: OutputRetention | None = None,
     ) -> Execution:
         """
         Executes code within the specified context using SSE streaming.
@@ -269,6 +274,7 @@ class CodesAdapter(Codes):
                 execution_count=None,
                 result=[],
                 error=None,
+                logs=ExecutionLogs.with_retention(output_retention),
             )
 
             # Use SSE client for streaming responses (read timeout disabled)
@@ -291,25 +297,15 @@ class CodesAdapter(Codes):
 
                 dispatcher = ExecutionEventDispatcher(execution, handlers)
 
-                async for line in response.aiter_lines():
-                    if not line.strip():
-                        continue
-
-                    # Handle potential SSE format "data: ..."
-                    data = line
-                    if data.startswith("data:"):
-                        data = data[5:].strip()
-
+                async for event in aiter_stream_events(response):
                     try:
-                        event_dict = json.loads(data)
-                        event_node = EventNode(**event_dict)
-                        await dispatcher.dispatch(event_node)
-                    except json.JSONDecodeError:
-                        logger.debug("Failed to parse SSE line: %s", line)
-                        continue
+                        await dispatcher.dispatch(event)
                     except Exception as e:
-                        logger.error("Error processing event: %s", data, exc_info=e)
-                        continue
+                        logger.error("Error processing event: %r", event, exc_info=e)
+                try:
+                    await dispatcher.flush()
+                except Exception as e:
+                    logger.error("Error delivering batched output", exc_info=e)
 
             return execution
 
@@ -22,7 +22,7 @@ session persistence, and real-time execution capabilities.
 
 from typing import Protocol, overload
 
-from opensandbox.models.execd import Execution, ExecutionHandlers
+from opensandbox.models.execd import Execution, ExecutionHandlers, OutputRetention
 
 from code_interpreter.models.code import CodeContext
 
@@ -140,6 +140,7 @@ class Codes(Protocol):
         *,
         context: CodeContext,
         handlers: ExecutionHandlers | None = None,
+        output_retention: OutputRetention | None = None,
     ) -> Execution: ...
 
     @overload
@@ -149,6 +150,7 @@ class Codes(Protocol):
         *,
         language: str,
         handlers: ExecutionHandlers | None = None,
+        output_retention: OutputRetention | None = None,
     ) -> Execution: ...
 
     async def run(
@@ -158,6 +160,7 @@ class Codes(Protocol):
         language: str | None = None,
         context: CodeContext | None = None,
         handlers: ExecutionHandlers | None = None,
+        output_retention: OutputRetention | None = None,
     ) -> Execution:
         """
         Executes code within the specified context.
@@ -182,6 +185,7 @@ class Codes(Protocol):
                 provided, they must match.
             context: Execution context (language + optional id). If None, the default Python context is used.
             handlers: Optional streaming handlers for stdout/stderr/events.
+            output_retention: How much stdout/stderr the returned Execution keeps (all if None).
 
         Returns:
             Execution with stdout, stderr, exit code, and execution metadata
@@ -17,11 +17,9 @@
 Synchronous adapter for code execution service (including SSE streaming).
 """
 
-import json
 import logging
 
 import httpx
-from opensandbox.adapters.converter.event_node import EventNode
 from opensandbox.adapters.converter.exception_converter import (
     ExceptionConverter,
 )
@@ -29,9 +27,10 @@ from opensandbox.adapters.converter.response_handler import (
     handle_api_error,
     require_parsed,
 )
+from opensandbox.adapters.converter.sse import iter_stream_events
 from opensandbox.config.connection_sync import ConnectionConfigSync
 from opensandbox.exceptions import InvalidArgumentException, SandboxApiException
-from opensandbox.models.execd import Execution
+from opensandbox.models.execd import Execution, ExecutionLogs, OutputRetention
 from opensandbox.models.execd_sync import ExecutionHandlersSync
 from opensandbox.models.sandboxes import SandboxEndpoint
 from opensandbox.sync.adapters.converter.execution_event_dispatcher import (
@@ -55,7 +54,7 @@ class CodesAdapterSync(CodesSync):
     Notes:
 
     - ``run`` performs blocking SSE streaming via ``httpx.Client.stream``.
-    - Each SSE line is parsed into an :class:`EventNode` and dispatched via
+    - Each SSE line is decoded into a :class:`StreamEvent` and dispatched via
       :class:`ExecutionEventDispatcherSync` to update the shared :class:`Execution` object
       and invoke any user-provided handlers.
     """
@@ -204,6 +203,7 @@ class CodesAdapterSync(CodesSync):
         language: str | None = None,
         context: CodeContextSync | None = None,
         handlers: ExecutionHandlersSync | None = None,
+        output_retention: OutputRetention | None = None,
     ) -> Execution:
         """
         Execute code within the specified context using SSE streaming (sync).
@@ -212,6 +212,7 @@ class CodesAdapterSync(CodesSync):
             code: Source code to execute.
             context: Execution context (language + optional id). If None, a temporary Python context is used.
             handlers: Optional streaming handlers for stdout/stderr/events.
+            output_retention: How much stdout/stderr the returned Execution keeps (all if None).
 
         Returns:
             Execution result populated incrementally while streaming events
@@ -243,7 +244,13 @@ class CodesAdapterSync(CodesSync):
             }
 
             url = self._get_execd_url(self.RUN_CODE_PATH)
-            execution = Execution(id=None, execution_count=None, result=[], error=None)
+            execution = Execution(
+                id=None,
+                execution_count=None,
+                result=[],
+                error=None,
+                logs=ExecutionLogs.with_retention(output_retention),
+            )
             dispatcher = ExecutionEventDispatcherSync(execution, handlers)
 
             with self._sse_client.stream("POST", url, json=api_request) as response:
@@ -254,22 +261,15 @@ class CodesAdapterSync(CodesSync):
                         status_code=response.status_code,
                     )
 
-                for line in response.iter_lines():
-                    if not line or not line.strip():
-                        continue
-                    data = line
-                    if data.startswith("data:"):
-                        data = data[5:].strip()
+                for event in iter_stream_events(response):
                     try:
-                        event_dict = json.loads(data)
-                        event_node = EventNode(**event_dict)
-                        dispatcher.dispatch(event_node)
-                    except json.JSONDecodeError:
-                        logger.debug("Failed to parse SSE line: %s", line)
-                        continue
+                        dispatcher.dispatch(event)
                     except Exception as e:
-                        logger.error("Error processing event: %s", data, exc_info=e)
-                        continue
+                        logger.error("Error processing event: %r", event, exc_info=e)
+                try:
+                    dispatcher.flush()
+                except Exception as e:
+                    logger.error("Error delivering batched output", exc_info=e)
 
             return execution
         except Exception as e:
@@ -24,7 +24,7 @@ This is the sync counterpart of :mod:`code_interpreter.services.code`.
 
 from typing import Protocol, overload
 
-from opensandbox.models.execd import Execution
+from opensandbox.models.execd import Execution, OutputRetention
 from opensandbox.models.execd_sync import ExecutionHandlersSync
 
 from code_interpreter.models.code_sync import CodeContextSync
@@ -96,6 +96,7 @@ class CodesSync(Protocol):
         *,
         context: CodeContextSync,
         handlers: ExecutionHandlersSync | None = None,
+        output_retention: OutputRetention | None = None,
     ) -> Execution: ...
 
     @overload
@@ -105,6 +106,7 @@ class CodesSync(Protocol):
         *,
         language: str,
         handlers: ExecutionHandlersSync | None = None,
+        output_retention: OutputRetention | None = None,
     ) -> Execution: ...
 
     def run(
@@ -114,6 +116,7 @@ class CodesSync(Protocol):
         language: str | None = None,
         context: CodeContextSync | None = None,
         handlers: ExecutionHandlersSync | None = None,
+        output_retention: OutputRetention | None = None,
     ) -> Execution:
         """
         Execute code within the specified context (blocking).
@@ -136,6 +139,7 @@ class CodesSync(Protocol):
                 provided, they must match.
             context: Execution context (language + optional id). If None, the default Python context is used.
             handlers: Optional streaming handlers for stdout/stderr/events.
+            output_retention: How much stdout/stderr the returned Execution keeps (all if None).
 
         Returns:
             Execution with stdout/stderr/events and execution metadata.
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Memory per sandbox reference.
+
+Compares the heap retained by one fully built Sandbox (every adapter
+constructed up front, as before lazy services), a Sandbox whose services are
+built on first use, and a SandboxHandle. No requests are made::
+
+    python scripts/handle_bench.py
+    python scripts/handle_bench.py --count 10000
+"""
+
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+
+from opensandbox.adapters.factory import AdapterFactory
+from opensandbox.config import ConnectionConfig
+from opensandbox.handle import SandboxHandle
+from opensandbox.models.sandboxes import SandboxEndpoint
+from opensandbox.sandbox import Sandbox
+
+
+def _eager(index: int, config: ConnectionConfig) -> Sandbox:
+    factory = AdapterFactory(config)
+    endpoint = SandboxEndpoint(endpoint=f"10.0.{index // 256 % 256}.{index % 256}:44772")
+    return Sandbox(
+        sandbox_id=f"sandbox-{index:08d}",
+        sandbox_service=factory.create_sandbox_service(),
+        filesystem_service=factory.create_filesystem_service(endpoint),
+        command_service=factory.create_command_service(endpoint),
+        health_service=factory.create_health_service(endpoint),
+        metrics_service=factory.create_metrics_service(endpoint),
+        connection_config=config,
+    )
+
+
+def _lazy(index: int, config: ConnectionConfig) -> Sandbox:
+    return SandboxHandle(
+        f"sandbox-{index:08d}", f"10.0.{index // 256 % 256}.{index % 256}:44772", config
+    ).to_sandbox()
+
+
+def _handle(index: int, config: ConnectionConfig) -> SandboxHandle:
+    return SandboxHandle(f"sandbox-{index:08d}", f"10.0.{index // 256 % 256}.{index % 256}:44772", config)
+
+
+def measure(build: Callable[[int, ConnectionConfig], object], count: int, config: ConnectionConfig) -> float:
+    """Return the bytes retained per object when ``count`` objects are alive."""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [build(index, config) for index in range(count)]
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=2000, help="Objects alive per measurement")
+    args = parser.parse_args()
+
+    config = ConnectionConfig().with_transport_if_missing()
+    # Warm imports and lazily initialized module state before measuring.
+    measure(_eager, 10, config)
+    measure(_lazy, 10, config)
+
+    print(f"{'reference':<28}{'bytes/object':>14}")
+    for name, build in (
+        ("Sandbox (eager adapters)", _eager),
+        ("Sandbox (lazy adapters)", _lazy),
+        ("SandboxHandle", _handle),
+    ):
+        print(f"{name:<28}{measure(build, args.count, config):>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Client-side throughput of execution stream decoding.
+
+Replays a recorded-style execd stream (mostly stdout lines of a chatty
+process) through the previous line-by-line decoder (``json.loads`` and a
+validated ``EventNode`` per line) and through the byte-level decoder, both
+with and without dispatching into an :class:`Execution`. No server is
+needed::
+
+    python scripts/sse_bench.py
+    python scripts/sse_bench.py --lines 200000 --chunk-size 4096
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable, Iterator
+
+import httpx
+
+from opensandbox.adapters.converter.event_node import EventNode
+from opensandbox.adapters.converter.sse import JSON_BACKEND, iter_stream_events
+from opensandbox.models.execd import Execution
+from opensandbox.sync.adapters.converter.execution_event_dispatcher import (
+    ExecutionEventDispatcherSync,
+)
+
+
+def build_stream(lines: int) -> bytes:
+    """Return an SSE body with ``lines`` output events between init and completion."""
+    events = [b'data: {"type":"init","text":"exec-1","timestamp":1700000000000}\n\n']
+    for index in range(lines):
+        kind = "stderr" if index % 10 == 9 else "stdout"
+        text = f"[{index:07d}] step {index % 500}: loss=0.{index % 9973:04d} lr=3e-4 \\u2713"
+        events.append(
+            f'data: {{"type":"{kind}","text":"{text}","timestamp":{1700000000000 + index}}}\n\n'.encode()
+        )
+    events.append(b'data: {"type":"execution_complete","timestamp":1700000999999,"execution_time":42}\n\n')
+    return b"".join(events)
+
+
+def _response(body: bytes, chunk_size: int) -> httpx.Response:
+    def chunks() -> Iterator[bytes]:
+        for start in range(0, len(body), chunk_size):
+            yield body[start : start + chunk_size]
+
+    return httpx.Response(200, content=chunks())
+
+
+def _legacy_events(response: httpx.Response) -> Iterator[EventNode]:
+    for line in response.iter_lines():
+        if not line or not line.strip():
+            continue
+        data = line
+        if data.startswith("data:"):
+            data = data[5:].strip()
+        yield EventNode(**json.loads(data))
+
+
+def _run(
+    decode: Callable[[httpx.Response], Iterator[object]], body: bytes, chunk_size: int, dispatch: bool
+) -> tuple[int, float]:
+    execution = Execution()
+    dispatcher = ExecutionEventDispatcherSync(execution)
+    count = 0
+    started = time.perf_counter()
+    for event in decode(_response(body, chunk_size)):
+        if dispatch:
+            dispatcher.dispatch(event)  # type: ignore[arg-type]
+        count += 1
+    return count, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=1_000_000, help="Output events in the stream")
+    parser.add_argument("--chunk-size", type=int, default=16384, help="Bytes per response chunk")
+    args = parser.parse_args()
+
+    body = build_stream(args.lines)
+    print(f"stream: {args.lines:,} output lines, {len(body) / 2**20:.1f} MiB, JSON backend: {JSON_BACKEND}")
+    print(f"{'decoder':<34}{'events':>12}{'seconds':>10}{'events/sec':>14}")
+    for name, decode, dispatch in (
+        ("line + EventNode", _legacy_events, False),
+        ("byte-level StreamEvent", iter_stream_events, False),
+        ("line + EventNode + dispatch", _legacy_events, True),
+        ("byte-level StreamEvent + dispatch", iter_stream_events, True),
+    ):
+        count, elapsed = _run(decode, body, args.chunk_size, dispatch)
+        print(f"{name:<34}{count:>12,}{elapsed:>10.2f}{count / elapsed:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -99,9 +99,19 @@ For advanced code execution with persistent contexts, see the separate
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as _pkg_version
 
+from opensandbox.background import BackgroundCommand
+from opensandbox.batch import SandboxBatchResult
+from opensandbox.handle import SandboxHandle
 from opensandbox.manager import SandboxManager
+from opensandbox.pool import SandboxPool, SandboxPoolStats
 from opensandbox.sandbox import Sandbox
-from opensandbox.sync import SandboxManagerSync, SandboxSync
+from opensandbox.sync import (
+    BackgroundCommandSync,
+    SandboxHandleSync,
+    SandboxManagerSync,
+    SandboxPoolSync,
+    SandboxSync,
+)
 
 try:
     __version__ = _pkg_version("opensandbox")
@@ -111,7 +121,15 @@ except PackageNotFoundError:  # pragma: no cover
 
 __all__ = [
     "Sandbox",
+    "SandboxHandle",
     "SandboxManager",
+    "SandboxBatchResult",
+    "SandboxPool",
+    "SandboxPoolStats",
+    "BackgroundCommand",
     "SandboxSync",
+    "SandboxHandleSync",
     "SandboxManagerSync",
+    "SandboxPoolSync",
+    "BackgroundCommandSync",
 ]
@@ -21,12 +21,13 @@ This adapter handles command execution within sandboxes, providing both
 synchronous and streaming execution modes with proper session management.
 """
 
-import json
+import asyncio
+import contextlib
 import logging
+from collections.abc import AsyncIterator
 
 import httpx
 
-from opensandbox.adapters.converter.event_node import EventNode
 from opensandbox.adapters.converter.exception_converter import (
     ExceptionConverter,
 )
@@ -36,10 +37,28 @@ from opensandbox.adapters.converter.execution_converter import (
 from opensandbox.adapters.converter.execution_event_dispatcher import (
     ExecutionEventDispatcher,
 )
-from opensandbox.adapters.converter.response_handler import handle_api_error
+from opensandbox.adapters.converter.response_handler import (
+    handle_api_error,
+    require_parsed,
+)
+from opensandbox.adapters.converter.sse import aiter_stream_events
+from opensandbox.background import BackgroundCommand
 from opensandbox.config import ConnectionConfig
-from opensandbox.exceptions import InvalidArgumentException, SandboxApiException
-from opensandbox.models.execd import Execution, ExecutionHandlers, RunCommandOpts
+from opensandbox.exceptions import (
+    InvalidArgumentException,
+    SandboxApiException,
+    SandboxInternalException,
+)
+from opensandbox.models.execd import (
+    CommandLogs,
+    CommandStatus,
+    Execution,
+    ExecutionEvent,
+    ExecutionHandlers,
+    ExecutionLogs,
+    OutputRetention,
+    RunCommandOpts,
+)
 from opensandbox.models.sandboxes import SandboxEndpoint
 from opensandbox.services.command import Commands
 
@@ -160,6 +179,7 @@ class CommandsAdapter(Commands):
                 execution_count=None,
                 result=[],
                 error=None,
+                logs=ExecutionLogs.with_retention(opts.output_retention),
             )
 
             # Use SSE client for streaming responses (read timeout disabled)
@@ -180,21 +200,15 @@ class CommandsAdapter(Commands):
 
                 dispatcher = ExecutionEventDispatcher(execution, handlers)
 
-                async for line in response.aiter_lines():
-                    if not line.strip():
-                        continue
-
-                    # Handle potential SSE format "data: ..."
-                    data = line
-                    if data.startswith("data:"):
-                        data = data[5:].strip()
-
+                async for event in aiter_stream_events(response):
                     try:
-                        event_dict = json.loads(data)
-                        event_node = EventNode(**event_dict)
-                        await dispatcher.dispatch(event_node)
+                        await dispatcher.dispatch(event)
                     except Exception as e:
-                        logger.error(f"Failed to parse SSE line: {line}", exc_info=e)
+                        logger.error("Error processing event: %r", event, exc_info=e)
+                try:
+                    await dispatcher.flush()
+                except Exception as e:
+                    logger.error("Error delivering batched output", exc_info=e)
 
             return execution
 
@@ -206,6 +220,111 @@ class CommandsAdapter(Commands):
             )
             raise ExceptionConverter.to_sandbox_exception(e) from e
 
+    async def stream(
+        self,
+        command: str,
+        *,
+        opts: RunCommandOpts | None = None,
+        buffer_size: int = 256,
+    ) -> AsyncIterator[ExecutionEvent]:
+        """Execute a shell command and iterate over its events.
+
+        The stream is read by a background task into a buffer of at most
+        ``buffer_size`` events; while the buffer is full the task stops
+        reading, so a slow consumer slows down the stream instead of
+        growing memory. Leaving the iteration early stops the read.
+        """
+        if buffer_size < 1:
+            raise InvalidArgumentException("buffer_size must be at least 1")
+        opts = opts or RunCommandOpts()
+        if opts.output_retention is None:
+            opts = opts.model_copy(update={"output_retention": OutputRetention(mode="none")})
+
+        slots = asyncio.Semaphore(buffer_size)
+        events: asyncio.Queue[ExecutionEvent | None] = asyncio.Queue()
+
+        async def put(event: ExecutionEvent) -> None:
+            await slots.acquire()
+            events.put_nowait(event)
+
+        handlers = ExecutionHandlers(
+            on_init=put,
+            on_stdout=put,
+            on_stderr=put,
+            on_result=put,
+            on_error=put,
+            on_execution_complete=put,
+        )
+        reader = asyncio.create_task(self.run(command, opts=opts, handlers=handlers))
+        reader.add_done_callback(lambda _: events.put_nowait(None))
+        try:
+            while (event := await events.get()) is not None:
+                slots.release()
+                yield event
+            reader.result()
+        finally:
+            if not reader.done():
+                reader.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await reader
+
+    async def start(
+        self,
+        command: str,
+        *,
+        opts: RunCommandOpts | None = None,
+    ) -> BackgroundCommand:
+        """Start a command in background mode and return a handle to follow it."""
+        opts = (opts or RunCommandOpts()).model_copy(
+            update={"background": True, "output_retention": OutputRetention(mode="none")}
+        )
+        execution = await self.run(command, opts=opts)
+        if not execution.id:
+            raise SandboxInternalException("execd did not return an id for the background command")
+        return BackgroundCommand(execution.id, self, command)
+
+    async def status(self, execution_id: str) -> CommandStatus:
+        """Get the status of a command."""
+        try:
+            from opensandbox.api.execd.api.command import get_command_status
+            from opensandbox.api.execd.models import CommandStatusResponse
+
+            client = await self._get_client()
+            response_obj = await get_command_status.asyncio_detailed(
+                client=client,
+                id=execution_id,
+            )
+
+            handle_api_error(response_obj, "Get command status")
+            parsed = require_parsed(response_obj, CommandStatusResponse, "Get command status")
+            return ExecutionConverter.to_command_status(parsed, execution_id)
+
+        except Exception as e:
+            logger.error("Failed to get command status", exc_info=e)
+            raise ExceptionConverter.to_sandbox_exception(e) from e
+
+    async def logs(self, execution_id: str, *, cursor: int | None = None) -> CommandLogs:
+        """Read background command output after ``cursor``."""
+        try:
+            from opensandbox.api.execd.api.command import get_background_command_logs
+            from opensandbox.api.execd.types import UNSET
+
+            client = await self._get_client()
+            response_obj = await get_background_command_logs.asyncio_detailed(
+                client=client,
+                id=execution_id,
+                cursor=UNSET if cursor is None else cursor,
+            )
+
+            handle_api_error(response_obj, "Get command logs")
+            return ExecutionConverter.to_command_logs(
+                response_obj.content, response_obj.headers, cursor
+            )
+
+        except Exception as e:
+            logger.error("Failed to get command logs", exc_info=e)
+            raise ExceptionConverter.to_sandbox_exception(e) from e
+
     async def interrupt(self, execution_id: str) -> None:
         """Interrupt a running command execution."""
         try:
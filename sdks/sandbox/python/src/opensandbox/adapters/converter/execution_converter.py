@@ -22,12 +22,19 @@ similar to the Kotlin SDK ExecutionConverter.
 This converter is designed to work with openapi-python-client generated models.
 """
 
+from collections.abc import Mapping
 from typing import Any
 
+from opensandbox.api.execd.models.command_status_response import (
+    CommandStatusResponse as ApiCommandStatusResponse,
+)
 from opensandbox.api.execd.models.run_command_request import (
     RunCommandRequest as ApiRunCommandRequest,
 )
-from opensandbox.models.execd import RunCommandOpts
+from opensandbox.api.execd.types import Unset
+from opensandbox.models.execd import CommandLogs, CommandStatus, RunCommandOpts
+
+COMMAND_TAIL_CURSOR_HEADER = "EXECD-COMMANDS-TAIL-CURSOR"
 
 
 class ExecutionConverter:
@@ -72,3 +79,30 @@ class ExecutionConverter:
             return api_request.to_dict()
         # Fallback (shouldn't normally happen for openapi-python-client models).
         return dict(getattr(api_request, "__dict__", {}))
+
+    @staticmethod
+    def to_command_status(api_status: ApiCommandStatusResponse, command_id: str) -> CommandStatus:
+        """Convert API CommandStatusResponse to domain CommandStatus."""
+
+        def value(field: Any) -> Any:
+            return None if isinstance(field, Unset) else field
+
+        return CommandStatus(
+            id=value(api_status.id) or command_id,
+            content=value(api_status.content),
+            running=bool(value(api_status.running)),
+            exit_code=value(api_status.exit_code),
+            error=value(api_status.error) or None,
+            started_at=value(api_status.started_at),
+            finished_at=value(api_status.finished_at),
+        )
+
+    @staticmethod
+    def to_command_logs(
+        content: bytes, headers: Mapping[str, str], cursor: int | None
+    ) -> CommandLogs:
+        """Build CommandLogs from a logs response body and its tail cursor header."""
+        next_cursor = headers.get(COMMAND_TAIL_CURSOR_HEADER)
+        if next_cursor is None:
+            return CommandLogs(content=content, cursor=(cursor or 0) + len(content))
+        return CommandLogs(content=content, cursor=int(next_cursor))
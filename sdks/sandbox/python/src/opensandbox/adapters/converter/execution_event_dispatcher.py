@@ -17,7 +17,12 @@
 Dispatcher for processing execution events.
 """
 
+import asyncio
+import logging
+
 from opensandbox.adapters.converter.event_node import EventNode
+from opensandbox.adapters.converter.output_batch import OutputBatch
+from opensandbox.adapters.converter.sse import StreamEvent
 from opensandbox.models.execd import (
     Execution,
     ExecutionComplete,
@@ -28,6 +33,8 @@ from opensandbox.models.execd import (
     OutputMessage,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class ExecutionEventDispatcher:
     """
@@ -41,17 +48,38 @@ class ExecutionEventDispatcher:
     ) -> None:
         self.execution = execution
         self.handlers = handlers
+        self._batches: dict[str, OutputBatch] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._pending_deliveries: set[asyncio.Task[None]] = set()
+        self._delivery_lock = asyncio.Lock()
+        if handlers is not None:
+            for stream, handler in (
+                ("stdout", handlers.on_stdout_batch),
+                ("stderr", handlers.on_stderr_batch),
+            ):
+                if handler is not None:
+                    self._batches[stream] = OutputBatch(
+                        handlers.batch_max_messages,
+                        handlers.batch_max_bytes,
+                        handlers.batch_max_delay.total_seconds(),
+                    )
 
-    async def dispatch(self, event_node: EventNode) -> None:
+    async def dispatch(self, event_node: EventNode | StreamEvent) -> None:
         """Dispatch a single event node asynchronously."""
         event_type = event_node.type
         timestamp = event_node.timestamp
 
         if event_type == "stdout":
             await self._handle_stdout(event_node, timestamp)
-        elif event_type == "stderr":
+            return
+        if event_type == "stderr":
             await self._handle_stderr(event_node, timestamp)
-        elif event_type == "result":
+            return
+        if self._batches:
+            # Output handlers see everything printed before a result, error or completion.
+            await self.flush()
+
+        if event_type == "result":
             await self._handle_result(event_node, timestamp)
         elif event_type == "error":
             await self._handle_error(event_node, timestamp)
@@ -63,7 +91,7 @@ class ExecutionEventDispatcher:
             if event_node.execution_count is not None:
                 self.execution.execution_count = event_node.execution_count
 
-    async def _handle_init(self, event_node: EventNode, timestamp: int) -> None:
+    async def _handle_init(self, event_node: EventNode | StreamEvent, timestamp: int) -> None:
         execution_id = event_node.text or ""
         init_event = ExecutionInit(
             id=execution_id,
@@ -73,29 +101,29 @@ class ExecutionEventDispatcher:
         if self.handlers and self.handlers.on_init:
             await self.handlers.on_init(init_event)
 
-    async def _handle_stdout(self, event_node: EventNode, timestamp: int) -> None:
+    async def _handle_stdout(self, event_node: EventNode | StreamEvent, timestamp: int) -> None:
         text = event_node.text or ""
-        message = OutputMessage(
-            text=text,
-            timestamp=timestamp,
-            is_error=False,
-        )
-        self.execution.logs.add_stdout(message)
-        if self.handlers and self.handlers.on_stdout:
-            await self.handlers.on_stdout(message)
+        self.execution.logs.stdout.add(text, timestamp)
+        handlers = self.handlers
+        if handlers and (handlers.on_stdout or handlers.on_stdout_batch):
+            message = OutputMessage(text=text, timestamp=timestamp, is_error=False)
+            if handlers.on_stdout:
+                await handlers.on_stdout(message)
+            if handlers.on_stdout_batch:
+                await self._add_to_batch("stdout", message)
 
-    async def _handle_stderr(self, event_node: EventNode, timestamp: int) -> None:
+    async def _handle_stderr(self, event_node: EventNode | StreamEvent, timestamp: int) -> None:
         text = event_node.text or ""
-        message = OutputMessage(
-            text=text,
-            timestamp=timestamp,
-            is_error=True,
-        )
-        self.execution.logs.add_stderr(message)
-        if self.handlers and self.handlers.on_stderr:
-            await self.handlers.on_stderr(message)
+        self.execution.logs.stderr.add(text, timestamp)
+        handlers = self.handlers
+        if handlers and (handlers.on_stderr or handlers.on_stderr_batch):
+            message = OutputMessage(text=text, timestamp=timestamp, is_error=True)
+            if handlers.on_stderr:
+                await handlers.on_stderr(message)
+            if handlers.on_stderr_batch:
+                await self._add_to_batch("stderr", message)
 
-    async def _handle_result(self, event_node: EventNode, timestamp: int) -> None:
+    async def _handle_result(self, event_node: EventNode | StreamEvent, timestamp: int) -> None:
         result_text = event_node.results.get_text() if event_node.results else ""
         result = ExecutionResult(
             text=result_text,
@@ -105,7 +133,7 @@ class ExecutionEventDispatcher:
         if self.handlers and self.handlers.on_result:
             await self.handlers.on_result(result)
 
-    async def _handle_error(self, event_node: EventNode, timestamp: int) -> None:
+    async def _handle_error(self, event_node: EventNode | StreamEvent, timestamp: int) -> None:
         if not event_node.error:
             return
 
@@ -120,10 +148,56 @@ class ExecutionEventDispatcher:
         if self.handlers and self.handlers.on_error:
             await self.handlers.on_error(error)
 
-    async def _handle_execution_complete(self, event_node: EventNode, timestamp: int) -> None:
+    async def _handle_execution_complete(self, event_node: EventNode | StreamEvent, timestamp: int) -> None:
         complete = ExecutionComplete(
             timestamp=timestamp,
             execution_time_in_millis=event_node.execution_time_in_millis or 0,
         )
         if self.handlers and self.handlers.on_execution_complete:
             await self.handlers.on_execution_complete(complete)
+
+    async def flush(self) -> None:
+        """Deliver pending output batches and wait for deliveries in progress."""
+        for stream in self._batches:
+            await self._deliver(stream)
+        if self._pending_deliveries:
+            await asyncio.gather(*self._pending_deliveries)
+
+    async def _add_to_batch(self, stream: str, message: OutputMessage) -> None:
+        batch = self._batches[stream]
+        if batch.add(message):
+            await self._deliver(stream)
+        elif stream not in self._timers:
+            self._timers[stream] = asyncio.get_running_loop().call_later(
+                batch.max_delay, self._deliver_later, stream
+            )
+
+    def _deliver_later(self, stream: str) -> None:
+        self._timers.pop(stream, None)
+        task = asyncio.ensure_future(self._deliver_logged(stream))
+        self._pending_deliveries.add(task)
+        task.add_done_callback(self._pending_deliveries.discard)
+
+    async def _deliver_logged(self, stream: str) -> None:
+        try:
+            await self._deliver(stream)
+        except Exception as e:
+            logger.error("Batched %s handler failed", stream, exc_info=e)
+
+    async def _deliver(self, stream: str) -> None:
+        timer = self._timers.pop(stream, None)
+        if timer is not None:
+            timer.cancel()
+        # Taking the batch and queueing on the lock happen without yielding, so batches stay ordered.
+        messages = self._batches[stream].take()
+        if not messages:
+            return
+        assert self.handlers is not None
+        handler = (
+            self.handlers.on_stdout_batch
+            if stream == "stdout"
+            else self.handlers.on_stderr_batch
+        )
+        assert handler is not None
+        async with self._delivery_lock:
+            await handler(messages)
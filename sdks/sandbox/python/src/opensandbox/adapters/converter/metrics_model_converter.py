@@ -19,9 +19,14 @@ Metrics model converter utilities.
 Provides conversion functions between API models and domain models for metrics operations.
 """
 
+import json
+import logging
+
 from opensandbox.api.execd.models import Metrics
 from opensandbox.models.sandboxes import SandboxMetrics
 
+logger = logging.getLogger(__name__)
+
 
 class MetricsModelConverter:
     """
@@ -41,3 +46,21 @@ class MetricsModelConverter:
             memory_used_in_mib=api_metrics.mem_used_mib,
             timestamp=api_metrics.timestamp,
         )
+
+    @staticmethod
+    def from_watch_line(line: str, sandbox_id: str) -> SandboxMetrics | None:
+        """Decode one line of the metrics watch stream; None for lines carrying no sample."""
+        line = line.strip()
+        if line.startswith("data:"):
+            line = line[5:].lstrip()
+        if not line or line.startswith(":"):
+            return None
+        try:
+            payload = json.loads(line)
+            if "error" in payload:
+                logger.warning("Sandbox %s failed to sample metrics: %s", sandbox_id, payload["error"])
+                return None
+            return MetricsModelConverter.to_sandbox_metrics(Metrics.from_dict(payload))
+        except (ValueError, TypeError, KeyError) as e:
+            logger.debug("Failed to parse metrics line %r: %s", line, e)
+            return None
@@ -0,0 +1,66 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Accumulation of output messages for batched handler delivery.
+"""
+
+import time
+
+from opensandbox.models.execd import OutputMessage
+
+
+class OutputBatch:
+    """Messages of one stream waiting for a batch handler."""
+
+    __slots__ = ("max_messages", "max_bytes", "max_delay", "messages", "size", "started_at")
+
+    def __init__(self, max_messages: int, max_bytes: int, max_delay: float) -> None:
+        """
+        Args:
+            max_messages: Batch is full at this many messages
+            max_bytes: Batch is full at this many bytes of text
+            max_delay: Seconds a batch may wait after its first message
+        """
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self.messages: list[OutputMessage] = []
+        self.size = 0
+        self.started_at = 0.0
+
+    def add(self, message: OutputMessage) -> bool:
+        """
+        Append a message.
+
+        Returns:
+            True if the batch is now full and should be delivered
+        """
+        if not self.messages:
+            self.started_at = time.monotonic()
+        self.messages.append(message)
+        self.size += len(message.text)
+        return len(self.messages) >= self.max_messages or self.size >= self.max_bytes
+
+    def overdue(self, now: float) -> bool:
+        """Whether the oldest pending message has waited ``max_delay``."""
+        return bool(self.messages) and now - self.started_at >= self.max_delay
+
+    def take(self) -> list[OutputMessage]:
+        """Remove and return the pending messages."""
+        messages = self.messages
+        self.messages = []
+        self.size = 0
+        return messages
@@ -28,7 +28,8 @@ import logging
 from http import HTTPStatus
 from typing import Any, TypeVar
 
-from opensandbox.exceptions import SandboxApiException
+from opensandbox.exceptions import SandboxApiException, SandboxError, SandboxException
+from opensandbox.models.sandboxes import SandboxEndpoint, SandboxInfo
 
 logger = logging.getLogger(__name__)
 
@@ -110,3 +111,89 @@ def handle_api_error(response_obj: Any, operation_name: str = "API call") -> Non
             message=error_message,
             status_code=status_code,
         )
+
+
+def parse_batch_endpoints(
+    response: Any, sandbox_ids: list[str], port: int
+) -> dict[str, SandboxEndpoint | SandboxException]:
+    """
+    Convert a ``POST /sandboxes/endpoints`` response into one result per sandbox.
+
+    Args:
+        response: The raw httpx response
+        sandbox_ids: Sandboxes that were requested
+        port: The single port that was requested
+
+    Returns:
+        Endpoint or per-sandbox error keyed by sandbox ID
+
+    Raises:
+        SandboxApiException: If the whole request failed; a 404 or 405 means the
+            server does not provide the batch API
+    """
+    operation_name = "Get endpoints in batch"
+    if response.status_code >= 300:
+        message = f"{operation_name} failed: HTTP {response.status_code}"
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+        if isinstance(body, dict) and body.get("message"):
+            message = f"{operation_name} failed: {body['message']}"
+        raise SandboxApiException(message=message, status_code=response.status_code)
+
+    results: dict[str, SandboxEndpoint | SandboxException] = {}
+    for item in response.json().get("items", []):
+        sandbox_id = item.get("sandboxId")
+        endpoint = item.get("endpoints", {}).get(str(port))
+        if endpoint is not None:
+            results[sandbox_id] = SandboxEndpoint(endpoint=endpoint["endpoint"])
+        else:
+            error = item.get("error") or {}
+            results[sandbox_id] = SandboxApiException(
+                message=f"Get endpoint for sandbox {sandbox_id} port {port} failed: "
+                f"{error.get('message') or 'not resolved'}",
+                error=SandboxError(error.get("code", SandboxError.UNEXPECTED_RESPONSE), error.get("message")),
+            )
+    for sandbox_id in sandbox_ids:
+        results.setdefault(
+            sandbox_id,
+            SandboxApiException(message=f"{operation_name} failed: sandbox {sandbox_id} missing from response"),
+        )
+    return results
+
+
+def parse_sandbox_wait(response: Any, sandbox_id: str) -> SandboxInfo | None:
+    """
+    Convert a ``GET /sandboxes/{id}/wait`` response into the sandbox it returned.
+
+    Args:
+        response: The raw httpx response
+        sandbox_id: Sandbox that was waited for
+
+    Returns:
+        Sandbox info at the end of the wait, or None if the server does not provide the wait API
+
+    Raises:
+        SandboxApiException: If the server reported an error, e.g. an unknown sandbox
+    """
+    operation_name = f"Wait for sandbox {sandbox_id}"
+    try:
+        body = response.json()
+    except ValueError:
+        body = None
+    if response.status_code >= 300:
+        # Unknown routes carry no error code; errors of the wait API itself do.
+        if response.status_code in (404, 405) and not (isinstance(body, dict) and body.get("code")):
+            return None
+        message = f"{operation_name} failed: HTTP {response.status_code}"
+        if isinstance(body, dict) and body.get("message"):
+            message = f"{operation_name} failed: {body['message']}"
+        raise SandboxApiException(message=message, status_code=response.status_code)
+
+    from opensandbox.adapters.converter.sandbox_model_converter import (
+        SandboxModelConverter,
+    )
+    from opensandbox.api.lifecycle.models import Sandbox
+
+    return SandboxModelConverter.to_sandbox_info(Sandbox.from_dict(body))
@@ -0,0 +1,214 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Byte-level decoding of the execd Server-Sent Events stream.
+
+Command and code output can produce hundreds of thousands of events, so the
+stream is split on raw bytes, each payload goes through the fastest JSON
+decoder available (``orjson``, then ``msgspec``, then the standard library)
+and lands in a slotted :class:`StreamEvent`. The nested ``results`` and
+``error`` pydantic models are only built for the events that carry them.
+"""
+
+import json
+import logging
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Any
+
+import httpx
+
+from opensandbox.adapters.converter.event_node import EventNodeError, EventNodeResults
+
+logger = logging.getLogger(__name__)
+
+_DATA_PREFIX = b"data:"
+# Other SSE fields and comments carry nothing the dispatcher uses.
+_IGNORED_PREFIXES = (b":", b"event:", b"id:", b"retry:")
+
+_loads: Callable[[bytes], Any]
+_decode_errors: tuple[type[Exception], ...]
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _decode_errors = (orjson.JSONDecodeError,)
+    JSON_BACKEND = "orjson"
+except ImportError:
+    try:
+        import msgspec
+
+        _loads = msgspec.json.decode
+        _decode_errors = (msgspec.DecodeError,)
+        JSON_BACKEND = "msgspec"
+    except ImportError:
+        _loads = json.loads
+        _decode_errors = (ValueError,)
+        JSON_BACKEND = "json"
+
+
+class StreamEvent:
+    """
+    One decoded event of the execution stream.
+
+    Exposes the same attributes as :class:`EventNode`, without validating the
+    whole payload through pydantic.
+    """
+
+    __slots__ = (
+        "type",
+        "text",
+        "timestamp",
+        "execution_count",
+        "execution_time_in_millis",
+        "_results",
+        "_error",
+    )
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        """
+        Build an event from a decoded JSON payload.
+
+        Args:
+            payload: Decoded event object
+
+        Raises:
+            ValueError: if ``type`` or ``timestamp`` are missing or mistyped
+        """
+        event_type = payload.get("type")
+        timestamp = payload.get("timestamp")
+        if type(event_type) is not str or type(timestamp) is not int:
+            raise ValueError("SSE event requires a string 'type' and an integer 'timestamp'")
+        self.type: str = event_type
+        self.timestamp: int = timestamp
+        self.text: str | None = payload.get("text")
+        self.execution_count: int | None = payload.get("execution_count")
+        self.execution_time_in_millis: int | None = payload.get("execution_time")
+        self._results: Any = payload.get("results")
+        self._error: Any = payload.get("error")
+
+    @property
+    def results(self) -> EventNodeResults | None:
+        """Result payload, validated on first access."""
+        if isinstance(self._results, dict):
+            self._results = EventNodeResults.model_validate(self._results)
+        return self._results
+
+    @property
+    def error(self) -> EventNodeError | None:
+        """Error payload, validated on first access."""
+        if isinstance(self._error, dict):
+            self._error = EventNodeError.model_validate(self._error)
+        return self._error
+
+    def __repr__(self) -> str:
+        return f"StreamEvent(type={self.type!r}, timestamp={self.timestamp!r}, text={self.text!r})"
+
+
+class SseDecoder:
+    """
+    Incremental decoder turning response body chunks into stream events.
+
+    Lines may be plain JSON or SSE ``data:`` fields and may be split across
+    chunks. Blank lines, comments and other SSE fields are skipped; lines that
+    do not decode to a valid event are logged and dropped.
+    """
+
+    __slots__ = ("_buffer",)
+
+    def __init__(self) -> None:
+        self._buffer = b""
+
+    def feed(self, chunk: bytes) -> list[StreamEvent]:
+        """
+        Decode every complete line of ``chunk``.
+
+        Args:
+            chunk: Next piece of the response body
+
+        Returns:
+            Events completed by this chunk, in stream order
+        """
+        if self._buffer:
+            chunk = self._buffer + chunk
+        lines = chunk.split(b"\n")
+        self._buffer = lines.pop()
+        return self._decode(lines)
+
+    def flush(self) -> list[StreamEvent]:
+        """Decode a trailing line that was not terminated by a newline."""
+        lines = [self._buffer] if self._buffer else []
+        self._buffer = b""
+        return self._decode(lines)
+
+    @staticmethod
+    def _decode(lines: list[bytes]) -> list[StreamEvent]:
+        events = []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith(_DATA_PREFIX):
+                line = line[5:].lstrip()
+            elif line.startswith(_IGNORED_PREFIXES):
+                continue
+            try:
+                events.append(StreamEvent(_loads(line)))
+            except (*_decode_errors, ValueError, TypeError, AttributeError) as e:
+                logger.debug("Failed to parse SSE line: %r (%s)", line, e)
+        return events
+
+
+async def aiter_stream_events(response: httpx.Response) -> AsyncIterator[StreamEvent]:
+    """
+    Iterate over the events of a streaming execd response.
+
+    Args:
+        response: Open streaming response
+
+    Returns:
+        Async iterator of decoded events
+    """
+    decoder = SseDecoder()
+    async for chunk in response.aiter_bytes():
+        for event in decoder.feed(chunk):
+            yield event
+    for event in decoder.flush():
+        yield event
+
+
+def iter_stream_events(response: httpx.Response) -> Iterator[StreamEvent]:
+    """
+    Iterate over the events of a streaming execd response (blocking).
+
+    Args:
+        response: Open streaming response
+
+    Returns:
+        Iterator of decoded events
+    """
+    decoder = SseDecoder()
+    for chunk in response.iter_bytes():
+        yield from decoder.feed(chunk)
+    yield from decoder.flush()
+
+
+__all__ = [
+    "JSON_BACKEND",
+    "SseDecoder",
+    "StreamEvent",
+    "aiter_stream_events",
+    "iter_stream_events",
+]
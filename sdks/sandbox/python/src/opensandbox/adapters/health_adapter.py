@@ -21,6 +21,7 @@ This adapter provides health check functionality for sandboxes.
 """
 
 import logging
+from datetime import timedelta
 
 import httpx
 
@@ -40,6 +41,8 @@ class HealthAdapter(Health):
     generated API client.
     """
 
+    PING_PATH = "/ping"
+
     def __init__(
         self,
         connection_config: ConnectionConfig,
@@ -84,15 +87,26 @@ class HealthAdapter(Health):
         """Return the client for execd API (no auth required)."""
         return self._client
 
-    async def ping(self, sandbox_id: str) -> bool:
+    async def ping(self, sandbox_id: str, *, timeout: timedelta | None = None) -> bool:
         """Check if a sandbox is alive and responsive.
 
         Args:
             sandbox_id: Unique identifier of the sandbox to check
+            timeout: Limit for this request; the configured request timeout if None
 
         Returns:
             True if the sandbox is healthy and responsive, False otherwise
         """
+        if timeout is not None:
+            # Readiness probes bound each attempt instead of waiting out a full request timeout.
+            try:
+                response = await self._httpx_client.get(
+                    self.PING_PATH, timeout=timeout.total_seconds()
+                )
+                return response.status_code < 300
+            except Exception as e:
+                logger.debug(f"Health check failed for sandbox {sandbox_id}: {e}")
+                return False
         try:
             from opensandbox.adapters.converter.response_handler import (
                 handle_api_error,
@@ -19,7 +19,10 @@ Metrics service adapter implementation.
 Implementation of MetricsService that adapts openapi-python-client generated MetricApi.
 """
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
+from datetime import timedelta
 
 import httpx
 
@@ -33,12 +36,17 @@ from opensandbox.adapters.converter.response_handler import (
     handle_api_error,
     require_parsed,
 )
+from opensandbox.backoff import RETRYABLE_STATUS, Backoff
 from opensandbox.config import ConnectionConfig
+from opensandbox.exceptions import SandboxApiException, SandboxException
 from opensandbox.models.sandboxes import SandboxEndpoint, SandboxMetrics
 from opensandbox.services.metrics import Metrics
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_RECONNECT_DELAY = timedelta(milliseconds=500)
+DEFAULT_MAX_RECONNECT_DELAY = timedelta(seconds=10)
+
 
 class MetricsAdapter(Metrics):
     """
@@ -49,6 +57,8 @@ class MetricsAdapter(Metrics):
     performance metrics using the openapi-python-client generated API client.
     """
 
+    WATCH_METRICS_PATH = "/metrics/watch"
+
     def __init__(
         self,
         connection_config: ConnectionConfig,
@@ -89,6 +99,19 @@ class MetricsAdapter(Metrics):
         )
         self._client.set_async_httpx_client(self._httpx_client)
 
+        # Watch client (read timeout disabled, samples arrive every second)
+        self._sse_client = httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=httpx.Timeout(
+                connect=timeout_seconds,
+                read=None,
+                write=timeout_seconds,
+                pool=None,
+            ),
+            transport=self.connection_config.transport,
+        )
+
     async def _get_client(self):
         """Return the client for execd API (no auth required)."""
         return self._client
@@ -121,3 +144,50 @@ class MetricsAdapter(Metrics):
         except Exception as e:
             logger.error(f"Failed to get metrics for sandbox {sandbox_id}", exc_info=e)
             raise ExceptionConverter.to_sandbox_exception(e) from e
+
+    async def watch(
+        self,
+        sandbox_id: str,
+        *,
+        reconnect_delay: timedelta = DEFAULT_RECONNECT_DELAY,
+        max_reconnect_delay: timedelta = DEFAULT_MAX_RECONNECT_DELAY,
+        max_reconnect_attempts: int | None = None,
+    ) -> AsyncIterator[SandboxMetrics]:
+        """Stream resource usage metrics of a sandbox, reconnecting on failure.
+
+        Reconnect delays double from ``reconnect_delay`` up to
+        ``max_reconnect_delay`` and start over once a sample arrives.
+        """
+        backoff = Backoff(reconnect_delay, max_reconnect_delay)
+        failures = 0
+        while True:
+            try:
+                async with self._sse_client.stream("GET", self.WATCH_METRICS_PATH) as response:
+                    if response.status_code != 200:
+                        await response.aread()
+                        raise SandboxApiException(
+                            message=f"Failed to watch metrics. Status code: {response.status_code}",
+                            status_code=response.status_code,
+                        )
+                    async for line in response.aiter_lines():
+                        metrics = MetricsModelConverter.from_watch_line(line, sandbox_id)
+                        if metrics is not None:
+                            failures = 0
+                            backoff.reset()
+                            yield metrics
+                error: Exception = SandboxException("Metrics stream ended")
+            except SandboxApiException as e:
+                if e.status_code not in RETRYABLE_STATUS:
+                    logger.error(f"Failed to watch metrics for sandbox {sandbox_id}", exc_info=e)
+                    raise
+                error = e
+            except httpx.TransportError as e:
+                error = e
+
+            failures += 1
+            if max_reconnect_attempts is not None and failures > max_reconnect_attempts:
+                logger.error(f"Giving up watching metrics for sandbox {sandbox_id}", exc_info=error)
+                raise ExceptionConverter.to_sandbox_exception(error) from error
+            delay = backoff.next()
+            logger.debug("Metrics stream of sandbox %s interrupted (%s), reconnecting in %.2fs", sandbox_id, error, delay)
+            await asyncio.sleep(delay)
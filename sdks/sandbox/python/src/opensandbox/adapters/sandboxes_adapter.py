@@ -31,6 +31,8 @@ from opensandbox.adapters.converter.exception_converter import (
 )
 from opensandbox.adapters.converter.response_handler import (
     handle_api_error,
+    parse_batch_endpoints,
+    parse_sandbox_wait,
     require_parsed,
 )
 from opensandbox.adapters.converter.sandbox_model_converter import (
@@ -38,6 +40,7 @@ from opensandbox.adapters.converter.sandbox_model_converter import (
 )
 from opensandbox.api.lifecycle.types import UNSET
 from opensandbox.config import ConnectionConfig
+from opensandbox.exceptions import SandboxException
 from opensandbox.models.sandboxes import (
     NetworkPolicy,
     PagedSandboxInfos,
@@ -102,6 +105,8 @@ class SandboxesAdapter(Sandboxes):
             transport=self.connection_config.transport,
         )
         self._client.set_async_httpx_client(self._httpx_client)
+        # Whether the server provides GET /sandboxes/{id}/wait; cleared on the first 404/405.
+        self._wait_supported = True
 
     async def _get_client(self):
         """Return the authenticated client for lifecycle API."""
@@ -249,6 +254,46 @@ class SandboxesAdapter(Sandboxes):
             )
             raise ExceptionConverter.to_sandbox_exception(e) from e
 
+    async def get_sandbox_endpoints(
+        self, sandbox_ids: list[str], port: int
+    ) -> dict[str, SandboxEndpoint | SandboxException]:
+        """Resolve one port of several sandboxes with the batch endpoints API."""
+        logger.debug(f"Retrieving endpoints of {len(sandbox_ids)} sandboxes, port {port}")
+
+        try:
+            response = await self._httpx_client.post(
+                "/sandboxes/endpoints",
+                json={"sandboxIds": sandbox_ids, "ports": [port]},
+            )
+            return parse_batch_endpoints(response, sandbox_ids, port)
+        except Exception as e:
+            logger.debug("Failed to retrieve sandbox endpoints in batch", exc_info=e)
+            raise ExceptionConverter.to_sandbox_exception(e) from e
+
+    async def wait_for_state(
+        self, sandbox_id: str, states: list[str], timeout: timedelta
+    ) -> SandboxInfo | None:
+        """Long-poll the server until the sandbox reaches one of ``states``."""
+        logger.debug(f"Waiting for sandbox {sandbox_id} to reach {states}")
+
+        if not self._wait_supported:
+            return None
+        try:
+            response = await self._httpx_client.get(
+                f"/sandboxes/{sandbox_id}/wait",
+                params=[*(("state", state) for state in states), ("timeout", timeout.total_seconds())],
+                # The server holds the request for up to ``timeout``.
+                timeout=(self.connection_config.request_timeout + timeout).total_seconds(),
+            )
+            info = parse_sandbox_wait(response, sandbox_id)
+            if info is None:
+                logger.info("Server does not provide the sandbox wait API, probing readiness instead")
+                self._wait_supported = False
+            return info
+        except Exception as e:
+            logger.debug(f"Failed to wait for sandbox {sandbox_id}", exc_info=e)
+            raise ExceptionConverter.to_sandbox_exception(e) from e
+
     async def pause_sandbox(self, sandbox_id: str) -> None:
         """Pause a running sandbox while preserving its state."""
         logger.info(f"Pausing sandbox: {sandbox_id}")
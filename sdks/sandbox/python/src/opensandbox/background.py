@@ -0,0 +1,216 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Background commands.
+
+``commands.start()`` runs a command detached and returns a
+:class:`BackgroundCommand`. Its status and output are polled over plain
+requests, so many long-running jobs can be followed from one client without
+holding an SSE connection per process.
+"""
+
+import asyncio
+import codecs
+import time
+from collections.abc import AsyncIterator
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from opensandbox.backoff import Backoff
+from opensandbox.exceptions import SandboxException
+from opensandbox.models.execd import CommandLogs, CommandStatus
+
+if TYPE_CHECKING:
+    from opensandbox.services.command import Commands
+
+DEFAULT_POLL_INTERVAL = timedelta(milliseconds=200)
+DEFAULT_MAX_POLL_INTERVAL = timedelta(seconds=5)
+
+
+class _LineSplitter:
+    """Turns raw output chunks into complete lines."""
+
+    __slots__ = ("_decoder", "_pending")
+
+    def __init__(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._pending = ""
+
+    def feed(self, content: bytes) -> list[str]:
+        lines = (self._pending + self._decoder.decode(content)).split("\n")
+        self._pending = lines.pop()
+        return [line.removesuffix("\r") for line in lines]
+
+    def flush(self) -> list[str]:
+        rest = self._pending + self._decoder.decode(b"", final=True)
+        self._pending = ""
+        return [rest.removesuffix("\r")] if rest else []
+
+
+class BackgroundCommand:
+    """
+    A command running detached in a sandbox.
+
+    Usage Example:
+
+    ```python
+    job = await sandbox.commands.start("python train.py")
+    async for line in job.tail():
+        print(line)
+    status = await job.wait()
+    print(status.exit_code)
+    ```
+    """
+
+    __slots__ = ("id", "command", "cursor", "_commands")
+
+    def __init__(self, command_id: str, commands: "Commands", command: str | None = None) -> None:
+        """
+        Args:
+            command_id: Command identifier returned by execd
+            commands: Command service of the sandbox running the command
+            command: Command text, if known
+        """
+        self.id = command_id
+        self.command = command
+        # Where tail() continues from; advanced as output is read.
+        self.cursor = 0
+        self._commands = commands
+
+    async def status(self) -> CommandStatus:
+        """
+        Get the current status of the command.
+
+        Raises:
+            SandboxException: if the operation fails
+        """
+        return await self._commands.status(self.id)
+
+    async def logs(self, cursor: int | None = None) -> CommandLogs:
+        """
+        Read output produced after ``cursor``.
+
+        Args:
+            cursor: Cursor returned by a previous read; all output if None
+
+        Raises:
+            SandboxException: if the operation fails
+        """
+        return await self._commands.logs(self.id, cursor=cursor)
+
+    async def wait(
+        self,
+        *,
+        timeout: timedelta | None = None,
+        poll_interval: timedelta = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: timedelta = DEFAULT_MAX_POLL_INTERVAL,
+    ) -> CommandStatus:
+        """
+        Wait until the command finishes.
+
+        The status is polled starting at ``poll_interval``; the interval doubles
+        up to ``max_poll_interval`` while the command keeps running.
+
+        Args:
+            timeout: Maximum time to wait; unbounded if None
+            poll_interval: First polling interval
+            max_poll_interval: Upper bound of the polling interval
+
+        Returns:
+            Final status of the command
+
+        Raises:
+            SandboxException: if the timeout expires or a status request fails
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout.total_seconds()
+        backoff = Backoff(poll_interval, max_poll_interval)
+        while True:
+            status = await self.status()
+            if not status.running:
+                return status
+            delay = backoff.next()
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise SandboxException(
+                        f"Timed out after {timeout} waiting for command {self.id}"
+                    )
+                delay = min(delay, remaining)
+            await asyncio.sleep(delay)
+
+    async def tail(
+        self,
+        *,
+        cursor: int | None = None,
+        poll_interval: timedelta = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: timedelta = DEFAULT_MAX_POLL_INTERVAL,
+    ) -> AsyncIterator[str]:
+        """
+        Iterate over output lines until the command finishes.
+
+        Output is read incrementally from the last cursor. While no new output
+        arrives the polling interval doubles up to ``max_poll_interval``; it
+        resets as soon as output appears.
+
+        Args:
+            cursor: Where to start reading; continues from :attr:`cursor` if None
+            poll_interval: First polling interval
+            max_poll_interval: Upper bound of the polling interval
+
+        Returns:
+            Async iterator of lines (stdout and stderr combined, without newlines)
+
+        Raises:
+            SandboxException: if a request fails
+        """
+        if cursor is not None:
+            self.cursor = cursor
+        splitter = _LineSplitter()
+        backoff = Backoff(poll_interval, max_poll_interval)
+        finished = False
+        while True:
+            chunk = await self.logs(self.cursor)
+            self.cursor = chunk.cursor
+            for line in splitter.feed(chunk.content):
+                yield line
+            if finished:
+                break
+            if chunk.content:
+                backoff.reset()
+            elif not (await self.status()).running:
+                # Output written before the command exited is picked up by one last read.
+                finished = True
+                continue
+            await asyncio.sleep(backoff.next())
+        for line in splitter.flush():
+            yield line
+
+    async def interrupt(self) -> None:
+        """
+        Interrupt the command.
+
+        Raises:
+            SandboxException: if the operation fails
+        """
+        await self._commands.interrupt(self.id)
+
+    def __repr__(self) -> str:
+        return f"BackgroundCommand(id={self.id!r}, command={self.command!r})"
+
+
+__all__ = [
+    "BackgroundCommand",
+]
@@ -0,0 +1,44 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Reconnect and poll backoff shared by the async and blocking clients.
+"""
+
+import random
+from datetime import timedelta
+
+# Statuses worth reconnecting on; anything else (e.g. 404 from an older execd) is final.
+RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class Backoff:
+    """Poll delay that doubles while nothing changes and resets on progress."""
+
+    __slots__ = ("initial", "maximum", "current")
+
+    def __init__(self, initial: timedelta, maximum: timedelta) -> None:
+        self.initial = initial.total_seconds()
+        self.maximum = max(maximum.total_seconds(), self.initial)
+        self.current = self.initial
+
+    def reset(self) -> None:
+        self.current = self.initial
+
+    def next(self) -> float:
+        """Return the next delay in seconds, jittered so many pollers spread out."""
+        delay = self.current
+        self.current = min(self.current * 2, self.maximum)
+        return delay * random.uniform(0.5, 1.0)
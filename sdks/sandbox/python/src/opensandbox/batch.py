@@ -0,0 +1,55 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Results of fleet-wide operations on :class:`opensandbox.manager.SandboxManager`.
+"""
+
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+# Upper bound of sandbox IDs per ``POST /sandboxes/endpoints`` request.
+MAX_ENDPOINT_BATCH = 100
+
+
+@dataclass(frozen=True)
+class SandboxBatchResult(Generic[T]):
+    """
+    Outcome of one item of a batch operation, yielded as soon as that item completes.
+
+    Attributes:
+        index: Position of the item in the request (create number or position in ``ids``)
+        sandbox_id: Sandbox the item refers to; ``None`` when a create failed before
+            the server assigned an ID
+        value: Result of the item (the Sandbox, the renew response, ``None`` for kills)
+        error: Failure of the item, ``None`` on success
+    """
+
+    index: int
+    sandbox_id: str | None
+    value: T | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item succeeded."""
+        return self.error is None
+
+
+__all__ = [
+    "SandboxBatchResult",
+]
@@ -19,5 +19,6 @@ Configuration module for OpenSandbox SDK.
 
 from opensandbox.config.connection import ConnectionConfig
 from opensandbox.config.connection_sync import ConnectionConfigSync
+from opensandbox.config.transport_registry import TransportStats, shared_transport_stats
 
-__all__ = ["ConnectionConfig", "ConnectionConfigSync"]
+__all__ = ["ConnectionConfig", "ConnectionConfigSync", "TransportStats", "shared_transport_stats"]
@@ -18,6 +18,7 @@ Connection configuration for OpenSandbox operations.
 """
 
 import os
+from collections.abc import Callable
 from datetime import timedelta
 
 import httpx  # type: ignore[reportMissingImports]
@@ -29,6 +30,14 @@ from pydantic import (  # type: ignore[reportMissingImports]
     field_validator,
 )
 
+from opensandbox.config.transport_registry import (
+    DEFAULT_LIMITS,
+    SharedAsyncTransport,
+    TransportStats,
+    transport_registry,
+)
+from opensandbox.models.sandboxes import SandboxReadiness
+
 
 class ConnectionConfig(BaseModel):
     """
@@ -38,6 +47,10 @@ class ConnectionConfig(BaseModel):
     - If `transport` is NOT provided, the SDK creates a default `httpx.AsyncHTTPTransport`
       per Sandbox/Manager instance. In this case, `Sandbox.close()` / `SandboxManager.close()`
       will close the transport.
+    - With `share_transport=True`, the SDK instead borrows a process-wide transport shared
+      by every config with the same event loop, `proxy` and `verify`. `close()` gives the
+      reference back and the last one closes the transport. Outside a running event loop
+      a private transport is created as usual.
     - If `transport` IS provided by the user, the SDK will NOT close it; the user owns it.
 
     Note:
@@ -79,6 +92,28 @@ class ConnectionConfig(BaseModel):
         ),
     )
 
+    share_transport: bool = Field(
+        default=False,
+        description=(
+            "Borrow a reference-counted transport shared process-wide (per event loop, proxy "
+            "and TLS settings) instead of creating one per Sandbox/Manager instance"
+        ),
+    )
+    proxy: str | None = Field(
+        default=None, description="Proxy URL for transports created by the SDK"
+    )
+    verify: bool | str = Field(
+        default=True,
+        description="TLS verification for transports created by the SDK: flag or CA bundle path",
+    )
+    readiness_hook: Callable[[SandboxReadiness], None] | None = Field(
+        default=None,
+        description=(
+            "Called after every readiness wait with its latency and probe counts, "
+            "e.g. to export them as metrics. Errors raised by the hook are logged"
+        ),
+    )
+
     # Environment variable names
     _ENV_API_KEY = "OPEN_SANDBOX_API_KEY"
     _ENV_DOMAIN = "OPEN_SANDBOX_DOMAIN"
@@ -98,13 +133,17 @@ class ConnectionConfig(BaseModel):
         """
         if self.transport is not None:
             return self
-        transport = httpx.AsyncHTTPTransport(
-            limits=httpx.Limits(
-                max_connections=100,
-                max_keepalive_connections=20,
-                keepalive_expiry=30.0,
-            ),
-        )
+        transport: httpx.AsyncBaseTransport | None = None
+        if self.share_transport:
+            try:
+                transport = transport_registry.acquire_async(self.proxy, self.verify)
+            except RuntimeError:
+                # No running event loop to bind a shared transport to.
+                transport = None
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                limits=DEFAULT_LIMITS, proxy=self.proxy, verify=self.verify
+            )
         config = self.model_copy(update={"transport": transport})
         config._owns_transport = True
         return config
@@ -114,6 +153,11 @@ class ConnectionConfig(BaseModel):
         if self.transport is None or not self._owns_transport:
             return
         try:
+            if isinstance(self.transport, SharedAsyncTransport):
+                # Give the reference back exactly once.
+                self._owns_transport = False
+                await transport_registry.release_async(self.transport)
+                return
             await self.transport.aclose()
         except Exception:
             # Avoid raising during cleanup paths
@@ -134,6 +178,17 @@ class ConnectionConfig(BaseModel):
             raise ValueError(f"Request timeout must be positive, got: {v}")
         return v
 
+    def transport_stats(self) -> TransportStats | None:
+        """
+        Usage counters of this config's transport.
+
+        Returns:
+            Counters of the shared transport, or None if the transport is not shared
+        """
+        if not isinstance(self.transport, SharedAsyncTransport):
+            return None
+        return self.transport.stats()
+
     def get_api_key(self) -> str:
         """
         Get API key from config or environment variable.
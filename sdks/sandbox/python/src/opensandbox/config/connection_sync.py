@@ -20,11 +20,20 @@ This mirrors ConnectionConfig (async) but uses httpx sync transports.
 """
 
 import os
+from collections.abc import Callable
 from datetime import timedelta
 
 import httpx
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
+from opensandbox.config.transport_registry import (
+    DEFAULT_LIMITS,
+    SharedTransport,
+    TransportStats,
+    transport_registry,
+)
+from opensandbox.models.sandboxes import SandboxReadiness
+
 
 class ConnectionConfigSync(BaseModel):
     """
@@ -33,6 +42,8 @@ class ConnectionConfigSync(BaseModel):
     Ownership rules:
     - If `transport` is not provided, the SDK creates a default HTTPTransport per
       Sandbox/Manager instance and will close it.
+    - With `share_transport=True`, the SDK instead borrows a process-wide transport shared
+      by every config with the same `proxy` and `verify`; the last `close()` closes it.
     - If `transport` is provided, the SDK will NOT close it (user owns it).
     """
 
@@ -66,6 +77,26 @@ class ConnectionConfigSync(BaseModel):
         ),
     )
 
+    share_transport: bool = Field(
+        default=False,
+        description=(
+            "Borrow a reference-counted transport shared process-wide (per proxy and TLS "
+            "settings) instead of creating one per Sandbox/Manager instance"
+        ),
+    )
+    proxy: str | None = Field(default=None, description="Proxy URL for transports created by the SDK")
+    verify: bool | str = Field(
+        default=True,
+        description="TLS verification for transports created by the SDK: flag or CA bundle path",
+    )
+    readiness_hook: Callable[[SandboxReadiness], None] | None = Field(
+        default=None,
+        description=(
+            "Called after every readiness wait with its latency and probe counts, "
+            "e.g. to export them as metrics. Errors raised by the hook are logged"
+        ),
+    )
+
     _ENV_API_KEY = "OPEN_SANDBOX_API_KEY"
     _ENV_DOMAIN = "OPEN_SANDBOX_DOMAIN"
     _DEFAULT_DOMAIN = "localhost:8080"
@@ -83,13 +114,11 @@ class ConnectionConfigSync(BaseModel):
         """
         if self.transport is not None:
             return self
-        transport = httpx.HTTPTransport(
-            limits=httpx.Limits(
-                max_connections=100,
-                max_keepalive_connections=20,
-                keepalive_expiry=30.0,
-            ),
-        )
+        transport: httpx.BaseTransport
+        if self.share_transport:
+            transport = transport_registry.acquire(self.proxy, self.verify)
+        else:
+            transport = httpx.HTTPTransport(limits=DEFAULT_LIMITS, proxy=self.proxy, verify=self.verify)
         config = self.model_copy(update={"transport": transport})
         config._owns_transport = True
         return config
@@ -99,10 +128,26 @@ class ConnectionConfigSync(BaseModel):
         if self.transport is None or not self._owns_transport:
             return
         try:
+            if isinstance(self.transport, SharedTransport):
+                # Give the reference back exactly once.
+                self._owns_transport = False
+                transport_registry.release(self.transport)
+                return
             self.transport.close()
         except Exception:
             pass
 
+    def transport_stats(self) -> TransportStats | None:
+        """
+        Usage counters of this config's transport.
+
+        Returns:
+            Counters of the shared transport, or None if the transport is not shared
+        """
+        if not isinstance(self.transport, SharedTransport):
+            return None
+        return self.transport.stats()
+
     @field_validator("protocol")
     @classmethod
     def protocol_must_be_valid(cls, v: str) -> str:
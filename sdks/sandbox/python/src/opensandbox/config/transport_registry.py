@@ -0,0 +1,290 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Process-wide registry of shared HTTP transports.
+
+By default every Sandbox and SandboxManager creates its own transport, i.e. its
+own connection pool. With ``share_transport=True`` on the connection config,
+all SDK resources with the same proxy/TLS settings (and, for async code, the
+same event loop) borrow one reference-counted transport from this registry, so
+lifecycle calls across all of them reuse keep-alive connections. The transport
+is closed when the last resource holding it is closed.
+
+Shared transports count requests and newly opened connections; see
+:func:`shared_transport_stats` for the resulting connection reuse ratio.
+"""
+
+import asyncio
+import threading
+import weakref
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+# Pool settings of transports created by the SDK.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+# httpcore trace events emitted when a request has to open a new connection.
+_CONNECT_EVENTS = frozenset(
+    {"connection.connect_tcp.complete", "connection.connect_unix_socket.complete"}
+)
+
+# (proxy, verify) of the transport.
+TransportKey = tuple[str | None, bool | str]
+
+
+@dataclass(frozen=True)
+class TransportStats:
+    """
+    Usage counters of shared transports.
+
+    Attributes:
+        transports: Number of live shared transports
+        references: SDK resources currently holding one of them
+        requests: Requests sent
+        connections: Connections opened; every other request reused a pooled connection
+    """
+
+    transports: int
+    references: int
+    requests: int
+    connections: int
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fraction of requests served on an already open connection."""
+        if not self.requests:
+            return 0.0
+        return max(0.0, 1 - self.connections / self.requests)
+
+
+class _Counters:
+    __slots__ = ("references", "requests", "connections")
+
+    def __init__(self) -> None:
+        self.references = 0
+        self.requests = 0
+        self.connections = 0
+
+    def snapshot(self) -> TransportStats:
+        return TransportStats(
+            transports=1,
+            references=self.references,
+            requests=self.requests,
+            connections=self.connections,
+        )
+
+
+class SharedAsyncTransport(httpx.AsyncBaseTransport):
+    """Async transport from the registry; counts requests and new connections. Only the registry closes it."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+        self.counters = _Counters()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        counters = self.counters
+        counters.requests += 1
+        previous: Callable[[str, dict[str, Any]], Awaitable[None]] | None = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            if event_name in _CONNECT_EVENTS:
+                counters.connections += 1
+            if previous is not None:
+                await previous(event_name, info)
+
+        request.extensions["trace"] = trace
+        return await self._transport.handle_async_request(request)
+
+    def stats(self) -> TransportStats:
+        """Counters of this transport."""
+        return self.counters.snapshot()
+
+    async def aclose(self) -> None:
+        # Closing an httpx client must not close a pool other resources still use.
+        pass
+
+    async def _shutdown(self) -> None:
+        await self._transport.aclose()
+
+
+class SharedTransport(httpx.BaseTransport):
+    """Sync transport from the registry; counts requests and new connections. Only the registry closes it."""
+
+    def __init__(self, transport: httpx.BaseTransport) -> None:
+        self._transport = transport
+        self.counters = _Counters()
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        counters = self.counters
+        with self._lock:
+            counters.requests += 1
+        previous: Callable[[str, dict[str, Any]], None] | None = request.extensions.get("trace")
+
+        def trace(event_name: str, info: dict[str, Any]) -> None:
+            if event_name in _CONNECT_EVENTS:
+                with self._lock:
+                    counters.connections += 1
+            if previous is not None:
+                previous(event_name, info)
+
+        request.extensions["trace"] = trace
+        return self._transport.handle_request(request)
+
+    def stats(self) -> TransportStats:
+        """Counters of this transport."""
+        with self._lock:
+            return self.counters.snapshot()
+
+    def close(self) -> None:
+        # Closing an httpx client must not close a pool other resources still use.
+        pass
+
+    def _shutdown(self) -> None:
+        self._transport.close()
+
+
+class TransportRegistry:
+    """
+    Reference-counted transports keyed by event loop (async only) and proxy/TLS settings.
+
+    Async transports are bound to the event loop they were created in; entries of
+    a loop disappear with the loop.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._async: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[TransportKey, SharedAsyncTransport]
+        ] = weakref.WeakKeyDictionary()
+        self._sync: dict[TransportKey, SharedTransport] = {}
+
+    def acquire_async(self, proxy: str | None, verify: bool | str) -> SharedAsyncTransport:
+        """
+        Take a reference to the async transport of the running event loop and settings.
+
+        Args:
+            proxy: Proxy URL, or None for direct connections
+            verify: TLS verification flag or CA bundle path
+
+        Returns:
+            The shared transport; give it back with :meth:`release_async`
+
+        Raises:
+            RuntimeError: if no event loop is running
+        """
+        loop = asyncio.get_running_loop()
+        key = (proxy, verify)
+        with self._lock:
+            transports = self._async.setdefault(loop, {})
+            transport = transports.get(key)
+            if transport is None:
+                transport = SharedAsyncTransport(
+                    httpx.AsyncHTTPTransport(limits=DEFAULT_LIMITS, proxy=proxy, verify=verify)
+                )
+                transports[key] = transport
+            transport.counters.references += 1
+            return transport
+
+    async def release_async(self, transport: SharedAsyncTransport) -> None:
+        """Drop one reference; the last one closes the transport."""
+        with self._lock:
+            transport.counters.references -= 1
+            if transport.counters.references > 0:
+                return
+            for transports in self._async.values():
+                for key, candidate in list(transports.items()):
+                    if candidate is transport:
+                        del transports[key]
+        await transport._shutdown()
+
+    def acquire(self, proxy: str | None, verify: bool | str) -> SharedTransport:
+        """
+        Take a reference to the sync transport of the given settings.
+
+        Args:
+            proxy: Proxy URL, or None for direct connections
+            verify: TLS verification flag or CA bundle path
+
+        Returns:
+            The shared transport; give it back with :meth:`release`
+        """
+        key = (proxy, verify)
+        with self._lock:
+            transport = self._sync.get(key)
+            if transport is None:
+                transport = SharedTransport(
+                    httpx.HTTPTransport(limits=DEFAULT_LIMITS, proxy=proxy, verify=verify)
+                )
+                self._sync[key] = transport
+            transport.counters.references += 1
+            return transport
+
+    def release(self, transport: SharedTransport) -> None:
+        """Drop one reference; the last one closes the transport."""
+        with self._lock:
+            transport.counters.references -= 1
+            if transport.counters.references > 0:
+                return
+            for key, candidate in list(self._sync.items()):
+                if candidate is transport:
+                    del self._sync[key]
+        transport._shutdown()
+
+    def stats(self) -> TransportStats:
+        """Counters summed over all live shared transports."""
+        with self._lock:
+            transports: list[SharedAsyncTransport | SharedTransport] = [
+                transport for per_loop in self._async.values() for transport in per_loop.values()
+            ]
+            transports.extend(self._sync.values())
+            return TransportStats(
+                transports=len(transports),
+                references=sum(t.counters.references for t in transports),
+                requests=sum(t.counters.requests for t in transports),
+                connections=sum(t.counters.connections for t in transports),
+            )
+
+
+transport_registry = TransportRegistry()
+
+
+def shared_transport_stats() -> TransportStats:
+    """
+    Report usage of the transports shared through ``share_transport=True``.
+
+    Returns:
+        Counters summed over all live shared transports, including the connection reuse ratio
+    """
+    return transport_registry.stats()
+
+
+__all__ = [
+    "DEFAULT_LIMITS",
+    "SharedAsyncTransport",
+    "SharedTransport",
+    "TransportRegistry",
+    "TransportStats",
+    "shared_transport_stats",
+    "transport_registry",
+]
@@ -0,0 +1,105 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Compact sandbox references.
+
+A :class:`~opensandbox.sandbox.Sandbox` keeps its service adapters, and with
+them several HTTP clients, alive for as long as it is referenced. Schedulers
+that track many sandboxes but talk to few at a time can hold a
+:class:`SandboxHandle` instead and upgrade it when needed.
+"""
+
+from collections.abc import Awaitable, Callable
+
+from opensandbox.config import ConnectionConfig
+from opensandbox.models.sandboxes import SandboxEndpoint
+from opensandbox.sandbox import Sandbox
+
+
+class SandboxHandle:
+    """
+    Sandbox ID, execd endpoint and a shared connection config; nothing else.
+
+    Upgrading with :meth:`to_sandbox` performs no request; the resulting
+    Sandbox builds each service on first use. Handles created from the same
+    config share its transport, which must stay open while they are used.
+
+    Usage Example:
+
+    ```python
+    handles = [sandbox.to_handle() for sandbox in sandboxes]
+    ...
+    sandbox = handles[i].to_sandbox()
+    await sandbox.commands.run("python -V")
+    ```
+    """
+
+    __slots__ = ("id", "endpoint", "connection_config", "__weakref__")
+
+    def __init__(self, sandbox_id: str, endpoint: str, connection_config: ConnectionConfig) -> None:
+        """
+        Create a handle.
+
+        Args:
+            sandbox_id: Sandbox ID
+            endpoint: Execd endpoint of the sandbox (``host:port[/path]``)
+            connection_config: Connection configuration shared by handles
+        """
+        self.id = sandbox_id
+        self.endpoint = endpoint
+        self.connection_config = connection_config
+
+    def to_sandbox(
+        self, *, health_check: Callable[[Sandbox], Awaitable[bool]] | None = None
+    ) -> Sandbox:
+        """
+        Upgrade to a full Sandbox without contacting the server.
+
+        The Sandbox borrows the handle's transport: closing it leaves the
+        transport open. If the config has no transport yet, the Sandbox gets
+        its own and closes it.
+
+        Args:
+            health_check: Custom async health check function
+
+        Returns:
+            Sandbox whose services are built on first use
+        """
+        config = self.connection_config
+        if config.transport is None:
+            config = config.with_transport_if_missing()
+        elif config._owns_transport:
+            config = config.model_copy()
+            config._owns_transport = False
+        return Sandbox(
+            sandbox_id=self.id,
+            sandbox_service=None,
+            filesystem_service=None,
+            command_service=None,
+            health_service=None,
+            metrics_service=None,
+            connection_config=config,
+            custom_health_check=health_check,
+            execd_endpoint=SandboxEndpoint(endpoint=self.endpoint),
+        )
+
+    def __repr__(self) -> str:
+        return f"SandboxHandle(id={self.id!r}, endpoint={self.endpoint!r})"
+
+
+__all__ = [
+    "SandboxHandle",
+]
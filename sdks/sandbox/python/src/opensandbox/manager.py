@@ -20,21 +20,34 @@ This module provides a centralized interface for managing sandbox instances,
 enabling administrative operations and sandbox discovery following the Kotlin SDK pattern.
 """
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
 from datetime import datetime, timedelta, timezone
+from typing import TypeVar
 
 from opensandbox.adapters.factory import AdapterFactory
+from opensandbox.batch import MAX_ENDPOINT_BATCH, SandboxBatchResult
 from opensandbox.config import ConnectionConfig
+from opensandbox.constants import DEFAULT_EXECD_PORT
+from opensandbox.exceptions import InvalidArgumentException, SandboxApiException
 from opensandbox.models.sandboxes import (
+    NetworkPolicy,
     PagedSandboxInfos,
+    SandboxEndpoint,
     SandboxFilter,
+    SandboxImageSpec,
     SandboxInfo,
+    SandboxMetrics,
     SandboxRenewResponse,
 )
+from opensandbox.sandbox import Sandbox
 from opensandbox.services.sandbox import Sandboxes
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class SandboxManager:
     """
@@ -48,6 +61,8 @@ class SandboxManager:
 
     - **Sandbox Discovery**: List and filter sandbox instances by various criteria
     - **Administrative Operations**: Individual sandbox management operations
+    - **Batch Operations**: Create, kill or renew many sandboxes with bounded concurrency
+    - **Metrics Streaming**: Watch the resource usage of many sandboxes over one iterator
     - **Connection Pool Management**: Efficient HTTP client reuse for multiple operations
 
     Usage Example:
@@ -68,6 +83,11 @@ class SandboxManager:
     await manager.resume_sandbox(sandbox_id)
     await manager.kill_sandbox(sandbox_id)
 
+    # Batch operations stream each result as soon as it completes
+    async for result in manager.create_many("python:3.11", count=20, concurrency=8):
+        if result.ok:
+            sandboxes.append(result.value)
+
     # Cleanup
     await manager.close()
     ```
@@ -92,6 +112,11 @@ class SandboxManager:
         """
         self._sandbox_service = sandbox_service
         self._connection_config = connection_config
+        # Sandboxes created in batch share the manager's transport and must never close it.
+        self._member_config = connection_config.model_copy()
+        self._member_config._owns_transport = False
+        # Whether the server provides POST /sandboxes/endpoints; None until first used.
+        self._batch_endpoints: bool | None = None
 
     @property
     def connection_config(self) -> ConnectionConfig:
@@ -208,6 +233,319 @@ class SandboxManager:
         logger.info(f"Resuming sandbox: {sandbox_id}")
         await self._sandbox_service.resume_sandbox(sandbox_id)
 
+    async def create_many(
+        self,
+        image: SandboxImageSpec | str,
+        count: int,
+        *,
+        concurrency: int = 8,
+        timeout: timedelta = timedelta(minutes=10),
+        ready_timeout: timedelta = timedelta(seconds=30),
+        env: dict[str, str] | None = None,
+        metadata: dict[str, str] | None = None,
+        resource: dict[str, str] | None = None,
+        network_policy: NetworkPolicy | None = None,
+        extensions: dict[str, str] | None = None,
+        entrypoint: list[str] | None = None,
+        health_check: Callable[[Sandbox], Awaitable[bool]] | None = None,
+        health_check_polling_interval: timedelta = timedelta(milliseconds=200),
+        skip_health_check: bool = False,
+    ) -> AsyncIterator[SandboxBatchResult[Sandbox]]:
+        """
+        Create ``count`` identical sandboxes, yielding each one as soon as it is ready.
+
+        At most ``concurrency`` sandboxes are being created or waited on for
+        readiness at a time. All sandboxes share the
+        manager's transport and lifecycle client, so ``close()`` on a sandbox
+        leaves the connection pool open; it is closed with the manager.
+        Endpoint lookups of sandboxes that finish together are resolved with
+        one ``POST /sandboxes/endpoints`` request when the server provides it.
+
+        A sandbox that is created but fails endpoint resolution or its health
+        check is killed and reported as a failed result. If iteration stops
+        early (``break``, an exception or cancellation), in-flight creates are
+        cancelled and created sandboxes not yet yielded are killed; wrap the
+        iterator in ``contextlib.aclosing`` to run that cleanup immediately.
+
+        Args:
+            image: Container image of every sandbox
+            count: Number of sandboxes to create
+            concurrency: Maximum sandboxes being created or checked for readiness
+            timeout: Maximum sandbox lifetime
+            ready_timeout: Maximum time to wait for each sandbox to become ready
+            env: Environment variables for the sandboxes
+            metadata: Custom metadata for the sandboxes
+            resource: Resource limits (CPU, memory, etc.)
+            network_policy: Optional outbound network policy (egress)
+            extensions: Opaque extension parameters passed through to the server as-is
+            entrypoint: Command to run as entrypoint
+            health_check: Custom async health check function
+            health_check_polling_interval: Time between health check attempts
+            skip_health_check: Yield sandboxes without waiting for readiness
+
+        Returns:
+            Async iterator of results in completion order; ``result.index`` is the create number
+
+        Raises:
+            InvalidArgumentException: if ``count`` or ``concurrency`` is invalid
+        """
+        _validate_batch(count, concurrency)
+        if isinstance(image, str):
+            image = SandboxImageSpec(image=image)
+        # Same defaults as Sandbox.create.
+        entrypoint = entrypoint or ["tail", "-f", "/dev/null"]
+        env = env or {}
+        metadata = metadata or {}
+        resource = resource or {"cpu": "1", "memory": "2Gi"}
+        extensions = extensions or {}
+
+        factory = AdapterFactory(self._member_config)
+        semaphore = asyncio.Semaphore(concurrency)
+        created: asyncio.Queue[tuple[int, str]] = asyncio.Queue()
+        results: asyncio.Queue[SandboxBatchResult[Sandbox]] = asyncio.Queue()
+        undelivered: set[str] = set()
+        tasks: set[asyncio.Task[None]] = set()
+
+        def spawn(coro: Awaitable[None]) -> None:
+            task = asyncio.ensure_future(coro)
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        def settle(result: SandboxBatchResult[Sandbox]) -> None:
+            semaphore.release()
+            results.put_nowait(result)
+
+        async def fail(index: int, sandbox_id: str, error: Exception) -> None:
+            undelivered.discard(sandbox_id)
+            await self._kill_quietly(sandbox_id)
+            settle(SandboxBatchResult(index, sandbox_id, error=error))
+
+        async def create_one(index: int) -> None:
+            # The slot is held until the sandbox is ready or has failed, so readiness waits are bounded too.
+            await semaphore.acquire()
+            try:
+                response = await self._sandbox_service.create_sandbox(
+                    image, entrypoint, env, metadata, timeout, resource, network_policy, extensions
+                )
+            except Exception as e:
+                settle(SandboxBatchResult(index, None, error=e))
+                return
+            undelivered.add(response.id)
+            created.put_nowait((index, response.id))
+
+        async def resolve_forever() -> None:
+            # Creates finishing while a lookup is in flight are resolved together by the next one.
+            while True:
+                batch = [await created.get()]
+                while not created.empty():
+                    batch.append(created.get_nowait())
+                try:
+                    endpoints = await self._resolve_execd_endpoints([sandbox_id for _, sandbox_id in batch])
+                except Exception as e:
+                    endpoints = {sandbox_id: e for _, sandbox_id in batch}
+                for index, sandbox_id in batch:
+                    endpoint = endpoints[sandbox_id]
+                    if isinstance(endpoint, Exception):
+                        spawn(fail(index, sandbox_id, endpoint))
+                    else:
+                        spawn(finish(index, sandbox_id, endpoint))
+
+        async def finish(index: int, sandbox_id: str, endpoint: SandboxEndpoint) -> None:
+            sandbox = Sandbox(
+                sandbox_id=sandbox_id,
+                sandbox_service=self._sandbox_service,
+                filesystem_service=None,
+                command_service=None,
+                health_service=None,
+                metrics_service=None,
+                connection_config=self._member_config,
+                custom_health_check=health_check,
+                execd_endpoint=endpoint,
+                adapter_factory=factory,
+            )
+            if not skip_health_check:
+                try:
+                    await sandbox.check_ready(ready_timeout, health_check_polling_interval)
+                except Exception as e:
+                    await fail(index, sandbox_id, e)
+                    return
+            settle(SandboxBatchResult(index, sandbox_id, value=sandbox))
+
+        try:
+            for index in range(count):
+                spawn(create_one(index))
+            if count:
+                spawn(resolve_forever())
+            for _ in range(count):
+                result = await results.get()
+                if result.sandbox_id is not None:
+                    undelivered.discard(result.sandbox_id)
+                yield result
+        finally:
+            pending = list(tasks)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            if undelivered:
+                logger.warning("Batch create stopped early, killing %d undelivered sandboxes", len(undelivered))
+                await asyncio.gather(*(self._kill_quietly(sandbox_id) for sandbox_id in undelivered))
+
+    async def kill_many(
+        self, sandbox_ids: list[str], *, concurrency: int = 16
+    ) -> AsyncIterator[SandboxBatchResult[None]]:
+        """
+        Terminate several sandboxes, yielding each outcome as soon as it completes.
+
+        Args:
+            sandbox_ids: Sandbox IDs to terminate
+            concurrency: Maximum requests in flight
+
+        Returns:
+            Async iterator of results in completion order; ``result.index`` is the position in ``sandbox_ids``
+
+        Raises:
+            InvalidArgumentException: if ``concurrency`` is invalid
+        """
+        _validate_batch(len(sandbox_ids), concurrency)
+        logger.info(f"Terminating {len(sandbox_ids)} sandboxes")
+        async for result in _fan_out(sandbox_ids, self._sandbox_service.kill_sandbox, concurrency):
+            yield result
+
+    async def renew_many(
+        self, sandbox_ids: list[str], timeout: timedelta, *, concurrency: int = 16
+    ) -> AsyncIterator[SandboxBatchResult[SandboxRenewResponse]]:
+        """
+        Renew the expiration of several sandboxes, yielding each outcome as soon as it completes.
+
+        All sandboxes get the same new expiration time: now plus ``timeout``.
+
+        Args:
+            sandbox_ids: Sandbox IDs to renew
+            timeout: Duration to add to the current time to set the new expiration
+            concurrency: Maximum requests in flight
+
+        Returns:
+            Async iterator of results in completion order; ``result.index`` is the position in ``sandbox_ids``
+
+        Raises:
+            InvalidArgumentException: if ``concurrency`` is invalid
+        """
+        _validate_batch(len(sandbox_ids), concurrency)
+        new_expiration = datetime.now(timezone.utc) + timeout
+        logger.info(f"Renew expiration for {len(sandbox_ids)} sandboxes to {new_expiration}")
+
+        async def renew(sandbox_id: str) -> SandboxRenewResponse:
+            return await self._sandbox_service.renew_sandbox_expiration(sandbox_id, new_expiration)
+
+        async for result in _fan_out(sandbox_ids, renew, concurrency):
+            yield result
+
+    async def watch_metrics(
+        self,
+        sandbox_ids: list[str],
+        *,
+        queue_size: int = 1024,
+        on_error: Callable[[str, Exception], None] | None = None,
+        reconnect_delay: timedelta = timedelta(milliseconds=500),
+        max_reconnect_delay: timedelta = timedelta(seconds=10),
+        max_reconnect_attempts: int | None = None,
+    ) -> AsyncIterator[tuple[str, SandboxMetrics]]:
+        """
+        Watch the metrics of several sandboxes concurrently.
+
+        Each sandbox keeps one metrics stream open (see :meth:`Metrics.watch`)
+        and samples of all sandboxes are merged, in arrival order, into one
+        queue of at most ``queue_size`` entries; while it is full the streams
+        stop being read. A sandbox whose endpoint cannot be resolved or whose
+        stream fails for good is reported to ``on_error`` (or logged) and no
+        longer watched. Iteration ends when no sandbox is left.
+
+        Args:
+            sandbox_ids: Sandbox IDs to watch
+            queue_size: Maximum samples buffered ahead of the consumer
+            on_error: Called with the sandbox ID and error when a sandbox stops being watched
+            reconnect_delay: First delay before reconnecting a dropped stream
+            max_reconnect_delay: Upper bound of the reconnect delay
+            max_reconnect_attempts: Consecutive failed connections tolerated per sandbox;
+                unbounded if None
+
+        Returns:
+            Async iterator of ``(sandbox_id, metrics)`` tuples
+
+        Raises:
+            InvalidArgumentException: if ``queue_size`` is invalid
+        """
+        if queue_size < 1:
+            raise InvalidArgumentException("queue_size must be >= 1")
+        if not sandbox_ids:
+            return
+        endpoints = await self._resolve_execd_endpoints(sandbox_ids)
+        factory = AdapterFactory(self._member_config)
+        # A (sandbox_id, None) entry marks the end of that sandbox's stream.
+        samples: asyncio.Queue[tuple[str, SandboxMetrics | None]] = asyncio.Queue(maxsize=queue_size)
+
+        async def watch_one(sandbox_id: str, endpoint: SandboxEndpoint | Exception) -> None:
+            try:
+                if isinstance(endpoint, Exception):
+                    raise endpoint
+                metrics = factory.create_metrics_service(endpoint)
+                async for sample in metrics.watch(
+                    sandbox_id,
+                    reconnect_delay=reconnect_delay,
+                    max_reconnect_delay=max_reconnect_delay,
+                    max_reconnect_attempts=max_reconnect_attempts,
+                ):
+                    await samples.put((sandbox_id, sample))
+            except Exception as e:
+                _report_watch_error(sandbox_id, e, on_error)
+            await samples.put((sandbox_id, None))
+
+        tasks = [asyncio.ensure_future(watch_one(sandbox_id, endpoints[sandbox_id])) for sandbox_id in endpoints]
+        try:
+            live = len(tasks)
+            while live:
+                sandbox_id, sample = await samples.get()
+                if sample is None:
+                    live -= 1
+                    continue
+                yield sandbox_id, sample
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _resolve_execd_endpoints(
+        self, sandbox_ids: list[str]
+    ) -> dict[str, SandboxEndpoint | Exception]:
+        if self._batch_endpoints is not False:
+            try:
+                resolved: dict[str, SandboxEndpoint | Exception] = {}
+                for start in range(0, len(sandbox_ids), MAX_ENDPOINT_BATCH):
+                    chunk = sandbox_ids[start:start + MAX_ENDPOINT_BATCH]
+                    resolved.update(
+                        await self._sandbox_service.get_sandbox_endpoints(chunk, DEFAULT_EXECD_PORT)
+                    )
+                self._batch_endpoints = True
+                return resolved
+            except SandboxApiException as e:
+                if e.status_code in (404, 405):
+                    logger.info("Server does not provide batch endpoint lookup, resolving one by one")
+                    self._batch_endpoints = False
+                else:
+                    logger.warning("Batch endpoint lookup failed, resolving one by one: %s", e)
+
+        endpoints = await asyncio.gather(
+            *(self._sandbox_service.get_sandbox_endpoint(sandbox_id, DEFAULT_EXECD_PORT) for sandbox_id in sandbox_ids),
+            return_exceptions=True,
+        )
+        return dict(zip(sandbox_ids, endpoints, strict=True))
+
+    async def _kill_quietly(self, sandbox_id: str) -> None:
+        try:
+            await self._sandbox_service.kill_sandbox(sandbox_id)
+        except Exception as e:
+            logger.error("Failed to clean up sandbox %s after batch create", sandbox_id, exc_info=e)
+
     async def close(self) -> None:
         """
         Close local resources associated with this sandbox manager.
@@ -238,3 +576,46 @@ class SandboxManager:
     ) -> None:
         """Async context manager exit."""
         await self.close()
+
+
+def _validate_batch(count: int, concurrency: int) -> None:
+    if count < 0:
+        raise InvalidArgumentException("count must be >= 0")
+    if concurrency < 1:
+        raise InvalidArgumentException("concurrency must be >= 1")
+
+
+def _report_watch_error(
+    sandbox_id: str, error: Exception, on_error: Callable[[str, Exception], None] | None
+) -> None:
+    if on_error is None:
+        logger.warning("Stopped watching metrics of sandbox %s: %s", sandbox_id, error)
+        return
+    try:
+        on_error(sandbox_id, error)
+    except Exception as e:
+        logger.error("Metrics watch error callback failed for sandbox %s", sandbox_id, exc_info=e)
+
+
+async def _fan_out(
+    sandbox_ids: list[str],
+    operation: Callable[[str], Awaitable[T]],
+    concurrency: int,
+) -> AsyncIterator[SandboxBatchResult[T]]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(index: int, sandbox_id: str) -> SandboxBatchResult[T]:
+        async with semaphore:
+            try:
+                return SandboxBatchResult(index, sandbox_id, value=await operation(sandbox_id))
+            except Exception as e:
+                return SandboxBatchResult(index, sandbox_id, error=e)
+
+    tasks = [asyncio.ensure_future(run(index, sandbox_id)) for index, sandbox_id in enumerate(sandbox_ids)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
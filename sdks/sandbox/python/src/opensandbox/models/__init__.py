@@ -20,13 +20,17 @@ Core Pydantic models for sandbox operations.
 """
 
 from opensandbox.models.execd import (
+    CommandLogs,
+    CommandStatus,
     Execution,
     ExecutionComplete,
     ExecutionError,
     ExecutionInit,
     ExecutionLogs,
     ExecutionResult,
+    OutputLog,
     OutputMessage,
+    OutputRetention,
 )
 from opensandbox.models.filesystem import (
     ContentReplaceEntry,
@@ -48,6 +52,7 @@ from opensandbox.models.sandboxes import (
     SandboxImageSpec,
     SandboxInfo,
     SandboxMetrics,
+    SandboxReadiness,
     SandboxState,
     SandboxStatus,
 )
@@ -57,10 +62,14 @@ __all__ = [
     "Execution",
     "ExecutionLogs",
     "OutputMessage",
+    "OutputLog",
+    "OutputRetention",
     "ExecutionResult",
     "ExecutionError",
     "ExecutionComplete",
     "ExecutionInit",
+    "CommandStatus",
+    "CommandLogs",
     # Filesystem models
     "EntryInfo",
     "WriteEntry",
@@ -80,6 +89,7 @@ __all__ = [
     "SandboxImageAuth",
     "SandboxFilter",
     "SandboxMetrics",
+    "SandboxReadiness",
     "PagedSandboxInfos",
     "PaginationInfo",
 ]
@@ -19,10 +19,22 @@ Execution-related data models.
 Models for code execution, results, and output handling.
 """
 
-from collections.abc import Awaitable, Callable
-from typing import Any
-
-from pydantic import BaseModel, ConfigDict, Field
+import struct
+import tempfile
+from array import array
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Sequence
+from datetime import datetime, timedelta
+from typing import IO, Any, Literal, overload
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    GetCoreSchemaHandler,
+    field_validator,
+    model_validator,
+)
+from pydantic_core import core_schema
 
 
 class OutputMessage(BaseModel):
@@ -85,21 +97,312 @@ class ExecutionError(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+class OutputRetention(BaseModel):
+    """
+    How much stdout/stderr output an :class:`Execution` keeps.
+
+    Handlers always receive every message; retention only affects
+    ``execution.logs``. Each stream is bounded separately.
+
+    Modes:
+
+    - ``all``: keep every line (default)
+    - ``tail``: keep the newest ``max_lines`` lines and/or ``max_bytes`` bytes
+      of UTF-8 text; a single line larger than ``max_bytes`` is not kept
+    - ``none``: keep nothing, output only reaches the handlers
+    - ``spill``: write every line to a temporary file that is read back
+      lazily when the log is iterated
+
+    Example:
+        ```python
+        opts = RunCommandOpts(output_retention=OutputRetention(mode="tail", max_lines=1000))
+        ```
+    """
+
+    mode: Literal["all", "tail", "none", "spill"] = Field(
+        default="all", description="Retention mode"
+    )
+    max_lines: int | None = Field(
+        default=None, ge=1, description="Lines kept per stream in tail mode"
+    )
+    max_bytes: int | None = Field(
+        default=None, ge=1, description="UTF-8 bytes kept per stream in tail mode"
+    )
+    directory: str | None = Field(
+        default=None,
+        description="Directory of spill files (system temporary directory if None)",
+    )
+
+    @model_validator(mode="after")
+    def _check_limits(self) -> "OutputRetention":
+        if self.mode == "tail" and self.max_lines is None and self.max_bytes is None:
+            raise ValueError("tail retention requires max_lines or max_bytes")
+        return self
+
+    model_config = ConfigDict(frozen=True)
+
+
+_SPILL_HEADER = struct.Struct("<qI")
+_SPILL_READ_SIZE = 1 << 16
+
+
+def _utf8_size(text: str) -> int:
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+class OutputLog(Sequence["OutputMessage"]):
+    """
+    Output lines of one stream, stored compactly under an :class:`OutputRetention`.
+
+    Behaves like a read-only list of :class:`OutputMessage`. Texts are kept as
+    plain strings next to an ``array`` of timestamps (or in a spill file), and
+    messages are only built when lines are read.
+    """
+
+    __slots__ = (
+        "is_error",
+        "retention",
+        "dropped",
+        "_texts",
+        "_timestamps",
+        "_start",
+        "_bytes",
+        "_spill",
+        "_offsets",
+    )
+
+    def __init__(
+        self,
+        retention: OutputRetention | None = None,
+        *,
+        is_error: bool = False,
+        messages: Iterable["OutputMessage"] = (),
+    ) -> None:
+        """
+        Create an empty log.
+
+        Args:
+            retention: Retention policy; keep everything if None
+            is_error: Whether the lines come from stderr
+            messages: Initial messages, added under the policy
+        """
+        self.is_error = is_error
+        self.retention = retention or OutputRetention()
+        self.dropped = 0
+        self._texts: list[str] = []
+        self._timestamps = array("q")
+        self._start = 0
+        self._bytes = 0
+        self._spill: IO[bytes] | None = None
+        self._offsets = array("q")
+        for message in messages:
+            self.append(message)
+
+    @property
+    def retained_bytes(self) -> int:
+        """UTF-8 bytes of text currently retained (in memory or spilled)."""
+        return self._bytes
+
+    def add(self, text: str, timestamp: int) -> None:
+        """
+        Record one output line.
+
+        Args:
+            text: Line text
+            timestamp: Unix timestamp in milliseconds
+        """
+        mode = self.retention.mode
+        if mode == "all":
+            self._texts.append(text)
+            self._timestamps.append(timestamp)
+            self._bytes += _utf8_size(text)
+        elif mode == "tail":
+            self._add_tail(text, timestamp)
+        elif mode == "spill":
+            self._add_spill(text, timestamp)
+        else:
+            self.dropped += 1
+
+    def append(self, message: "OutputMessage") -> None:
+        """Record an :class:`OutputMessage`."""
+        self.add(message.text, message.timestamp)
+
+    def close(self) -> None:
+        """Delete the spill file, if any; spilled lines can no longer be read."""
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+            self._offsets = array("q")
+
+    def _add_tail(self, text: str, timestamp: int) -> None:
+        retention = self.retention
+        texts = self._texts
+        texts.append(text)
+        self._timestamps.append(timestamp)
+        self._bytes += _utf8_size(text)
+        max_lines = retention.max_lines
+        max_bytes = retention.max_bytes
+        while (max_lines is not None and len(texts) - self._start > max_lines) or (
+            max_bytes is not None and self._bytes > max_bytes
+        ):
+            evicted = texts[self._start]
+            texts[self._start] = ""
+            self._bytes -= _utf8_size(evicted)
+            self._start += 1
+            self.dropped += 1
+        # Compact once the evicted prefix outweighs the live lines.
+        if self._start > 64 and self._start * 2 > len(texts):
+            del texts[: self._start]
+            del self._timestamps[: self._start]
+            self._start = 0
+
+    def _add_spill(self, text: str, timestamp: int) -> None:
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile(
+                prefix="opensandbox-output-", dir=self.retention.directory
+            )
+        data = text.encode("utf-8")
+        self._offsets.append(self._spill.tell())
+        self._spill.write(_SPILL_HEADER.pack(timestamp, len(data)))
+        self._spill.write(data)
+        self._bytes += len(data)
+
+    def _message(self, text: str, timestamp: int) -> "OutputMessage":
+        return OutputMessage(text=text, timestamp=timestamp, is_error=self.is_error)
+
+    def _read_spilled(self, index: int) -> "OutputMessage":
+        assert self._spill is not None
+        end = self._spill.tell()
+        try:
+            self._spill.seek(self._offsets[index])
+            timestamp, size = _SPILL_HEADER.unpack(self._spill.read(_SPILL_HEADER.size))
+            text = self._spill.read(size).decode("utf-8")
+        finally:
+            self._spill.seek(end)
+        return self._message(text, timestamp)
+
+    def _iter_spilled(self) -> Iterator["OutputMessage"]:
+        # Lines spilled after iteration starts are not visited.
+        remaining = len(self._offsets)
+        offset = 0
+        pending = b""
+        while remaining and self._spill is not None:
+            end = self._spill.tell()
+            try:
+                self._spill.seek(offset)
+                block = self._spill.read(min(_SPILL_READ_SIZE, end - offset))
+            finally:
+                self._spill.seek(end)
+            if not block:
+                return
+            offset += len(block)
+            pending += block
+            position = 0
+            messages = []
+            while remaining and len(pending) - position >= _SPILL_HEADER.size:
+                timestamp, size = _SPILL_HEADER.unpack_from(pending, position)
+                start = position + _SPILL_HEADER.size
+                if len(pending) - start < size:
+                    break
+                messages.append(self._message(pending[start : start + size].decode("utf-8"), timestamp))
+                position = start + size
+                remaining -= 1
+            pending = pending[position:]
+            yield from messages
+
+    def __len__(self) -> int:
+        if self.retention.mode == "spill":
+            return len(self._offsets)
+        return len(self._texts) - self._start
+
+    @overload
+    def __getitem__(self, index: int) -> "OutputMessage": ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list["OutputMessage"]: ...
+
+    def __getitem__(self, index: int | slice) -> "OutputMessage | list[OutputMessage]":
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("output log index out of range")
+        if self.retention.mode == "spill":
+            return self._read_spilled(index)
+        position = self._start + index
+        return self._message(self._texts[position], self._timestamps[position])
+
+    def __iter__(self) -> Iterator["OutputMessage"]:
+        if self.retention.mode == "spill":
+            return self._iter_spilled()
+        return (
+            self._message(self._texts[i], self._timestamps[i])
+            for i in range(self._start, len(self._texts))
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, OutputLog | list | tuple):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"OutputLog(mode={self.retention.mode!r}, lines={len(self)}, dropped={self.dropped})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        messages_schema = handler.generate_schema(list[OutputMessage])
+        from_messages = core_schema.no_info_after_validator_function(
+            lambda messages: cls(messages=messages), messages_schema
+        )
+        return core_schema.json_or_python_schema(
+            json_schema=from_messages,
+            python_schema=core_schema.union_schema(
+                [core_schema.is_instance_schema(cls), from_messages]
+            ),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                list, return_schema=messages_schema
+            ),
+        )
+
+
 class ExecutionLogs(BaseModel):
     """
     Container for execution output logs.
 
     Separates standard output and error output streams for better organization
     and allows users to process different types of output appropriately.
+    Each stream is an :class:`OutputLog` bounded by the run's
+    :class:`OutputRetention`.
     """
 
-    stdout: list["OutputMessage"] = Field(
-        default_factory=list, description="Standard output messages"
+    stdout: OutputLog = Field(
+        default_factory=OutputLog, description="Standard output messages"
     )
-    stderr: list["OutputMessage"] = Field(
-        default_factory=list, description="Standard error messages"
+    stderr: OutputLog = Field(
+        default_factory=lambda: OutputLog(is_error=True),
+        description="Standard error messages",
     )
 
+    @field_validator("stderr")
+    @classmethod
+    def _mark_stderr(cls, value: OutputLog) -> OutputLog:
+        value.is_error = True
+        return value
+
+    @classmethod
+    def with_retention(cls, retention: OutputRetention | None) -> "ExecutionLogs":
+        """Create empty logs that retain output according to ``retention``."""
+        return cls(
+            stdout=OutputLog(retention),
+            stderr=OutputLog(retention, is_error=True),
+        )
+
     def add_stdout(self, message: OutputMessage) -> None:
         """Add a message to standard output log."""
         self.stdout.append(message)
@@ -108,6 +411,11 @@ class ExecutionLogs(BaseModel):
         """Add a message to standard error log."""
         self.stderr.append(message)
 
+    def close(self) -> None:
+        """Release spill files of both streams."""
+        self.stdout.close()
+        self.stderr.close()
+
 
 class ExecutionComplete(BaseModel):
     """
@@ -168,6 +476,45 @@ class Execution(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+class CommandStatus(BaseModel):
+    """
+    Status of a command started through execd.
+    """
+
+    id: str = Field(description="Command identifier")
+    content: str | None = Field(default=None, description="Command text")
+    running: bool = Field(description="Whether the command is still running")
+    exit_code: int | None = Field(
+        default=None, description="Exit code once the command has finished"
+    )
+    error: str | None = Field(default=None, description="Error message if the command failed")
+    started_at: datetime | None = Field(default=None, description="Start time")
+    finished_at: datetime | None = Field(
+        default=None, description="Finish time (None while running)"
+    )
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class CommandLogs(BaseModel):
+    """
+    Output of a background command read from a cursor.
+    """
+
+    content: bytes = Field(description="Combined stdout/stderr bytes after the requested cursor")
+    cursor: int = Field(description="Cursor to pass to the next read for incremental output")
+
+    @property
+    def text(self) -> str:
+        """Content decoded as UTF-8."""
+        return self.content.decode("utf-8", errors="replace")
+
+
+# Events yielded by ``commands.stream()``
+ExecutionEvent = (
+    ExecutionInit | OutputMessage | ExecutionResult | ExecutionError | ExecutionComplete
+)
+
 # Type aliases for async handlers
 AsyncOutputHandler = Callable[[Any], Awaitable[None]]
 
@@ -191,6 +538,12 @@ class ExecutionHandlers(BaseModel):
             on_stderr=lambda msg: print(f"Error: {msg.text}"),
         )
         ```
+
+    Batch handlers receive ``list[OutputMessage]`` and are called once a batch
+    reaches ``batch_max_messages`` messages or ``batch_max_bytes`` bytes of
+    text, ``batch_max_delay`` after its first message, before any result,
+    error or completion event, and when the stream ends. They can be combined
+    with the per-message handlers.
     """
 
     on_stdout: AsyncOutputHandler | None = Field(
@@ -213,6 +566,24 @@ class ExecutionHandlers(BaseModel):
     on_init: AsyncOutputHandler | None = Field(
         default=None, description="Async handler for execution init"
     )
+    on_stdout_batch: AsyncOutputHandler | None = Field(
+        default=None,
+        description="Async handler receiving stdout messages in batches (list[OutputMessage])",
+    )
+    on_stderr_batch: AsyncOutputHandler | None = Field(
+        default=None,
+        description="Async handler receiving stderr messages in batches (list[OutputMessage])",
+    )
+    batch_max_messages: int = Field(
+        default=256, ge=1, description="Deliver a batch once it holds this many messages"
+    )
+    batch_max_bytes: int = Field(
+        default=64 * 1024, ge=1, description="Deliver a batch once its text reaches this many bytes"
+    )
+    batch_max_delay: timedelta = Field(
+        default=timedelta(milliseconds=200),
+        description="Deliver a batch at most this long after its first message",
+    )
 
     model_config = ConfigDict(populate_by_name=True, arbitrary_types_allowed=True)
 
@@ -229,5 +600,9 @@ class RunCommandOpts(BaseModel):
         description="Directory to execute command in",
         alias="working_directory",
     )
+    output_retention: OutputRetention | None = Field(
+        default=None,
+        description="How much stdout/stderr the returned Execution keeps (all if None)",
+    )
 
     model_config = ConfigDict(populate_by_name=True, arbitrary_types_allowed=True)
@@ -21,6 +21,7 @@ Core data models (Execution, OutputMessage, etc.) are reused from the async modu
 """
 
 from collections.abc import Callable
+from datetime import timedelta
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -39,5 +40,11 @@ class ExecutionHandlersSync(BaseModel):
     on_execution_complete: SyncOutputHandler | None = Field(default=None, alias="on_execution_complete")
     on_error: SyncOutputHandler | None = Field(default=None)
     on_init: SyncOutputHandler | None = Field(default=None)
+    on_stdout_batch: SyncOutputHandler | None = Field(default=None)
+    on_stderr_batch: SyncOutputHandler | None = Field(default=None)
+    batch_max_messages: int = Field(default=256, ge=1)
+    batch_max_bytes: int = Field(default=64 * 1024, ge=1)
+    # Checked when the next event arrives; there is no background timer.
+    batch_max_delay: timedelta = Field(default=timedelta(milliseconds=200))
 
     model_config = ConfigDict(populate_by_name=True, arbitrary_types_allowed=True)
@@ -19,7 +19,7 @@ Sandbox-related data models.
 Models for sandbox creation, configuration, status, and lifecycle management.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
@@ -295,6 +295,22 @@ class SandboxMetrics(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+class SandboxReadiness(BaseModel):
+    """
+    Outcome of one wait for a sandbox to become ready.
+
+    Passed to ``ConnectionConfig.readiness_hook`` after every readiness wait.
+    """
+
+    sandbox_id: str = Field(description="Sandbox that was waited for")
+    ready: bool = Field(description="Whether the sandbox became ready before the timeout")
+    latency: timedelta = Field(description="Time from the start of the wait until it ended")
+    probes: int = Field(description="Health probes sent to the sandbox")
+    server_waits: int = Field(
+        default=0, description="Long-poll requests made to the server's wait API"
+    )
+
+
 class SandboxState:
     """High-level lifecycle state of the sandbox.
 
@@ -0,0 +1,455 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Client-side pool of ready sandboxes.
+
+``Sandbox.create`` pays for the create call, the endpoint lookup and readiness
+polling before the first command can run. A ``SandboxPool`` keeps ``size``
+sandboxes of one configuration ready in the background, so ``acquire()``
+returns one without any network round trip while the pool is warm.
+"""
+
+import asyncio
+import logging
+import time
+import weakref
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Literal
+
+from opensandbox.config import ConnectionConfig
+from opensandbox.exceptions import InvalidArgumentException, SandboxException
+from opensandbox.models.sandboxes import SandboxImageSpec
+from opensandbox.sandbox import Sandbox
+
+logger = logging.getLogger(__name__)
+
+ReleaseMode = Literal["discard", "reset"]
+
+
+@dataclass(frozen=True)
+class SandboxPoolStats:
+    """Point-in-time counters of a sandbox pool."""
+
+    size: int
+    """Target number of ready sandboxes."""
+    idle: int
+    """Ready sandboxes waiting in the pool."""
+    in_use: int
+    """Sandboxes handed out and not yet released."""
+    hits: int
+    """Acquires served from the pool."""
+    misses: int
+    """Acquires that had to create a sandbox on demand."""
+    refills: int
+    """Sandboxes created in the background."""
+    refill_failures: int
+    """Background creates that failed."""
+    renewals: int
+    """Idle sandboxes renewed before expiring."""
+    evictions: int
+    """Idle sandboxes killed for exceeding the maximum idle time or failing renewal."""
+    refill_latency_avg: float
+    """Mean seconds for a background create to return a ready sandbox."""
+    refill_latency_max: float
+    """Slowest background create, in seconds."""
+
+
+class _PoolMember:
+    __slots__ = ("sandbox", "idle_since", "expires_at")
+
+    def __init__(self, sandbox: Any, lifetime: float) -> None:
+        self.sandbox = sandbox
+        now = time.monotonic()
+        self.idle_since = now
+        self.expires_at = now + lifetime
+
+
+class _PoolCounters:
+    """Counters shared by the async and sync pools."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.refills = 0
+        self.refill_failures = 0
+        self.renewals = 0
+        self.evictions = 0
+        self.refill_latency_total = 0.0
+        self.refill_latency_max = 0.0
+
+    def record_refill(self, seconds: float) -> None:
+        self.refills += 1
+        self.refill_latency_total += seconds
+        self.refill_latency_max = max(self.refill_latency_max, seconds)
+
+    def snapshot(self, size: int, idle: int, in_use: int) -> SandboxPoolStats:
+        return SandboxPoolStats(
+            size=size,
+            idle=idle,
+            in_use=in_use,
+            hits=self.hits,
+            misses=self.misses,
+            refills=self.refills,
+            refill_failures=self.refill_failures,
+            renewals=self.renewals,
+            evictions=self.evictions,
+            refill_latency_avg=self.refill_latency_total / self.refills if self.refills else 0.0,
+            refill_latency_max=self.refill_latency_max,
+        )
+
+
+def _validate_pool_options(
+    size: int,
+    max_concurrency: int,
+    release_mode: str,
+    reset: object,
+    timeout: timedelta,
+    renew_before: timedelta,
+) -> None:
+    if size < 0:
+        raise InvalidArgumentException(f"Pool size must be non-negative, got: {size}")
+    if max_concurrency < 1:
+        raise InvalidArgumentException(f"max_concurrency must be at least 1, got: {max_concurrency}")
+    if release_mode not in ("discard", "reset"):
+        raise InvalidArgumentException(f"release_mode must be 'discard' or 'reset', got: {release_mode!r}")
+    if release_mode == "reset" and reset is None:
+        raise InvalidArgumentException("release_mode='reset' requires a reset callback")
+    if renew_before >= timeout:
+        raise InvalidArgumentException("renew_before must be shorter than the sandbox timeout")
+
+
+class SandboxPool:
+    """
+    Keeps a fixed number of ready sandboxes for one image and configuration.
+
+    - ``acquire()`` pops a ready sandbox in O(1); when the pool is empty it
+      creates one on demand (a miss) instead of waiting for a refill.
+    - Refills run in the background with at most ``max_concurrency`` creates
+      in flight.
+    - Idle sandboxes are renewed ``renew_before`` their expiry and killed once
+      idle for longer than ``max_idle``; both are replaced by refills.
+    - ``release()`` kills the sandbox (``release_mode="discard"``) or runs the
+      ``reset`` callback and returns it to the pool (``"reset"``). Releasing is
+      optional: a sandbox that is never released simply expires.
+
+    All members share one HTTP transport owned by the pool.
+
+    Usage Example:
+
+    ```python
+    async with SandboxPool("python:3.11", size=4) as pool:
+        async with pool.sandbox() as sandbox:
+            result = await sandbox.commands.run("python -V")
+    ```
+    """
+
+    def __init__(
+        self,
+        image: SandboxImageSpec | str,
+        *,
+        size: int,
+        max_concurrency: int = 4,
+        timeout: timedelta = timedelta(minutes=10),
+        renew_before: timedelta = timedelta(minutes=2),
+        max_idle: timedelta = timedelta(minutes=30),
+        release_mode: ReleaseMode = "discard",
+        reset: Callable[[Sandbox], Awaitable[None]] | None = None,
+        maintenance_interval: timedelta = timedelta(seconds=5),
+        connection_config: ConnectionConfig | None = None,
+        **create_options: Any,
+    ) -> None:
+        """
+        Configure a pool. Call :meth:`start` (or use ``async with``) to begin filling it.
+
+        Args:
+            image: Image of every pooled sandbox
+            size: Number of ready sandboxes to keep
+            max_concurrency: Maximum background creates in flight
+            timeout: Sandbox lifetime, also used when renewing idle members
+            renew_before: Renew idle members this long before they expire
+            max_idle: Kill idle members after this long and replace them
+            release_mode: ``"discard"`` kills released sandboxes, ``"reset"`` reuses them
+            reset: Async callback that restores a released sandbox; required for ``"reset"``.
+                If it raises, the sandbox is discarded.
+            maintenance_interval: Interval of the renew/evict/refill loop
+            connection_config: Connection configuration shared by all members
+            **create_options: Further keyword arguments for :meth:`Sandbox.create`
+                (``env``, ``resource``, ``entrypoint``, ``extensions``, ...)
+
+        Raises:
+            InvalidArgumentException: if the options are inconsistent
+        """
+        _validate_pool_options(size, max_concurrency, release_mode, reset, timeout, renew_before)
+        self.size = size
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.renew_before = renew_before
+        self.max_idle = max_idle
+        self.release_mode = release_mode
+        self.maintenance_interval = maintenance_interval
+        self._image = image
+        self._reset = reset
+        self._create_options = create_options
+        self._config = (connection_config or ConnectionConfig()).with_transport_if_missing()
+        # Members must never close the shared transport, including on a failed create.
+        self._member_config = self._config.model_copy()
+        self._member_config._owns_transport = False
+
+        self._idle: deque[_PoolMember] = deque()
+        self._in_use: weakref.WeakKeyDictionary[Sandbox, _PoolMember] = weakref.WeakKeyDictionary()
+        self._pending = 0
+        self._counters = _PoolCounters()
+        self._semaphore: asyncio.Semaphore | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._maintenance_task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    @property
+    def stats(self) -> SandboxPoolStats:
+        """Current pool counters."""
+        return self._counters.snapshot(self.size, len(self._idle), len(self._in_use))
+
+    @property
+    def connection_config(self) -> ConnectionConfig:
+        """Connection configuration shared by the pool members."""
+        return self._config
+
+    async def start(self, *, wait_ready: bool = False) -> "SandboxPool":
+        """
+        Start filling the pool and the maintenance loop.
+
+        Args:
+            wait_ready: Wait until the first round of refills has finished
+
+        Returns:
+            The pool itself
+        """
+        self._ensure_open()
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if self._maintenance_task is None:
+            self._maintenance_task = asyncio.create_task(self._maintain_forever())
+        self._schedule_refills()
+        if wait_ready and self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        return self
+
+    async def acquire(self) -> Sandbox:
+        """
+        Take a ready sandbox from the pool, creating one if the pool is empty.
+
+        Returns:
+            A ready Sandbox owned by the caller until released
+
+        Raises:
+            SandboxException: if the pool is closed or an on-demand create fails
+        """
+        self._ensure_open()
+        now = time.monotonic()
+        while self._idle:
+            member = self._idle.popleft()
+            if member.expires_at - now <= 0:
+                self._spawn(self._kill(member.sandbox))
+                continue
+            self._counters.hits += 1
+            self._in_use[member.sandbox] = member
+            self._schedule_refills()
+            return member.sandbox
+
+        self._counters.misses += 1
+        self._schedule_refills()
+        sandbox = await self._create()
+        self._in_use[sandbox] = _PoolMember(sandbox, self.timeout.total_seconds())
+        return sandbox
+
+    async def release(self, sandbox: Sandbox, *, discard: bool = False) -> None:
+        """
+        Return an acquired sandbox.
+
+        Args:
+            sandbox: Sandbox obtained from :meth:`acquire`
+            discard: Kill the sandbox even in ``"reset"`` mode (e.g. after an error)
+        """
+        member = self._in_use.pop(sandbox, None)
+        reuse = (
+            member is not None
+            and not discard
+            and not self._closed
+            and self.release_mode == "reset"
+            and len(self._idle) < self.size
+        )
+        if reuse:
+            assert self._reset is not None and member is not None
+            try:
+                await self._reset(sandbox)
+            except Exception as e:
+                logger.warning("Resetting pooled sandbox %s failed, discarding it: %s", sandbox.id, e)
+                reuse = False
+        if not reuse:
+            await self._kill(sandbox)
+            if not self._closed:
+                self._schedule_refills()
+            return
+        member.idle_since = time.monotonic()
+        self._idle.append(member)
+
+    @asynccontextmanager
+    async def sandbox(self) -> AsyncIterator[Sandbox]:
+        """Acquire a sandbox for the block; it is released afterwards and discarded if the block raised."""
+        sandbox = await self.acquire()
+        try:
+            yield sandbox
+        except BaseException:
+            await self.release(sandbox, discard=True)
+            raise
+        await self.release(sandbox)
+
+    async def maintain(self) -> None:
+        """
+        Run one maintenance pass: evict members idle longer than ``max_idle``,
+        renew members close to expiry and schedule refills.
+
+        The background loop calls this every ``maintenance_interval``.
+        """
+        now = time.monotonic()
+        max_idle = self.max_idle.total_seconds()
+        renew_window = self.renew_before.total_seconds()
+        evicted = [m for m in self._idle if now - m.idle_since >= max_idle or m.expires_at <= now]
+        for member in evicted:
+            self._idle.remove(member)
+        expiring = [m for m in self._idle if m.expires_at - now <= renew_window]
+
+        self._counters.evictions += len(evicted)
+        await asyncio.gather(
+            *(self._kill(m.sandbox) for m in evicted),
+            *(self._renew(m) for m in expiring),
+        )
+        self._schedule_refills()
+
+    async def close(self) -> None:
+        """
+        Stop the pool, kill its idle sandboxes and close the shared transport.
+
+        Sandboxes that are still acquired are not killed, but can no longer make
+        requests once the transport is closed; release them first.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        tasks = list(self._tasks)
+        if self._maintenance_task is not None:
+            tasks.append(self._maintenance_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        idle = list(self._idle)
+        self._idle.clear()
+        await asyncio.gather(*(self._kill(m.sandbox) for m in idle))
+        await self._config.close_transport_if_owned()
+
+    async def _create(self) -> Sandbox:
+        return await Sandbox.create(
+            self._image,
+            timeout=self.timeout,
+            connection_config=self._member_config,
+            **self._create_options,
+        )
+
+    def _schedule_refills(self) -> None:
+        if self._semaphore is None:
+            return
+        for _ in range(self.size - len(self._idle) - self._pending):
+            self._pending += 1
+            self._spawn(self._refill_one())
+
+    def _spawn(self, coro: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refill_one(self) -> None:
+        assert self._semaphore is not None
+        try:
+            async with self._semaphore:
+                started = time.monotonic()
+                try:
+                    sandbox = await self._create()
+                except Exception as e:
+                    # Retried by the next maintenance pass.
+                    self._counters.refill_failures += 1
+                    logger.warning("Failed to refill sandbox pool: %s", e)
+                    return
+                if self._closed:
+                    await self._kill(sandbox)
+                    return
+                self._counters.record_refill(time.monotonic() - started)
+                self._idle.append(_PoolMember(sandbox, self.timeout.total_seconds()))
+        finally:
+            self._pending -= 1
+
+    async def _renew(self, member: _PoolMember) -> None:
+        try:
+            await member.sandbox.renew(self.timeout)
+        except Exception as e:
+            logger.warning("Failed to renew pooled sandbox %s, evicting it: %s", member.sandbox.id, e)
+            if member in self._idle:
+                self._idle.remove(member)
+                self._counters.evictions += 1
+                await self._kill(member.sandbox)
+            return
+        member.expires_at = time.monotonic() + self.timeout.total_seconds()
+        self._counters.renewals += 1
+
+    async def _kill(self, sandbox: Sandbox) -> None:
+        try:
+            await sandbox.kill()
+        except SandboxException as e:
+            logger.warning("Failed to kill pooled sandbox %s: %s", sandbox.id, e)
+        except Exception as e:
+            logger.warning("Unexpected error killing pooled sandbox %s: %s", sandbox.id, e)
+
+    async def _maintain_forever(self) -> None:
+        interval = self.maintenance_interval.total_seconds()
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.maintain()
+            except Exception as e:
+                logger.warning("Sandbox pool maintenance failed: %s", e)
+
+    def _ensure_open(self) -> None:
+        if self._closed:
+            raise SandboxException("Sandbox pool is closed")
+
+    async def __aenter__(self) -> "SandboxPool":
+        """Async context manager entry; starts the pool."""
+        return await self.start()
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit; closes the pool."""
+        await self.close()
+
+
+__all__ = [
+    "ReleaseMode",
+    "SandboxPool",
+    "SandboxPoolStats",
+]
@@ -0,0 +1,116 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Adaptive readiness wait shared by ``Sandbox`` and ``SandboxSync``.
+
+Readiness used to be a ping on a fixed interval, which cost up to one interval
+of latency for sandboxes that are ready almost at once (pool-backed) and many
+pings for cold images. The wait now probes immediately, then backs off
+exponentially with jitter up to the polling interval, caps every ping at a
+short timeout, and long-polls the server's wait API while the sandbox is
+still being provisioned.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from datetime import timedelta
+
+from opensandbox.backoff import Backoff
+from opensandbox.exceptions import SandboxUnhealthyException
+from opensandbox.models.sandboxes import SandboxInfo, SandboxReadiness
+
+logger = logging.getLogger(__name__)
+
+# Delay before the second probe; later delays double up to the polling interval.
+FIRST_PROBE_INTERVAL = timedelta(milliseconds=10)
+# Upper bound of a single ping, so an unreachable endpoint costs little of the wait.
+MAX_PROBE_TIMEOUT = timedelta(seconds=2)
+# Longest wait the server accepts per long-poll request.
+MAX_SERVER_WAIT = timedelta(seconds=60)
+_MIN_PROBE_TIMEOUT = 0.05
+_TERMINAL_STATES = frozenset({"failed", "terminated"})
+
+
+class _ReadinessTracker:
+    """Deadline, backoff and counters of one readiness wait."""
+
+    __slots__ = ("sandbox_id", "started", "deadline", "probes", "server_waits", "_backoff")
+
+    def __init__(self, sandbox_id: str, timeout: timedelta, polling_interval: timedelta) -> None:
+        self.sandbox_id = sandbox_id
+        self.started = time.monotonic()
+        self.deadline = self.started + timeout.total_seconds()
+        self.probes = 0
+        self.server_waits = 0
+        self._backoff = Backoff(min(FIRST_PROBE_INTERVAL, polling_interval), polling_interval)
+
+    def remaining(self) -> float:
+        return self.deadline - time.monotonic()
+
+    def probe_timeout(self) -> timedelta:
+        seconds = min(MAX_PROBE_TIMEOUT.total_seconds(), self.remaining())
+        return timedelta(seconds=max(seconds, _MIN_PROBE_TIMEOUT))
+
+    def server_wait_timeout(self) -> timedelta | None:
+        """Timeout of the next long-poll, or None once the deadline has passed."""
+        remaining = self.remaining()
+        if remaining <= 0:
+            return None
+        return min(timedelta(seconds=remaining), MAX_SERVER_WAIT)
+
+    def next_delay(self) -> float | None:
+        """Seconds until the next probe, or None once the deadline has passed."""
+        remaining = self.remaining()
+        if remaining <= 0:
+            return None
+        return min(self._backoff.next(), remaining)
+
+    def still_provisioning(self, info: SandboxInfo | None) -> bool:
+        """
+        Interpret the result of a server-side wait.
+
+        Returns:
+            True if the sandbox is still pending and the wait should be repeated
+
+        Raises:
+            SandboxUnhealthyException: if the sandbox reached a terminal state
+        """
+        if info is None:
+            return False
+        self.server_waits += 1
+        state = info.status.state
+        if state.lower() in _TERMINAL_STATES:
+            detail = f": {info.status.message}" if info.status.message else ""
+            raise SandboxUnhealthyException(f"Sandbox {self.sandbox_id} is {state}{detail}")
+        # Probes start over quickly once the sandbox is up.
+        self._backoff.reset()
+        return state.lower() == "pending"
+
+    def report(self, hook: Callable[[SandboxReadiness], None] | None, ready: bool) -> None:
+        if hook is None:
+            return
+        readiness = SandboxReadiness(
+            sandbox_id=self.sandbox_id,
+            ready=ready,
+            latency=timedelta(seconds=time.monotonic() - self.started),
+            probes=self.probes,
+            server_waits=self.server_waits,
+        )
+        try:
+            hook(readiness)
+        except Exception as e:
+            logger.warning("Readiness hook failed for sandbox %s", self.sandbox_id, exc_info=e)
@@ -19,10 +19,9 @@ Main Sandbox client implementation.
 
 import asyncio
 import logging
-import time
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from opensandbox.adapters.factory import AdapterFactory
 from opensandbox.config import ConnectionConfig
@@ -41,6 +40,7 @@ from opensandbox.models.sandboxes import (
     SandboxMetrics,
     SandboxRenewResponse,
 )
+from opensandbox.readiness import _ReadinessTracker
 from opensandbox.services import (
     Commands,
     Filesystem,
@@ -49,6 +49,9 @@ from opensandbox.services import (
     Sandboxes,
 )
 
+if TYPE_CHECKING:
+    from opensandbox.handle import SandboxHandle
+
 logger = logging.getLogger(__name__)
 
 
@@ -105,16 +108,22 @@ class Sandbox:
     def __init__(
         self,
         sandbox_id: str,
-        sandbox_service: Sandboxes,
-        filesystem_service: Filesystem,
-        command_service: Commands,
-        health_service: Health,
-        metrics_service: Metrics,
+        sandbox_service: Sandboxes | None,
+        filesystem_service: Filesystem | None,
+        command_service: Commands | None,
+        health_service: Health | None,
+        metrics_service: Metrics | None,
         connection_config: ConnectionConfig,
         custom_health_check: Callable[["Sandbox"], Awaitable[bool]] | None = None,
+        *,
+        execd_endpoint: SandboxEndpoint | None = None,
+        adapter_factory: AdapterFactory | None = None,
     ) -> None:
         """
         Internal constructor for Sandbox. Use Sandbox.create() or Sandbox.connect() instead.
+
+        Services passed as None are built from ``execd_endpoint`` on first use,
+        so a sandbox that is only renewed or killed never creates execd clients.
         """
         self.id = sandbox_id
         self._sandbox_service = sandbox_service
@@ -124,6 +133,8 @@ class Sandbox:
         self._metrics_service = metrics_service
         self._connection_config = connection_config
         self._custom_health_check = custom_health_check
+        self._execd_endpoint = execd_endpoint
+        self._adapter_factory = adapter_factory
 
     @property
     def files(self) -> Filesystem:
@@ -132,6 +143,8 @@ class Sandbox:
 
         Allows writing, reading, listing, and deleting files and directories.
         """
+        if self._filesystem_service is None:
+            self._filesystem_service = self._factory().create_filesystem_service(self._require_execd_endpoint())
         return self._filesystem_service
 
     @property
@@ -141,6 +154,8 @@ class Sandbox:
 
         Allows running shell commands, capturing output, and managing processes.
         """
+        if self._command_service is None:
+            self._command_service = self._factory().create_command_service(self._require_execd_endpoint())
         return self._command_service
 
     @property
@@ -150,6 +165,8 @@ class Sandbox:
 
         Allows retrieving resource usage statistics (CPU, memory) and other performance metrics.
         """
+        if self._metrics_service is None:
+            self._metrics_service = self._factory().create_metrics_service(self._require_execd_endpoint())
         return self._metrics_service
 
     @property
@@ -157,6 +174,45 @@ class Sandbox:
         """Provides access to the connection configuration (including shared transport)."""
         return self._connection_config
 
+    @property
+    def _sandboxes(self) -> Sandboxes:
+        if self._sandbox_service is None:
+            self._sandbox_service = self._factory().create_sandbox_service()
+        return self._sandbox_service
+
+    @property
+    def _health(self) -> Health:
+        if self._health_service is None:
+            self._health_service = self._factory().create_health_service(self._require_execd_endpoint())
+        return self._health_service
+
+    def to_handle(self) -> "SandboxHandle":
+        """
+        Return a compact reference to this sandbox; ``to_sandbox()`` turns it back into a full one.
+
+        The handle keeps this sandbox's connection config, so its transport must
+        stay open while the handle is used (e.g. a manager's or a shared transport).
+
+        Returns:
+            Handle holding the sandbox ID, execd endpoint and connection config
+
+        Raises:
+            SandboxInternalException: if the sandbox has no known execd endpoint
+        """
+        from opensandbox.handle import SandboxHandle
+
+        return SandboxHandle(self.id, self._require_execd_endpoint().endpoint, self._connection_config)
+
+    def _factory(self) -> AdapterFactory:
+        if self._adapter_factory is None:
+            self._adapter_factory = AdapterFactory(self._connection_config)
+        return self._adapter_factory
+
+    def _require_execd_endpoint(self) -> SandboxEndpoint:
+        if self._execd_endpoint is None:
+            raise SandboxInternalException(f"Sandbox {self.id} has no execd endpoint to build services from")
+        return self._execd_endpoint
+
     async def get_info(self) -> SandboxInfo:
         """
         Get the current status of this sandbox.
@@ -167,7 +223,7 @@ class Sandbox:
         Raises:
             SandboxException: if status cannot be retrieved
         """
-        return await self._sandbox_service.get_sandbox_info(self.id)
+        return await self._sandboxes.get_sandbox_info(self.id)
 
     async def get_endpoint(self, port: int) -> SandboxEndpoint:
         """
@@ -182,7 +238,7 @@ class Sandbox:
         Raises:
             SandboxException: if endpoint cannot be retrieved
         """
-        return await self._sandbox_service.get_sandbox_endpoint(self.id, port)
+        return await self._sandboxes.get_sandbox_endpoint(self.id, port)
 
     async def get_metrics(self) -> SandboxMetrics:
         """
@@ -194,7 +250,34 @@ class Sandbox:
         Raises:
             SandboxException: if metrics cannot be retrieved
         """
-        return await self._metrics_service.get_metrics(self.id)
+        return await self.metrics.get_metrics(self.id)
+
+    def watch_metrics(
+        self,
+        *,
+        reconnect_delay: timedelta = timedelta(milliseconds=500),
+        max_reconnect_delay: timedelta = timedelta(seconds=10),
+        max_reconnect_attempts: int | None = None,
+    ) -> AsyncIterator[SandboxMetrics]:
+        """
+        Stream the resource usage metrics of this sandbox, about once a second.
+
+        See :meth:`Metrics.watch` for the reconnect behavior.
+
+        Usage Example:
+
+        ```python
+        async for sample in sandbox.watch_metrics():
+            if sample.cpu_used_percentage < 1:
+                idle_seconds += 1
+        ```
+        """
+        return self.metrics.watch(
+            self.id,
+            reconnect_delay=reconnect_delay,
+            max_reconnect_delay=max_reconnect_delay,
+            max_reconnect_attempts=max_reconnect_attempts,
+        )
 
     async def renew(self, timeout: timedelta) -> SandboxRenewResponse:
         """
@@ -216,7 +299,7 @@ class Sandbox:
         logger.info(
             f"Renewing sandbox {self.id} timeout, estimated expiration: {new_expiration}"
         )
-        return await self._sandbox_service.renew_sandbox_expiration(self.id, new_expiration)
+        return await self._sandboxes.renew_sandbox_expiration(self.id, new_expiration)
 
     async def pause(self) -> None:
         """
@@ -229,7 +312,7 @@ class Sandbox:
             SandboxException: if pause operation fails
         """
         logger.info(f"Pausing sandbox: {self.id}")
-        await self._sandbox_service.pause_sandbox(self.id)
+        await self._sandboxes.pause_sandbox(self.id)
 
 
     async def kill(self) -> None:
@@ -245,7 +328,7 @@ class Sandbox:
             SandboxException: if termination fails
         """
         logger.info(f"Killing sandbox: {self.id}")
-        await self._sandbox_service.kill_sandbox(self.id)
+        await self._sandboxes.kill_sandbox(self.id)
 
     async def close(self) -> None:
         """
@@ -282,7 +365,7 @@ class Sandbox:
     async def _ping(self) -> bool:
         """Check if the sandbox is alive."""
         try:
-            return await self._health_service.ping(self.id)
+            return await self._health.ping(self.id)
         except Exception:
             return False
 
@@ -292,46 +375,60 @@ class Sandbox:
         polling_interval: timedelta,
     ) -> None:
         """
-        Wait for the sandbox to pass health checks with polling.
+        Wait for the sandbox to pass health checks.
+
+        The first probe is sent at once and later ones after delays that grow
+        from a few milliseconds up to ``polling_interval`` (doubling, with
+        jitter), so warm sandboxes are picked up almost immediately. Each ping
+        is capped at a short timeout. If the first probe fails and the server
+        provides ``GET /sandboxes/{id}/wait``, the sandbox is long-polled there
+        while it is still Pending instead of being pinged through image pulls
+        and scheduling. The outcome is passed to
+        ``connection_config.readiness_hook``.
 
         Args:
             timeout: Maximum time to wait for health check to pass
-            polling_interval: Time between health check attempts
+            polling_interval: Upper bound of the time between health check attempts
 
         Raises:
             SandboxReadyTimeoutException: if health check doesn't pass within timeout
+            SandboxUnhealthyException: if the sandbox failed or was terminated meanwhile
             SandboxException: if health check fails
         """
         logger.info(
             f"Waiting for sandbox {self.id} to pass health check (timeout: {timeout.total_seconds()}s)"
         )
 
-        deadline = time.time() + timeout.total_seconds()
-        attempt = 0
+        tracker = _ReadinessTracker(self.id, timeout, polling_interval)
         last_exception: Exception | None = None
-
-        while time.time() < deadline:
-            attempt += 1
-            logger.debug(f"Health check attempt #{attempt} for sandbox {self.id}")
-
-            try:
-                is_healthy = await self.is_healthy()
-                if is_healthy:
-                    logger.info(
-                        f"Sandbox {self.id} passed health check after {attempt} attempts"
+        ready = False
+        try:
+            while True:
+                tracker.probes += 1
+                logger.debug(f"Health check attempt #{tracker.probes} for sandbox {self.id}")
+                try:
+                    if await self._probe(tracker.probe_timeout()):
+                        logger.info(
+                            f"Sandbox {self.id} passed health check after {tracker.probes} attempts"
+                        )
+                        ready = True
+                        return
+                    last_exception = None
+                    logger.debug(f"Health check attempt #{tracker.probes} returned false")
+                except Exception as e:
+                    last_exception = e
+                    logger.debug(
+                        f"Health check attempt #{tracker.probes} failed with exception: {e}"
                     )
-                    return
-                last_exception = None
-                logger.debug(f"Health check attempt #{attempt} returned false")
-            except Exception as e:
-                last_exception = e
-                is_healthy = False
-                logger.debug(
-                    f"Health check attempt #{attempt} failed with exception: {e}"
-                )
 
-            if not is_healthy:
-                await asyncio.sleep(polling_interval.total_seconds())
+                if tracker.probes == 1:
+                    await self._wait_while_provisioning(tracker)
+                delay = tracker.next_delay()
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
+        finally:
+            tracker.report(self._connection_config.readiness_hook, ready)
 
         error_detail = (
             f"Last error: {last_exception}"
@@ -341,12 +438,31 @@ class Sandbox:
 
         final_message = (
             f"Sandbox health check timed out after {timeout.total_seconds()}s "
-            f"({attempt} attempts). {error_detail}"
+            f"({tracker.probes} attempts). {error_detail}"
         )
 
         logger.error(final_message)
         raise SandboxReadyTimeoutException(final_message)
 
+    async def _probe(self, timeout: timedelta) -> bool:
+        if self._custom_health_check:
+            return await self._custom_health_check(self)
+        try:
+            return await self._health.ping(self.id, timeout=timeout)
+        except Exception:
+            return False
+
+    async def _wait_while_provisioning(self, tracker: _ReadinessTracker) -> None:
+        """Long-poll the server while the sandbox is Pending; no-op if the server lacks the wait API."""
+        while (wait_timeout := tracker.server_wait_timeout()) is not None:
+            try:
+                info = await self._sandboxes.wait_for_state(self.id, ["Running"], wait_timeout)
+            except Exception as e:
+                logger.debug(f"Server-side wait for sandbox {self.id} failed, probing instead: {e}")
+                return
+            if not tracker.still_provisioning(info):
+                return
+
     @classmethod
     async def create(
         cls,
@@ -381,7 +497,7 @@ class Sandbox:
             entrypoint: Command to run as entrypoint
             connection_config: Connection configuration
             health_check: Custom async health check function
-            health_check_polling_interval: Time between health check attempts
+            health_check_polling_interval: Upper bound of the time between health check attempts
             skip_health_check: If True, do NOT wait for sandbox readiness/health; returned instance may not be ready yet.
 
         Returns:
@@ -428,12 +544,14 @@ class Sandbox:
             sandbox = cls(
                 sandbox_id=response.id,
                 sandbox_service=sandbox_service,
-                filesystem_service=factory.create_filesystem_service(execd_endpoint),
-                command_service=factory.create_command_service(execd_endpoint),
-                health_service=factory.create_health_service(execd_endpoint),
-                metrics_service=factory.create_metrics_service(execd_endpoint),
+                filesystem_service=None,
+                command_service=None,
+                health_service=None,
+                metrics_service=None,
                 connection_config=config,
                 custom_health_check=health_check,
+                execd_endpoint=execd_endpoint,
+                adapter_factory=factory,
             )
 
             if not skip_health_check:
@@ -516,12 +634,14 @@ class Sandbox:
             sandbox = cls(
                 sandbox_id=sandbox_id,
                 sandbox_service=sandbox_service,
-                filesystem_service=factory.create_filesystem_service(execd_endpoint),
-                command_service=factory.create_command_service(execd_endpoint),
-                health_service=factory.create_health_service(execd_endpoint),
-                metrics_service=factory.create_metrics_service(execd_endpoint),
+                filesystem_service=None,
+                command_service=None,
+                health_service=None,
+                metrics_service=None,
                 connection_config=config,
                 custom_health_check=health_check,
+                execd_endpoint=execd_endpoint,
+                adapter_factory=factory,
             )
 
             if not skip_health_check:
@@ -587,12 +707,14 @@ class Sandbox:
             sandbox = cls(
                 sandbox_id=sandbox_id,
                 sandbox_service=sandbox_service,
-                filesystem_service=factory.create_filesystem_service(execd_endpoint),
-                command_service=factory.create_command_service(execd_endpoint),
-                health_service=factory.create_health_service(execd_endpoint),
-                metrics_service=factory.create_metrics_service(execd_endpoint),
+                filesystem_service=None,
+                command_service=None,
+                health_service=None,
+                metrics_service=None,
                 connection_config=config,
                 custom_health_check=health_check,
+                execd_endpoint=execd_endpoint,
+                adapter_factory=factory,
             )
 
             if not skip_health_check:
@@ -19,9 +19,20 @@ Command service interface.
 Protocol for sandbox command execution operations.
 """
 
-from typing import Protocol
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Protocol
 
-from opensandbox.models.execd import Execution, ExecutionHandlers, RunCommandOpts
+from opensandbox.models.execd import (
+    CommandLogs,
+    CommandStatus,
+    Execution,
+    ExecutionEvent,
+    ExecutionHandlers,
+    RunCommandOpts,
+)
+
+if TYPE_CHECKING:
+    from opensandbox.background import BackgroundCommand
 
 
 class Commands(Protocol):
@@ -59,6 +70,100 @@ class Commands(Protocol):
         """
         ...
 
+    def stream(
+        self,
+        command: str,
+        *,
+        opts: RunCommandOpts | None = None,
+        buffer_size: int = 256,
+    ) -> AsyncIterator[ExecutionEvent]:
+        """
+        Execute a shell command and iterate over its events as they arrive.
+
+        Yields ExecutionInit, OutputMessage, ExecutionResult, ExecutionError and
+        ExecutionComplete objects in stream order. At most ``buffer_size`` events
+        are read ahead; a slow consumer slows down reading instead of buffering
+        without limit. Output is not retained unless ``opts.output_retention``
+        says otherwise.
+
+        Usage Example:
+
+        ```python
+        async for event in sandbox.commands.stream("make build"):
+            if isinstance(event, OutputMessage):
+                print(event.text)
+        ```
+
+        Args:
+            command: Shell command text to execute
+            opts: Command execution options
+            buffer_size: Maximum number of events read ahead of the consumer
+
+        Returns:
+            Async iterator of execution events
+
+        Raises:
+            InvalidArgumentException: if ``buffer_size`` is less than 1
+            SandboxException: if the command cannot be run (raised during iteration)
+        """
+        ...
+
+    async def start(
+        self,
+        command: str,
+        *,
+        opts: RunCommandOpts | None = None,
+    ) -> "BackgroundCommand":
+        """
+        Start a shell command in background (detached) mode.
+
+        The call returns once execd has assigned the command an id; output is
+        then read with :meth:`BackgroundCommand.tail` or :meth:`logs` instead of
+        an SSE connection held open for the whole run.
+
+        Args:
+            command: Shell command text to execute
+            opts: Command execution options; ``background`` is always set
+
+        Returns:
+            Handle exposing status(), wait(), tail() and interrupt()
+
+        Raises:
+            SandboxException: if the operation fails
+        """
+        ...
+
+    async def status(self, execution_id: str) -> CommandStatus:
+        """
+        Get the status of a command.
+
+        Args:
+            execution_id: Unique identifier of the command
+
+        Returns:
+            Running flag, exit code, error and timestamps of the command
+
+        Raises:
+            SandboxException: if the operation fails
+        """
+        ...
+
+    async def logs(self, execution_id: str, *, cursor: int | None = None) -> CommandLogs:
+        """
+        Read the combined output of a background command.
+
+        Args:
+            execution_id: Unique identifier of the command
+            cursor: Cursor returned by a previous read; all output if None
+
+        Returns:
+            Output after ``cursor`` and the cursor for the next read
+
+        Raises:
+            SandboxException: if the operation fails
+        """
+        ...
+
     async def interrupt(self, execution_id: str) -> None:
         """
         Interrupt and terminate a running command execution.
@@ -19,6 +19,7 @@ Health service interface.
 Protocol for sandbox health monitoring operations.
 """
 
+from datetime import timedelta
 from typing import Protocol
 
 
@@ -30,12 +31,13 @@ class Health(Protocol):
     for sandbox instances.
     """
 
-    async def ping(self, sandbox_id: str) -> bool:
+    async def ping(self, sandbox_id: str, *, timeout: timedelta | None = None) -> bool:
         """
         Check if a sandbox is alive and responsive.
 
         Args:
             sandbox_id: Unique identifier of the sandbox
+            timeout: Limit for this request; the configured request timeout if None
 
         Returns:
             True if the sandbox is healthy, False otherwise
@@ -19,6 +19,8 @@ Metrics service interface.
 Protocol for sandbox metrics and monitoring operations.
 """
 
+from collections.abc import AsyncIterator
+from datetime import timedelta
 from typing import Protocol
 
 from opensandbox.models.sandboxes import SandboxMetrics
@@ -46,3 +48,33 @@ class Metrics(Protocol):
             SandboxException: if the operation fails
         """
         ...
+
+    def watch(
+        self,
+        sandbox_id: str,
+        *,
+        reconnect_delay: timedelta = timedelta(milliseconds=500),
+        max_reconnect_delay: timedelta = timedelta(milliseconds=500),
+        max_reconnect_attempts: int | None = None,
+    ) -> AsyncIterator[SandboxMetrics]:
+        """
+        Stream metrics of a sandbox as execd samples them (about once a second).
+
+        One long-lived request replaces periodic ``get_metrics`` polling. The
+        stream reconnects with exponential backoff when the connection drops
+        or execd answers with a transient error.
+
+        Args:
+            sandbox_id: Unique identifier of the sandbox
+            reconnect_delay: First delay before reconnecting
+            max_reconnect_delay: Upper bound of the reconnect delay
+            max_reconnect_attempts: Consecutive failed connections tolerated before
+                giving up; unbounded if None
+
+        Returns:
+            Async iterator of metrics samples
+
+        Raises:
+            SandboxException: on a non-transient error or when reconnect attempts are exhausted
+        """
+        ...
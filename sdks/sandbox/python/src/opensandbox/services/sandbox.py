@@ -22,6 +22,7 @@ Protocol for sandbox lifecycle management operations.
 from datetime import datetime, timedelta
 from typing import Protocol
 
+from opensandbox.exceptions import SandboxException
 from opensandbox.models.sandboxes import (
     NetworkPolicy,
     PagedSandboxInfos,
@@ -123,6 +124,47 @@ class Sandboxes(Protocol):
         """
         ...
 
+    async def get_sandbox_endpoints(
+        self, sandbox_ids: list[str], port: int
+    ) -> dict[str, SandboxEndpoint | SandboxException]:
+        """
+        Get one endpoint of several sandboxes in a single request.
+
+        Args:
+            sandbox_ids: Sandbox IDs (at most 100)
+            port: Endpoint port number
+
+        Returns:
+            Endpoint, or the error that prevented resolving it, keyed by sandbox ID
+
+        Raises:
+            SandboxApiException: if the request fails as a whole; status 404 or 405
+                means the server does not provide the batch API
+        """
+        ...
+
+    async def wait_for_state(
+        self, sandbox_id: str, states: list[str], timeout: timedelta
+    ) -> SandboxInfo | None:
+        """
+        Long-poll the server until a sandbox reaches one of the given states.
+
+        The server answers early when the sandbox enters a terminal state
+        (Failed, Terminated); check ``status.state`` of the result.
+
+        Args:
+            sandbox_id: Unique identifier of the sandbox
+            states: Lifecycle states to wait for
+            timeout: Maximum server-side wait (at most 60 seconds)
+
+        Returns:
+            Sandbox info at the end of the wait, or None if the server does not provide the wait API
+
+        Raises:
+            SandboxException: if the operation fails
+        """
+        ...
+
     async def pause_sandbox(self, sandbox_id: str) -> None:
         """
         Pause a running sandbox, preserving its state.
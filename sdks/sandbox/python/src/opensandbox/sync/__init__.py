@@ -17,7 +17,10 @@
 Synchronous OpenSandbox SDK entrypoints.
 """
 
+from opensandbox.sync.background import BackgroundCommandSync
+from opensandbox.sync.handle import SandboxHandleSync
 from opensandbox.sync.manager import SandboxManagerSync
+from opensandbox.sync.pool import SandboxPoolSync
 from opensandbox.sync.sandbox import SandboxSync
 
-__all__ = ["SandboxSync", "SandboxManagerSync"]
+__all__ = ["SandboxSync", "SandboxHandleSync", "SandboxManagerSync", "SandboxPoolSync", "BackgroundCommandSync"]
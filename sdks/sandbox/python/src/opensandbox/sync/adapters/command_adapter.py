@@ -17,27 +17,44 @@
 Synchronous command adapter implementation (including SSE streaming).
 """
 
-import json
 import logging
+from collections import deque
+from collections.abc import Iterator
 
 import httpx
 
-from opensandbox.adapters.converter.event_node import EventNode
 from opensandbox.adapters.converter.exception_converter import (
     ExceptionConverter,
 )
 from opensandbox.adapters.converter.execution_converter import (
     ExecutionConverter,
 )
-from opensandbox.adapters.converter.response_handler import handle_api_error
+from opensandbox.adapters.converter.response_handler import (
+    handle_api_error,
+    require_parsed,
+)
+from opensandbox.adapters.converter.sse import iter_stream_events
 from opensandbox.config.connection_sync import ConnectionConfigSync
-from opensandbox.exceptions import InvalidArgumentException, SandboxApiException
-from opensandbox.models.execd import Execution, RunCommandOpts
+from opensandbox.exceptions import (
+    InvalidArgumentException,
+    SandboxApiException,
+    SandboxInternalException,
+)
+from opensandbox.models.execd import (
+    CommandLogs,
+    CommandStatus,
+    Execution,
+    ExecutionEvent,
+    ExecutionLogs,
+    OutputRetention,
+    RunCommandOpts,
+)
 from opensandbox.models.execd_sync import ExecutionHandlersSync
 from opensandbox.models.sandboxes import SandboxEndpoint
 from opensandbox.sync.adapters.converter.execution_event_dispatcher import (
     ExecutionEventDispatcherSync,
 )
+from opensandbox.sync.background import BackgroundCommandSync
 from opensandbox.sync.services.command import CommandsSync
 
 logger = logging.getLogger(__name__)
@@ -115,39 +132,125 @@ class CommandsAdapterSync(CommandsSync):
 
         try:
             opts = opts or RunCommandOpts()
-            json_body = ExecutionConverter.to_api_run_command_json(command, opts)
-            url = self._get_execd_url(self.RUN_COMMAND_PATH)
-
-            execution = Execution(id=None, execution_count=None, result=[], error=None)
+            execution = Execution(
+                id=None,
+                execution_count=None,
+                result=[],
+                error=None,
+                logs=ExecutionLogs.with_retention(opts.output_retention),
+            )
             dispatcher = ExecutionEventDispatcherSync(execution, handlers)
-
-            with self._sse_client.stream("POST", url, json=json_body) as response:
-                if response.status_code != 200:
-                    response.read()
-                    raise SandboxApiException(
-                        message=f"Failed to run command. Status code: {response.status_code}",
-                        status_code=response.status_code,
-                    )
-
-                for line in response.iter_lines():
-                    if not line or not line.strip():
-                        continue
-                    data = line
-                    if data.startswith("data:"):
-                        data = data[5:].strip()
-                    try:
-                        event_dict = json.loads(data)
-                        event_node = EventNode(**event_dict)
-                        dispatcher.dispatch(event_node)
-                    except Exception as e:
-                        logger.error("Failed to parse SSE line: %s", line, exc_info=e)
-
+            for _ in self._dispatch_stream(command, opts, dispatcher):
+                pass
             return execution
 
         except Exception as e:
             logger.error("Failed to run command (length: %s)", len(command), exc_info=e)
             raise ExceptionConverter.to_sandbox_exception(e) from e
 
+    def stream(
+        self,
+        command: str,
+        *,
+        opts: RunCommandOpts | None = None,
+    ) -> Iterator[ExecutionEvent]:
+        if not command.strip():
+            raise InvalidArgumentException("Command cannot be empty")
+
+        opts = opts or RunCommandOpts()
+        pending: deque[ExecutionEvent] = deque()
+        handlers = ExecutionHandlersSync(
+            on_init=pending.append,
+            on_stdout=pending.append,
+            on_stderr=pending.append,
+            on_result=pending.append,
+            on_error=pending.append,
+            on_execution_complete=pending.append,
+        )
+        execution = Execution(
+            logs=ExecutionLogs.with_retention(opts.output_retention or OutputRetention(mode="none"))
+        )
+        dispatcher = ExecutionEventDispatcherSync(execution, handlers)
+        try:
+            for _ in self._dispatch_stream(command, opts, dispatcher):
+                while pending:
+                    yield pending.popleft()
+        except Exception as e:
+            logger.error("Failed to stream command (length: %s)", len(command), exc_info=e)
+            raise ExceptionConverter.to_sandbox_exception(e) from e
+
+    def _dispatch_stream(
+        self, command: str, opts: RunCommandOpts, dispatcher: ExecutionEventDispatcherSync
+    ) -> Iterator[None]:
+        """POST the command and dispatch its events, yielding after each one."""
+        json_body = ExecutionConverter.to_api_run_command_json(command, opts)
+        url = self._get_execd_url(self.RUN_COMMAND_PATH)
+
+        with self._sse_client.stream("POST", url, json=json_body) as response:
+            if response.status_code != 200:
+                response.read()
+                raise SandboxApiException(
+                    message=f"Failed to run command. Status code: {response.status_code}",
+                    status_code=response.status_code,
+                )
+
+            for event in iter_stream_events(response):
+                try:
+                    dispatcher.dispatch(event)
+                except Exception as e:
+                    logger.error("Error processing event: %r", event, exc_info=e)
+                yield
+            try:
+                dispatcher.flush()
+            except Exception as e:
+                logger.error("Error delivering batched output", exc_info=e)
+            yield
+
+    def start(
+        self,
+        command: str,
+        *,
+        opts: RunCommandOpts | None = None,
+    ) -> BackgroundCommandSync:
+        opts = (opts or RunCommandOpts()).model_copy(
+            update={"background": True, "output_retention": OutputRetention(mode="none")}
+        )
+        execution = self.run(command, opts=opts)
+        if not execution.id:
+            raise SandboxInternalException("execd did not return an id for the background command")
+        return BackgroundCommandSync(execution.id, self, command)
+
+    def status(self, execution_id: str) -> CommandStatus:
+        try:
+            from opensandbox.api.execd.api.command import get_command_status
+            from opensandbox.api.execd.models import CommandStatusResponse
+
+            response_obj = get_command_status.sync_detailed(client=self._client, id=execution_id)
+            handle_api_error(response_obj, "Get command status")
+            parsed = require_parsed(response_obj, CommandStatusResponse, "Get command status")
+            return ExecutionConverter.to_command_status(parsed, execution_id)
+        except Exception as e:
+            logger.error("Failed to get command status", exc_info=e)
+            raise ExceptionConverter.to_sandbox_exception(e) from e
+
+    def logs(self, execution_id: str, *, cursor: int | None = None) -> CommandLogs:
+        try:
+            from opensandbox.api.execd.api.command import get_background_command_logs
+            from opensandbox.api.execd.types import UNSET
+
+            response_obj = get_background_command_logs.sync_detailed(
+                client=self._client,
+                id=execution_id,
+                cursor=UNSET if cursor is None else cursor,
+            )
+            handle_api_error(response_obj, "Get command logs")
+            return ExecutionConverter.to_command_logs(
+                response_obj.content, response_obj.headers, cursor
+            )
+        except Exception as e:
+            logger.error("Failed to get command logs", exc_info=e)
+            raise ExceptionConverter.to_sandbox_exception(e) from e
+
     def interrupt(self, execution_id: str) -> None:
         """
         Interrupt a running command execution.
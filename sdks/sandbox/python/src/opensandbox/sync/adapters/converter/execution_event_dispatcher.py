@@ -17,7 +17,11 @@
 Synchronous dispatcher for processing execution events.
 """
 
+import time
+
 from opensandbox.adapters.converter.event_node import EventNode
+from opensandbox.adapters.converter.output_batch import OutputBatch
+from opensandbox.adapters.converter.sse import StreamEvent
 from opensandbox.models.execd import (
     Execution,
     ExecutionComplete,
@@ -37,16 +41,39 @@ class ExecutionEventDispatcherSync:
     def __init__(self, execution: Execution, handlers: ExecutionHandlersSync | None = None) -> None:
         self.execution = execution
         self.handlers = handlers
+        self._batches: dict[str, OutputBatch] = {}
+        if handlers is not None:
+            for stream, handler in (
+                ("stdout", handlers.on_stdout_batch),
+                ("stderr", handlers.on_stderr_batch),
+            ):
+                if handler is not None:
+                    self._batches[stream] = OutputBatch(
+                        handlers.batch_max_messages,
+                        handlers.batch_max_bytes,
+                        handlers.batch_max_delay.total_seconds(),
+                    )
 
-    def dispatch(self, event_node: EventNode) -> None:
+    def dispatch(self, event_node: EventNode | StreamEvent) -> None:
         event_type = event_node.type
         timestamp = event_node.timestamp
 
+        if self._batches:
+            now = time.monotonic()
+            for stream, batch in self._batches.items():
+                if batch.overdue(now):
+                    self._deliver(stream)
         if event_type == "stdout":
             self._handle_stdout(event_node, timestamp)
-        elif event_type == "stderr":
+            return
+        if event_type == "stderr":
             self._handle_stderr(event_node, timestamp)
-        elif event_type == "result":
+            return
+        if self._batches:
+            # Output handlers see everything printed before a result, error or completion.
+            self.flush()
+
+        if event_type == "result":
             self._handle_result(event_node, timestamp)
         elif event_type == "error":
             self._handle_error(event_node, timestamp)
@@ -58,33 +85,43 @@ class ExecutionEventDispatcherSync:
             if event_node.execution_count is not None:
                 self.execution.execution_count = event_node.execution_count
 
-    def _handle_init(self, event_node: EventNode, timestamp: int) -> None:
+    def _handle_init(self, event_node: EventNode | StreamEvent, timestamp: int) -> None:
         execution_id = event_node.text or ""
         init_event = ExecutionInit(id=execution_id, timestamp=timestamp)
         self.execution.id = init_event.id
         if self.handlers and self.handlers.on_init:
             self.handlers.on_init(init_event)
 
-    def _handle_stdout(self, event_node: EventNode, timestamp: int) -> None:
-        message = OutputMessage(text=event_node.text or "", timestamp=timestamp, is_error=False)
-        self.execution.logs.add_stdout(message)
-        if self.handlers and self.handlers.on_stdout:
-            self.handlers.on_stdout(message)
+    def _handle_stdout(self, event_node: EventNode | StreamEvent, timestamp: int) -> None:
+        text = event_node.text or ""
+        self.execution.logs.stdout.add(text, timestamp)
+        handlers = self.handlers
+        if handlers and (handlers.on_stdout or handlers.on_stdout_batch):
+            message = OutputMessage(text=text, timestamp=timestamp, is_error=False)
+            if handlers.on_stdout:
+                handlers.on_stdout(message)
+            if handlers.on_stdout_batch and self._batches["stdout"].add(message):
+                self._deliver("stdout")
 
-    def _handle_stderr(self, event_node: EventNode, timestamp: int) -> None:
-        message = OutputMessage(text=event_node.text or "", timestamp=timestamp, is_error=True)
-        self.execution.logs.add_stderr(message)
-        if self.handlers and self.handlers.on_stderr:
-            self.handlers.on_stderr(message)
+    def _handle_stderr(self, event_node: EventNode | StreamEvent, timestamp: int) -> None:
+        text = event_node.text or ""
+        self.execution.logs.stderr.add(text, timestamp)
+        handlers = self.handlers
+        if handlers and (handlers.on_stderr or handlers.on_stderr_batch):
+            message = OutputMessage(text=text, timestamp=timestamp, is_error=True)
+            if handlers.on_stderr:
+                handlers.on_stderr(message)
+            if handlers.on_stderr_batch and self._batches["stderr"].add(message):
+                self._deliver("stderr")
 
-    def _handle_result(self, event_node: EventNode, timestamp: int) -> None:
+    def _handle_result(self, event_node: EventNode | StreamEvent, timestamp: int) -> None:
         result_text = event_node.results.get_text() if event_node.results else ""
         result = ExecutionResult(text=result_text, timestamp=timestamp)
         self.execution.add_result(result)
         if self.handlers and self.handlers.on_result:
             self.handlers.on_result(result)
 
-    def _handle_error(self, event_node: EventNode, timestamp: int) -> None:
+    def _handle_error(self, event_node: EventNode | StreamEvent, timestamp: int) -> None:
         if not event_node.error:
             return
         error_data = event_node.error
@@ -98,10 +135,28 @@ class ExecutionEventDispatcherSync:
         if self.handlers and self.handlers.on_error:
             self.handlers.on_error(error)
 
-    def _handle_execution_complete(self, event_node: EventNode, timestamp: int) -> None:
+    def _handle_execution_complete(self, event_node: EventNode | StreamEvent, timestamp: int) -> None:
         complete = ExecutionComplete(
             timestamp=timestamp,
             execution_time_in_millis=event_node.execution_time_in_millis or 0,
         )
         if self.handlers and self.handlers.on_execution_complete:
             self.handlers.on_execution_complete(complete)
+
+    def flush(self) -> None:
+        """Deliver pending output batches."""
+        for stream in self._batches:
+            self._deliver(stream)
+
+    def _deliver(self, stream: str) -> None:
+        messages = self._batches[stream].take()
+        if not messages:
+            return
+        assert self.handlers is not None
+        handler = (
+            self.handlers.on_stdout_batch
+            if stream == "stdout"
+            else self.handlers.on_stderr_batch
+        )
+        assert handler is not None
+        handler(messages)
@@ -18,6 +18,7 @@ Synchronous health service adapter implementation.
 """
 
 import logging
+from datetime import timedelta
 
 import httpx
 
@@ -30,6 +31,8 @@ logger = logging.getLogger(__name__)
 
 
 class HealthAdapterSync(HealthSync):
+    PING_PATH = "/ping"
+
     def __init__(self, connection_config: ConnectionConfigSync, execd_endpoint: SandboxEndpoint) -> None:
         self.connection_config = connection_config
         self.execd_endpoint = execd_endpoint
@@ -48,7 +51,14 @@ class HealthAdapterSync(HealthSync):
         )
         self._client.set_httpx_client(self._httpx_client)
 
-    def ping(self, sandbox_id: str) -> bool:
+    def ping(self, sandbox_id: str, *, timeout: timedelta | None = None) -> bool:
+        if timeout is not None:
+            try:
+                response = self._httpx_client.get(self.PING_PATH, timeout=timeout.total_seconds())
+                return response.status_code < 300
+            except Exception as e:
+                logger.debug("Health check failed for sandbox %s: %s", sandbox_id, e)
+                return False
         try:
             from opensandbox.api.execd.api.health import ping
 
@@ -18,6 +18,9 @@ Synchronous metrics service adapter implementation.
 """
 
 import logging
+import time
+from collections.abc import Iterator
+from datetime import timedelta
 
 import httpx
 
@@ -31,7 +34,13 @@ from opensandbox.adapters.converter.response_handler import (
     handle_api_error,
     require_parsed,
 )
+from opensandbox.adapters.metrics_adapter import (
+    DEFAULT_MAX_RECONNECT_DELAY,
+    DEFAULT_RECONNECT_DELAY,
+)
+from opensandbox.backoff import RETRYABLE_STATUS, Backoff
 from opensandbox.config.connection_sync import ConnectionConfigSync
+from opensandbox.exceptions import SandboxApiException, SandboxException
 from opensandbox.models.sandboxes import SandboxEndpoint, SandboxMetrics
 from opensandbox.sync.services.metrics import MetricsSync
 
@@ -39,13 +48,16 @@ logger = logging.getLogger(__name__)
 
 
 class MetricsAdapterSync(MetricsSync):
+    WATCH_METRICS_PATH = "/metrics/watch"
+
     def __init__(self, connection_config: ConnectionConfigSync, execd_endpoint: SandboxEndpoint) -> None:
         self.connection_config = connection_config
         self.execd_endpoint = execd_endpoint
         from opensandbox.api.execd import Client
 
         base_url = f"{self.connection_config.protocol}://{self.execd_endpoint.endpoint}"
-        timeout = httpx.Timeout(self.connection_config.request_timeout.total_seconds())
+        timeout_seconds = self.connection_config.request_timeout.total_seconds()
+        timeout = httpx.Timeout(timeout_seconds)
         headers = {"User-Agent": self.connection_config.user_agent, **self.connection_config.headers}
 
         self._client = Client(base_url=base_url, timeout=timeout)
@@ -56,6 +68,12 @@ class MetricsAdapterSync(MetricsSync):
             transport=self.connection_config.transport,
         )
         self._client.set_httpx_client(self._httpx_client)
+        self._sse_client = httpx.Client(
+            base_url=base_url,
+            headers=headers,
+            timeout=httpx.Timeout(connect=timeout_seconds, read=None, write=timeout_seconds, pool=None),
+            transport=self.connection_config.transport,
+        )
 
     def get_metrics(self, sandbox_id: str) -> SandboxMetrics:
         try:
@@ -69,3 +87,45 @@ class MetricsAdapterSync(MetricsSync):
         except Exception as e:
             logger.error("Failed to get metrics for sandbox %s", sandbox_id, exc_info=e)
             raise ExceptionConverter.to_sandbox_exception(e) from e
+
+    def watch(
+        self,
+        sandbox_id: str,
+        *,
+        reconnect_delay: timedelta = DEFAULT_RECONNECT_DELAY,
+        max_reconnect_delay: timedelta = DEFAULT_MAX_RECONNECT_DELAY,
+        max_reconnect_attempts: int | None = None,
+    ) -> Iterator[SandboxMetrics]:
+        backoff = Backoff(reconnect_delay, max_reconnect_delay)
+        failures = 0
+        while True:
+            try:
+                with self._sse_client.stream("GET", self.WATCH_METRICS_PATH) as response:
+                    if response.status_code != 200:
+                        response.read()
+                        raise SandboxApiException(
+                            message=f"Failed to watch metrics. Status code: {response.status_code}",
+                            status_code=response.status_code,
+                        )
+                    for line in response.iter_lines():
+                        metrics = MetricsModelConverter.from_watch_line(line, sandbox_id)
+                        if metrics is not None:
+                            failures = 0
+                            backoff.reset()
+                            yield metrics
+                error: Exception = SandboxException("Metrics stream ended")
+            except SandboxApiException as e:
+                if e.status_code not in RETRYABLE_STATUS:
+                    logger.error("Failed to watch metrics for sandbox %s", sandbox_id, exc_info=e)
+                    raise
+                error = e
+            except httpx.TransportError as e:
+                error = e
+
+            failures += 1
+            if max_reconnect_attempts is not None and failures > max_reconnect_attempts:
+                logger.error("Giving up watching metrics for sandbox %s", sandbox_id, exc_info=error)
+                raise ExceptionConverter.to_sandbox_exception(error) from error
+            delay = backoff.next()
+            logger.debug("Metrics stream of sandbox %s interrupted (%s), reconnecting in %.2fs", sandbox_id, error, delay)
+            time.sleep(delay)
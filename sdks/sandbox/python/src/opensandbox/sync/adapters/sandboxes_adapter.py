@@ -27,6 +27,8 @@ from opensandbox.adapters.converter.exception_converter import (
 )
 from opensandbox.adapters.converter.response_handler import (
     handle_api_error,
+    parse_batch_endpoints,
+    parse_sandbox_wait,
     require_parsed,
 )
 from opensandbox.adapters.converter.sandbox_model_converter import (
@@ -34,6 +36,7 @@ from opensandbox.adapters.converter.sandbox_model_converter import (
 )
 from opensandbox.api.lifecycle.types import UNSET
 from opensandbox.config.connection_sync import ConnectionConfigSync
+from opensandbox.exceptions import SandboxException
 from opensandbox.models.sandboxes import (
     NetworkPolicy,
     PagedSandboxInfos,
@@ -80,6 +83,8 @@ class SandboxesAdapterSync(SandboxesSync):
             transport=self.connection_config.transport,
         )
         self._client.set_httpx_client(self._httpx_client)
+        # Whether the server provides GET /sandboxes/{id}/wait; cleared on the first 404/405.
+        self._wait_supported = True
 
     def _get_client(self):
         return self._client
@@ -192,6 +197,39 @@ class SandboxesAdapterSync(SandboxesSync):
             logger.error("Failed to retrieve sandbox endpoint for sandbox %s", sandbox_id, exc_info=e)
             raise ExceptionConverter.to_sandbox_exception(e) from e
 
+    def get_sandbox_endpoints(
+        self, sandbox_ids: list[str], port: int
+    ) -> dict[str, SandboxEndpoint | SandboxException]:
+        try:
+            response = self._httpx_client.post(
+                "/sandboxes/endpoints",
+                json={"sandboxIds": sandbox_ids, "ports": [port]},
+            )
+            return parse_batch_endpoints(response, sandbox_ids, port)
+        except Exception as e:
+            logger.debug("Failed to retrieve sandbox endpoints in batch", exc_info=e)
+            raise ExceptionConverter.to_sandbox_exception(e) from e
+
+    def wait_for_state(
+        self, sandbox_id: str, states: list[str], timeout: timedelta
+    ) -> SandboxInfo | None:
+        if not self._wait_supported:
+            return None
+        try:
+            response = self._httpx_client.get(
+                f"/sandboxes/{sandbox_id}/wait",
+                params=[*(("state", state) for state in states), ("timeout", timeout.total_seconds())],
+                timeout=(self.connection_config.request_timeout + timeout).total_seconds(),
+            )
+            info = parse_sandbox_wait(response, sandbox_id)
+            if info is None:
+                logger.info("Server does not provide the sandbox wait API, probing readiness instead")
+                self._wait_supported = False
+            return info
+        except Exception as e:
+            logger.debug("Failed to wait for sandbox %s", sandbox_id, exc_info=e)
+            raise ExceptionConverter.to_sandbox_exception(e) from e
+
     def pause_sandbox(self, sandbox_id: str) -> None:
         try:
             from opensandbox.api.lifecycle.api.sandboxes import (
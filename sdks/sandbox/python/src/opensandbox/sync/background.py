@@ -0,0 +1,156 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Background commands (blocking API).
+
+Mirrors :class:`opensandbox.background.BackgroundCommand`.
+"""
+
+import time
+from collections.abc import Iterator
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from opensandbox.background import (
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_POLL_INTERVAL,
+    _LineSplitter,
+)
+from opensandbox.backoff import Backoff
+from opensandbox.exceptions import SandboxException
+from opensandbox.models.execd import CommandLogs, CommandStatus
+
+if TYPE_CHECKING:
+    from opensandbox.sync.services.command import CommandsSync
+
+
+class BackgroundCommandSync:
+    """
+    A command running detached in a sandbox (blocking API).
+
+    Usage Example:
+
+    ```python
+    job = sandbox.commands.start("python train.py")
+    for line in job.tail():
+        print(line)
+    print(job.wait().exit_code)
+    ```
+    """
+
+    __slots__ = ("id", "command", "cursor", "_commands")
+
+    def __init__(self, command_id: str, commands: "CommandsSync", command: str | None = None) -> None:
+        """
+        Args:
+            command_id: Command identifier returned by execd
+            commands: Command service of the sandbox running the command
+            command: Command text, if known
+        """
+        self.id = command_id
+        self.command = command
+        # Where tail() continues from; advanced as output is read.
+        self.cursor = 0
+        self._commands = commands
+
+    def status(self) -> CommandStatus:
+        """Get the current status of the command."""
+        return self._commands.status(self.id)
+
+    def logs(self, cursor: int | None = None) -> CommandLogs:
+        """Read output produced after ``cursor`` (all output if None)."""
+        return self._commands.logs(self.id, cursor=cursor)
+
+    def wait(
+        self,
+        *,
+        timeout: timedelta | None = None,
+        poll_interval: timedelta = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: timedelta = DEFAULT_MAX_POLL_INTERVAL,
+    ) -> CommandStatus:
+        """
+        Block until the command finishes.
+
+        Args:
+            timeout: Maximum time to wait; unbounded if None
+            poll_interval: First polling interval
+            max_poll_interval: Upper bound of the polling interval
+
+        Returns:
+            Final status of the command
+
+        Raises:
+            SandboxException: if the timeout expires or a status request fails
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout.total_seconds()
+        backoff = Backoff(poll_interval, max_poll_interval)
+        while True:
+            status = self.status()
+            if not status.running:
+                return status
+            delay = backoff.next()
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise SandboxException(
+                        f"Timed out after {timeout} waiting for command {self.id}"
+                    )
+                delay = min(delay, remaining)
+            time.sleep(delay)
+
+    def tail(
+        self,
+        *,
+        cursor: int | None = None,
+        poll_interval: timedelta = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: timedelta = DEFAULT_MAX_POLL_INTERVAL,
+    ) -> Iterator[str]:
+        """
+        Iterate over output lines until the command finishes.
+
+        See :meth:`opensandbox.background.BackgroundCommand.tail`.
+        """
+        if cursor is not None:
+            self.cursor = cursor
+        splitter = _LineSplitter()
+        backoff = Backoff(poll_interval, max_poll_interval)
+        finished = False
+        while True:
+            chunk = self.logs(self.cursor)
+            self.cursor = chunk.cursor
+            yield from splitter.feed(chunk.content)
+            if finished:
+                break
+            if chunk.content:
+                backoff.reset()
+            elif not self.status().running:
+                # Output written before the command exited is picked up by one last read.
+                finished = True
+                continue
+            time.sleep(backoff.next())
+        yield from splitter.flush()
+
+    def interrupt(self) -> None:
+        """Interrupt the command."""
+        self._commands.interrupt(self.id)
+
+    def __repr__(self) -> str:
+        return f"BackgroundCommandSync(id={self.id!r}, command={self.command!r})"
+
+
+__all__ = [
+    "BackgroundCommandSync",
+]
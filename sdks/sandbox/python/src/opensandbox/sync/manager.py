@@ -18,21 +18,42 @@ Synchronous SandboxManager implementation.
 """
 
 import logging
+import queue
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, TypeVar
 
+from opensandbox.batch import MAX_ENDPOINT_BATCH, SandboxBatchResult
 from opensandbox.config.connection_sync import ConnectionConfigSync
+from opensandbox.constants import DEFAULT_EXECD_PORT
+from opensandbox.exceptions import InvalidArgumentException, SandboxApiException
+from opensandbox.manager import _report_watch_error, _validate_batch
 from opensandbox.models.sandboxes import (
+    NetworkPolicy,
     PagedSandboxInfos,
+    SandboxEndpoint,
     SandboxFilter,
+    SandboxImageSpec,
     SandboxInfo,
+    SandboxMetrics,
     SandboxRenewResponse,
 )
 from opensandbox.sync.adapters.factory import AdapterFactorySync
+from opensandbox.sync.sandbox import SandboxSync
 from opensandbox.sync.services.sandbox import SandboxesSync
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class SandboxManagerSync:
     """
@@ -71,6 +92,11 @@ class SandboxManagerSync:
         """
         self._sandbox_service = sandbox_service
         self._connection_config = connection_config
+        # Sandboxes created in batch share the manager's transport and must never close it.
+        self._member_config = connection_config.model_copy()
+        self._member_config._owns_transport = False
+        # Whether the server provides POST /sandboxes/endpoints; None until first used.
+        self._batch_endpoints: bool | None = None
 
     @property
     def connection_config(self) -> ConnectionConfigSync:
@@ -183,6 +209,307 @@ class SandboxManagerSync:
         logger.info("Resuming sandbox: %s", sandbox_id)
         self._sandbox_service.resume_sandbox(sandbox_id)
 
+    def create_many(
+        self,
+        image: SandboxImageSpec | str,
+        count: int,
+        *,
+        concurrency: int = 8,
+        timeout: timedelta = timedelta(minutes=10),
+        ready_timeout: timedelta = timedelta(seconds=30),
+        env: dict[str, str] | None = None,
+        metadata: dict[str, str] | None = None,
+        resource: dict[str, str] | None = None,
+        network_policy: NetworkPolicy | None = None,
+        extensions: dict[str, str] | None = None,
+        entrypoint: list[str] | None = None,
+        health_check: Callable[[SandboxSync], bool] | None = None,
+        health_check_polling_interval: timedelta = timedelta(milliseconds=200),
+        skip_health_check: bool = False,
+    ) -> Iterator[SandboxBatchResult[SandboxSync]]:
+        """
+        Create ``count`` identical sandboxes, yielding each one as soon as it is ready (blocking).
+
+        See :meth:`opensandbox.manager.SandboxManager.create_many`. Creates and
+        health checks run on a pool of ``concurrency`` threads; endpoint lookups
+        of sandboxes that finished together are batched on the calling thread.
+        Closing the iterator early (``break`` or an exception) kills created
+        sandboxes that were not yielded yet.
+
+        Args:
+            image: Container image of every sandbox
+            count: Number of sandboxes to create
+            concurrency: Maximum sandboxes being created or checked for readiness
+            timeout: Maximum sandbox lifetime
+            ready_timeout: Maximum time to wait for each sandbox to become ready
+            env: Environment variables for the sandboxes
+            metadata: Custom metadata for the sandboxes
+            resource: Resource limits (CPU, memory, etc.)
+            network_policy: Optional outbound network policy (egress)
+            extensions: Opaque extension parameters passed through to the server as-is
+            entrypoint: Command to run as entrypoint
+            health_check: Custom health check function
+            health_check_polling_interval: Time between health check attempts
+            skip_health_check: Yield sandboxes without waiting for readiness
+
+        Returns:
+            Iterator of results in completion order; ``result.index`` is the create number
+
+        Raises:
+            InvalidArgumentException: if ``count`` or ``concurrency`` is invalid
+        """
+        _validate_batch(count, concurrency)
+        if isinstance(image, str):
+            image = SandboxImageSpec(image=image)
+        # Same defaults as SandboxSync.create.
+        entrypoint = entrypoint or ["tail", "-f", "/dev/null"]
+        env = env or {}
+        metadata = metadata or {}
+        resource = resource or {"cpu": "1", "memory": "2Gi"}
+        extensions = extensions or {}
+        factory = AdapterFactorySync(self._member_config)
+
+        def create_one() -> str:
+            response = self._sandbox_service.create_sandbox(
+                image, entrypoint, env, metadata, timeout, resource, network_policy, extensions
+            )
+            return response.id
+
+        def finish(sandbox_id: str, endpoint: SandboxEndpoint) -> SandboxSync:
+            sandbox = SandboxSync(
+                sandbox_id=sandbox_id,
+                sandbox_service=self._sandbox_service,
+                filesystem_service=None,
+                command_service=None,
+                health_service=None,
+                metrics_service=None,
+                connection_config=self._member_config,
+                custom_health_check=health_check,
+                execd_endpoint=endpoint,
+                adapter_factory=factory,
+            )
+            if not skip_health_check:
+                sandbox.check_ready(ready_timeout, health_check_polling_interval)
+            return sandbox
+
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="sandbox-batch")
+        # Future -> (index, sandbox ID once created).
+        pending: dict[Future[Any], tuple[int, str | None]] = {}
+        undelivered: set[str] = set()
+        try:
+            for index in range(count):
+                pending[executor.submit(create_one)] = (index, None)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                created: list[tuple[int, str]] = []
+                for future in done:
+                    index, sandbox_id = pending.pop(future)
+                    error = future.exception()
+                    if sandbox_id is None and error is None:
+                        sandbox_id = future.result()
+                        undelivered.add(sandbox_id)
+                        created.append((index, sandbox_id))
+                    elif error is not None:
+                        if sandbox_id is not None:
+                            undelivered.discard(sandbox_id)
+                            self._kill_quietly(sandbox_id)
+                        yield SandboxBatchResult(index, sandbox_id, error=error)
+                    else:
+                        undelivered.discard(sandbox_id)
+                        yield SandboxBatchResult(index, sandbox_id, value=future.result())
+                if not created:
+                    continue
+                try:
+                    endpoints = self._resolve_execd_endpoints([sandbox_id for _, sandbox_id in created])
+                except Exception as e:
+                    endpoints = {sandbox_id: e for _, sandbox_id in created}
+                for index, sandbox_id in created:
+                    endpoint = endpoints[sandbox_id]
+                    if isinstance(endpoint, Exception):
+                        undelivered.discard(sandbox_id)
+                        self._kill_quietly(sandbox_id)
+                        yield SandboxBatchResult(index, sandbox_id, error=endpoint)
+                    else:
+                        pending[executor.submit(finish, sandbox_id, endpoint)] = (index, sandbox_id)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            for future, (_, sandbox_id) in pending.items():
+                if sandbox_id is None and not future.cancelled() and future.exception() is None:
+                    undelivered.add(future.result())
+            if undelivered:
+                logger.warning("Batch create stopped early, killing %d undelivered sandboxes", len(undelivered))
+                for sandbox_id in undelivered:
+                    self._kill_quietly(sandbox_id)
+
+    def kill_many(
+        self, sandbox_ids: list[str], *, concurrency: int = 16
+    ) -> Iterator[SandboxBatchResult[None]]:
+        """
+        Terminate several sandboxes, yielding each outcome as soon as it completes (blocking).
+
+        Args:
+            sandbox_ids: Sandbox IDs to terminate
+            concurrency: Maximum requests in flight
+
+        Returns:
+            Iterator of results in completion order; ``result.index`` is the position in ``sandbox_ids``
+
+        Raises:
+            InvalidArgumentException: if ``concurrency`` is invalid
+        """
+        _validate_batch(len(sandbox_ids), concurrency)
+        logger.info("Terminating %d sandboxes", len(sandbox_ids))
+        yield from _fan_out(sandbox_ids, self._sandbox_service.kill_sandbox, concurrency)
+
+    def renew_many(
+        self, sandbox_ids: list[str], timeout: timedelta, *, concurrency: int = 16
+    ) -> Iterator[SandboxBatchResult[SandboxRenewResponse]]:
+        """
+        Renew the expiration of several sandboxes, yielding each outcome as soon as it completes (blocking).
+
+        All sandboxes get the same new expiration time: now plus ``timeout``.
+
+        Args:
+            sandbox_ids: Sandbox IDs to renew
+            timeout: Duration to add to the current time to set the new expiration
+            concurrency: Maximum requests in flight
+
+        Returns:
+            Iterator of results in completion order; ``result.index`` is the position in ``sandbox_ids``
+
+        Raises:
+            InvalidArgumentException: if ``concurrency`` is invalid
+        """
+        _validate_batch(len(sandbox_ids), concurrency)
+        new_expiration = datetime.now(timezone.utc) + timeout
+        logger.info("Renew expiration for %d sandboxes to %s", len(sandbox_ids), new_expiration)
+        yield from _fan_out(
+            sandbox_ids,
+            lambda sandbox_id: self._sandbox_service.renew_sandbox_expiration(sandbox_id, new_expiration),
+            concurrency,
+        )
+
+    def watch_metrics(
+        self,
+        sandbox_ids: list[str],
+        *,
+        queue_size: int = 1024,
+        on_error: Callable[[str, Exception], None] | None = None,
+        reconnect_delay: timedelta = timedelta(milliseconds=500),
+        max_reconnect_delay: timedelta = timedelta(seconds=10),
+        max_reconnect_attempts: int | None = None,
+    ) -> Iterator[tuple[str, SandboxMetrics]]:
+        """
+        Watch the metrics of several sandboxes concurrently (blocking).
+
+        See :meth:`opensandbox.manager.SandboxManager.watch_metrics`. Each
+        sandbox is read by its own daemon thread; after the iterator is closed
+        the threads exit with their next sample.
+
+        Args:
+            sandbox_ids: Sandbox IDs to watch
+            queue_size: Maximum samples buffered ahead of the consumer
+            on_error: Called with the sandbox ID and error when a sandbox stops being watched
+            reconnect_delay: First delay before reconnecting a dropped stream
+            max_reconnect_delay: Upper bound of the reconnect delay
+            max_reconnect_attempts: Consecutive failed connections tolerated per sandbox;
+                unbounded if None
+
+        Returns:
+            Iterator of ``(sandbox_id, metrics)`` tuples
+
+        Raises:
+            InvalidArgumentException: if ``queue_size`` is invalid
+        """
+        if queue_size < 1:
+            raise InvalidArgumentException("queue_size must be >= 1")
+        if not sandbox_ids:
+            return
+        endpoints = self._resolve_execd_endpoints(sandbox_ids)
+        factory = AdapterFactorySync(self._member_config)
+        # A (sandbox_id, None) entry marks the end of that sandbox's stream.
+        samples: queue.Queue[tuple[str, SandboxMetrics | None]] = queue.Queue(maxsize=queue_size)
+        stop = threading.Event()
+
+        def put(entry: tuple[str, SandboxMetrics | None]) -> bool:
+            while not stop.is_set():
+                try:
+                    samples.put(entry, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def watch_one(sandbox_id: str, endpoint: SandboxEndpoint | Exception) -> None:
+            try:
+                if isinstance(endpoint, Exception):
+                    raise endpoint
+                stream = factory.create_metrics_service(endpoint).watch(
+                    sandbox_id,
+                    reconnect_delay=reconnect_delay,
+                    max_reconnect_delay=max_reconnect_delay,
+                    max_reconnect_attempts=max_reconnect_attempts,
+                )
+                try:
+                    for sample in stream:
+                        if not put((sandbox_id, sample)):
+                            return
+                finally:
+                    stream.close()
+            except Exception as e:
+                if stop.is_set():
+                    return
+                _report_watch_error(sandbox_id, e, on_error)
+            put((sandbox_id, None))
+
+        for sandbox_id, endpoint in endpoints.items():
+            threading.Thread(
+                target=watch_one,
+                args=(sandbox_id, endpoint),
+                name=f"sandbox-metrics-{sandbox_id}",
+                daemon=True,
+            ).start()
+        try:
+            live = len(endpoints)
+            while live:
+                sandbox_id, sample = samples.get()
+                if sample is None:
+                    live -= 1
+                    continue
+                yield sandbox_id, sample
+        finally:
+            stop.set()
+
+    def _resolve_execd_endpoints(self, sandbox_ids: list[str]) -> dict[str, SandboxEndpoint | Exception]:
+        if self._batch_endpoints is not False:
+            try:
+                resolved: dict[str, SandboxEndpoint | Exception] = {}
+                for start in range(0, len(sandbox_ids), MAX_ENDPOINT_BATCH):
+                    chunk = sandbox_ids[start:start + MAX_ENDPOINT_BATCH]
+                    resolved.update(self._sandbox_service.get_sandbox_endpoints(chunk, DEFAULT_EXECD_PORT))
+                self._batch_endpoints = True
+                return resolved
+            except SandboxApiException as e:
+                if e.status_code in (404, 405):
+                    logger.info("Server does not provide batch endpoint lookup, resolving one by one")
+                    self._batch_endpoints = False
+                else:
+                    logger.warning("Batch endpoint lookup failed, resolving one by one: %s", e)
+
+        endpoints: dict[str, SandboxEndpoint | Exception] = {}
+        for sandbox_id in sandbox_ids:
+            try:
+                endpoints[sandbox_id] = self._sandbox_service.get_sandbox_endpoint(sandbox_id, DEFAULT_EXECD_PORT)
+            except Exception as e:
+                endpoints[sandbox_id] = e
+        return endpoints
+
+    def _kill_quietly(self, sandbox_id: str) -> None:
+        try:
+            self._sandbox_service.kill_sandbox(sandbox_id)
+        except Exception as e:
+            logger.error("Failed to clean up sandbox %s after batch create", sandbox_id, exc_info=e)
+
     def close(self) -> None:
         """
         Close local resources associated with this sandbox manager.
@@ -204,3 +531,28 @@ class SandboxManagerSync:
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Sync context manager exit."""
         self.close()
+
+
+def _fan_out(
+    sandbox_ids: list[str],
+    operation: Callable[[str], T],
+    concurrency: int,
+) -> Iterator[SandboxBatchResult[T]]:
+    if not sandbox_ids:
+        return
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="sandbox-batch") as executor:
+        futures = {
+            executor.submit(operation, sandbox_id): (index, sandbox_id)
+            for index, sandbox_id in enumerate(sandbox_ids)
+        }
+        try:
+            for future in as_completed(futures):
+                index, sandbox_id = futures[future]
+                error = future.exception()
+                if error is not None:
+                    yield SandboxBatchResult(index, sandbox_id, error=error)
+                else:
+                    yield SandboxBatchResult(index, sandbox_id, value=future.result())
+        finally:
+            for future in futures:
+                future.cancel()
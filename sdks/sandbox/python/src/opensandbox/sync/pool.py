@@ -0,0 +1,385 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Synchronous client-side pool of ready sandboxes.
+
+Mirrors :class:`opensandbox.pool.SandboxPool`; refills run on a bounded
+thread pool and maintenance on a daemon thread.
+"""
+
+import logging
+import threading
+import time
+import weakref
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Any
+
+from opensandbox.config.connection_sync import ConnectionConfigSync
+from opensandbox.exceptions import SandboxException
+from opensandbox.models.sandboxes import SandboxImageSpec
+from opensandbox.pool import (
+    ReleaseMode,
+    SandboxPoolStats,
+    _PoolCounters,
+    _PoolMember,
+    _validate_pool_options,
+)
+from opensandbox.sync.sandbox import SandboxSync
+
+logger = logging.getLogger(__name__)
+
+
+class SandboxPoolSync:
+    """
+    Keeps a fixed number of ready sandboxes for one image and configuration (blocking API).
+
+    See :class:`opensandbox.pool.SandboxPool` for the pooling rules.
+
+    Usage Example:
+
+    ```python
+    with SandboxPoolSync("python:3.11", size=4) as pool:
+        with pool.sandbox() as sandbox:
+            result = sandbox.commands.run("python -V")
+    ```
+    """
+
+    def __init__(
+        self,
+        image: SandboxImageSpec | str,
+        *,
+        size: int,
+        max_concurrency: int = 4,
+        timeout: timedelta = timedelta(minutes=10),
+        renew_before: timedelta = timedelta(minutes=2),
+        max_idle: timedelta = timedelta(minutes=30),
+        release_mode: ReleaseMode = "discard",
+        reset: Callable[[SandboxSync], None] | None = None,
+        maintenance_interval: timedelta = timedelta(seconds=5),
+        connection_config: ConnectionConfigSync | None = None,
+        **create_options: Any,
+    ) -> None:
+        """
+        Configure a pool. Call :meth:`start` (or use ``with``) to begin filling it.
+
+        Args:
+            image: Image of every pooled sandbox
+            size: Number of ready sandboxes to keep
+            max_concurrency: Maximum background creates in flight
+            timeout: Sandbox lifetime, also used when renewing idle members
+            renew_before: Renew idle members this long before they expire
+            max_idle: Kill idle members after this long and replace them
+            release_mode: ``"discard"`` kills released sandboxes, ``"reset"`` reuses them
+            reset: Callback that restores a released sandbox; required for ``"reset"``.
+                If it raises, the sandbox is discarded.
+            maintenance_interval: Interval of the renew/evict/refill loop
+            connection_config: Connection configuration shared by all members
+            **create_options: Further keyword arguments for :meth:`SandboxSync.create`
+
+        Raises:
+            InvalidArgumentException: if the options are inconsistent
+        """
+        _validate_pool_options(size, max_concurrency, release_mode, reset, timeout, renew_before)
+        self.size = size
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.renew_before = renew_before
+        self.max_idle = max_idle
+        self.release_mode = release_mode
+        self.maintenance_interval = maintenance_interval
+        self._image = image
+        self._reset = reset
+        self._create_options = create_options
+        self._config = (connection_config or ConnectionConfigSync()).with_transport_if_missing()
+        # Members must never close the shared transport, including on a failed create.
+        self._member_config = self._config.model_copy()
+        self._member_config._owns_transport = False
+
+        self._lock = threading.Lock()
+        self._idle: deque[_PoolMember] = deque()
+        self._in_use: weakref.WeakKeyDictionary[SandboxSync, _PoolMember] = weakref.WeakKeyDictionary()
+        self._pending = 0
+        self._counters = _PoolCounters()
+        self._executor: ThreadPoolExecutor | None = None
+        self._futures: set[Future[None]] = set()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    @property
+    def stats(self) -> SandboxPoolStats:
+        """Current pool counters."""
+        with self._lock:
+            return self._counters.snapshot(self.size, len(self._idle), len(self._in_use))
+
+    @property
+    def connection_config(self) -> ConnectionConfigSync:
+        """Connection configuration shared by the pool members."""
+        return self._config
+
+    def start(self, *, wait_ready: bool = False) -> "SandboxPoolSync":
+        """
+        Start filling the pool and the maintenance thread.
+
+        Args:
+            wait_ready: Block until the first round of refills has finished
+
+        Returns:
+            The pool itself
+        """
+        self._ensure_open()
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency, thread_name_prefix="sandbox-pool-refill"
+                )
+                self._thread = threading.Thread(
+                    target=self._maintain_forever, name="sandbox-pool-maintenance", daemon=True
+                )
+                self._thread.start()
+        self._schedule_refills()
+        if wait_ready:
+            with self._lock:
+                futures = list(self._futures)
+            wait(futures)
+        return self
+
+    def acquire(self) -> SandboxSync:
+        """
+        Take a ready sandbox from the pool, creating one if the pool is empty.
+
+        Returns:
+            A ready SandboxSync owned by the caller until released
+
+        Raises:
+            SandboxException: if the pool is closed or an on-demand create fails
+        """
+        self._ensure_open()
+        expired: list[_PoolMember] = []
+        member: _PoolMember | None = None
+        with self._lock:
+            now = time.monotonic()
+            while self._idle:
+                candidate = self._idle.popleft()
+                if candidate.expires_at - now <= 0:
+                    expired.append(candidate)
+                    continue
+                member = candidate
+                self._counters.hits += 1
+                self._in_use[member.sandbox] = member
+                break
+            else:
+                self._counters.misses += 1
+        self._schedule_refills()
+        for stale in expired:
+            self._kill(stale.sandbox)
+        if member is not None:
+            return member.sandbox
+
+        sandbox = self._create()
+        with self._lock:
+            self._in_use[sandbox] = _PoolMember(sandbox, self.timeout.total_seconds())
+        return sandbox
+
+    def release(self, sandbox: SandboxSync, *, discard: bool = False) -> None:
+        """
+        Return an acquired sandbox.
+
+        Args:
+            sandbox: Sandbox obtained from :meth:`acquire`
+            discard: Kill the sandbox even in ``"reset"`` mode (e.g. after an error)
+        """
+        with self._lock:
+            member = self._in_use.pop(sandbox, None)
+            reuse = (
+                member is not None
+                and not discard
+                and not self._closed
+                and self.release_mode == "reset"
+                and len(self._idle) < self.size
+            )
+        if reuse:
+            assert self._reset is not None and member is not None
+            try:
+                self._reset(sandbox)
+            except Exception as e:
+                logger.warning("Resetting pooled sandbox %s failed, discarding it: %s", sandbox.id, e)
+                reuse = False
+        if not reuse:
+            self._kill(sandbox)
+            if not self._closed:
+                self._schedule_refills()
+            return
+        member.idle_since = time.monotonic()
+        with self._lock:
+            self._idle.append(member)
+
+    @contextmanager
+    def sandbox(self) -> Iterator[SandboxSync]:
+        """Acquire a sandbox for the block; it is released afterwards and discarded if the block raised."""
+        sandbox = self.acquire()
+        try:
+            yield sandbox
+        except BaseException:
+            self.release(sandbox, discard=True)
+            raise
+        self.release(sandbox)
+
+    def maintain(self) -> None:
+        """
+        Run one maintenance pass: evict members idle longer than ``max_idle``,
+        renew members close to expiry and schedule refills.
+
+        The maintenance thread calls this every ``maintenance_interval``.
+        """
+        max_idle = self.max_idle.total_seconds()
+        renew_window = self.renew_before.total_seconds()
+        with self._lock:
+            now = time.monotonic()
+            evicted = [m for m in self._idle if now - m.idle_since >= max_idle or m.expires_at <= now]
+            for member in evicted:
+                self._idle.remove(member)
+            expiring = [m for m in self._idle if m.expires_at - now <= renew_window]
+            self._counters.evictions += len(evicted)
+        for member in evicted:
+            self._kill(member.sandbox)
+        for member in expiring:
+            self._renew(member)
+        self._schedule_refills()
+
+    def close(self) -> None:
+        """
+        Stop the pool, kill its idle sandboxes and close the shared transport.
+
+        Sandboxes that are still acquired are not killed, but can no longer make
+        requests once the transport is closed; release them first.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._stop.set()
+        if self._executor is not None:
+            # Creates already running finish and are killed by their refill.
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        if self._thread is not None:
+            self._thread.join(timeout=self.maintenance_interval.total_seconds())
+
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+        for member in idle:
+            self._kill(member.sandbox)
+        self._config.close_transport_if_owned()
+
+    def _create(self) -> SandboxSync:
+        return SandboxSync.create(
+            self._image,
+            timeout=self.timeout,
+            connection_config=self._member_config,
+            **self._create_options,
+        )
+
+    def _schedule_refills(self) -> None:
+        with self._lock:
+            if self._executor is None or self._closed:
+                return
+            deficit = self.size - len(self._idle) - self._pending
+            for _ in range(deficit):
+                self._pending += 1
+                future = self._executor.submit(self._refill_one)
+                self._futures.add(future)
+                future.add_done_callback(self._refill_done)
+
+    def _refill_done(self, future: "Future[None]") -> None:
+        with self._lock:
+            self._futures.discard(future)
+            if future.cancelled():
+                self._pending -= 1
+
+    def _refill_one(self) -> None:
+        started = time.monotonic()
+        try:
+            sandbox = self._create()
+        except Exception as e:
+            # Retried by the next maintenance pass.
+            with self._lock:
+                self._pending -= 1
+                self._counters.refill_failures += 1
+            logger.warning("Failed to refill sandbox pool: %s", e)
+            return
+        with self._lock:
+            self._pending -= 1
+            closed = self._closed
+            if not closed:
+                self._counters.record_refill(time.monotonic() - started)
+                self._idle.append(_PoolMember(sandbox, self.timeout.total_seconds()))
+        if closed:
+            self._kill(sandbox)
+
+    def _renew(self, member: _PoolMember) -> None:
+        try:
+            member.sandbox.renew(self.timeout)
+        except Exception as e:
+            logger.warning("Failed to renew pooled sandbox %s, evicting it: %s", member.sandbox.id, e)
+            with self._lock:
+                evict = member in self._idle
+                if evict:
+                    self._idle.remove(member)
+                    self._counters.evictions += 1
+            if evict:
+                self._kill(member.sandbox)
+            return
+        with self._lock:
+            member.expires_at = time.monotonic() + self.timeout.total_seconds()
+            self._counters.renewals += 1
+
+    def _kill(self, sandbox: SandboxSync) -> None:
+        try:
+            sandbox.kill()
+        except SandboxException as e:
+            logger.warning("Failed to kill pooled sandbox %s: %s", sandbox.id, e)
+        except Exception as e:
+            logger.warning("Unexpected error killing pooled sandbox %s: %s", sandbox.id, e)
+
+    def _maintain_forever(self) -> None:
+        interval = self.maintenance_interval.total_seconds()
+        while not self._stop.wait(interval):
+            try:
+                self.maintain()
+            except Exception as e:
+                logger.warning("Sandbox pool maintenance failed: %s", e)
+
+    def _ensure_open(self) -> None:
+        if self._closed:
+            raise SandboxException("Sandbox pool is closed")
+
+    def __enter__(self) -> "SandboxPoolSync":
+        """Context manager entry; starts the pool."""
+        return self.start()
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit; closes the pool."""
+        self.close()
+
+
+__all__ = [
+    "SandboxPoolSync",
+]
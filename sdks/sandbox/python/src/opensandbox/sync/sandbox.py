@@ -19,9 +19,9 @@ Synchronous Sandbox client implementation.
 
 import logging
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from opensandbox.config.connection_sync import ConnectionConfigSync
 from opensandbox.constants import DEFAULT_EXECD_PORT
@@ -39,6 +39,7 @@ from opensandbox.models.sandboxes import (
     SandboxMetrics,
     SandboxRenewResponse,
 )
+from opensandbox.readiness import _ReadinessTracker
 from opensandbox.sync.adapters.factory import AdapterFactorySync
 from opensandbox.sync.services import (
     CommandsSync,
@@ -48,6 +49,9 @@ from opensandbox.sync.services import (
     SandboxesSync,
 )
 
+if TYPE_CHECKING:
+    from opensandbox.sync.handle import SandboxHandleSync
+
 logger = logging.getLogger(__name__)
 
 
@@ -111,16 +115,22 @@ class SandboxSync:
     def __init__(
         self,
         sandbox_id: str,
-        sandbox_service: SandboxesSync,
-        filesystem_service: FilesystemSync,
-        command_service: CommandsSync,
-        health_service: HealthSync,
-        metrics_service: MetricsSync,
+        sandbox_service: SandboxesSync | None,
+        filesystem_service: FilesystemSync | None,
+        command_service: CommandsSync | None,
+        health_service: HealthSync | None,
+        metrics_service: MetricsSync | None,
         connection_config: ConnectionConfigSync,
         custom_health_check: Callable[["SandboxSync"], bool] | None = None,
+        *,
+        execd_endpoint: SandboxEndpoint | None = None,
+        adapter_factory: AdapterFactorySync | None = None,
     ) -> None:
         """
         Internal constructor for SandboxSync. Use :meth:`create` or :meth:`connect` instead.
+
+        Services passed as None are built from ``execd_endpoint`` on first use,
+        so a sandbox that is only renewed or killed never creates execd clients.
         """
         self.id = sandbox_id
         self._sandbox_service = sandbox_service
@@ -130,6 +140,8 @@ class SandboxSync:
         self._metrics_service = metrics_service
         self._connection_config = connection_config
         self._custom_health_check = custom_health_check
+        self._execd_endpoint = execd_endpoint
+        self._adapter_factory = adapter_factory
 
     @property
     def files(self) -> FilesystemSync:
@@ -138,6 +150,8 @@ class SandboxSync:
 
         Allows writing, reading, listing, and deleting files and directories.
         """
+        if self._filesystem_service is None:
+            self._filesystem_service = self._factory().create_filesystem_service(self._require_execd_endpoint())
         return self._filesystem_service
 
     @property
@@ -147,6 +161,8 @@ class SandboxSync:
 
         Supports both one-shot command execution and SSE streaming output.
         """
+        if self._command_service is None:
+            self._command_service = self._factory().create_command_service(self._require_execd_endpoint())
         return self._command_service
 
     @property
@@ -156,6 +172,8 @@ class SandboxSync:
 
         Allows retrieving resource usage statistics (CPU, memory) and other performance metrics.
         """
+        if self._metrics_service is None:
+            self._metrics_service = self._factory().create_metrics_service(self._require_execd_endpoint())
         return self._metrics_service
 
     @property
@@ -163,6 +181,45 @@ class SandboxSync:
         """Provides access to the connection configuration (including shared transport)."""
         return self._connection_config
 
+    @property
+    def _sandboxes(self) -> SandboxesSync:
+        if self._sandbox_service is None:
+            self._sandbox_service = self._factory().create_sandbox_service()
+        return self._sandbox_service
+
+    @property
+    def _health(self) -> HealthSync:
+        if self._health_service is None:
+            self._health_service = self._factory().create_health_service(self._require_execd_endpoint())
+        return self._health_service
+
+    def to_handle(self) -> "SandboxHandleSync":
+        """
+        Return a compact reference to this sandbox; ``to_sandbox()`` turns it back into a full one.
+
+        The handle keeps this sandbox's connection config, so its transport must
+        stay open while the handle is used (e.g. a manager's or a shared transport).
+
+        Returns:
+            Handle holding the sandbox ID, execd endpoint and connection config
+
+        Raises:
+            SandboxInternalException: if the sandbox has no known execd endpoint
+        """
+        from opensandbox.sync.handle import SandboxHandleSync
+
+        return SandboxHandleSync(self.id, self._require_execd_endpoint().endpoint, self._connection_config)
+
+    def _factory(self) -> AdapterFactorySync:
+        if self._adapter_factory is None:
+            self._adapter_factory = AdapterFactorySync(self._connection_config)
+        return self._adapter_factory
+
+    def _require_execd_endpoint(self) -> SandboxEndpoint:
+        if self._execd_endpoint is None:
+            raise SandboxInternalException(f"Sandbox {self.id} has no execd endpoint to build services from")
+        return self._execd_endpoint
+
     def get_info(self) -> SandboxInfo:
         """
         Get the current status of this sandbox.
@@ -173,7 +230,7 @@ class SandboxSync:
         Raises:
             SandboxException: if status cannot be retrieved
         """
-        return self._sandbox_service.get_sandbox_info(self.id)
+        return self._sandboxes.get_sandbox_info(self.id)
 
     def get_endpoint(self, port: int) -> SandboxEndpoint:
         """
@@ -188,7 +245,7 @@ class SandboxSync:
         Raises:
             SandboxException: if endpoint cannot be retrieved
         """
-        return self._sandbox_service.get_sandbox_endpoint(self.id, port)
+        return self._sandboxes.get_sandbox_endpoint(self.id, port)
 
     def get_metrics(self) -> SandboxMetrics:
         """
@@ -200,7 +257,26 @@ class SandboxSync:
         Raises:
             SandboxException: if metrics cannot be retrieved
         """
-        return self._metrics_service.get_metrics(self.id)
+        return self.metrics.get_metrics(self.id)
+
+    def watch_metrics(
+        self,
+        *,
+        reconnect_delay: timedelta = timedelta(milliseconds=500),
+        max_reconnect_delay: timedelta = timedelta(seconds=10),
+        max_reconnect_attempts: int | None = None,
+    ) -> Iterator[SandboxMetrics]:
+        """
+        Stream the resource usage metrics of this sandbox, about once a second.
+
+        See :meth:`MetricsSync.watch` for the reconnect behavior.
+        """
+        return self.metrics.watch(
+            self.id,
+            reconnect_delay=reconnect_delay,
+            max_reconnect_delay=max_reconnect_delay,
+            max_reconnect_attempts=max_reconnect_attempts,
+        )
 
     def renew(self, timeout: timedelta) -> SandboxRenewResponse:
         """
@@ -224,7 +300,7 @@ class SandboxSync:
             self.id,
             new_expiration,
         )
-        return self._sandbox_service.renew_sandbox_expiration(self.id, new_expiration)
+        return self._sandboxes.renew_sandbox_expiration(self.id, new_expiration)
 
     def pause(self) -> None:
         """
@@ -237,7 +313,7 @@ class SandboxSync:
             SandboxException: if pause operation fails
         """
         logger.info("Pausing sandbox: %s", self.id)
-        self._sandbox_service.pause_sandbox(self.id)
+        self._sandboxes.pause_sandbox(self.id)
 
 
     def kill(self) -> None:
@@ -253,7 +329,7 @@ class SandboxSync:
             SandboxException: if termination fails
         """
         logger.info("Killing sandbox: %s", self.id)
-        self._sandbox_service.kill_sandbox(self.id)
+        self._sandboxes.kill_sandbox(self.id)
 
     def close(self) -> None:
         """
@@ -282,20 +358,23 @@ class SandboxSync:
         if self._custom_health_check:
             return self._custom_health_check(self)
         try:
-            return self._health_service.ping(self.id)
+            return self._health.ping(self.id)
         except Exception:
             return False
 
     def check_ready(self, timeout: timedelta, polling_interval: timedelta) -> None:
         """
-        Wait for the sandbox to pass health checks with polling.
+        Wait for the sandbox to pass health checks.
+
+        See :meth:`opensandbox.sandbox.Sandbox.check_ready` for the probing strategy.
 
         Args:
             timeout: Maximum time to wait for health check to pass
-            polling_interval: Time between health check attempts
+            polling_interval: Upper bound of the time between health check attempts
 
         Raises:
             SandboxReadyTimeoutException: if health check doesn't pass within timeout
+            SandboxUnhealthyException: if the sandbox failed or was terminated meanwhile
             SandboxException: if health check fails
         """
         logger.info(
@@ -304,34 +383,60 @@ class SandboxSync:
             timeout.total_seconds(),
         )
 
-        deadline = time.time() + timeout.total_seconds()
-        attempt = 0
+        tracker = _ReadinessTracker(self.id, timeout, polling_interval)
         last_exception: Exception | None = None
-
-        while time.time() < deadline:
-            attempt += 1
-            logger.debug("Health check attempt #%s for sandbox %s", attempt, self.id)
-            try:
-                if self.is_healthy():
-                    logger.info(
-                        "Sandbox %s passed health check after %s attempts",
-                        self.id,
-                        attempt,
-                    )
-                    return
-                last_exception = None
-            except Exception as e:
-                last_exception = e
-
-            time.sleep(polling_interval.total_seconds())
+        ready = False
+        try:
+            while True:
+                tracker.probes += 1
+                logger.debug("Health check attempt #%s for sandbox %s", tracker.probes, self.id)
+                try:
+                    if self._probe(tracker.probe_timeout()):
+                        logger.info(
+                            "Sandbox %s passed health check after %s attempts",
+                            self.id,
+                            tracker.probes,
+                        )
+                        ready = True
+                        return
+                    last_exception = None
+                except Exception as e:
+                    last_exception = e
+
+                if tracker.probes == 1:
+                    self._wait_while_provisioning(tracker)
+                delay = tracker.next_delay()
+                if delay is None:
+                    break
+                time.sleep(delay)
+        finally:
+            tracker.report(self._connection_config.readiness_hook, ready)
 
         error_detail = f"Last error: {last_exception}" if last_exception else "Health check returned false continuously"
         final_message = (
-            f"Sandbox health check timed out after {timeout.total_seconds()}s ({attempt} attempts). {error_detail}"
+            f"Sandbox health check timed out after {timeout.total_seconds()}s ({tracker.probes} attempts). {error_detail}"
         )
         logger.error(final_message)
         raise SandboxReadyTimeoutException(final_message)
 
+    def _probe(self, timeout: timedelta) -> bool:
+        if self._custom_health_check:
+            return self._custom_health_check(self)
+        try:
+            return self._health.ping(self.id, timeout=timeout)
+        except Exception:
+            return False
+
+    def _wait_while_provisioning(self, tracker: _ReadinessTracker) -> None:
+        while (wait_timeout := tracker.server_wait_timeout()) is not None:
+            try:
+                info = self._sandboxes.wait_for_state(self.id, ["Running"], wait_timeout)
+            except Exception as e:
+                logger.debug("Server-side wait for sandbox %s failed, probing instead: %s", self.id, e)
+                return
+            if not tracker.still_provisioning(info):
+                return
+
     @classmethod
     def create(
         cls,
@@ -366,7 +471,7 @@ class SandboxSync:
             entrypoint: Command to run as entrypoint
             connection_config: Connection configuration
             health_check: Custom sync health check function
-            health_check_polling_interval: Time between health check attempts
+            health_check_polling_interval: Upper bound of the time between health check attempts
             skip_health_check: If True, do NOT wait for sandbox readiness/health; returned instance may not be ready yet.
 
         Returns:
@@ -412,12 +517,14 @@ class SandboxSync:
             sandbox = cls(
                 sandbox_id=response.id,
                 sandbox_service=sandbox_service,
-                filesystem_service=factory.create_filesystem_service(execd_endpoint),
-                command_service=factory.create_command_service(execd_endpoint),
-                health_service=factory.create_health_service(execd_endpoint),
-                metrics_service=factory.create_metrics_service(execd_endpoint),
+                filesystem_service=None,
+                command_service=None,
+                health_service=None,
+                metrics_service=None,
                 connection_config=config,
                 custom_health_check=health_check,
+                execd_endpoint=execd_endpoint,
+                adapter_factory=factory,
             )
 
             if not skip_health_check:
@@ -489,12 +596,14 @@ class SandboxSync:
             sandbox = cls(
                 sandbox_id=sandbox_id,
                 sandbox_service=sandbox_service,
-                filesystem_service=factory.create_filesystem_service(execd_endpoint),
-                command_service=factory.create_command_service(execd_endpoint),
-                health_service=factory.create_health_service(execd_endpoint),
-                metrics_service=factory.create_metrics_service(execd_endpoint),
+                filesystem_service=None,
+                command_service=None,
+                health_service=None,
+                metrics_service=None,
                 connection_config=config,
                 custom_health_check=health_check,
+                execd_endpoint=execd_endpoint,
+                adapter_factory=factory,
             )
 
             if not skip_health_check:
@@ -558,12 +667,14 @@ class SandboxSync:
             sandbox = cls(
                 sandbox_id=sandbox_id,
                 sandbox_service=sandbox_service,
-                filesystem_service=factory.create_filesystem_service(execd_endpoint),
-                command_service=factory.create_command_service(execd_endpoint),
-                health_service=factory.create_health_service(execd_endpoint),
-                metrics_service=factory.create_metrics_service(execd_endpoint),
+                filesystem_service=None,
+                command_service=None,
+                health_service=None,
+                metrics_service=None,
                 connection_config=config,
                 custom_health_check=health_check,
+                execd_endpoint=execd_endpoint,
+                adapter_factory=factory,
             )
 
             if not skip_health_check:
@@ -20,11 +20,21 @@ Defines the contract for **blocking** command execution operations inside a sand
 This is the sync counterpart of :mod:`opensandbox.services.command`.
 """
 
-from typing import Protocol
-
-from opensandbox.models.execd import Execution, RunCommandOpts
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Protocol
+
+from opensandbox.models.execd import (
+    CommandLogs,
+    CommandStatus,
+    Execution,
+    ExecutionEvent,
+    RunCommandOpts,
+)
 from opensandbox.models.execd_sync import ExecutionHandlersSync
 
+if TYPE_CHECKING:
+    from opensandbox.sync.background import BackgroundCommandSync
+
 
 class CommandsSync(Protocol):
     """
@@ -64,6 +74,78 @@ class CommandsSync(Protocol):
         """
         ...
 
+    def stream(
+        self,
+        command: str,
+        *,
+        opts: RunCommandOpts | None = None,
+    ) -> Iterator[ExecutionEvent]:
+        """
+        Execute a shell command and iterate over its events as they arrive.
+
+        Yields ExecutionInit, OutputMessage, ExecutionResult, ExecutionError and
+        ExecutionComplete objects in stream order. The response is read only as
+        the consumer advances, so a slow consumer slows down the stream. Output
+        is not retained unless ``opts.output_retention`` says otherwise.
+
+        Args:
+            command: Shell command text to execute
+            opts: Command execution options
+
+        Returns:
+            Iterator of execution events
+
+        Raises:
+            SandboxException: If the command cannot be run (raised during iteration).
+        """
+        ...
+
+    def start(
+        self,
+        command: str,
+        *,
+        opts: RunCommandOpts | None = None,
+    ) -> "BackgroundCommandSync":
+        """
+        Start a shell command in background (detached) mode.
+
+        Args:
+            command: Shell command text to execute
+            opts: Command execution options; ``background`` is always set
+
+        Returns:
+            Handle exposing status(), wait(), tail() and interrupt()
+
+        Raises:
+            SandboxException: If the operation fails.
+        """
+        ...
+
+    def status(self, execution_id: str) -> CommandStatus:
+        """
+        Get the status of a command.
+
+        Args:
+            execution_id: Unique identifier of the command
+
+        Raises:
+            SandboxException: If the operation fails.
+        """
+        ...
+
+    def logs(self, execution_id: str, *, cursor: int | None = None) -> CommandLogs:
+        """
+        Read the combined output of a background command.
+
+        Args:
+            execution_id: Unique identifier of the command
+            cursor: Cursor returned by a previous read; all output if None
+
+        Raises:
+            SandboxException: If the operation fails.
+        """
+        ...
+
     def interrupt(self, execution_id: str) -> None:
         """
         Interrupt and terminate a running command execution.
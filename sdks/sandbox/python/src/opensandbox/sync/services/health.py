@@ -20,6 +20,7 @@ Defines the contract for **blocking** health checks against a sandbox instance.
 This is the sync counterpart of :mod:`opensandbox.services.health`.
 """
 
+from datetime import timedelta
 from typing import Protocol
 
 
@@ -31,12 +32,13 @@ class HealthSync(Protocol):
     is reachable and responsive.
     """
 
-    def ping(self, sandbox_id: str) -> bool:
+    def ping(self, sandbox_id: str, *, timeout: timedelta | None = None) -> bool:
         """
         Ping the sandbox execd service to verify liveness.
 
         Args:
             sandbox_id: Unique identifier of the sandbox.
+            timeout: Limit for this request; the configured request timeout if None.
 
         Returns:
             True if the sandbox responds successfully, False otherwise.
@@ -20,6 +20,8 @@ Defines the contract for **blocking** metrics retrieval from a sandbox instance.
 This is the sync counterpart of :mod:`opensandbox.services.metrics`.
 """
 
+from collections.abc import Iterator
+from datetime import timedelta
 from typing import Protocol
 
 from opensandbox.models.sandboxes import SandboxMetrics
@@ -46,3 +48,28 @@ class MetricsSync(Protocol):
             SandboxException: If the operation fails.
         """
         ...
+
+    def watch(
+        self,
+        sandbox_id: str,
+        *,
+        reconnect_delay: timedelta = timedelta(milliseconds=500),
+        max_reconnect_delay: timedelta = timedelta(seconds=10),
+        max_reconnect_attempts: int | None = None,
+    ) -> Iterator[SandboxMetrics]:
+        """
+        Stream metrics of a sandbox as execd samples them (blocking).
+
+        See :meth:`opensandbox.services.metrics.Metrics.watch`.
+
+        Args:
+            sandbox_id: Unique identifier of the sandbox.
+            reconnect_delay: First delay before reconnecting.
+            max_reconnect_delay: Upper bound of the reconnect delay.
+            max_reconnect_attempts: Consecutive failed connections tolerated before
+                giving up; unbounded if None.
+
+        Raises:
+            SandboxException: on a non-transient error or when reconnect attempts are exhausted.
+        """
+        ...
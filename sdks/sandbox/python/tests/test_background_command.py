@@ -0,0 +1,173 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+
+import httpx
+import pytest
+
+from opensandbox.adapters.command_adapter import CommandsAdapter
+from opensandbox.config import ConnectionConfig
+from opensandbox.config.connection_sync import ConnectionConfigSync
+from opensandbox.exceptions import SandboxException
+from opensandbox.models.execd import RunCommandOpts
+from opensandbox.models.sandboxes import SandboxEndpoint
+from opensandbox.sync.adapters.command_adapter import CommandsAdapterSync
+
+_ENDPOINT = SandboxEndpoint(endpoint="localhost:44772", port=44772)
+_FAST = {"poll_interval": timedelta(milliseconds=1), "max_poll_interval": timedelta(milliseconds=2)}
+
+
+class _FakeExecd:
+    """Serves one background command whose output arrives in ``chunks``, one per logs request."""
+
+    def __init__(self, chunks: list[bytes], *, polls_until_exit: int | None = None) -> None:
+        self.output = b""
+        self.chunks = list(chunks)
+        self.polls_until_exit = len(chunks) if polls_until_exit is None else polls_until_exit
+        self.status_polls = 0
+        self.cursors: list[str | None] = []
+        self.started_with: dict | None = None
+
+    @property
+    def running(self) -> bool:
+        return self.status_polls < self.polls_until_exit
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "POST" and path == "/command":
+            self.started_with = json.loads(request.content)
+            return httpx.Response(
+                200, content=b'data: {"type":"init","text":"cmd-1","timestamp":0}\n\n'
+            )
+        if path == "/command/status/cmd-1":
+            self.status_polls += 1
+            body = {"id": "cmd-1", "running": self.running}
+            if not self.running:
+                body["exit_code"] = 3
+            return httpx.Response(200, json=body)
+        if path == "/command/cmd-1/logs":
+            if self.chunks:
+                self.output += self.chunks.pop(0)
+            cursor = request.url.params.get("cursor")
+            self.cursors.append(cursor)
+            start = int(cursor or 0)
+            return httpx.Response(
+                200,
+                content=self.output[start:],
+                headers={"EXECD-COMMANDS-TAIL-CURSOR": str(len(self.output))},
+            )
+        return httpx.Response(404, json={"code": "NOT_FOUND", "message": path})
+
+
+def _async_adapter(execd: _FakeExecd) -> CommandsAdapter:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return execd.handle(request)
+
+    cfg = ConnectionConfig(protocol="http", transport=httpx.MockTransport(handler))
+    return CommandsAdapter(cfg, _ENDPOINT)
+
+
+def _sync_adapter(execd: _FakeExecd) -> CommandsAdapterSync:
+    cfg = ConnectionConfigSync(protocol="http", transport=httpx.MockTransport(execd.handle))
+    return CommandsAdapterSync(cfg, _ENDPOINT)
+
+
+@pytest.mark.asyncio
+async def test_start_runs_detached_and_returns_handle() -> None:
+    execd = _FakeExecd([])
+    adapter = _async_adapter(execd)
+
+    job = await adapter.start("sleep 60", opts=RunCommandOpts(working_directory="/tmp"))
+
+    assert job.id == "cmd-1" and job.command == "sleep 60"
+    assert execd.started_with["background"] is True
+    assert execd.started_with["cwd"] == "/tmp"
+
+
+@pytest.mark.asyncio
+async def test_tail_follows_cursor_and_joins_split_lines() -> None:
+    execd = _FakeExecd([b"one\ntw", b"", b"o\r\nthr", b"ee"], polls_until_exit=2)
+    job = await _async_adapter(execd).start("job")
+
+    lines = [line async for line in job.tail(**_FAST)]
+
+    assert lines == ["one", "two", "three"]
+    assert execd.cursors[0] in (None, "0")
+    assert execd.cursors[1:3] == ["6", "6"]
+    assert job.cursor == len(b"one\ntwo\r\nthree")
+
+
+@pytest.mark.asyncio
+async def test_tail_reads_output_written_just_before_exit() -> None:
+    # The command has exited by the first status poll, but its last chunk
+    # only becomes visible on the next logs request.
+    execd = _FakeExecd([b"", b"done\n"], polls_until_exit=1)
+    job = await _async_adapter(execd).start("job")
+
+    lines = [line async for line in job.tail(**_FAST)]
+
+    assert lines == ["done"]
+    assert execd.status_polls == 1
+
+
+@pytest.mark.asyncio
+async def test_wait_returns_final_status() -> None:
+    execd = _FakeExecd([], polls_until_exit=3)
+    job = await _async_adapter(execd).start("job")
+
+    status = await job.wait(**_FAST)
+
+    assert status.running is False and status.exit_code == 3
+    assert execd.status_polls == 3
+
+
+@pytest.mark.asyncio
+async def test_wait_times_out() -> None:
+    execd = _FakeExecd([], polls_until_exit=10**6)
+    job = await _async_adapter(execd).start("job")
+
+    with pytest.raises(SandboxException, match="Timed out"):
+        await job.wait(timeout=timedelta(milliseconds=20), **_FAST)
+
+
+@pytest.mark.asyncio
+async def test_logs_falls_back_to_byte_offset_without_header() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"abc")
+
+    cfg = ConnectionConfig(protocol="http", transport=httpx.MockTransport(handler))
+    logs = await CommandsAdapter(cfg, _ENDPOINT).logs("cmd-1", cursor=4)
+
+    assert logs.text == "abc" and logs.cursor == 7
+
+
+def test_sync_background_command_tail_and_wait() -> None:
+    execd = _FakeExecd([b"a\n", b"", b"b\nc"], polls_until_exit=2)
+    job = _sync_adapter(execd).start("job")
+
+    assert list(job.tail(**_FAST)) == ["a", "b", "c"]
+    assert job.wait(**_FAST).exit_code == 3
+
+
+def test_sync_wait_times_out() -> None:
+    execd = _FakeExecd([], polls_until_exit=10**6)
+    job = _sync_adapter(execd).start("job")
+
+    with pytest.raises(SandboxException, match="Timed out"):
+        job.wait(timeout=timedelta(milliseconds=20), **_FAST)
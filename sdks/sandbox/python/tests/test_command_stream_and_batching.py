@@ -0,0 +1,202 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+import httpx
+import pytest
+
+from opensandbox.adapters.command_adapter import CommandsAdapter
+from opensandbox.adapters.converter.execution_event_dispatcher import (
+    ExecutionEventDispatcher,
+)
+from opensandbox.adapters.converter.sse import StreamEvent
+from opensandbox.config import ConnectionConfig
+from opensandbox.config.connection_sync import ConnectionConfigSync
+from opensandbox.exceptions import SandboxApiException
+from opensandbox.models.execd import (
+    Execution,
+    ExecutionComplete,
+    ExecutionHandlers,
+    ExecutionInit,
+    OutputMessage,
+)
+from opensandbox.models.execd_sync import ExecutionHandlersSync
+from opensandbox.models.sandboxes import SandboxEndpoint
+from opensandbox.sync.adapters.command_adapter import CommandsAdapterSync
+from opensandbox.sync.adapters.converter.execution_event_dispatcher import (
+    ExecutionEventDispatcherSync,
+)
+
+_ENDPOINT = SandboxEndpoint(endpoint="localhost:44772", port=44772)
+
+
+def _event(index: int, kind: str = "stdout") -> bytes:
+    return f'data: {{"type":"{kind}","text":"line {index}","timestamp":{index}}}\n\n'.encode()
+
+
+def _body(lines: int) -> list[bytes]:
+    return [
+        b'data: {"type":"init","text":"exec-1","timestamp":0}\n\n',
+        *(_event(i) for i in range(lines)),
+        b'data: {"type":"execution_complete","timestamp":99,"execution_time":7}\n\n',
+    ]
+
+
+class _CountingStream(httpx.AsyncByteStream):
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+        self.sent = 0
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.sent += 1
+            yield chunk
+
+
+def _async_adapter(stream: httpx.AsyncByteStream | None = None, status: int = 200) -> CommandsAdapter:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status, stream=stream or httpx.ByteStream(b"boom"))
+
+    cfg = ConnectionConfig(protocol="http", transport=httpx.MockTransport(handler))
+    return CommandsAdapter(cfg, _ENDPOINT)
+
+
+def _stdout(index: int) -> StreamEvent:
+    return StreamEvent({"type": "stdout", "text": f"line {index}", "timestamp": index})
+
+
+@pytest.mark.asyncio
+async def test_batches_flush_on_message_count_and_before_completion() -> None:
+    batches: list[list[str]] = []
+    order: list[str] = []
+
+    async def on_batch(messages: list[OutputMessage]) -> None:
+        batches.append([m.text for m in messages])
+        order.append("batch")
+
+    async def on_complete(complete: ExecutionComplete) -> None:
+        order.append("complete")
+
+    handlers = ExecutionHandlers(
+        on_stdout_batch=on_batch, on_execution_complete=on_complete, batch_max_messages=4
+    )
+    execution = await _async_adapter(_CountingStream(_body(10))).run("yes", handlers=handlers)
+
+    assert [len(b) for b in batches] == [4, 4, 2]
+    assert order == ["batch", "batch", "batch", "complete"]
+    assert len(execution.logs.stdout) == 10
+
+
+@pytest.mark.asyncio
+async def test_batches_flush_on_bytes_and_delay() -> None:
+    batches: list[int] = []
+
+    async def on_batch(messages: list[OutputMessage]) -> None:
+        batches.append(len(messages))
+
+    dispatcher = ExecutionEventDispatcher(
+        Execution(),
+        ExecutionHandlers(
+            on_stderr_batch=on_batch,
+            batch_max_bytes=12,
+            batch_max_delay=timedelta(milliseconds=20),
+        ),
+    )
+    for index in range(3):
+        await dispatcher.dispatch(StreamEvent({"type": "stderr", "text": "abcdef", "timestamp": index}))
+    assert batches == [2]
+
+    await asyncio.sleep(0.05)
+    assert batches == [2, 1]
+    await dispatcher.flush()
+    assert batches == [2, 1]
+
+
+def test_sync_batches_flush_when_overdue() -> None:
+    batches: list[int] = []
+    dispatcher = ExecutionEventDispatcherSync(
+        Execution(),
+        ExecutionHandlersSync(
+            on_stdout_batch=lambda messages: batches.append(len(messages)),
+            batch_max_delay=timedelta(0),
+        ),
+    )
+
+    dispatcher.dispatch(_stdout(0))
+    dispatcher.dispatch(_stdout(1))
+    assert batches == [1]
+    dispatcher.flush()
+    assert batches == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_events_in_order() -> None:
+    adapter = _async_adapter(_CountingStream(_body(3)))
+
+    events = [event async for event in adapter.stream("yes")]
+
+    assert isinstance(events[0], ExecutionInit)
+    assert [e.text for e in events[1:4]] == ["line 0", "line 1", "line 2"]
+    assert isinstance(events[-1], ExecutionComplete)
+
+
+@pytest.mark.asyncio
+async def test_stream_applies_backpressure_and_stops_on_break() -> None:
+    body = _CountingStream(_body(1000))
+    adapter = _async_adapter(body)
+
+    consumed = 0
+    async for _ in adapter.stream("yes", buffer_size=8):
+        consumed += 1
+        if consumed == 5:
+            for _ in range(20):
+                await asyncio.sleep(0)
+            assert body.sent <= consumed + 8 + 2
+        if consumed == 10:
+            break
+
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert body.sent < 30
+
+
+@pytest.mark.asyncio
+async def test_stream_raises_server_errors() -> None:
+    adapter = _async_adapter(status=500)
+
+    with pytest.raises(SandboxApiException):
+        async for _ in adapter.stream("yes"):
+            pass
+
+
+def test_sync_stream_yields_events() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"".join(_body(2)))
+
+    cfg = ConnectionConfigSync(protocol="http", transport=httpx.MockTransport(handler))
+    adapter = CommandsAdapterSync(cfg, _ENDPOINT)
+
+    events = list(adapter.stream("yes"))
+
+    assert [type(e).__name__ for e in events] == [
+        "ExecutionInit",
+        "OutputMessage",
+        "OutputMessage",
+        "ExecutionComplete",
+    ]
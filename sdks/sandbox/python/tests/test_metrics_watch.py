@@ -0,0 +1,168 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import itertools
+import json
+from collections import defaultdict
+from datetime import timedelta
+
+import httpx
+import pytest
+
+from opensandbox.adapters.metrics_adapter import MetricsAdapter
+from opensandbox.config import ConnectionConfig
+from opensandbox.config.connection_sync import ConnectionConfigSync
+from opensandbox.exceptions import SandboxApiException, SandboxException
+from opensandbox.manager import SandboxManager
+from opensandbox.models.sandboxes import SandboxEndpoint
+from opensandbox.sync.adapters.metrics_adapter import MetricsAdapterSync
+from opensandbox.sync.manager import SandboxManagerSync
+
+_ENDPOINT = SandboxEndpoint(endpoint="localhost:44772", port=44772)
+_FAST = {"reconnect_delay": timedelta(milliseconds=1), "max_reconnect_delay": timedelta(milliseconds=2)}
+_clock = itertools.count(1)
+
+
+def _sample(cpu: float) -> bytes:
+    return json.dumps(
+        {"cpu_count": 2, "cpu_used_pct": cpu, "mem_total_mib": 1024, "mem_used_mib": 256, "timestamp": next(_clock)}
+    ).encode() + b"\n"
+
+
+class _FakeWatch:
+    """Answers each /metrics/watch connection of a host with the next scripted response."""
+
+    def __init__(self, script: dict[str, list[int | bytes]]) -> None:
+        self.script = script
+        self.connections: dict[str, int] = defaultdict(int)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/metrics/watch"
+        host = request.url.host
+        responses = self.script[host]
+        step = responses[min(self.connections[host], len(responses) - 1)]
+        self.connections[host] += 1
+        if isinstance(step, int):
+            return httpx.Response(step, json={"code": "ERR", "message": "unavailable"})
+        return httpx.Response(200, content=step)
+
+
+def _async_adapter(watch: _FakeWatch) -> MetricsAdapter:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return watch.handle(request)
+
+    cfg = ConnectionConfig(protocol="http", transport=httpx.MockTransport(handler))
+    return MetricsAdapter(cfg, _ENDPOINT)
+
+
+async def _take(stream, count: int) -> list:
+    taken = []
+    async for item in stream:
+        taken.append(item)
+        if len(taken) == count:
+            break
+    await stream.aclose()
+    return taken
+
+
+@pytest.mark.asyncio
+async def test_watch_reconnects_across_errors_and_skips_failed_samples() -> None:
+    watch = _FakeWatch(
+        {"localhost": [503, _sample(10) + b'{"error":"cpu busy"}\n' + b"not json\n", _sample(20) + _sample(30)]}
+    )
+
+    samples = await _take(_async_adapter(watch).watch("sbx", **_FAST), 3)
+
+    assert [s.cpu_used_percentage for s in samples] == [10, 20, 30]
+    assert samples[0].memory_used_in_mib == 256
+    assert watch.connections["localhost"] == 3
+
+
+@pytest.mark.asyncio
+async def test_watch_does_not_retry_client_errors() -> None:
+    watch = _FakeWatch({"localhost": [404]})
+
+    with pytest.raises(SandboxApiException) as exc:
+        await _take(_async_adapter(watch).watch("sbx", **_FAST), 1)
+
+    assert exc.value.status_code == 404
+    assert watch.connections["localhost"] == 1
+
+
+@pytest.mark.asyncio
+async def test_watch_gives_up_after_max_reconnect_attempts() -> None:
+    watch = _FakeWatch({"localhost": [503]})
+
+    with pytest.raises(SandboxException):
+        await _take(_async_adapter(watch).watch("sbx", max_reconnect_attempts=2, **_FAST), 1)
+
+    assert watch.connections["localhost"] == 3
+
+
+class _EndpointStub:
+    async def get_sandbox_endpoints(self, sandbox_ids, port):
+        return {
+            sandbox_id: SandboxException("not found")
+            if sandbox_id == "missing"
+            else SandboxEndpoint(endpoint=f"{sandbox_id}.local:{port}")
+            for sandbox_id in sandbox_ids
+        }
+
+
+class _EndpointSyncStub:
+    def get_sandbox_endpoints(self, sandbox_ids, port):
+        return {sandbox_id: SandboxEndpoint(endpoint=f"{sandbox_id}.local:{port}") for sandbox_id in sandbox_ids}
+
+
+@pytest.mark.asyncio
+async def test_manager_multiplexes_sandboxes_and_reports_failures() -> None:
+    watch = _FakeWatch({"a.local": [_sample(1) + _sample(2), 404], "b.local": [_sample(3), 404]})
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return watch.handle(request)
+
+    cfg = ConnectionConfig(protocol="http", transport=httpx.MockTransport(handler))
+    manager = SandboxManager(_EndpointStub(), cfg)
+    errors: dict[str, Exception] = {}
+
+    received = [
+        item
+        async for item in manager.watch_metrics(
+            ["a", "b", "missing"], queue_size=1, on_error=errors.__setitem__, **_FAST
+        )
+    ]
+
+    by_sandbox = defaultdict(list)
+    for sandbox_id, sample in received:
+        by_sandbox[sandbox_id].append(sample.cpu_used_percentage)
+    assert by_sandbox == {"a": [1, 2], "b": [3]}
+    assert set(errors) == {"a", "b", "missing"}
+    assert isinstance(errors["a"], SandboxApiException) and errors["a"].status_code == 404
+
+
+def test_sync_watch_and_manager() -> None:
+    watch = _FakeWatch({"localhost": [502, _sample(5)], "a.local": [_sample(6), 404]})
+    cfg = ConnectionConfigSync(protocol="http", transport=httpx.MockTransport(watch.handle))
+
+    stream = MetricsAdapterSync(cfg, _ENDPOINT).watch("sbx", **_FAST)
+    assert next(stream).cpu_used_percentage == 5
+    stream.close()
+
+    manager = SandboxManagerSync(_EndpointSyncStub(), cfg)
+    received = list(manager.watch_metrics(["a"], on_error=lambda *_: None, **_FAST))
+
+    assert [(sandbox_id, s.cpu_used_percentage) for sandbox_id, s in received] == [("a", 6)]
@@ -0,0 +1,139 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from opensandbox.adapters.command_adapter import CommandsAdapter
+from opensandbox.config import ConnectionConfig
+from opensandbox.models.execd import (
+    Execution,
+    ExecutionHandlers,
+    ExecutionLogs,
+    OutputLog,
+    OutputMessage,
+    OutputRetention,
+    RunCommandOpts,
+)
+from opensandbox.models.sandboxes import SandboxEndpoint
+
+
+def _fill(log: OutputLog, count: int, text: str = "line {}") -> OutputLog:
+    for index in range(count):
+        log.add(text.format(index), index)
+    return log
+
+
+def test_all_mode_behaves_like_a_message_list() -> None:
+    log = _fill(OutputLog(), 3)
+
+    assert len(log) == 3
+    assert log[-1] == OutputMessage(text="line 2", timestamp=2, is_error=False)
+    assert [m.text for m in log[:2]] == ["line 0", "line 1"]
+    assert log == [OutputMessage(text=f"line {i}", timestamp=i) for i in range(3)]
+    assert log.retained_bytes == 18
+    with pytest.raises(IndexError):
+        log[3]
+
+
+def test_tail_mode_keeps_newest_lines() -> None:
+    log = _fill(OutputLog(OutputRetention(mode="tail", max_lines=3)), 1000)
+
+    assert [m.text for m in log] == ["line 997", "line 998", "line 999"]
+    assert log[0].timestamp == 997
+    assert log.dropped == 997
+    assert log.retained_bytes == 24
+    assert len(log._texts) < 200
+
+
+def test_tail_mode_bounds_utf8_bytes() -> None:
+    log = _fill(OutputLog(OutputRetention(mode="tail", max_bytes=10)), 10, "éé{}")
+
+    assert [m.text for m in log] == ["éé8", "éé9"]
+    assert log.retained_bytes == 10
+
+    log.add("x" * 11, 10)
+    assert len(log) == 0 and log.retained_bytes == 0
+
+
+def test_none_mode_keeps_nothing() -> None:
+    log = _fill(OutputLog(OutputRetention(mode="none")), 5)
+
+    assert len(log) == 0 and list(log) == []
+    assert log.dropped == 5
+
+
+def test_spill_mode_reads_lines_back_lazily(tmp_path) -> None:
+    log = _fill(OutputLog(OutputRetention(mode="spill", directory=str(tmp_path)), is_error=True), 20000, "lïne {}")
+
+    assert len(log) == 20000
+    assert log[12345] == OutputMessage(text="lïne 12345", timestamp=12345, is_error=True)
+    messages = iter(log)
+    assert next(messages).text == "lïne 0"
+    log.add("appended", 20000)
+    assert sum(1 for _ in messages) == 19999
+    assert log[-1].text == "appended"
+
+    log.close()
+    assert len(log) == 0
+
+
+def test_tail_retention_requires_a_limit() -> None:
+    with pytest.raises(ValidationError):
+        OutputRetention(mode="tail")
+
+
+def test_execution_logs_round_trip_through_pydantic() -> None:
+    logs = ExecutionLogs.with_retention(OutputRetention(mode="tail", max_lines=1))
+    logs.add_stdout(OutputMessage(text="a", timestamp=1))
+    logs.add_stdout(OutputMessage(text="b", timestamp=2))
+    logs.add_stderr(OutputMessage(text="c", timestamp=3, is_error=True))
+
+    dumped = Execution(logs=logs).model_dump()
+
+    assert dumped["logs"]["stdout"] == [{"text": "b", "timestamp": 2, "is_error": False}]
+    restored = Execution.model_validate(dumped)
+    assert isinstance(restored.logs.stderr, OutputLog)
+    assert restored.logs.stderr[0].is_error is True
+
+
+@pytest.mark.asyncio
+async def test_run_command_applies_retention_but_still_calls_handlers() -> None:
+    body = b"".join(
+        f'data: {{"type":"stdout","text":"{i}","timestamp":{i}}}\n\n'.encode() for i in range(50)
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=body)
+
+    seen: list[str] = []
+
+    async def on_stdout(message: OutputMessage) -> None:
+        seen.append(message.text)
+
+    cfg = ConnectionConfig(protocol="http", transport=httpx.MockTransport(handler))
+    adapter = CommandsAdapter(cfg, SandboxEndpoint(endpoint="localhost:44772", port=44772))
+
+    execution = await adapter.run(
+        "yes",
+        opts=RunCommandOpts(output_retention=OutputRetention(mode="tail", max_lines=2)),
+        handlers=ExecutionHandlers(on_stdout=on_stdout),
+    )
+
+    assert [m.text for m in execution.logs.stdout] == ["48", "49"]
+    assert len(seen) == 50
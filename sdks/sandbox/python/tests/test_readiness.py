@@ -0,0 +1,210 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from opensandbox.adapters.converter.response_handler import parse_sandbox_wait
+from opensandbox.config import ConnectionConfig
+from opensandbox.config.connection_sync import ConnectionConfigSync
+from opensandbox.exceptions import (
+    SandboxApiException,
+    SandboxReadyTimeoutException,
+    SandboxUnhealthyException,
+)
+from opensandbox.models.sandboxes import SandboxInfo, SandboxReadiness, SandboxStatus
+from opensandbox.sandbox import Sandbox
+from opensandbox.sync.sandbox import SandboxSync
+
+
+def _info(state: str, message: str | None = None) -> SandboxInfo:
+    now = datetime.now(timezone.utc)
+    return SandboxInfo(
+        id="sbx",
+        status=SandboxStatus(state=state, message=message),
+        entrypoint=["sleep"],
+        expires_at=now,
+        created_at=now,
+    )
+
+
+class _SandboxServiceStub:
+    def __init__(self, *states: str | None) -> None:
+        self.states = list(states)
+        self.wait_calls: list[timedelta] = []
+
+    async def wait_for_state(self, sandbox_id, states, timeout: timedelta) -> SandboxInfo | None:
+        return self._next(timeout)
+
+    def _next(self, timeout: timedelta) -> SandboxInfo | None:
+        self.wait_calls.append(timeout)
+        state = self.states.pop(0) if self.states else None
+        return _info(state, "image pull failed") if state else None
+
+
+class _HealthServiceStub:
+    def __init__(self, ready_after: int = 1) -> None:
+        self.ready_after = ready_after
+        self.timeouts: list[timedelta | None] = []
+
+    async def ping(self, sandbox_id, *, timeout: timedelta | None = None) -> bool:
+        return self._ping(timeout)
+
+    def _ping(self, timeout: timedelta | None) -> bool:
+        self.timeouts.append(timeout)
+        return len(self.timeouts) >= self.ready_after
+
+
+class _SandboxServiceSyncStub(_SandboxServiceStub):
+    def wait_for_state(self, sandbox_id, states, timeout: timedelta) -> SandboxInfo | None:  # type: ignore[override]
+        return self._next(timeout)
+
+
+class _HealthServiceSyncStub(_HealthServiceStub):
+    def ping(self, sandbox_id, *, timeout: timedelta | None = None) -> bool:  # type: ignore[override]
+        return self._ping(timeout)
+
+
+class _Noop:
+    pass
+
+
+def _make_sandbox(health, sandboxes, reports: list[SandboxReadiness]) -> Sandbox:
+    return Sandbox(
+        sandbox_id=str(uuid4()),
+        sandbox_service=sandboxes,
+        filesystem_service=_Noop(),
+        command_service=_Noop(),
+        health_service=health,
+        metrics_service=_Noop(),
+        connection_config=ConnectionConfig(readiness_hook=reports.append),
+    )
+
+
+@pytest.fixture
+def reports() -> list[SandboxReadiness]:
+    return []
+
+
+@pytest.fixture
+def no_sleep(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    delays: list[float] = []
+
+    async def _sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr("opensandbox.sandbox.asyncio.sleep", _sleep)
+    return delays
+
+
+@pytest.mark.asyncio
+async def test_ready_sandbox_passes_on_first_probe(reports) -> None:
+    health = _HealthServiceStub()
+    sandboxes = _SandboxServiceStub("Running")
+    sbx = _make_sandbox(health, sandboxes, reports)
+
+    await sbx.check_ready(timeout=timedelta(seconds=30), polling_interval=timedelta(seconds=1))
+
+    assert sandboxes.wait_calls == []
+    assert health.timeouts == [timedelta(seconds=2)]
+    assert len(reports) == 1
+    assert reports[0].ready and reports[0].probes == 1 and reports[0].server_waits == 0
+
+
+@pytest.mark.asyncio
+async def test_pending_sandbox_is_waited_for_on_the_server(reports, no_sleep) -> None:
+    health = _HealthServiceStub(ready_after=2)
+    sandboxes = _SandboxServiceStub("Pending", "Running")
+    sbx = _make_sandbox(health, sandboxes, reports)
+
+    await sbx.check_ready(timeout=timedelta(seconds=30), polling_interval=timedelta(seconds=1))
+
+    assert len(sandboxes.wait_calls) == 2
+    assert sandboxes.wait_calls[0] <= timedelta(seconds=30)
+    assert len(health.timeouts) == 2
+    # Probing restarts from the shortest delay once the sandbox is running.
+    assert no_sleep[0] <= 0.01
+    assert (reports[0].probes, reports[0].server_waits) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_terminal_state_fails_fast(reports) -> None:
+    sbx = _make_sandbox(_HealthServiceStub(ready_after=100), _SandboxServiceStub("Failed"), reports)
+
+    with pytest.raises(SandboxUnhealthyException, match="image pull failed"):
+        await sbx.check_ready(timeout=timedelta(seconds=30), polling_interval=timedelta(seconds=1))
+
+    assert reports[0].ready is False
+
+
+@pytest.mark.asyncio
+async def test_without_server_wait_probes_back_off_to_polling_interval(reports, no_sleep) -> None:
+    health = _HealthServiceStub(ready_after=8)
+    sandboxes = _SandboxServiceStub()
+    sbx = _make_sandbox(health, sandboxes, reports)
+
+    await sbx.check_ready(timeout=timedelta(seconds=30), polling_interval=timedelta(seconds=0.1))
+
+    assert len(sandboxes.wait_calls) == 1
+    assert len(no_sleep) == 7
+    assert no_sleep[0] <= 0.01
+    assert all(delay <= 0.1 for delay in no_sleep)
+    assert reports[0].probes == 8
+
+
+@pytest.mark.asyncio
+async def test_timeout_is_reported(reports) -> None:
+    sbx = _make_sandbox(_HealthServiceStub(ready_after=10**6), _SandboxServiceStub(), reports)
+
+    with pytest.raises(SandboxReadyTimeoutException):
+        await sbx.check_ready(timeout=timedelta(seconds=0.05), polling_interval=timedelta(seconds=0.01))
+
+    assert reports[0].ready is False
+    assert reports[0].probes > 1
+
+
+def test_parse_sandbox_wait_detects_missing_route() -> None:
+    request = httpx.Request("GET", "http://server/sandboxes/sbx/wait")
+    missing = httpx.Response(404, json={"detail": "Not Found"}, request=request)
+    unknown = httpx.Response(404, json={"code": "SANDBOX_NOT_FOUND", "message": "no sbx"}, request=request)
+
+    assert parse_sandbox_wait(missing, "sbx") is None
+    with pytest.raises(SandboxApiException, match="no sbx"):
+        parse_sandbox_wait(unknown, "sbx")
+
+
+def test_sync_check_ready_uses_server_wait(monkeypatch: pytest.MonkeyPatch, reports) -> None:
+    monkeypatch.setattr("opensandbox.sync.sandbox.time.sleep", lambda _: None)
+    health = _HealthServiceSyncStub(ready_after=2)
+    sandboxes = _SandboxServiceSyncStub("Running")
+    sbx = SandboxSync(
+        sandbox_id=str(uuid4()),
+        sandbox_service=sandboxes,
+        filesystem_service=None,
+        command_service=None,
+        health_service=health,
+        metrics_service=None,
+        connection_config=ConnectionConfigSync(readiness_hook=reports.append),
+    )
+
+    sbx.check_ready(timeout=timedelta(seconds=30), polling_interval=timedelta(seconds=1))
+
+    assert len(sandboxes.wait_calls) == 1
+    assert (reports[0].probes, reports[0].server_waits) == (2, 1)
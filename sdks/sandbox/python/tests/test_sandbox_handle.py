@@ -0,0 +1,137 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import weakref
+
+import pytest
+
+from opensandbox.adapters.command_adapter import CommandsAdapter
+from opensandbox.adapters.factory import AdapterFactory
+from opensandbox.config import ConnectionConfig
+from opensandbox.config.connection_sync import ConnectionConfigSync
+from opensandbox.exceptions import SandboxInternalException
+from opensandbox.handle import SandboxHandle
+from opensandbox.models.sandboxes import SandboxCreateResponse, SandboxEndpoint
+from opensandbox.sandbox import Sandbox
+from opensandbox.sync.handle import SandboxHandleSync
+
+
+class _LifecycleStub:
+    def __init__(self) -> None:
+        self.killed: list[str] = []
+
+    async def create_sandbox(self, *args) -> SandboxCreateResponse:
+        return SandboxCreateResponse(id="sbx-1")
+
+    async def get_sandbox_endpoint(self, sandbox_id, port) -> SandboxEndpoint:
+        return SandboxEndpoint(endpoint=f"{sandbox_id}.local:{port}")
+
+    async def kill_sandbox(self, sandbox_id) -> None:
+        self.killed.append(sandbox_id)
+
+
+def _lazy_sandbox(config: ConnectionConfig, endpoint: str | None = "sbx.local:44772") -> Sandbox:
+    return Sandbox(
+        sandbox_id="sbx-1",
+        sandbox_service=None,
+        filesystem_service=None,
+        command_service=None,
+        health_service=None,
+        metrics_service=None,
+        connection_config=config,
+        execd_endpoint=SandboxEndpoint(endpoint=endpoint) if endpoint else None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_services_are_built_on_first_use_only() -> None:
+    sandbox = _lazy_sandbox(ConnectionConfig().with_transport_if_missing())
+    assert sandbox._command_service is None and sandbox._filesystem_service is None
+
+    commands = sandbox.commands
+
+    assert isinstance(commands, CommandsAdapter)
+    assert sandbox.commands is commands
+    assert sandbox._filesystem_service is None
+    assert sandbox._metrics_service is None
+    assert sandbox._sandbox_service is None
+    await sandbox.close()
+
+
+@pytest.mark.asyncio
+async def test_create_does_not_build_execd_adapters_it_does_not_use(monkeypatch: pytest.MonkeyPatch) -> None:
+    lifecycle = _LifecycleStub()
+    monkeypatch.setattr(AdapterFactory, "create_sandbox_service", lambda self: lifecycle)
+
+    sandbox = await Sandbox.create("python:3.11", skip_health_check=True)
+
+    assert sandbox._sandbox_service is lifecycle
+    assert sandbox._command_service is None
+    assert sandbox._health_service is None
+    await sandbox.kill()
+    assert lifecycle.killed == ["sbx-1"]
+    await sandbox.close()
+
+
+def test_sandbox_without_endpoint_cannot_build_execd_services() -> None:
+    sandbox = _lazy_sandbox(ConnectionConfig(), endpoint=None)
+
+    with pytest.raises(SandboxInternalException):
+        _ = sandbox.files
+    assert sandbox._filesystem_service is None
+    with pytest.raises(SandboxInternalException):
+        sandbox.to_handle()
+
+
+@pytest.mark.asyncio
+async def test_handle_round_trip_borrows_the_transport() -> None:
+    config = ConnectionConfig().with_transport_if_missing()
+    handle = _lazy_sandbox(config).to_handle()
+
+    assert (handle.id, handle.endpoint, handle.connection_config) == ("sbx-1", "sbx.local:44772", config)
+    assert not hasattr(handle, "__dict__")
+    assert weakref.ref(handle)() is handle
+
+    upgraded = handle.to_sandbox()
+    assert upgraded.connection_config.transport is config.transport
+    assert upgraded.connection_config._owns_transport is False
+    assert upgraded._require_execd_endpoint().endpoint == "sbx.local:44772"
+    await upgraded.close()
+    assert config._owns_transport is True
+    await config.close_transport_if_owned()
+
+
+@pytest.mark.asyncio
+async def test_handle_without_transport_gives_the_sandbox_its_own() -> None:
+    upgraded = SandboxHandle("sbx-1", "sbx.local:44772", ConnectionConfig()).to_sandbox()
+
+    assert upgraded.connection_config.transport is not None
+    assert upgraded.connection_config._owns_transport is True
+    await upgraded.close()
+
+
+def test_sync_handle_upgrades_lazily() -> None:
+    config = ConnectionConfigSync().with_transport_if_missing()
+    handle = SandboxHandleSync("sbx-1", "sbx.local:44772", config)
+
+    sandbox = handle.to_sandbox()
+
+    assert sandbox._command_service is None
+    assert sandbox.connection_config.transport is config.transport
+    assert sandbox.to_handle().endpoint == handle.endpoint
+    assert sandbox.commands is sandbox.commands
+    config.close_transport_if_owned()
@@ -0,0 +1,280 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import asyncio
+import itertools
+from contextlib import aclosing
+from datetime import timedelta
+
+import httpx
+import pytest
+
+from opensandbox.adapters.converter.response_handler import parse_batch_endpoints
+from opensandbox.config import ConnectionConfig
+from opensandbox.config.connection_sync import ConnectionConfigSync
+from opensandbox.exceptions import (
+    InvalidArgumentException,
+    SandboxApiException,
+    SandboxException,
+)
+from opensandbox.manager import SandboxManager
+from opensandbox.models.sandboxes import SandboxCreateResponse, SandboxEndpoint
+from opensandbox.sync.manager import SandboxManagerSync
+
+
+class _BatchServiceStub:
+    def __init__(self, *, batch_status: int | None = None) -> None:
+        self._ids = itertools.count()
+        self.batch_status = batch_status
+        self.batch_calls: list[list[str]] = []
+        self.single_calls: list[str] = []
+        self.killed: list[str] = []
+        self.renewed: list[str] = []
+        self.unresolvable: set[str] = set()
+        self.fail_creates = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    async def create_sandbox(self, *args) -> SandboxCreateResponse:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if self.fail_creates:
+                self.fail_creates -= 1
+                raise SandboxApiException("quota exceeded", status_code=429)
+            return SandboxCreateResponse(id=f"sbx-{next(self._ids)}")
+        finally:
+            self.in_flight -= 1
+
+    async def get_sandbox_endpoints(self, sandbox_ids, port):
+        if self.batch_status is not None:
+            raise SandboxApiException("not here", status_code=self.batch_status)
+        self.batch_calls.append(list(sandbox_ids))
+        return {
+            sandbox_id: SandboxException("not found")
+            if sandbox_id in self.unresolvable
+            else SandboxEndpoint(endpoint=f"{sandbox_id}.local:{port}")
+            for sandbox_id in sandbox_ids
+        }
+
+    async def get_sandbox_endpoint(self, sandbox_id, port) -> SandboxEndpoint:
+        self.single_calls.append(sandbox_id)
+        return SandboxEndpoint(endpoint=f"{sandbox_id}.local:{port}")
+
+    async def kill_sandbox(self, sandbox_id) -> None:
+        if sandbox_id == "missing":
+            raise SandboxApiException("not found", status_code=404)
+        self.killed.append(sandbox_id)
+
+    async def renew_sandbox_expiration(self, sandbox_id, new_expiration_time):
+        self.renewed.append(sandbox_id)
+        return new_expiration_time
+
+
+class _BatchServiceSyncStub:
+    def __init__(self) -> None:
+        self._ids = itertools.count()
+        self.batch_calls: list[list[str]] = []
+        self.killed: list[str] = []
+
+    def create_sandbox(self, *args) -> SandboxCreateResponse:
+        return SandboxCreateResponse(id=f"sbx-{next(self._ids)}")
+
+    def get_sandbox_endpoints(self, sandbox_ids, port):
+        self.batch_calls.append(list(sandbox_ids))
+        return {sandbox_id: SandboxEndpoint(endpoint=f"{sandbox_id}.local:{port}") for sandbox_id in sandbox_ids}
+
+    def kill_sandbox(self, sandbox_id) -> None:
+        self.killed.append(sandbox_id)
+
+
+def _manager(service) -> SandboxManager:
+    return SandboxManager(service, ConnectionConfig().with_transport_if_missing())
+
+
+async def _collect(results):
+    return [result async for result in results]
+
+
+@pytest.mark.asyncio
+async def test_create_many_streams_sandboxes_on_shared_transport() -> None:
+    service = _BatchServiceStub()
+    manager = _manager(service)
+
+    results = await _collect(manager.create_many("python:3.11", 5, concurrency=2, skip_health_check=True))
+
+    assert sorted(result.index for result in results) == [0, 1, 2, 3, 4]
+    assert all(result.ok for result in results)
+    assert service.peak == 2
+    assert sorted(sum(service.batch_calls, [])) == sorted(result.sandbox_id for result in results)
+    sandbox = results[0].value
+    assert sandbox.connection_config.transport is manager.connection_config.transport
+    assert sandbox.connection_config._owns_transport is False
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_create_many_falls_back_when_batch_endpoint_is_missing() -> None:
+    service = _BatchServiceStub(batch_status=405)
+    manager = _manager(service)
+
+    results = await _collect(manager.create_many("python:3.11", 3, skip_health_check=True))
+
+    assert all(result.ok for result in results)
+    assert sorted(service.single_calls) == ["sbx-0", "sbx-1", "sbx-2"]
+    assert manager._batch_endpoints is False
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_create_many_reports_and_cleans_up_failures() -> None:
+    service = _BatchServiceStub()
+    service.fail_creates = 1
+    service.unresolvable = {"sbx-0"}
+
+    async def _never_healthy(sandbox) -> bool:
+        return sandbox.id != "sbx-1"
+
+    results = await _collect(
+        _manager(service).create_many(
+            "python:3.11",
+            4,
+            concurrency=1,
+            health_check=_never_healthy,
+            ready_timeout=timedelta(milliseconds=50),
+            health_check_polling_interval=timedelta(milliseconds=10),
+        )
+    )
+
+    failed = {result.sandbox_id: result.error for result in results if not result.ok}
+    assert set(failed) == {None, "sbx-0", "sbx-1"}
+    assert isinstance(failed[None], SandboxApiException)
+    assert sorted(service.killed) == ["sbx-0", "sbx-1"]
+    assert [result.sandbox_id for result in results if result.ok] == ["sbx-2"]
+
+
+@pytest.mark.asyncio
+async def test_create_many_bounds_readiness_waits_by_concurrency() -> None:
+    service = _BatchServiceStub()
+    checking = 0
+    peak = 0
+
+    async def _slow_health(sandbox) -> bool:
+        nonlocal checking, peak
+        checking += 1
+        peak = max(peak, checking + service.in_flight)
+        await asyncio.sleep(0.02)
+        checking -= 1
+        return True
+
+    results = await _collect(_manager(service).create_many("python:3.11", 6, concurrency=2, health_check=_slow_health))
+
+    assert all(result.ok for result in results)
+    assert peak <= 2
+
+
+@pytest.mark.asyncio
+async def test_create_many_kills_undelivered_sandboxes_when_closed_early() -> None:
+    service = _BatchServiceStub()
+    manager = _manager(service)
+
+    async with aclosing(manager.create_many("python:3.11", 4, concurrency=4, skip_health_check=True)) as results:
+        first = await anext(results)
+
+    await asyncio.sleep(0.05)
+    assert first.sandbox_id not in service.killed
+    created = {f"sbx-{i}" for i in range(4)} - {first.sandbox_id}
+    assert set(service.killed) == created
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_kill_many_and_renew_many_report_each_item() -> None:
+    service = _BatchServiceStub()
+    manager = _manager(service)
+
+    kills = await _collect(manager.kill_many(["a", "missing", "b"], concurrency=2))
+    renewals = await _collect(manager.renew_many(["a", "b"], timedelta(minutes=5)))
+
+    assert {result.sandbox_id: result.ok for result in kills} == {"a": True, "missing": False, "b": True}
+    assert next(result.index for result in kills if not result.ok) == 1
+    assert sorted(service.renewed) == ["a", "b"]
+    assert renewals[0].value == renewals[1].value
+
+
+@pytest.mark.asyncio
+async def test_batch_arguments_are_validated() -> None:
+    manager = _manager(_BatchServiceStub())
+
+    with pytest.raises(InvalidArgumentException):
+        await _collect(manager.create_many("python:3.11", 1, concurrency=0))
+    with pytest.raises(InvalidArgumentException):
+        await _collect(manager.create_many("python:3.11", -1))
+
+
+def test_sync_create_many_and_kill_many() -> None:
+    service = _BatchServiceSyncStub()
+    manager = SandboxManagerSync(service, ConnectionConfigSync().with_transport_if_missing())
+
+    created = list(manager.create_many("python:3.11", 3, concurrency=3, skip_health_check=True))
+    ids = [result.sandbox_id for result in created]
+    killed = list(manager.kill_many(ids))
+
+    assert all(result.ok for result in created)
+    assert sorted(sum(service.batch_calls, [])) == sorted(ids)
+    assert sorted(result.sandbox_id for result in killed) == sorted(ids)
+    assert sorted(service.killed) == sorted(ids)
+    manager.close()
+
+
+def test_sync_create_many_kills_undelivered_sandboxes_when_closed_early() -> None:
+    service = _BatchServiceSyncStub()
+    manager = SandboxManagerSync(service, ConnectionConfigSync().with_transport_if_missing())
+
+    results = manager.create_many("python:3.11", 3, concurrency=1, skip_health_check=True)
+    first = next(results)
+    results.close()
+
+    assert first.sandbox_id not in service.killed
+    assert len(service.killed) == 2
+    manager.close()
+
+
+def test_parse_batch_endpoints_maps_items_and_errors() -> None:
+    response = httpx.Response(
+        200,
+        json={
+            "items": [
+                {"sandboxId": "a", "endpoints": {"44772": {"endpoint": "a.local:44772"}}},
+                {"sandboxId": "b", "error": {"code": "SANDBOX_NOT_FOUND", "message": "gone"}},
+            ]
+        },
+    )
+
+    results = parse_batch_endpoints(response, ["a", "b", "c"], 44772)
+
+    assert results["a"] == SandboxEndpoint(endpoint="a.local:44772")
+    assert results["b"].error.code == "SANDBOX_NOT_FOUND"
+    assert isinstance(results["c"], SandboxException)
+
+
+def test_parse_batch_endpoints_raises_with_status_for_missing_api() -> None:
+    with pytest.raises(SandboxApiException) as exc_info:
+        parse_batch_endpoints(httpx.Response(405, json={"detail": "Method Not Allowed"}), ["a"], 44772)
+
+    assert exc_info.value.status_code == 405
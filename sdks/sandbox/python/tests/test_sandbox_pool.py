@@ -0,0 +1,256 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import asyncio
+import itertools
+from datetime import timedelta
+
+import pytest
+
+from opensandbox.exceptions import InvalidArgumentException, SandboxException
+from opensandbox.pool import SandboxPool
+from opensandbox.sandbox import Sandbox
+from opensandbox.sync.pool import SandboxPoolSync
+from opensandbox.sync.sandbox import SandboxSync
+
+_ids = itertools.count()
+
+
+class _FakeSandbox:
+    def __init__(self) -> None:
+        self.id = f"sbx-{next(_ids)}"
+        self.killed = False
+        self.renewals = 0
+        self.fail_renew = False
+
+    async def kill(self) -> None:
+        self.killed = True
+
+    async def renew(self, timeout: timedelta) -> None:
+        if self.fail_renew:
+            raise SandboxException("gone")
+        self.renewals += 1
+
+
+class _FakeSandboxSync(_FakeSandbox):
+    def kill(self) -> None:  # type: ignore[override]
+        self.killed = True
+
+    def renew(self, timeout: timedelta) -> None:  # type: ignore[override]
+        if self.fail_renew:
+            raise SandboxException("gone")
+        self.renewals += 1
+
+
+@pytest.fixture
+def created(monkeypatch: pytest.MonkeyPatch) -> list[_FakeSandbox]:
+    sandboxes: list[_FakeSandbox] = []
+
+    async def _create(image, **kwargs):
+        assert kwargs["connection_config"]._owns_transport is False
+        sandbox = _FakeSandbox()
+        sandboxes.append(sandbox)
+        return sandbox
+
+    monkeypatch.setattr(Sandbox, "create", _create)
+    return sandboxes
+
+
+@pytest.fixture
+def created_sync(monkeypatch: pytest.MonkeyPatch) -> list[_FakeSandboxSync]:
+    sandboxes: list[_FakeSandboxSync] = []
+
+    def _create(image, **kwargs):
+        sandbox = _FakeSandboxSync()
+        sandboxes.append(sandbox)
+        return sandbox
+
+    monkeypatch.setattr(SandboxSync, "create", _create)
+    return sandboxes
+
+
+def _pool(**kwargs) -> SandboxPool:
+    kwargs.setdefault("maintenance_interval", timedelta(hours=1))
+    return SandboxPool("python:3.11", **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_acquire_hits_warm_pool_and_refills(created) -> None:
+    pool = await _pool(size=2).start(wait_ready=True)
+    assert pool.stats.idle == 2
+
+    sandbox = await pool.acquire()
+    assert sandbox is created[0]
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    stats = pool.stats
+    assert (stats.hits, stats.misses, stats.in_use) == (1, 0, 1)
+    assert stats.idle == 2 and stats.refills == 3
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_empty_pool_creates_on_demand(created) -> None:
+    pool = await _pool(size=0).start()
+
+    sandbox = await pool.acquire()
+
+    assert sandbox is created[0]
+    assert pool.stats.misses == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_refill_concurrency_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    in_flight = 0
+    peak = 0
+
+    async def _create(image, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _FakeSandbox()
+
+    monkeypatch.setattr(Sandbox, "create", _create)
+    pool = await _pool(size=6, max_concurrency=2).start(wait_ready=True)
+
+    assert peak == 2
+    assert pool.stats.idle == 6
+    assert pool.stats.refill_latency_max > 0
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_release_discards_by_default(created) -> None:
+    pool = await _pool(size=1).start(wait_ready=True)
+    sandbox = await pool.acquire()
+
+    await pool.release(sandbox)
+
+    assert sandbox.killed
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_release_in_reset_mode_returns_sandbox(created) -> None:
+    reset_calls = []
+
+    async def _reset(sandbox) -> None:
+        reset_calls.append(sandbox)
+
+    pool = await _pool(size=2, release_mode="reset", reset=_reset).start(wait_ready=True)
+    async with pool.sandbox() as sandbox:
+        assert pool.stats.in_use == 1
+
+    assert reset_calls == [sandbox]
+    assert not sandbox.killed
+    assert any(member.sandbox is sandbox for member in pool._idle)
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_sandbox_context_discards_on_error(created) -> None:
+    async def _reset(sandbox) -> None:
+        raise AssertionError("not called")
+
+    pool = await _pool(size=1, release_mode="reset", reset=_reset).start(wait_ready=True)
+    with pytest.raises(RuntimeError):
+        async with pool.sandbox() as sandbox:
+            raise RuntimeError("boom")
+
+    assert sandbox.killed
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_maintain_renews_expiring_and_evicts_idle(created) -> None:
+    pool = await _pool(
+        size=2, timeout=timedelta(minutes=10), renew_before=timedelta(minutes=2), max_idle=timedelta(minutes=5)
+    ).start(wait_ready=True)
+    expiring, stale = list(pool._idle)
+    expiring.expires_at -= 9 * 60
+    stale.idle_since -= 6 * 60
+
+    await pool.maintain()
+    await asyncio.sleep(0)
+
+    assert expiring.sandbox.renewals == 1
+    assert stale.sandbox.killed
+    stats = pool.stats
+    assert (stats.renewals, stats.evictions, stats.idle) == (1, 1, 2)
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_renew_evicts_member(created) -> None:
+    pool = await _pool(size=1).start(wait_ready=True)
+    member = pool._idle[0]
+    member.sandbox.fail_renew = True
+    member.expires_at -= 9 * 60
+
+    await pool.maintain()
+
+    assert member.sandbox.killed
+    assert pool.stats.evictions == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_close_kills_idle_members_and_rejects_acquire(created) -> None:
+    pool = await _pool(size=2).start(wait_ready=True)
+
+    await pool.close()
+
+    assert all(sandbox.killed for sandbox in created)
+    with pytest.raises(SandboxException):
+        await pool.acquire()
+
+
+def test_reset_mode_requires_callback() -> None:
+    with pytest.raises(InvalidArgumentException):
+        SandboxPool("python:3.11", size=1, release_mode="reset")
+
+
+def test_sync_pool_acquire_release_and_close(created_sync) -> None:
+    with SandboxPoolSync("python:3.11", size=2, maintenance_interval=timedelta(hours=1)) as pool:
+        pool.start(wait_ready=True)
+        assert pool.stats.idle == 2
+
+        with pool.sandbox() as sandbox:
+            assert sandbox in created_sync
+        assert sandbox.killed
+        assert pool.stats.hits == 1
+
+    assert all(s.killed for s in created_sync)
+    with pytest.raises(SandboxException):
+        pool.acquire()
+
+
+def test_sync_pool_maintain_renews_expiring(created_sync) -> None:
+    pool = SandboxPoolSync("python:3.11", size=1, maintenance_interval=timedelta(hours=1))
+    pool.start(wait_ready=True)
+    member = pool._idle[0]
+    member.expires_at -= 9 * 60
+
+    pool.maintain()
+
+    assert member.sandbox.renewals == 1
+    assert pool.stats.renewals == 1
+    pool.close()
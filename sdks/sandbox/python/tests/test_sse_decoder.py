@@ -0,0 +1,116 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from opensandbox.adapters.converter import sse
+from opensandbox.adapters.converter.event_node import EventNodeError, EventNodeResults
+from opensandbox.adapters.converter.execution_event_dispatcher import (
+    ExecutionEventDispatcher,
+)
+from opensandbox.adapters.converter.sse import (
+    SseDecoder,
+    StreamEvent,
+    aiter_stream_events,
+    iter_stream_events,
+)
+from opensandbox.models.execd import Execution
+
+_STREAM = (
+    b'data: {"type":"init","text":"exec-1","timestamp":1}\r\n\r\n'
+    b": keep-alive\n"
+    b"event: message\n"
+    b'{"type":"stdout","text":"plain \\u00e9","timestamp":2}\n'
+    b"not-json\n\n"
+    b'data: {"type":"stdout","timestamp":"late"}\n\n'
+    b'data: {"type":"result","results":{"text":"ok","text/html":"<b>ok</b>"},"timestamp":3}\n\n'
+    b'data: {"type":"error","error":{"ename":"ValueError","evalue":"bad","traceback":["t"]},"timestamp":4}\n\n'
+    b'data: {"type":"execution_complete","timestamp":5,"execution_time":6}'
+)
+
+
+def _decode_in_chunks(body: bytes, size: int) -> list[StreamEvent]:
+    decoder = SseDecoder()
+    events: list[StreamEvent] = []
+    for start in range(0, len(body), size):
+        events.extend(decoder.feed(body[start : start + size]))
+    return events + decoder.flush()
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, len(_STREAM)])
+def test_decoder_is_independent_of_chunk_boundaries(size: int) -> None:
+    events = _decode_in_chunks(_STREAM, size)
+
+    assert [e.type for e in events] == ["init", "stdout", "result", "error", "execution_complete"]
+    assert events[1].text == "plain \u00e9"
+    assert events[4].execution_time_in_millis == 6
+
+
+def test_nested_payloads_are_validated_on_access() -> None:
+    result, error = _decode_in_chunks(_STREAM, len(_STREAM))[2:4]
+
+    assert isinstance(result.results, EventNodeResults)
+    assert result.results.get_text() == "ok"
+    assert result.results is result.results
+    assert isinstance(error.error, EventNodeError)
+    assert (error.error.name, error.error.value, error.error.traceback) == ("ValueError", "bad", ["t"])
+
+
+def test_stream_event_rejects_missing_required_fields() -> None:
+    with pytest.raises(ValueError):
+        StreamEvent({"type": "stdout"})
+    with pytest.raises(ValueError):
+        StreamEvent({"timestamp": 1})
+
+
+def test_stdlib_fallback_decodes_the_same_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    import json
+
+    monkeypatch.setattr(sse, "_loads", json.loads)
+    monkeypatch.setattr(sse, "_decode_errors", (ValueError,))
+
+    events = _decode_in_chunks(_STREAM, 5)
+
+    assert [e.type for e in events] == ["init", "stdout", "result", "error", "execution_complete"]
+
+
+@pytest.mark.asyncio
+async def test_async_iteration_feeds_dispatcher() -> None:
+    response = httpx.Response(200, content=_STREAM)
+    execution = Execution()
+    dispatcher = ExecutionEventDispatcher(execution)
+
+    async for event in aiter_stream_events(response):
+        await dispatcher.dispatch(event)
+
+    assert execution.id == "exec-1"
+    assert [m.text for m in execution.logs.stdout] == ["plain \u00e9"]
+    assert execution.result[0].text == "ok"
+    assert execution.error is not None and execution.error.name == "ValueError"
+
+
+def test_sync_iteration_matches_async() -> None:
+    response = httpx.Response(200, content=iter([_STREAM[:50], _STREAM[50:]]))
+
+    assert [e.type for e in iter_stream_events(response)] == [
+        "init",
+        "stdout",
+        "result",
+        "error",
+        "execution_complete",
+    ]
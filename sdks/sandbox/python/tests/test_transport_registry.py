@@ -0,0 +1,144 @@
+#
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from opensandbox.config import ConnectionConfig, ConnectionConfigSync
+from opensandbox.config import connection as connection_module
+from opensandbox.config import connection_sync as connection_sync_module
+from opensandbox.config.transport_registry import (
+    SharedAsyncTransport,
+    TransportRegistry,
+    TransportStats,
+)
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def registry(monkeypatch: pytest.MonkeyPatch) -> TransportRegistry:
+    fresh = TransportRegistry()
+    monkeypatch.setattr(connection_module, "transport_registry", fresh)
+    monkeypatch.setattr(connection_sync_module, "transport_registry", fresh)
+    return fresh
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_configs_share_one_refcounted_transport(registry) -> None:
+    first = ConnectionConfig(share_transport=True).with_transport_if_missing()
+    second = ConnectionConfig(share_transport=True, api_key="other").with_transport_if_missing()
+    assert first.transport is second.transport
+    assert registry.stats().references == 2
+
+    await first.close_transport_if_owned()
+    await first.close_transport_if_owned()
+    assert registry.stats() == TransportStats(transports=1, references=1, requests=0, connections=0)
+
+    await second.close_transport_if_owned()
+    assert registry.stats().transports == 0
+
+
+@pytest.mark.asyncio
+async def test_proxy_and_tls_settings_get_separate_transports(registry) -> None:
+    plain = ConnectionConfig(share_transport=True).with_transport_if_missing()
+    insecure = ConnectionConfig(share_transport=True, verify=False).with_transport_if_missing()
+    proxied = ConnectionConfig(share_transport=True, proxy="http://proxy:3128").with_transport_if_missing()
+
+    assert len({id(plain.transport), id(insecure.transport), id(proxied.transport)}) == 3
+    for config in (plain, insecure, proxied):
+        await config.close_transport_if_owned()
+
+
+def test_event_loops_get_separate_transports(registry) -> None:
+    async def _acquire() -> httpx.AsyncBaseTransport:
+        return ConnectionConfig(share_transport=True).with_transport_if_missing().transport
+
+    assert asyncio.run(_acquire()) is not asyncio.run(_acquire())
+
+
+def test_without_running_loop_a_private_transport_is_created(registry) -> None:
+    config = ConnectionConfig(share_transport=True).with_transport_if_missing()
+
+    assert not isinstance(config.transport, SharedAsyncTransport)
+    assert config.transport_stats() is None
+    assert registry.stats().transports == 0
+
+
+def test_unshared_configs_keep_private_transports() -> None:
+    first = ConnectionConfigSync().with_transport_if_missing()
+    second = ConnectionConfigSync().with_transport_if_missing()
+
+    assert first.transport is not second.transport
+    first.close_transport_if_owned()
+    second.close_transport_if_owned()
+
+
+@pytest.mark.asyncio
+async def test_shared_transport_reports_connection_reuse(registry, server_url) -> None:
+    configs = [ConnectionConfig(share_transport=True).with_transport_if_missing() for _ in range(3)]
+    clients = [httpx.AsyncClient(transport=config.transport) for config in configs]
+
+    for client in clients:
+        assert (await client.get(server_url)).status_code == 200
+
+    stats = configs[0].transport_stats()
+    assert (stats.references, stats.requests, stats.connections) == (3, 3, 1)
+    assert stats.reuse_ratio == pytest.approx(2 / 3)
+    for config in configs:
+        await config.close_transport_if_owned()
+
+
+def test_sync_configs_share_transport_and_report_reuse(registry, server_url) -> None:
+    configs = [ConnectionConfigSync(share_transport=True).with_transport_if_missing() for _ in range(2)]
+    assert configs[0].transport is configs[1].transport
+
+    for config in configs:
+        with httpx.Client(transport=config.transport) as client:
+            client.get(server_url)
+
+    stats = registry.stats()
+    assert (stats.transports, stats.requests, stats.connections) == (1, 2, 1)
+    assert stats.reuse_ratio == pytest.approx(0.5)
+    for config in configs:
+        config.close_transport_if_owned()
+    assert registry.stats().transports == 0
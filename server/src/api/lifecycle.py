@@ -22,13 +22,18 @@ All business logic is delegated to the service layer that backs each operation.
 from typing import List, Optional
 
 from fastapi import APIRouter,Header, Query, status
-from fastapi.responses import Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
 
 from src.api.schema import (
+    BatchEndpointsRequest,
+    BatchEndpointsResponse,
+    CloneSandboxRequest,
     CreateSandboxRequest,
     CreateSandboxResponse,
     Endpoint,
     ErrorResponse,
+    FleetStatsResponse,
     ListSandboxesRequest,
     ListSandboxesResponse,
     PaginationRequest,
@@ -36,6 +41,7 @@ from src.api.schema import (
     RenewSandboxExpirationResponse,
     Sandbox,
     SandboxFilter,
+    SandboxStatsResponse,
 )
 from src.services.factory import create_sandbox_service
 
@@ -85,7 +91,7 @@ async def create_sandbox(
         HTTPException: If sandbox creation scheduling fails
     """
 
-    return sandbox_service.create_sandbox(request)
+    return await sandbox_service.create_sandbox_async(request)
 
 
 # Search endpoint
@@ -152,6 +158,37 @@ async def list_sandboxes(
     return sandbox_service.list_sandboxes(request)
 
 
+@router.get(
+    "/sandboxes/stats",
+    response_model=FleetStatsResponse,
+    response_model_exclude_none=True,
+    responses={
+        200: {"description": "Aggregated resource usage across sandboxes"},
+        401: {"model": ErrorResponse, "description": "Authentication credentials are missing or invalid"},
+        501: {"model": ErrorResponse, "description": "Resource stats are not available for this runtime"},
+    },
+)
+async def get_fleet_stats(
+    x_request_id: Optional[str] = Header(None, alias="X-Request-ID"),
+) -> FleetStatsResponse:
+    """
+    Get fleet-wide resource usage.
+
+    Sums the most recent cgroup sample of every sandbox tracked by the stats collector.
+    Registered before /sandboxes/{sandbox_id} so "stats" is not captured as a sandbox ID.
+
+    Args:
+        x_request_id: Unique request identifier for tracing
+
+    Returns:
+        FleetStatsResponse: Aggregated resource usage
+
+    Raises:
+        HTTPException: If stats collection is not available
+    """
+    return sandbox_service.get_fleet_stats()
+
+
 @router.get(
     "/sandboxes/{sandbox_id}",
     response_model=Sandbox,
@@ -188,11 +225,51 @@ async def get_sandbox(
     return sandbox_service.get_sandbox(sandbox_id)
 
 
+@router.get(
+    "/sandboxes/{sandbox_id}/wait",
+    response_model=Sandbox,
+    response_model_exclude_none=True,
+    responses={
+        200: {"description": "Sandbox state at the end of the wait"},
+        401: {"model": ErrorResponse, "description": "Authentication credentials are missing or invalid"},
+        403: {"model": ErrorResponse, "description": "The authenticated user lacks permission for this operation"},
+        404: {"model": ErrorResponse, "description": "The requested resource does not exist"},
+        500: {"model": ErrorResponse, "description": "An unexpected server error occurred"},
+    },
+)
+async def wait_for_sandbox(
+    sandbox_id: str,
+    state: List[str] = Query(["Running"], description="Lifecycle states to wait for"),
+    timeout: float = Query(30.0, gt=0, le=60, description="Maximum time to wait, in seconds"),
+    x_request_id: Optional[str] = Header(None, alias="X-Request-ID"),
+) -> Sandbox:
+    """
+    Long-poll a sandbox until it reaches a lifecycle state.
+
+    Returns as soon as the sandbox is in one of the requested states or in a
+    terminal state (Failed, Terminated), or when the timeout expires. Clients
+    check ``status.state`` of the response to tell these apart.
+
+    Args:
+        sandbox_id: Unique sandbox identifier
+        state: Lifecycle states to wait for
+        timeout: Maximum time to wait, in seconds
+        x_request_id: Unique request identifier for tracing
+
+    Returns:
+        Sandbox: Sandbox information at the end of the wait
+
+    Raises:
+        HTTPException: If sandbox not found or access denied
+    """
+    return await sandbox_service.wait_for_state_async(sandbox_id, state, timeout)
+
+
 @router.delete(
     "/sandboxes/{sandbox_id}",
-    status_code=status.HTTP_204_NO_CONTENT,
+    status_code=status.HTTP_202_ACCEPTED,
     responses={
-        204: {"description": "Sandbox successfully deleted"},
+        202: {"description": "Sandbox deletion accepted; the sandbox is Stopping until removed"},
         401: {"model": ErrorResponse, "description": "Authentication credentials are missing or invalid"},
         403: {"model": ErrorResponse, "description": "The authenticated user lacks permission for this operation"},
         404: {"model": ErrorResponse, "description": "The requested resource does not exist"},
@@ -207,21 +284,22 @@ async def delete_sandbox(
     """
     Delete a sandbox.
 
-    Terminates sandbox execution. The sandbox will transition through Stopping state to Terminated.
+    Terminates sandbox execution. The request returns once termination is scheduled;
+    the sandbox reports Stopping until its resources are released.
 
     Args:
         sandbox_id: Unique sandbox identifier
         x_request_id: Unique request identifier for tracing
 
     Returns:
-        Response: 204 No Content
+        Response: 202 Accepted
 
     Raises:
         HTTPException: If sandbox not found or deletion fails
     """
     # Delegate to the service layer for deletion
     sandbox_service.delete_sandbox(sandbox_id)
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
+    return Response(status_code=status.HTTP_202_ACCEPTED)
 
 
 # ============================================================================
@@ -284,7 +362,8 @@ async def resume_sandbox(
     """
     Resume a paused sandbox.
 
-    Resumes execution of a paused sandbox.
+    Resumes execution of a paused sandbox, or restores a hibernated one in
+    the background (it reports Pending meanwhile).
     Poll GET /sandboxes/{sandboxId} to track state transition to Running.
 
     Args:
@@ -302,6 +381,93 @@ async def resume_sandbox(
     return Response(status_code=status.HTTP_202_ACCEPTED)
 
 
+@router.post(
+    "/sandboxes/{sandbox_id}/hibernate",
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        202: {"description": "Hibernate operation accepted"},
+        401: {"model": ErrorResponse, "description": "Authentication credentials are missing or invalid"},
+        403: {"model": ErrorResponse, "description": "The authenticated user lacks permission for this operation"},
+        404: {"model": ErrorResponse, "description": "The requested resource does not exist"},
+        409: {"model": ErrorResponse, "description": "The operation conflicts with the current state"},
+        500: {"model": ErrorResponse, "description": "An unexpected server error occurred"},
+        501: {"model": ErrorResponse, "description": "The runtime does not support hibernation"},
+    },
+)
+async def hibernate_sandbox(
+    sandbox_id: str,
+    x_request_id: Optional[str] = Header(None, alias="X-Request-ID"),
+) -> Response:
+    """
+    Snapshot a sandbox and free its runtime resources.
+
+    The sandbox filesystem is committed to an image and the container removed
+    in the background; the sandbox reports Hibernating until it is Hibernated.
+    POST /sandboxes/{sandboxId}/resume restores it under the same ID.
+
+    Args:
+        sandbox_id: Unique sandbox identifier
+        x_request_id: Unique request identifier for tracing
+
+    Returns:
+        Response: 202 Accepted
+
+    Raises:
+        HTTPException: If sandbox not found or cannot be hibernated
+    """
+    sandbox_service.hibernate_sandbox(sandbox_id)
+    return Response(status_code=status.HTTP_202_ACCEPTED)
+
+
+@router.post(
+    "/sandboxes/{sandbox_id}/clone",
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {
+            "description": "Newline-delimited JSON stream with one CloneSandboxResult per clone, in completion order",
+            "content": {"application/x-ndjson": {}},
+        },
+        401: {"model": ErrorResponse, "description": "Authentication credentials are missing or invalid"},
+        403: {"model": ErrorResponse, "description": "The authenticated user lacks permission for this operation"},
+        404: {"model": ErrorResponse, "description": "The requested resource does not exist"},
+        409: {"model": ErrorResponse, "description": "The operation conflicts with the current state"},
+        500: {"model": ErrorResponse, "description": "An unexpected server error occurred"},
+        501: {"model": ErrorResponse, "description": "The runtime does not support cloning"},
+    },
+)
+async def clone_sandbox(
+    sandbox_id: str,
+    count: int = Query(1, ge=1, le=64, description="Number of clones to create"),
+    request: Optional[CloneSandboxRequest] = None,
+    x_request_id: Optional[str] = Header(None, alias="X-Request-ID"),
+) -> StreamingResponse:
+    """
+    Create copies of a running sandbox, including its filesystem state.
+
+    The source is snapshotted once; each clone gets its own ID and expiration
+    and is streamed back as soon as it is provisioned. Per-clone failures are
+    reported in the stream rather than failing the whole request.
+
+    Args:
+        sandbox_id: Unique identifier of the source sandbox
+        count: Number of clones to create
+        request: Optional timeout and metadata overrides for the clones
+        x_request_id: Unique request identifier for tracing
+
+    Returns:
+        StreamingResponse: NDJSON stream of CloneSandboxResult
+
+    Raises:
+        HTTPException: If the source sandbox cannot be cloned
+    """
+    # Snapshotting the source blocks on the runtime; clones are then streamed from the threadpool.
+    results = await run_in_threadpool(sandbox_service.clone_sandbox, sandbox_id, count, request)
+    return StreamingResponse(
+        (result.model_dump_json(by_alias=True, exclude_none=True) + "\n" for result in results),
+        media_type="application/x-ndjson",
+    )
+
+
 @router.post(
     "/sandboxes/{sandbox_id}/renew-expiration",
     response_model=RenewSandboxExpirationResponse,
@@ -339,7 +505,7 @@ async def renew_sandbox_expiration(
         HTTPException: If sandbox not found or renewal fails
     """
     # Delegate to the service layer for expiration updates
-    return sandbox_service.renew_expiration(sandbox_id, request)
+    return await sandbox_service.renew_expiration_async(sandbox_id, request)
 
 
 # ============================================================================
@@ -383,3 +549,73 @@ async def get_sandbox_endpoint(
     """
     # Delegate to the service layer for endpoint resolution
     return sandbox_service.get_endpoint(sandbox_id, port)
+
+
+@router.post(
+    "/sandboxes/endpoints",
+    response_model=BatchEndpointsResponse,
+    response_model_exclude_none=True,
+    responses={
+        200: {"description": "Endpoints resolved; per-sandbox failures are reported in each item"},
+        400: {"model": ErrorResponse, "description": "The request was invalid or malformed"},
+        401: {"model": ErrorResponse, "description": "Authentication credentials are missing or invalid"},
+        403: {"model": ErrorResponse, "description": "The authenticated user lacks permission for this operation"},
+        500: {"model": ErrorResponse, "description": "An unexpected server error occurred"},
+    },
+)
+async def get_sandbox_endpoints(
+    request: BatchEndpointsRequest,
+    x_request_id: Optional[str] = Header(None, alias="X-Request-ID"),
+) -> BatchEndpointsResponse:
+    """
+    Get access endpoints for several ports of several sandboxes.
+
+    Args:
+        request: Sandbox IDs and ports to resolve
+        x_request_id: Unique request identifier for tracing
+
+    Returns:
+        BatchEndpointsResponse: Endpoints per sandbox, in request order
+
+    Raises:
+        HTTPException: If a port is invalid or the runtime cannot be queried
+    """
+    return sandbox_service.get_endpoints(request.sandbox_ids, request.ports)
+
+
+# ============================================================================
+# Sandbox Resource Stats
+# ============================================================================
+
+@router.get(
+    "/sandboxes/{sandbox_id}/stats",
+    response_model=SandboxStatsResponse,
+    response_model_exclude_none=True,
+    responses={
+        200: {"description": "Recent resource usage samples for the sandbox"},
+        401: {"model": ErrorResponse, "description": "Authentication credentials are missing or invalid"},
+        404: {"model": ErrorResponse, "description": "The requested resource does not exist"},
+        501: {"model": ErrorResponse, "description": "Resource stats are not available for this runtime"},
+    },
+)
+async def get_sandbox_stats(
+    sandbox_id: str,
+    x_request_id: Optional[str] = Header(None, alias="X-Request-ID"),
+) -> SandboxStatsResponse:
+    """
+    Get sandbox resource usage.
+
+    Returns the ring buffer of cgroup samples (CPU, memory, block IO, pids)
+    recorded for the sandbox, oldest first.
+
+    Args:
+        sandbox_id: Unique sandbox identifier
+        x_request_id: Unique request identifier for tracing
+
+    Returns:
+        SandboxStatsResponse: Sampled resource usage history
+
+    Raises:
+        HTTPException: If the sandbox has no samples or stats are not available
+    """
+    return sandbox_service.get_sandbox_stats(sandbox_id)
@@ -80,7 +80,7 @@ class SandboxStatus(BaseModel):
     """
     state: str = Field(
         ...,
-        description="Current lifecycle state (Pending, Running, Pausing, Paused, Stopping, Terminated, Failed)",
+        description="Current lifecycle state (Pending, Running, Pausing, Paused, Hibernated, Stopping, Terminated, Failed)",
     )
     reason: Optional[str] = Field(
         None,
@@ -293,6 +293,80 @@ class Endpoint(BaseModel):
     )
 
 
+# ============================================================================
+# Resource Stats
+# ============================================================================
+
+class SandboxResourceSample(BaseModel):
+    """
+    Point-in-time resource usage sampled from the sandbox cgroup.
+    """
+    collected_at: datetime = Field(..., alias="collectedAt", description="Time the sample was taken")
+    cpu_percent: Optional[float] = Field(
+        None,
+        alias="cpuPercent",
+        description="CPU usage since the previous sample, in percent of one core (absent for the first sample)",
+    )
+    cpu_usage_usec: int = Field(..., alias="cpuUsageUsec", description="Cumulative CPU time in microseconds")
+    memory_bytes: int = Field(..., alias="memoryBytes", description="Current memory usage in bytes")
+    io_read_bytes: int = Field(..., alias="ioReadBytes", description="Cumulative bytes read from block devices")
+    io_write_bytes: int = Field(..., alias="ioWriteBytes", description="Cumulative bytes written to block devices")
+    pids: int = Field(..., description="Current number of processes and threads")
+
+    class Config:
+        populate_by_name = True
+
+
+class SandboxStatsResponse(BaseModel):
+    """
+    Recent resource usage history for a single sandbox (oldest sample first).
+    """
+    sandbox_id: str = Field(..., alias="sandboxId", description="Unique sandbox identifier")
+    samples: List[SandboxResourceSample] = Field(..., description="Sampled resource usage, oldest first")
+
+    class Config:
+        populate_by_name = True
+
+
+class IdleStats(BaseModel):
+    """
+    Idle detection counters for the fleet.
+    """
+    active: int = Field(..., ge=0, description="Sandboxes whose latest sample is at or above the CPU threshold")
+    idle: int = Field(..., ge=0, description="Sandboxes whose latest sample is below the CPU threshold")
+    auto_paused: int = Field(..., ge=0, alias="autoPaused", description="Sandboxes currently paused by the idle policy")
+    auto_pause_total: int = Field(..., ge=0, alias="autoPauseTotal", description="Idle pauses since server start")
+    auto_resume_total: int = Field(..., ge=0, alias="autoResumeTotal", description="Transparent resumes since server start")
+    hibernate_total: int = Field(
+        0, ge=0, alias="hibernateTotal", description="Idle sandboxes hibernated since server start"
+    )
+    reclaim_total: int = Field(..., ge=0, alias="reclaimTotal", description="Idle sandboxes deleted since server start")
+
+    class Config:
+        populate_by_name = True
+
+
+class FleetStatsResponse(BaseModel):
+    """
+    Aggregated latest resource usage across all sampled sandboxes.
+    """
+    sandbox_count: int = Field(..., ge=0, alias="sandboxCount", description="Number of sandboxes with samples")
+    cpu_percent: float = Field(..., alias="cpuPercent", description="Sum of latest CPU usage, in percent of one core")
+    memory_bytes: int = Field(..., alias="memoryBytes", description="Sum of latest memory usage in bytes")
+    io_read_bytes: int = Field(..., alias="ioReadBytes", description="Sum of cumulative block device reads")
+    io_write_bytes: int = Field(..., alias="ioWriteBytes", description="Sum of cumulative block device writes")
+    pids: int = Field(..., description="Sum of current process and thread counts")
+    collected_at: Optional[datetime] = Field(
+        None,
+        alias="collectedAt",
+        description="Time of the most recent sample included in the aggregate",
+    )
+    idle: Optional[IdleStats] = Field(None, description="Idle detection counters (present when an idle policy is enabled)")
+
+    class Config:
+        populate_by_name = True
+
+
 # ============================================================================
 # Error Response
 # ============================================================================
@@ -311,3 +385,83 @@ class ErrorResponse(BaseModel):
         ...,
         description="Human-readable error message describing what went wrong and how to fix it",
     )
+
+
+# ============================================================================
+# Clone Sandbox
+# ============================================================================
+
+class CloneSandboxRequest(BaseModel):
+    """
+    Optional overrides applied to every clone of a sandbox.
+    """
+    timeout: Optional[int] = Field(
+        None,
+        ge=60,
+        le=86400,
+        description="Clone timeout in seconds (60-86400). Defaults to the source sandbox's remaining lifetime.",
+    )
+    metadata: Optional[Dict[str, str]] = Field(
+        None,
+        description="Metadata merged over the source sandbox metadata",
+    )
+
+
+class CloneSandboxResult(BaseModel):
+    """
+    One line of the streamed clone response, emitted as each clone finishes provisioning.
+    """
+    index: int = Field(..., ge=0, description="Position of the clone in the requested batch")
+    sandbox: Optional[CreateSandboxResponse] = Field(None, description="The clone, when provisioning succeeded")
+    error: Optional[ErrorResponse] = Field(None, description="Failure details, when provisioning failed")
+
+
+# ============================================================================
+# Batch Endpoints
+# ============================================================================
+
+class BatchEndpointsRequest(BaseModel):
+    """
+    Resolve endpoints for several ports of several sandboxes in one call.
+    """
+    sandbox_ids: List[str] = Field(
+        ...,
+        alias="sandboxIds",
+        min_length=1,
+        max_length=100,
+        description="Sandboxes to resolve (1-100)",
+    )
+    ports: List[int] = Field(
+        ...,
+        min_length=1,
+        max_length=32,
+        description="Ports inside each sandbox to resolve (1-32)",
+    )
+
+    class Config:
+        populate_by_name = True
+
+
+class SandboxEndpoints(BaseModel):
+    """
+    Resolved endpoints of one sandbox, keyed by port.
+    """
+    sandbox_id: str = Field(..., alias="sandboxId", description="Sandbox identifier")
+    endpoints: Dict[str, Endpoint] = Field(
+        default_factory=dict,
+        description="Endpoint per requested port (port number as string key)",
+    )
+    error: Optional[ErrorResponse] = Field(
+        None,
+        description="Failure details when the sandbox could not be resolved (e.g. not found)",
+    )
+
+    class Config:
+        populate_by_name = True
+
+
+class BatchEndpointsResponse(BaseModel):
+    """
+    Endpoints for each requested sandbox, in request order.
+    """
+    items: List[SandboxEndpoints] = Field(..., description="One entry per requested sandbox")
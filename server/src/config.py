@@ -112,6 +112,39 @@ class KubernetesRuntimeConfig(BaseModel):
         default=None,
         description="Path to BatchSandbox CR YAML template file. Used when workload_provider is 'batchsandbox'.",
     )
+    async_api: bool = Field(
+        default=False,
+        description=(
+            "Serve create, renew and delete through an asyncio HTTP client instead of blocking "
+            "a worker on the synchronous Kubernetes client for each call."
+        ),
+    )
+    api_pool_size: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum concurrent connections of the asyncio Kubernetes API client.",
+    )
+    api_http2: bool = Field(
+        default=True,
+        description="Negotiate HTTP/2 with the API server when the 'h2' package is installed.",
+    )
+    api_timeout_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Request timeout of the asyncio Kubernetes API client.",
+    )
+    pool_routing: bool = Field(
+        default=False,
+        description=(
+            "Route creates without an explicit poolRef to a Pool whose image and resource limits "
+            "match and that has idle pods; other creates are cold. Requires the batchsandbox provider."
+        ),
+    )
+    pool_refresh_interval_seconds: float = Field(
+        default=10.0,
+        gt=0,
+        description="Interval between Pool listings used for automatic pool routing.",
+    )
 
 
 class AgentSandboxRuntimeConfig(BaseModel):
@@ -131,10 +164,131 @@ class AgentSandboxRuntimeConfig(BaseModel):
     )
 
 
+class PoolAutoscalerConfig(BaseModel):
+    """Demand-driven sizing of Pool buffers (batchsandbox provider)."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Run the pool autoscaler loop in the lifecycle server.",
+    )
+    dry_run: bool = Field(
+        default=True,
+        description="Compute and report target buffer sizes without patching Pools.",
+    )
+    pools: list[str] = Field(
+        default_factory=list,
+        description="Pool names to manage. Empty manages every Pool in the namespace.",
+    )
+    interval_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Interval between demand samples and buffer decisions.",
+    )
+    smoothing: float = Field(
+        default=0.3,
+        gt=0,
+        le=1,
+        description="EWMA weight of the newest create-rate sample.",
+    )
+    seasonal: bool = Field(
+        default=False,
+        description="Also learn a daily create-rate profile and prewarm for the upcoming time slot.",
+    )
+    season_bucket_seconds: int = Field(
+        default=900,
+        ge=60,
+        le=86400,
+        description="Width of a time slot of the daily profile.",
+    )
+    warmup_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Time for a Pool to bring a new pod to idle; buffers cover the demand forecast over it.",
+    )
+    headroom: float = Field(
+        default=1.2,
+        ge=1,
+        description="Multiplier applied to the forecast demand when sizing bufferMin.",
+    )
+    buffer_max_ratio: float = Field(
+        default=2.0,
+        ge=1,
+        description="bufferMax as a multiple of the computed bufferMin.",
+    )
+    min_buffer: int = Field(
+        default=0,
+        ge=0,
+        description="Lower bound applied to bufferMin.",
+    )
+    max_buffer: int = Field(
+        default=20,
+        ge=0,
+        description="Upper bound applied to bufferMin and bufferMax.",
+    )
+    scale_down_cooldown_seconds: float = Field(
+        default=600.0,
+        ge=0,
+        description="Minimum time after a buffer increase before buffers are lowered again.",
+    )
+
+    @model_validator(mode="after")
+    def validate_bounds(self) -> "PoolAutoscalerConfig":
+        if self.min_buffer > self.max_buffer:
+            raise ValueError("pool_autoscaler.min_buffer must not exceed pool_autoscaler.max_buffer.")
+        return self
+
+
+class FakeRuntimeConfig(BaseModel):
+    """In-memory fake runtime settings, used to load test the API layer without a container runtime."""
+
+    pull_latency_ms: float = Field(
+        default=0.0,
+        ge=0,
+        description="Simulated image pull latency, paid on the first create for each image URI.",
+    )
+    create_latency_ms: float = Field(
+        default=0.0,
+        ge=0,
+        description="Simulated latency of a create call.",
+    )
+    ready_latency_ms: float = Field(
+        default=0.0,
+        ge=0,
+        description="Time after creation before a sandbox reports Running (does not block the create call).",
+    )
+    delete_latency_ms: float = Field(
+        default=0.0,
+        ge=0,
+        description="Simulated latency of a delete call.",
+    )
+    latency_jitter: float = Field(
+        default=0.0,
+        ge=0,
+        le=1,
+        description="Uniform +/- fraction applied to every simulated latency.",
+    )
+    create_failure_rate: float = Field(
+        default=0.0,
+        ge=0,
+        le=1,
+        description="Probability that a create call fails with an injected error.",
+    )
+    delete_failure_rate: float = Field(
+        default=0.0,
+        ge=0,
+        le=1,
+        description="Probability that a delete call fails with an injected error.",
+    )
+    seed: Optional[int] = Field(
+        default=None,
+        description="Random seed for jitter and failure injection, for reproducible runs.",
+    )
+
+
 class RuntimeConfig(BaseModel):
     """Runtime selection (docker, kubernetes, etc.)."""
 
-    type: Literal["docker", "kubernetes"] = Field(
+    type: Literal["docker", "kubernetes", "fake"] = Field(
         ...,
         description="Active sandbox runtime implementation.",
     )
@@ -143,6 +297,14 @@ class RuntimeConfig(BaseModel):
         description="Container image that contains the execd binary for sandbox initialization.",
         min_length=1,
     )
+    endpoint_cache_ttl_seconds: float = Field(
+        default=30.0,
+        ge=0,
+        description=(
+            "Seconds a resolved sandbox endpoint is served from cache. Entries are also dropped when the "
+            "sandbox is deleted, hibernated or its container restarts. Set to 0 to disable the cache."
+        ),
+    )
 
 
 class DockerConfig(BaseModel):
@@ -189,6 +351,100 @@ class DockerConfig(BaseModel):
         ge=1,
         description="Maximum number of processes allowed per sandbox container. Set to null to disable the limit.",
     )
+    stats_enabled: bool = Field(
+        default=False,
+        description=(
+            "Sample sandbox resource usage directly from cgroup v2 files in a background sweep. "
+            "Requires the host cgroup filesystem to be readable by the server."
+        ),
+    )
+    cgroup_root: str = Field(
+        default="/sys/fs/cgroup",
+        description="Mount point of the host cgroup v2 filesystem as seen by the server.",
+        min_length=1,
+    )
+    stats_interval_seconds: float = Field(
+        default=10.0,
+        gt=0,
+        description="Seconds between cgroup stats sweeps.",
+    )
+    stats_history_size: int = Field(
+        default=60,
+        ge=1,
+        description="Number of samples retained per sandbox in the stats ring buffer.",
+    )
+    idle_action: Literal["none", "pause", "hibernate", "delete"] = Field(
+        default="none",
+        description=(
+            "Action applied to sandboxes that stay idle for idle_timeout_seconds: 'pause' freezes the "
+            "container and resumes it on the next lifecycle or endpoint access, 'hibernate' commits it "
+            "to an image and removes the container until it is resumed, 'delete' reclaims it. "
+            "Requires stats_enabled."
+        ),
+    )
+    idle_timeout_seconds: int = Field(
+        default=900,
+        ge=60,
+        description="Seconds without API access and with CPU below idle_cpu_threshold_percent before idle_action applies.",
+    )
+    idle_cpu_threshold_percent: float = Field(
+        default=1.0,
+        ge=0,
+        description="CPU usage (percent of one core) under which a stats sample counts as idle.",
+    )
+
+    snapshot_repository: str = Field(
+        default="opensandbox-snapshots",
+        min_length=1,
+        description="Local image repository for sandbox snapshots taken by hibernate and clone (tagged by sandbox ID).",
+    )
+    clone_parallelism: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum number of clone containers provisioned concurrently per clone request.",
+    )
+    restore_parallelism: int = Field(
+        default=16,
+        ge=1,
+        description="Maximum number of expired sandboxes removed concurrently while restoring state at startup.",
+    )
+    delete_workers: int = Field(
+        default=8,
+        ge=1,
+        description=(
+            "Worker threads removing deleted and expired sandbox containers. Deletes return once "
+            "the sandbox is marked Stopping; removals beyond this limit queue."
+        ),
+    )
+    control_pool_size: int = Field(
+        default=32,
+        ge=1,
+        description=(
+            "Concurrent requests (and pooled connections) for short Docker control calls such as "
+            "inspect, list, create, kill and remove."
+        ),
+    )
+    transfer_pool_size: int = Field(
+        default=8,
+        ge=1,
+        description="Concurrent requests (and pooled connections) for image pulls, archive copies and commits.",
+    )
+    control_timeout_seconds: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Timeout for Docker control calls. Defaults to DOCKER_API_TIMEOUT (180 seconds).",
+    )
+    transfer_timeout_seconds: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Timeout for Docker transfer calls. Defaults to DOCKER_API_TIMEOUT (180 seconds).",
+    )
+
+    @model_validator(mode="after")
+    def validate_idle_policy(self) -> "DockerConfig":
+        if self.idle_action != "none" and not self.stats_enabled:
+            raise ValueError("docker.idle_action requires docker.stats_enabled = true.")
+        return self
 
 
 class AppConfig(BaseModel):
@@ -198,12 +454,23 @@ class AppConfig(BaseModel):
     runtime: RuntimeConfig = Field(..., description="Sandbox runtime configuration.")
     kubernetes: Optional[KubernetesRuntimeConfig] = None
     agent_sandbox: Optional["AgentSandboxRuntimeConfig"] = None
+    pool_autoscaler: Optional[PoolAutoscalerConfig] = None
     router: Optional[RouterConfig] = None
     docker: DockerConfig = Field(default_factory=DockerConfig)
+    fake: Optional[FakeRuntimeConfig] = None
 
     @model_validator(mode="after")
     def validate_runtime_blocks(self) -> "AppConfig":
-        if self.runtime.type == "docker":
+        if self.fake is not None and self.runtime.type != "fake":
+            raise ValueError("fake block requires runtime.type = 'fake'.")
+        if self.pool_autoscaler is not None and self.runtime.type != "kubernetes":
+            raise ValueError("pool_autoscaler block requires runtime.type = 'kubernetes'.")
+        if self.runtime.type == "fake":
+            if self.kubernetes is not None or self.agent_sandbox is not None:
+                raise ValueError("Kubernetes blocks must be omitted when runtime.type = 'fake'.")
+            if self.fake is None:
+                self.fake = FakeRuntimeConfig()
+        elif self.runtime.type == "docker":
             if self.kubernetes is not None:
                 raise ValueError("Kubernetes block must be omitted when runtime.type = 'docker'.")
             if self.agent_sandbox is not None:
@@ -312,6 +579,8 @@ __all__ = [
     "RouterConfig",
     "DockerConfig",
     "KubernetesRuntimeConfig",
+    "FakeRuntimeConfig",
+    "PoolAutoscalerConfig",
     "DEFAULT_CONFIG_PATH",
     "CONFIG_ENV_VAR",
     "get_config",
@@ -21,12 +21,13 @@ and configuration for the sandbox lifecycle management service.
 
 import copy
 import logging.config
+from contextlib import asynccontextmanager
 from typing import Any
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from src.config import load_config
 from uvicorn.config import LOGGING_CONFIG as UVICORN_LOGGING_CONFIG
@@ -60,8 +61,19 @@ logging.getLogger().setLevel(
     getattr(logging, app_config.server.log_level.upper(), logging.INFO)
 )
 
+from src.api import lifecycle  # noqa: E402
 from src.api.lifecycle import router  # noqa: E402
 from src.middleware.auth import AuthMiddleware  # noqa: E402
+from src.services.metrics import metrics  # noqa: E402
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # Startup work (e.g. restoring existing sandboxes) runs in the background;
+    # traffic is accepted immediately and /ready reports when it is done.
+    lifecycle.sandbox_service.start()
+    yield
+
 
 # Initialize FastAPI application
 app = FastAPI(
@@ -71,6 +83,7 @@ app = FastAPI(
                 "executed, paused, resumed, and finally disposed.",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -132,6 +145,33 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/ready")
+async def readiness_check():
+    """
+    Readiness endpoint.
+
+    Unlike /health, reports 503 until the sandbox service has finished its
+    startup work, such as restoring expiration timers for existing sandboxes.
+
+    Returns:
+        dict: Readiness status
+    """
+    if not lifecycle.sandbox_service.is_ready():
+        return JSONResponse(status_code=503, content={"status": "starting"})
+    return {"status": "ready"}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint():
+    """
+    Server metrics in the Prometheus text exposition format.
+
+    Returns:
+        PlainTextResponse: Counters, gauges and summaries recorded by the server
+    """
+    return PlainTextResponse(metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+
 if __name__ == "__main__":
     import uvicorn
 
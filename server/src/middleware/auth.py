@@ -38,7 +38,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
     API_KEY_HEADER = "OPEN-SANDBOX-API-KEY"
 
     # Paths that don't require authentication
-    EXEMPT_PATHS = ["/health", "/docs", "/redoc", "/openapi.json"]
+    EXEMPT_PATHS = ["/health", "/ready", "/docs", "/redoc", "/openapi.json"]
 
     def __init__(self, app, config: Optional[AppConfig] = None):
         """
@@ -15,6 +15,7 @@
 """Sandbox service implementations."""
 
 from src.services.docker import DockerSandboxService
+from src.services.fake import FakeSandboxService
 from src.services.k8s.kubernetes_service import KubernetesSandboxService
 from src.services.factory import create_sandbox_service
 from src.services.sandbox_service import SandboxService
@@ -23,5 +24,6 @@ __all__ = [
     "SandboxService",
     "DockerSandboxService",
     "KubernetesSandboxService",
+    "FakeSandboxService",
     "create_sandbox_service",
 ]
@@ -0,0 +1,263 @@
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cgroup v2 resource sampling for sandbox containers.
+
+The Docker stats API takes about a second per container and streams large JSON
+payloads, which makes fleet-wide utilisation impractical. This module reads the
+cgroup v2 accounting files (``cpu.stat``, ``memory.current``, ``io.stat`` and
+``pids.current``) directly for every sandbox container in a single sweep and
+keeps a bounded history of samples per sandbox.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from threading import Event, Lock, Thread
+from typing import Callable, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CGROUP_ROOT = "/sys/fs/cgroup"
+
+# Cgroup directory layouts used by the systemd and cgroupfs Docker cgroup drivers.
+CGROUP_PATH_TEMPLATES = (
+    "system.slice/docker-{container_id}.scope",
+    "docker/{container_id}",
+    "docker.slice/docker-{container_id}.scope",
+)
+
+
+@dataclass(frozen=True)
+class ResourceSample:
+    """Point-in-time resource usage for one sandbox container."""
+
+    collected_at: datetime
+    monotonic: float
+    cpu_usage_usec: int
+    cpu_percent: Optional[float]
+    memory_bytes: int
+    io_read_bytes: int
+    io_write_bytes: int
+    pids: int
+
+
+def _read_int(path: str) -> int:
+    with open(path, "r", encoding="ascii") as fh:
+        value = fh.read().strip()
+    return 0 if value == "max" else int(value)
+
+
+def _read_cpu_usage_usec(path: str) -> int:
+    with open(path, "r", encoding="ascii") as fh:
+        for line in fh:
+            key, _, value = line.partition(" ")
+            if key == "usage_usec":
+                return int(value)
+    return 0
+
+
+def _read_io_bytes(path: str) -> tuple[int, int]:
+    read_bytes = 0
+    write_bytes = 0
+    try:
+        with open(path, "r", encoding="ascii") as fh:
+            for line in fh:
+                for field in line.split()[1:]:
+                    key, _, value = field.partition("=")
+                    if key == "rbytes":
+                        read_bytes += int(value)
+                    elif key == "wbytes":
+                        write_bytes += int(value)
+    except FileNotFoundError:
+        # io controller may not be enabled for the container's cgroup.
+        pass
+    return read_bytes, write_bytes
+
+
+class CgroupStatsReader:
+    """Resolve container cgroup directories and read their accounting files."""
+
+    def __init__(self, cgroup_root: str = DEFAULT_CGROUP_ROOT):
+        self.cgroup_root = cgroup_root
+        self._paths: Dict[str, str] = {}
+
+    def resolve_path(self, container_id: str) -> Optional[str]:
+        """Return the cgroup directory for a container, caching the lookup."""
+        cached = self._paths.get(container_id)
+        if cached and os.path.isdir(cached):
+            return cached
+        for template in CGROUP_PATH_TEMPLATES:
+            candidate = os.path.join(self.cgroup_root, template.format(container_id=container_id))
+            if os.path.isdir(candidate):
+                self._paths[container_id] = candidate
+                return candidate
+        self._paths.pop(container_id, None)
+        return None
+
+    def forget(self, container_id: str) -> None:
+        self._paths.pop(container_id, None)
+
+    def read(self, container_id: str, previous: Optional[ResourceSample] = None) -> Optional[ResourceSample]:
+        """
+        Read one sample for the container.
+
+        Returns None when the cgroup directory cannot be found (container gone,
+        cgroup v1 host, or cgroup filesystem not mounted into the server).
+        """
+        path = self.resolve_path(container_id)
+        if path is None:
+            return None
+        now = time.monotonic()
+        try:
+            cpu_usage = _read_cpu_usage_usec(os.path.join(path, "cpu.stat"))
+            memory = _read_int(os.path.join(path, "memory.current"))
+            pids = _read_int(os.path.join(path, "pids.current"))
+        except (FileNotFoundError, ValueError) as exc:
+            logger.debug("container=%s | failed to read cgroup stats: %s", container_id, exc)
+            self.forget(container_id)
+            return None
+        io_read, io_write = _read_io_bytes(os.path.join(path, "io.stat"))
+
+        cpu_percent: Optional[float] = None
+        if previous is not None:
+            elapsed_usec = (now - previous.monotonic) * 1_000_000
+            if elapsed_usec > 0 and cpu_usage >= previous.cpu_usage_usec:
+                cpu_percent = (cpu_usage - previous.cpu_usage_usec) / elapsed_usec * 100
+
+        return ResourceSample(
+            collected_at=datetime.now(timezone.utc),
+            monotonic=now,
+            cpu_usage_usec=cpu_usage,
+            cpu_percent=cpu_percent,
+            memory_bytes=memory,
+            io_read_bytes=io_read,
+            io_write_bytes=io_write,
+            pids=pids,
+        )
+
+
+class SandboxStatsCollector:
+    """
+    Periodically sample every sandbox container and keep a ring buffer per sandbox.
+
+    ``list_targets`` returns the current mapping of sandbox ID to container ID;
+    it is called once per sweep so the collector costs one container listing
+    plus a handful of file reads per sandbox.
+    """
+
+    def __init__(
+        self,
+        list_targets: Callable[[], Dict[str, str]],
+        reader: Optional[CgroupStatsReader] = None,
+        interval_seconds: float = 10.0,
+        history_size: int = 60,
+    ):
+        self._list_targets = list_targets
+        self._reader = reader or CgroupStatsReader()
+        self.interval_seconds = interval_seconds
+        self.history_size = history_size
+        self._history: Dict[str, Deque[ResourceSample]] = {}
+        self._containers: Dict[str, str] = {}
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+        self._listeners: list[Callable[[Dict[str, ResourceSample]], None]] = []
+
+    def add_listener(self, listener: Callable[[Dict[str, ResourceSample]], None]) -> None:
+        """Register a callback invoked with the latest samples after each sweep."""
+        self._listeners.append(listener)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="sandbox-stats-collector", daemon=True)
+        self._thread.start()
+        logger.info(
+            "Started cgroup stats collector (interval=%.1fs, history=%d).",
+            self.interval_seconds,
+            self.history_size,
+        )
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval_seconds)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.sweep()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Stats sweep failed: %s", exc)
+            self._stop.wait(self.interval_seconds)
+
+    def sweep(self) -> Dict[str, ResourceSample]:
+        """Sample all current targets once and return the new samples."""
+        targets = self._list_targets()
+        latest: Dict[str, ResourceSample] = {}
+        for sandbox_id, container_id in targets.items():
+            with self._lock:
+                history = self._history.get(sandbox_id)
+                previous = history[-1] if history else None
+            if previous is not None and self._containers.get(sandbox_id) != container_id:
+                previous = None
+            sample = self._reader.read(container_id, previous)
+            if sample is None:
+                continue
+            latest[sandbox_id] = sample
+            with self._lock:
+                history = self._history.setdefault(sandbox_id, deque(maxlen=self.history_size))
+                history.append(sample)
+                self._containers[sandbox_id] = container_id
+
+        with self._lock:
+            for sandbox_id in list(self._history):
+                if sandbox_id not in targets:
+                    self._history.pop(sandbox_id, None)
+                    container_id = self._containers.pop(sandbox_id, None)
+                    if container_id:
+                        self._reader.forget(container_id)
+
+        for listener in self._listeners:
+            try:
+                listener(latest)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Stats listener %r failed: %s", listener, exc)
+        return latest
+
+    def get_samples(self, sandbox_id: str) -> Optional[list[ResourceSample]]:
+        """Return the sample history for a sandbox (oldest first), or None if untracked."""
+        with self._lock:
+            history = self._history.get(sandbox_id)
+            return list(history) if history is not None else None
+
+    def latest_samples(self) -> Dict[str, ResourceSample]:
+        with self._lock:
+            return {sandbox_id: history[-1] for sandbox_id, history in self._history.items() if history}
+
+
+__all__ = [
+    "CgroupStatsReader",
+    "ResourceSample",
+    "SandboxStatsCollector",
+]
@@ -16,9 +16,20 @@
 
 SANDBOX_ID_LABEL = "opensandbox.io/id"
 SANDBOX_EXPIRES_AT_LABEL = "opensandbox.io/expires-at"
+# JSON-encoded user entrypoint, so listings can be served from container summaries.
+SANDBOX_ENTRYPOINT_LABEL = "opensandbox.io/entrypoint"
 # Host-mapped ports recorded on containers (bridge mode).
 SANDBOX_EMBEDDING_PROXY_PORT_LABEL = "opensandbox.io/embedding-proxy-port"  # maps container 44772 -> host port
 SANDBOX_HTTP_PORT_LABEL = "opensandbox.io/http-port"  # maps container 8080 -> host port
+# Bookkeeping recorded on images committed by hibernation (inherited by restored containers).
+SANDBOX_HIBERNATED_AT_LABEL = "opensandbox.io/hibernated-at"
+SANDBOX_SOURCE_IMAGE_LABEL = "opensandbox.io/source-image"
+SANDBOX_CREATED_AT_LABEL = "opensandbox.io/created-at"
+SANDBOX_RESOURCE_LIMITS_LABEL = "opensandbox.io/resource-limits"
+# Source sandbox ID recorded on clone snapshot images.
+SANDBOX_CLONED_FROM_LABEL = "opensandbox.io/cloned-from"
+# JSON list of the metadata keys given at create time, to tell them apart from image labels.
+SANDBOX_METADATA_KEYS_LABEL = "opensandbox.io/metadata-keys"
 
 class SandboxErrorCodes:
     """Canonical error codes for sandbox service operations."""
@@ -34,6 +45,9 @@ class SandboxErrorCodes:
     SANDBOX_PAUSE_FAILED = "DOCKER::SANDBOX_PAUSE_FAILED"
     SANDBOX_NOT_PAUSED = "DOCKER::SANDBOX_NOT_PAUSED"
     SANDBOX_RESUME_FAILED = "DOCKER::SANDBOX_RESUME_FAILED"
+    SANDBOX_HIBERNATE_FAILED = "DOCKER::SANDBOX_HIBERNATE_FAILED"
+    SANDBOX_HIBERNATED = "DOCKER::SANDBOX_HIBERNATED"
+    SANDBOX_CLONE_FAILED = "DOCKER::SANDBOX_CLONE_FAILED"
     INVALID_EXPIRATION = "DOCKER::INVALID_EXPIRATION"
     EXPIRATION_NOT_EXTENDED = "DOCKER::EXPIRATION_NOT_EXTENDED"
     EXECD_START_FAILED = "DOCKER::SANDBOX_EXECD_START_FAILED"
@@ -51,6 +65,11 @@ class SandboxErrorCodes:
     K8S_API_ERROR = "KUBERNETES::API_ERROR"
     K8S_POD_IP_NOT_AVAILABLE = "KUBERNETES::POD_IP_NOT_AVAILABLE"
     
+    # Fake runtime error codes
+    FAKE_SANDBOX_NOT_FOUND = "FAKE::SANDBOX_NOT_FOUND"
+    FAKE_INVALID_STATE = "FAKE::INVALID_STATE"
+    FAKE_INJECTED_FAILURE = "FAKE::INJECTED_FAILURE"
+
     # Common error codes
     UNKNOWN_ERROR = "SANDBOX::UNKNOWN_ERROR"
     API_NOT_SUPPORTED = "SANDBOX::API_NOT_SUPPORTED"
@@ -61,7 +80,14 @@ class SandboxErrorCodes:
 __all__ = [
     "SANDBOX_ID_LABEL",
     "SANDBOX_EXPIRES_AT_LABEL",
+    "SANDBOX_ENTRYPOINT_LABEL",
     "SANDBOX_EMBEDDING_PROXY_PORT_LABEL",
     "SANDBOX_HTTP_PORT_LABEL",
+    "SANDBOX_HIBERNATED_AT_LABEL",
+    "SANDBOX_SOURCE_IMAGE_LABEL",
+    "SANDBOX_CREATED_AT_LABEL",
+    "SANDBOX_RESOURCE_LIMITS_LABEL",
+    "SANDBOX_CLONED_FROM_LABEL",
+    "SANDBOX_METADATA_KEYS_LABEL",
     "SandboxErrorCodes",
 ]
@@ -21,8 +21,8 @@ using Docker containers for sandbox lifecycle management.
 
 from __future__ import annotations
 
-import inspect
 import io
+import json
 import math
 import logging
 import os
@@ -30,44 +30,71 @@ import tarfile
 import time
 import socket
 import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
-from threading import Lock, Timer
-from typing import Any, Dict, Optional
+from threading import Event, Lock, Thread, Timer
+from typing import Any, Dict, Iterator, Optional
 from uuid import uuid4
 
 import docker
-from docker.errors import DockerException, ImageNotFound
+from docker.errors import DockerException, ImageNotFound, NotFound
 from fastapi import HTTPException, status
 
 from src.api.schema import (
+    BatchEndpointsResponse,
+    CloneSandboxRequest,
+    CloneSandboxResult,
     CreateSandboxRequest,
     CreateSandboxResponse,
     Endpoint,
+    ErrorResponse,
+    FleetStatsResponse,
+    IdleStats,
     ImageSpec,
     ListSandboxesRequest,
     ListSandboxesResponse,
     PaginationInfo,
     RenewSandboxExpirationRequest,
     RenewSandboxExpirationResponse,
+    ResourceLimits,
     Sandbox,
+    SandboxEndpoints,
+    SandboxResourceSample,
+    SandboxStatsResponse,
     SandboxStatus,
 )
 from src.config import AppConfig, get_config
+from src.services.cgroup_stats import CgroupStatsReader, ResourceSample, SandboxStatsCollector
 from src.services.constants import (
+    SANDBOX_CLONED_FROM_LABEL,
+    SANDBOX_CREATED_AT_LABEL,
+    SANDBOX_ENTRYPOINT_LABEL,
     SANDBOX_EXPIRES_AT_LABEL,
+    SANDBOX_HIBERNATED_AT_LABEL,
     SANDBOX_ID_LABEL,
     SANDBOX_EMBEDDING_PROXY_PORT_LABEL,
     SANDBOX_HTTP_PORT_LABEL,
+    SANDBOX_METADATA_KEYS_LABEL,
+    SANDBOX_RESOURCE_LIMITS_LABEL,
+    SANDBOX_SOURCE_IMAGE_LABEL,
     SandboxErrorCodes,
 )
+from src.services.docker_clients import (
+    CONTROL_POOL,
+    TRANSFER_POOL,
+    instrument_client_pool,
+)
 from src.services.helpers import (
     matches_filter,
     parse_memory_limit,
     parse_nano_cpus,
     parse_timestamp,
 )
+from src.services.endpoint_cache import EndpointCache
+from src.services.idle import IdleTracker
+from src.services.metrics import metrics
 from src.services.sandbox_service import SandboxService
 from src.services.validators import ensure_entrypoint, ensure_future_expiration, ensure_metadata_labels
 
@@ -87,14 +114,43 @@ def _resolve_docker_timeout(default: int = 180) -> int:
         logger.warning("Invalid DOCKER_API_TIMEOUT='%s'; falling back to %s seconds.", env_value, default)
         return default
 
+def _create_docker_client(timeout: float, max_pool_size: int):
+    """
+    Create a Docker client from the environment.
+
+    ``docker.from_env`` only declares ``**kwargs``, so the options are passed
+    directly rather than matched against its signature.
+    """
+    return docker.from_env(timeout=timeout, max_pool_size=max_pool_size)
+
+
 OPENSANDBOX_DIR = "/opt/opensandbox"
 EXECED_INSTALL_PATH = os.path.join(OPENSANDBOX_DIR, "execd")
 BOOTSTRAP_PATH = os.path.join(OPENSANDBOX_DIR, "bootstrap.sh")
 
 HOST_NETWORK_MODE = "host"
 BRIDGE_NETWORK_MODE = "bridge"
+# Container events after which cached endpoints of the sandbox may be stale.
+ENDPOINT_INVALIDATING_EVENTS = ("start", "restart", "die", "destroy")
+EVENTS_RECONNECT_DELAY_SECONDS = 5.0
 PENDING_FAILURE_TTL_SECONDS = int(os.environ.get("PENDING_FAILURE_TTL", "3600"))
 DOCKER_CLIENT_TIMEOUT = _resolve_docker_timeout()
+# Bookkeeping labels that are not surfaced as user metadata.
+INTERNAL_LABELS = frozenset(
+    {
+        SANDBOX_ID_LABEL,
+        SANDBOX_EXPIRES_AT_LABEL,
+        SANDBOX_ENTRYPOINT_LABEL,
+        SANDBOX_HIBERNATED_AT_LABEL,
+        SANDBOX_SOURCE_IMAGE_LABEL,
+        SANDBOX_CREATED_AT_LABEL,
+        SANDBOX_RESOURCE_LIMITS_LABEL,
+        SANDBOX_CLONED_FROM_LABEL,
+        SANDBOX_METADATA_KEYS_LABEL,
+    }
+)
+# Labels recording host port bindings, rewritten on every provisioning.
+PORT_LABELS = frozenset({SANDBOX_EMBEDDING_PROXY_PORT_LABEL, SANDBOX_HTTP_PORT_LABEL})
 
 
 @dataclass
@@ -130,26 +186,26 @@ class DockerSandboxService(SandboxService):
             raise ValueError("DockerSandboxService requires runtime.type = 'docker'.")
 
         self.execd_image = runtime_config.execd_image
-        self.network_mode = (self.app_config.docker.network_mode or HOST_NETWORK_MODE).lower()
+        docker_cfg = self.app_config.docker
+        self.network_mode = (docker_cfg.network_mode or HOST_NETWORK_MODE).lower()
         if self.network_mode not in {HOST_NETWORK_MODE, BRIDGE_NETWORK_MODE}:
             raise ValueError(f"Unsupported Docker network_mode '{self.network_mode}'.")
         self._execd_archive_cache: Optional[bytes] = None
+        control_timeout = docker_cfg.control_timeout_seconds or DOCKER_CLIENT_TIMEOUT
+        transfer_timeout = docker_cfg.transfer_timeout_seconds or DOCKER_CLIENT_TIMEOUT
         try:
-            # Initialize Docker service from environment variables
-            client_kwargs = {}
-            try:
-                signature = inspect.signature(docker.from_env)
-                if "timeout" in signature.parameters:
-                    client_kwargs["timeout"] = DOCKER_CLIENT_TIMEOUT
-            except (ValueError, TypeError):
-                logger.debug("Unable to introspect docker.from_env signature; using default parameters.")
-            self.docker_client = docker.from_env(**client_kwargs)
-            if not client_kwargs:
-                try:
-                    self.docker_client.api.timeout = DOCKER_CLIENT_TIMEOUT
-                except AttributeError:
-                    logger.debug("Docker client API does not expose timeout attribute.")
-            logger.info("Docker service initialized from environment")
+            # Initialize Docker clients from environment variables: short control calls
+            # and long transfers use separate connection pools (see docker_clients).
+            self.docker_client = _create_docker_client(control_timeout, docker_cfg.control_pool_size)
+            self.transfer_client = _create_docker_client(transfer_timeout, docker_cfg.transfer_pool_size)
+            instrument_client_pool(self.docker_client, CONTROL_POOL, docker_cfg.control_pool_size)
+            if self.transfer_client is not self.docker_client:
+                instrument_client_pool(self.transfer_client, TRANSFER_POOL, docker_cfg.transfer_pool_size)
+            logger.info(
+                "Docker service initialized from environment (control pool=%d, transfer pool=%d)",
+                docker_cfg.control_pool_size,
+                docker_cfg.transfer_pool_size,
+            )
         except Exception as e:  # noqa: BLE001
             # Common failure mode on macOS/dev machines: Docker daemon not running or socket path wrong.
             hint = ""
@@ -177,7 +233,46 @@ class DockerSandboxService(SandboxService):
         self._pending_sandboxes: Dict[str, PendingSandbox] = {}
         self._pending_lock = Lock()
         self._pending_cleanup_timers: Dict[str, Timer] = {}
-        self._restore_existing_sandboxes()
+        self._restore_thread: Optional[Thread] = None
+        self._restore_done = Event()
+        # Deletions and hibernations are accepted immediately and run on a bounded
+        # pool; meanwhile sandboxes are reported as Stopping or Hibernating.
+        self._stopping: Dict[str, datetime] = {}
+        self._hibernating: Dict[str, datetime] = {}
+        # Deletes accepted while a snapshot is being committed, by trigger.
+        self._delete_after_hibernate: Dict[str, str] = {}
+        self._stopping_lock = Lock()
+        self._endpoint_cache = EndpointCache(runtime_config.endpoint_cache_ttl_seconds)
+        self._public_host: Optional[str] = None
+        self._events_stop = Event()
+        self._events_thread: Optional[Thread] = None
+        self._teardown_executor = ThreadPoolExecutor(
+            max_workers=docker_cfg.delete_workers,
+            thread_name_prefix="sandbox-teardown",
+        )
+        self._stats_collector: Optional[SandboxStatsCollector] = None
+        if docker_cfg.stats_enabled:
+            self._stats_collector = SandboxStatsCollector(
+                list_targets=self._list_stats_targets,
+                reader=CgroupStatsReader(docker_cfg.cgroup_root),
+                interval_seconds=docker_cfg.stats_interval_seconds,
+                history_size=docker_cfg.stats_history_size,
+            )
+        self._idle_tracker: Optional[IdleTracker] = None
+        if self._stats_collector is not None and docker_cfg.idle_action != "none":
+            self._idle_tracker = IdleTracker(
+                idle_timeout_seconds=docker_cfg.idle_timeout_seconds,
+                cpu_threshold_percent=docker_cfg.idle_cpu_threshold_percent,
+            )
+            self._stats_collector.add_listener(self._apply_idle_policy)
+        if self._stats_collector is not None:
+            self._stats_collector.start()
+
+    def _transfer_container(self, container):
+        """Rebind a container model to the transfer client without an API call."""
+        if self.transfer_client is self.docker_client:
+            return container
+        return self.transfer_client.containers.prepare_model(container.attrs)
 
     @contextmanager
     def _docker_operation(self, action: str, sandbox_id: Optional[str] = None):
@@ -230,13 +325,48 @@ class DockerSandboxService(SandboxService):
 
         return containers[0]
 
-    def _schedule_expiration(self, sandbox_id: str, expires_at: datetime) -> None:
-        """Schedule automatic sandbox termination at expiration time."""
+    def _get_active_container(self, sandbox_id: str):
+        """Like _get_container_by_sandbox_id, but report hibernated sandboxes as a conflict."""
+        with self._stopping_lock:
+            hibernating = sandbox_id in self._hibernating
+        if hibernating:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "code": SandboxErrorCodes.SANDBOX_HIBERNATED,
+                    "message": f"Sandbox {sandbox_id} is being hibernated.",
+                },
+            )
+        try:
+            return self._get_container_by_sandbox_id(sandbox_id)
+        except HTTPException as exc:
+            if exc.status_code == status.HTTP_404_NOT_FOUND and self._find_hibernated_image(sandbox_id) is not None:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail={
+                        "code": SandboxErrorCodes.SANDBOX_HIBERNATED,
+                        "message": f"Sandbox {sandbox_id} is hibernated; resume it first.",
+                    },
+                ) from exc
+            raise
+
+    def _schedule_expiration(self, sandbox_id: str, expires_at: datetime, replace: bool = True) -> bool:
+        """
+        Schedule automatic sandbox termination at expiration time.
+
+        With ``replace=False`` an already tracked sandbox is left alone, so the
+        startup restore cannot overwrite a renewal that raced ahead of it.
+
+        Returns:
+            bool: True if a timer was scheduled
+        """
         # Delay might already be negative if the timer should fire immediately
         delay = max(0.0, (expires_at - datetime.now(timezone.utc)).total_seconds())
         timer = Timer(delay, self._expire_sandbox, args=(sandbox_id,))
         timer.daemon = True
         with self._expiration_lock:
+            if not replace and sandbox_id in self._expiration_timers:
+                return False
             # Replace existing timer (if any) so renew operations take effect immediately
             existing = self._expiration_timers.pop(sandbox_id, None)
             if existing:
@@ -244,6 +374,7 @@ class DockerSandboxService(SandboxService):
             self._sandbox_expirations[sandbox_id] = expires_at
             self._expiration_timers[sandbox_id] = timer
         timer.start()
+        return True
 
     def _remove_expiration_tracking(self, sandbox_id: str) -> None:
         """Remove expiration tracking and cancel any pending timers."""
@@ -270,44 +401,182 @@ class DockerSandboxService(SandboxService):
         return fallback
 
     def _expire_sandbox(self, sandbox_id: str) -> None:
-        """Timer callback to terminate expired sandboxes."""
+        """Timer callback: queue teardown of an expired sandbox."""
         try:
-            container = self._get_container_by_sandbox_id(sandbox_id)
+            self._begin_teardown(sandbox_id, trigger="expiry")
         except HTTPException as exc:
             if exc.status_code != status.HTTP_404_NOT_FOUND:
-                logger.warning("Failed to fetch sandbox %s for expiration: %s", sandbox_id, exc.detail)
+                logger.warning("Failed to expire sandbox %s: %s", sandbox_id, exc.detail)
             self._remove_expiration_tracking(sandbox_id)
-            return
 
+    def _begin_teardown(self, sandbox_id: str, trigger: str) -> None:
+        """
+        Mark a sandbox Stopping and hand its removal to the teardown pool.
+
+        Hibernated sandboxes only own an image, which is removed inline; a
+        sandbox that is being hibernated is removed once its snapshot settles.
+        Deleting a sandbox that is already Stopping is a no-op.
+
+        Raises:
+            HTTPException: If the sandbox does not exist or cannot be looked up
+        """
         try:
-            state = container.attrs.get("State", {})
-            if state.get("Running", False):
-                container.kill()
+            with self._docker_operation("lookup sandbox for delete", sandbox_id):
+                summaries = self._list_container_summaries({"label": [f"{SANDBOX_ID_LABEL}={sandbox_id}"]})
         except DockerException as exc:
-            logger.warning("Failed to stop expired sandbox %s: %s", sandbox_id, exc)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail={
+                    "code": SandboxErrorCodes.CONTAINER_QUERY_FAILED,
+                    "message": f"Failed to query sandbox containers: {str(exc)}",
+                },
+            ) from exc
+
+        if not summaries:
+            if self._find_hibernated_image(sandbox_id) is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail={
+                        "code": SandboxErrorCodes.SANDBOX_NOT_FOUND,
+                        "message": f"Sandbox {sandbox_id} not found.",
+                    },
+                )
+            self._delete_hibernated_sandbox(sandbox_id)
+            return
+
+        accepted_at = datetime.now(timezone.utc)
+        with self._stopping_lock:
+            if sandbox_id in self._stopping:
+                return
+            self._stopping[sandbox_id] = accepted_at
+            if sandbox_id in self._hibernating:
+                self._delete_after_hibernate[sandbox_id] = trigger
+                return
+        self._remove_expiration_tracking(sandbox_id)
+        self._endpoint_cache.invalidate(sandbox_id)
+        if self._idle_tracker is not None:
+            self._idle_tracker.forget(sandbox_id)
+
+        summary = summaries[0]
+        labels = summary.get("Labels") or {}
+        uses_snapshot = bool(labels.get(SANDBOX_HIBERNATED_AT_LABEL) or labels.get(SANDBOX_CLONED_FROM_LABEL))
+        metrics.add_gauge("sandbox_delete_backlog", 1)
+        self._teardown_executor.submit(
+            self._teardown_container,
+            sandbox_id,
+            summary.get("Id"),
+            uses_snapshot,
+            trigger,
+            time.perf_counter(),
+        )
 
+    def _teardown_container(
+        self,
+        sandbox_id: str,
+        container_id: str,
+        uses_snapshot: bool,
+        trigger: str,
+        queued_at: float,
+    ) -> None:
+        """Teardown worker: a forced remove kills and removes the container in one call."""
+        metrics.observe("sandbox_delete_queue_seconds", time.perf_counter() - queued_at, trigger=trigger)
+        removed = False
         try:
-            container.remove(force=True)
+            with self._docker_operation("remove sandbox container", sandbox_id):
+                self.docker_client.api.remove_container(container_id, force=True)
+            removed = True
+        except NotFound:
+            removed = True
         except DockerException as exc:
-            logger.warning("Failed to remove expired sandbox %s: %s", sandbox_id, exc)
+            logger.warning("sandbox=%s | teardown failed: %s", sandbox_id, exc)
+            metrics.inc("sandbox_delete_failures_total", trigger=trigger)
+        finally:
+            with self._stopping_lock:
+                self._stopping.pop(sandbox_id, None)
+            self._endpoint_cache.invalidate(sandbox_id)
+            metrics.add_gauge("sandbox_delete_backlog", -1)
+            metrics.observe("sandbox_delete_seconds", time.perf_counter() - queued_at, trigger=trigger)
+        if removed:
+            if uses_snapshot:
+                self._remove_snapshot_image_quietly(sandbox_id)
+            metrics.inc("sandbox_deleted_total", trigger=trigger)
+
+    def start(self) -> None:
+        """Restore expiration timers for existing sandboxes on a background thread."""
+        with self._expiration_lock:
+            if self._restore_thread is not None:
+                return
+            self._restore_thread = Thread(target=self._run_restore, name="sandbox-restore", daemon=True)
+            if self._endpoint_cache.enabled:
+                self._events_thread = Thread(
+                    target=self._watch_container_events,
+                    name="sandbox-container-events",
+                    daemon=True,
+                )
+        self._restore_thread.start()
+        if self._events_thread is not None:
+            self._events_thread.start()
+
+    def is_ready(self) -> bool:
+        return self._restore_done.is_set()
+
+    def _watch_container_events(self) -> None:
+        """Drop cached endpoints when Docker reports a sandbox container starting or going away."""
+        filters = {
+            "type": "container",
+            "label": [SANDBOX_ID_LABEL],
+            "event": list(ENDPOINT_INVALIDATING_EVENTS),
+        }
+        while not self._events_stop.is_set():
+            try:
+                # Long-lived stream: keep it off the control pool.
+                for event in self.transfer_client.events(decode=True, filters=filters):
+                    attributes = (event.get("Actor") or {}).get("Attributes") or {}
+                    sandbox_id = attributes.get(SANDBOX_ID_LABEL)
+                    if sandbox_id:
+                        self._endpoint_cache.invalidate(sandbox_id)
+                    if self._events_stop.is_set():
+                        return
+            except DockerException as exc:
+                logger.warning("Container event stream failed: %s", exc)
+            # Events missed while reconnecting could leave stale entries behind.
+            self._endpoint_cache.clear()
+            self._events_stop.wait(EVENTS_RECONNECT_DELAY_SECONDS)
 
-        self._remove_expiration_tracking(sandbox_id)
+    def _run_restore(self) -> None:
+        start = time.perf_counter()
+        try:
+            self._restore_existing_sandboxes()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Sandbox restoration failed: %s", exc)
+        finally:
+            self._restore_done.set()
+            logger.info("Sandbox restoration finished in %.2fs.", time.perf_counter() - start)
 
     def _restore_existing_sandboxes(self) -> None:
-        """On startup, rebuild expiration timers for containers already running."""
+        """
+        Rebuild expiration timers for existing and hibernated sandboxes.
+
+        Live sandboxes are scheduled first so the registry warms up quickly;
+        sandboxes that expired while the server was down are then removed by a
+        bounded worker pool.
+        """
         try:
-            containers = self.docker_client.containers.list(
-                all=True,
-                filters={"label": [SANDBOX_ID_LABEL]},
+            container_summaries = self._list_container_summaries({"label": [SANDBOX_ID_LABEL]})
+            hibernated_summaries = self._list_hibernated_summaries(
+                {(summary.get("Labels") or {}).get(SANDBOX_ID_LABEL) for summary in container_summaries}
             )
         except DockerException as exc:
             logger.warning("Failed to restore existing sandboxes: %s", exc)
             return
 
         restored = 0
+        expired: list[tuple[str, Optional[dict]]] = []
         now = datetime.now(timezone.utc)
-        for container in containers:
-            labels = container.attrs.get("Config", {}).get("Labels") or {}
+        for summary, is_container in [(item, True) for item in container_summaries] + [
+            (item, False) for item in hibernated_summaries
+        ]:
+            labels = summary.get("Labels") or {}
             sandbox_id = labels.get(SANDBOX_ID_LABEL)
             if not sandbox_id:
                 continue
@@ -323,15 +592,42 @@ class DockerSandboxService(SandboxService):
                 continue
 
             if expires_at <= now:
-                logger.info("Sandbox %s already expired; terminating now.", sandbox_id)
-                self._expire_sandbox(sandbox_id)
+                expired.append((sandbox_id, summary if is_container else None))
                 continue
 
-            self._schedule_expiration(sandbox_id, expires_at)
-            restored += 1
+            if self._schedule_expiration(sandbox_id, expires_at, replace=False):
+                restored += 1
 
         if restored:
             logger.info("Restored expiration timers for %d sandbox(es).", restored)
+        if expired:
+            self._reap_expired_sandboxes(expired)
+
+    def _reap_expired_sandboxes(self, expired: list[tuple[str, Optional[dict]]]) -> None:
+        parallelism = min(self.app_config.docker.restore_parallelism, len(expired))
+        logger.info("Terminating %d expired sandbox(es) (parallelism=%d).", len(expired), parallelism)
+        with ThreadPoolExecutor(max_workers=parallelism, thread_name_prefix="sandbox-reap") as executor:
+            for _ in executor.map(lambda item: self._reap_expired_sandbox(*item), expired):
+                pass
+
+    def _reap_expired_sandbox(self, sandbox_id: str, summary: Optional[dict]) -> None:
+        """
+        Remove a sandbox found expired at startup.
+
+        The container summary already identifies the container, so a single
+        forced remove replaces the lookup, kill and remove of _expire_sandbox.
+        ``summary`` is None for hibernated sandboxes, which only own an image.
+        """
+        if summary is not None:
+            labels = summary.get("Labels") or {}
+            try:
+                with self._docker_operation("reap expired sandbox", sandbox_id):
+                    self.docker_client.api.remove_container(summary.get("Id"), force=True)
+            except DockerException:
+                return
+            if not (labels.get(SANDBOX_HIBERNATED_AT_LABEL) or labels.get(SANDBOX_CLONED_FROM_LABEL)):
+                return
+        self._remove_snapshot_image_quietly(sandbox_id)
 
     def _fetch_execd_archive(self) -> bytes:
         """Fetch (and memoize) the execd archive from the platform container."""
@@ -354,7 +650,7 @@ class DockerSandboxService(SandboxService):
                         f"pull execd image {self.execd_image}",
                         "execd-cache",
                     ):
-                        self.docker_client.images.pull(self.execd_image)
+                        self.transfer_client.images.pull(self.execd_image)
 
                 with self._docker_operation("execd cache create container", "execd-cache"):
                     container = self.docker_client.containers.create(
@@ -379,7 +675,7 @@ class DockerSandboxService(SandboxService):
 
             try:
                 with self._docker_operation("execd cache read archive", "execd-cache"):
-                    stream, _ = container.get_archive("/execd")
+                    stream, _ = self._transfer_container(container).get_archive("/execd")
                     data = b"".join(stream)
             except DockerException as exc:
                 raise HTTPException(
@@ -415,12 +711,60 @@ class DockerSandboxService(SandboxService):
 
         status_section = container.attrs.get("State", {})
         status_value = (status_section.get("Status") or container.status or "").lower()
-        running = status_section.get("Running", False)
-        paused = status_section.get("Paused", False)
-        restarting = status_section.get("Restarting", False)
-        exit_code = status_section.get("ExitCode")
         finished_at = status_section.get("FinishedAt")
+        state, reason, message = self._resolve_container_state(
+            status_value,
+            running=status_section.get("Running", False),
+            paused=status_section.get("Paused", False),
+            restarting=status_section.get("Restarting", False),
+            exit_code=status_section.get("ExitCode"),
+        )
+
+        metadata = self._labels_to_metadata(labels)
+        entrypoint = container.attrs.get("Config", {}).get("Cmd") or []
+        if isinstance(entrypoint, str):
+            entrypoint = [entrypoint]
+        image_uri = labels.get(SANDBOX_SOURCE_IMAGE_LABEL)
+        if not image_uri:
+            image_tags = container.image.tags
+            image_uri = image_tags[0] if image_tags else container.image.short_id
+        image_spec = ImageSpec(uri=image_uri)
+
+        # Containers restored from hibernation keep the original creation time.
+        created_at = parse_timestamp(labels.get(SANDBOX_CREATED_AT_LABEL) or container.attrs.get("Created"))
+        last_transition_at = (
+            parse_timestamp(finished_at) if finished_at and finished_at != "0001-01-01T00:00:00Z" else created_at
+        )
+        expires_at = self._get_tracked_expiration(resolved_id, labels, created_at)
+
+        status_info = SandboxStatus(
+            state=state,
+            reason=reason,
+            message=message,
+            last_transition_at=last_transition_at,
+        )
+
+        return self._apply_tracked_status(
+            Sandbox(
+                id=resolved_id,
+                image=image_spec,
+                status=status_info,
+                metadata=metadata,
+                entrypoint=entrypoint,
+                expiresAt=expires_at,
+                createdAt=created_at,
+            )
+        )
 
+    @staticmethod
+    def _resolve_container_state(
+        status_value: str,
+        running: bool,
+        paused: bool,
+        restarting: bool,
+        exit_code: Optional[int],
+    ) -> tuple[str, str, str]:
+        """Map Docker container state onto the sandbox (state, reason, message) triple."""
         if running and not paused:
             state = "Running"
             reason = "CONTAINER_RUNNING"
@@ -450,40 +794,109 @@ class DockerSandboxService(SandboxService):
             state = "Unknown"
             reason = "CONTAINER_STATE_UNKNOWN"
             message = f"Sandbox container is in state '{status_value or 'unknown'}'."
+        return state, reason, message
 
-        metadata = {
+    @staticmethod
+    def _labels_to_metadata(labels: Dict[str, str]) -> Optional[Dict[str, str]]:
+        """Strip internal bookkeeping labels, returning user metadata only."""
+        return {
             key: value
             for key, value in labels.items()
-            if key not in {SANDBOX_ID_LABEL, SANDBOX_EXPIRES_AT_LABEL}
+            if key not in INTERNAL_LABELS
         } or None
-        entrypoint = container.attrs.get("Config", {}).get("Cmd") or []
-        if isinstance(entrypoint, str):
-            entrypoint = [entrypoint]
-        image_tags = container.image.tags
-        image_uri = image_tags[0] if image_tags else container.image.short_id
-        image_spec = ImageSpec(uri=image_uri)
 
-        created_at = parse_timestamp(container.attrs.get("Created"))
-        last_transition_at = (
-            parse_timestamp(finished_at) if finished_at and finished_at != "0001-01-01T00:00:00Z" else created_at
-        )
-        expires_at = self._get_tracked_expiration(resolved_id, labels, created_at)
+    @staticmethod
+    def _user_metadata(
+        labels: Dict[str, str],
+        image_labels: Optional[Dict[str, str]] = None,
+    ) -> Optional[Dict[str, str]]:
+        """
+        Return the metadata a sandbox was created with, without labels inherited from its image.
 
-        status_info = SandboxStatus(
-            state=state,
-            reason=reason,
-            message=message,
-            last_transition_at=last_transition_at,
+        Sandboxes created before the metadata keys label existed fall back to
+        dropping bookkeeping labels, port labels and labels matching ``image_labels``.
+        """
+        recorded = labels.get(SANDBOX_METADATA_KEYS_LABEL)
+        if recorded is not None:
+            try:
+                keys = json.loads(recorded)
+            except ValueError:
+                keys = []
+            return {key: labels[key] for key in keys if key in labels} or None
+        image_labels = image_labels or {}
+        return {
+            key: value
+            for key, value in labels.items()
+            if key not in INTERNAL_LABELS and key not in PORT_LABELS and image_labels.get(key) != value
+        } or None
+
+    def _list_container_summaries(self, filters: Dict[str, Any]) -> list[dict]:
+        """
+        List sandbox containers through the low-level API.
+
+        ``containers.list`` inspects every matching container individually (N+1
+        API calls); the ``/containers/json`` summary already carries labels,
+        state, status and creation time, which is all listing needs.
+        """
+        return self.docker_client.api.containers(all=True, filters=filters) or []
+
+    def _container_summary_to_sandbox(self, summary: dict, sandbox_id: Optional[str] = None) -> Sandbox:
+        """
+        Build a Sandbox from a ``/containers/json`` summary entry.
+
+        Falls back to a full inspect only when the summary cannot answer:
+        containers created before the entrypoint label existed, and exited
+        containers whose FinishedAt timestamp is only available via inspect.
+        """
+        labels = summary.get("Labels") or {}
+        resolved_id = sandbox_id or labels.get(SANDBOX_ID_LABEL)
+        status_value = (summary.get("State") or "").lower()
+        entrypoint_label = labels.get(SANDBOX_ENTRYPOINT_LABEL)
+        if not resolved_id or entrypoint_label is None or status_value in {"exited", "dead"}:
+            container = self.docker_client.containers.get(summary.get("Id"))
+            return self._container_to_sandbox(container, sandbox_id)
+
+        try:
+            entrypoint = json.loads(entrypoint_label)
+        except ValueError:
+            logger.warning("Invalid entrypoint label on sandbox %s; falling back to inspect.", resolved_id)
+            container = self.docker_client.containers.get(summary.get("Id"))
+            return self._container_to_sandbox(container, sandbox_id)
+
+        state, reason, message = self._resolve_container_state(
+            status_value,
+            running=status_value in {"running", "paused", "restarting"},
+            paused=status_value == "paused",
+            restarting=status_value == "restarting",
+            exit_code=None,
         )
+        created_raw = labels.get(SANDBOX_CREATED_AT_LABEL) or summary.get("Created")
+        if isinstance(created_raw, (int, float)):
+            created_at = datetime.fromtimestamp(created_raw, tz=timezone.utc)
+        else:
+            created_at = parse_timestamp(created_raw)
+        expires_at = self._get_tracked_expiration(resolved_id, labels, created_at)
 
-        return Sandbox(
-            id=resolved_id,
-            image=image_spec,
-            status=status_info,
-            metadata=metadata,
-            entrypoint=entrypoint,
-            expiresAt=expires_at,
-            createdAt=created_at,
+        return self._apply_tracked_status(
+            Sandbox(
+                id=resolved_id,
+                image=ImageSpec(
+                    uri=labels.get(SANDBOX_SOURCE_IMAGE_LABEL)
+                    or summary.get("Image")
+                    or summary.get("ImageID")
+                    or "unknown"
+                ),
+                status=SandboxStatus(
+                    state=state,
+                    reason=reason,
+                    message=message,
+                    last_transition_at=created_at,
+                ),
+                metadata=self._labels_to_metadata(labels),
+                entrypoint=entrypoint,
+                expiresAt=expires_at,
+                createdAt=created_at,
+            )
         )
 
     def _ensure_directory(self, container, path: str, sandbox_id: Optional[str] = None) -> None:
@@ -503,7 +916,7 @@ class DockerSandboxService(SandboxService):
         tar_stream.seek(0)
         try:
             with self._docker_operation(f"ensure directory {normalized_path}", sandbox_id):
-                container.put_archive(path="/", data=tar_stream.getvalue())
+                self._transfer_container(container).put_archive(path="/", data=tar_stream.getvalue())
         except DockerException as exc:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -520,7 +933,7 @@ class DockerSandboxService(SandboxService):
         self._ensure_directory(container, target_parent, sandbox_id)
         try:
             with self._docker_operation("copy execd archive to sandbox", sandbox_id):
-                container.put_archive(path=target_parent, data=archive)
+                self._transfer_container(container).put_archive(path=target_parent, data=archive)
         except DockerException as exc:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -556,7 +969,7 @@ class DockerSandboxService(SandboxService):
         tar_stream.seek(0)
         try:
             with self._docker_operation("install bootstrap script", sandbox_id):
-                container.put_archive(path="/", data=tar_stream.getvalue())
+                self._transfer_container(container).put_archive(path="/", data=tar_stream.getvalue())
         except DockerException as exc:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -581,16 +994,29 @@ class DockerSandboxService(SandboxService):
         return sandbox_id, created_at, expires_at
 
     @staticmethod
-    def _allocate_host_port(min_port: int = 40000, max_port: int = 60000, attempts: int = 50) -> Optional[int]:
-        """Find an available TCP port on the host within the given range."""
+    def _is_host_port_free(port: int) -> bool:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                sock.bind(("0.0.0.0", port))
+            except OSError:
+                return False
+            return True
+
+    @classmethod
+    def _allocate_host_port(
+        cls,
+        min_port: int = 40000,
+        max_port: int = 60000,
+        attempts: int = 50,
+        preferred: Optional[int] = None,
+    ) -> Optional[int]:
+        """Find an available TCP port on the host, trying ``preferred`` first."""
+        if preferred is not None and cls._is_host_port_free(preferred):
+            return preferred
         for _ in range(attempts):
             port = random.randint(min_port, max_port)
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                try:
-                    sock.bind(("0.0.0.0", port))
-                except OSError:
-                    continue
+            if cls._is_host_port_free(port):
                 return port
         return None
 
@@ -652,17 +1078,18 @@ class DockerSandboxService(SandboxService):
         """
         label_selector = f"{SANDBOX_ID_LABEL}={sandbox_id}"
         try:
-            containers = self.docker_client.containers.list(all=True, filters={"label": label_selector})
+            summaries = self._list_container_summaries({"label": label_selector})
         except DockerException as exc:
             logger.warning("sandbox=%s | cleanup listing failed containers: %s", sandbox_id, exc)
             return
 
-        for container in containers:
+        for summary in summaries:
+            container_id = summary.get("Id")
             try:
                 with self._docker_operation("cleanup failed sandbox container", sandbox_id):
-                    container.remove(force=True)
+                    self.docker_client.api.remove_container(container_id, force=True)
             except DockerException as exc:
-                logger.warning("sandbox=%s | failed to remove leftover container %s: %s", sandbox_id, container.id, exc)
+                logger.warning("sandbox=%s | failed to remove leftover container %s: %s", sandbox_id, container_id, exc)
 
     def _remove_pending_sandbox(self, sandbox_id: str) -> None:
         with self._pending_lock:
@@ -726,7 +1153,7 @@ class DockerSandboxService(SandboxService):
     ) -> None:
         try:
             with self._docker_operation(f"pull image {image_uri}", sandbox_id):
-                self.docker_client.images.pull(image_uri, auth_config=auth_config)
+                self.transfer_client.images.pull(image_uri, auth_config=auth_config)
         except DockerException as exc:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -763,9 +1190,11 @@ class DockerSandboxService(SandboxService):
         request: CreateSandboxRequest,
         created_at: datetime,
         expires_at: datetime,
+        preferred_host_ports: Optional[tuple[Optional[int], Optional[int]]] = None,
     ) -> CreateSandboxResponse:
         metadata = request.metadata or {}
         labels = {key: str(value) for key, value in metadata.items()}
+        labels[SANDBOX_METADATA_KEYS_LABEL] = json.dumps(sorted(labels))
         labels[SANDBOX_ID_LABEL] = sandbox_id
 
         env_dict = request.env or {}
@@ -811,8 +1240,9 @@ class DockerSandboxService(SandboxService):
 
         exposed_ports: Optional[list[str]] = None
         if self.network_mode == BRIDGE_NETWORK_MODE:
-            host_execd_port = self._allocate_host_port()
-            host_http_port = self._allocate_host_port()
+            preferred_execd_port, preferred_http_port = preferred_host_ports or (None, None)
+            host_execd_port = self._allocate_host_port(preferred=preferred_execd_port)
+            host_http_port = self._allocate_host_port(preferred=preferred_http_port)
             if host_execd_port is None or host_http_port is None:
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -843,6 +1273,7 @@ class DockerSandboxService(SandboxService):
             labels[SANDBOX_HTTP_PORT_LABEL] = str(host_http_port)
 
         labels[SANDBOX_EXPIRES_AT_LABEL] = expires_at.isoformat()
+        labels[SANDBOX_ENTRYPOINT_LABEL] = json.dumps(request.entrypoint)
 
         container_name = f"sandbox-{sandbox_id}"
 
@@ -931,10 +1362,26 @@ class DockerSandboxService(SandboxService):
         List sandboxes with optional filtering and pagination.
         """
         try:
-            containers = self.docker_client.containers.list(
-                all=True,
-                filters={"label": [SANDBOX_ID_LABEL]},
-            )
+            summaries = self._list_container_summaries({"label": [SANDBOX_ID_LABEL]})
+            sandboxes_by_id: dict[str, Sandbox] = {}
+            container_ids: set[str] = set()
+            for summary in summaries:
+                labels = summary.get("Labels") or {}
+                sandbox_id = labels.get(SANDBOX_ID_LABEL)
+                if not sandbox_id:
+                    continue
+                sandbox_obj = self._container_summary_to_sandbox(summary, sandbox_id)
+                container_ids.add(sandbox_id)
+                if matches_filter(sandbox_obj, request.filter):
+                    sandboxes_by_id[sandbox_id] = sandbox_obj
+            # Sandboxes being restored are listed from their pending record below.
+            restoring = {sandbox_id for sandbox_id, _ in self._iter_pending_sandboxes()}
+            for summary in self._list_hibernated_summaries(container_ids | restoring):
+                labels = summary.get("Labels") or {}
+                sandbox_obj = self._hibernated_labels_to_sandbox(labels[SANDBOX_ID_LABEL], labels)
+                container_ids.add(sandbox_obj.id)
+                if matches_filter(sandbox_obj, request.filter):
+                    sandboxes_by_id[sandbox_obj.id] = sandbox_obj
         except DockerException as exc:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -944,18 +1391,6 @@ class DockerSandboxService(SandboxService):
                 },
             ) from exc
 
-        sandboxes_by_id: dict[str, Sandbox] = {}
-        container_ids: set[str] = set()
-        for container in containers:
-            labels = container.attrs.get("Config", {}).get("Labels") or {}
-            sandbox_id = labels.get(SANDBOX_ID_LABEL)
-            if not sandbox_id:
-                continue
-            sandbox_obj = self._container_to_sandbox(container, sandbox_id)
-            container_ids.add(sandbox_id)
-            if matches_filter(sandbox_obj, request.filter):
-                sandboxes_by_id[sandbox_id] = sandbox_obj
-
         for sandbox_id, pending in self._iter_pending_sandboxes():
             if sandbox_id in container_ids:
                 # If a real container exists, prefer its state regardless of filter outcome.
@@ -1014,6 +1449,9 @@ class DockerSandboxService(SandboxService):
             pending = self._get_pending_sandbox(sandbox_id)
             if pending:
                 return self._pending_to_sandbox(sandbox_id, pending)
+            image = self._find_hibernated_image(sandbox_id)
+            if image is not None:
+                return self._hibernated_labels_to_sandbox(sandbox_id, self._image_labels(image))
             raise
         return self._container_to_sandbox(container, sandbox_id)
 
@@ -1021,33 +1459,16 @@ class DockerSandboxService(SandboxService):
         """
         Delete a sandbox using Docker.
 
+        Returns once the sandbox is marked Stopping; the container is removed
+        by the teardown pool.
+
         Args:
             sandbox_id: Unique sandbox identifier
 
         Raises:
-            HTTPException: If sandbox not found or deletion fails
+            HTTPException: If sandbox not found or cannot be looked up
         """
-        container = self._get_container_by_sandbox_id(sandbox_id)
-        try:
-            try:
-                with self._docker_operation("kill sandbox container", sandbox_id):
-                    container.kill()
-            except DockerException as exc:
-                # Ignore error if container is already stopped
-                if "is not running" not in str(exc).lower():
-                    raise
-            with self._docker_operation("remove sandbox container", sandbox_id):
-                container.remove(force=True)
-        except DockerException as exc:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={
-                    "code": SandboxErrorCodes.SANDBOX_DELETE_FAILED,
-                    "message": f"Failed to delete sandbox container: {str(exc)}",
-                },
-            ) from exc
-        finally:
-            self._remove_expiration_tracking(sandbox_id)
+        self._begin_teardown(sandbox_id, trigger="api")
 
     def pause_sandbox(self, sandbox_id: str) -> None:
         """
@@ -1059,7 +1480,7 @@ class DockerSandboxService(SandboxService):
         Raises:
             HTTPException: If sandbox not found or cannot be paused
         """
-        container = self._get_container_by_sandbox_id(sandbox_id)
+        container = self._get_active_container(sandbox_id)
         state = container.attrs.get("State", {})
         if not state.get("Running", False):
             raise HTTPException(
@@ -1086,13 +1507,25 @@ class DockerSandboxService(SandboxService):
         """
         Resume a paused sandbox using Docker.
 
+        Hibernated sandboxes are recreated from their snapshot image instead;
+        they report Pending until the restore, which runs in the background, completes.
+
         Args:
             sandbox_id: Unique sandbox identifier
 
         Raises:
             HTTPException: If sandbox not found or cannot be resumed
         """
-        container = self._get_container_by_sandbox_id(sandbox_id)
+        try:
+            container = self._get_container_by_sandbox_id(sandbox_id)
+        except HTTPException as exc:
+            if exc.status_code != status.HTTP_404_NOT_FOUND:
+                raise
+            image = self._find_hibernated_image(sandbox_id)
+            if image is None:
+                raise
+            self._begin_restore(sandbox_id, image)
+            return
         state = container.attrs.get("State", {})
         if not state.get("Paused", False):
             raise HTTPException(
@@ -1114,6 +1547,9 @@ class DockerSandboxService(SandboxService):
                     "message": f"Failed to resume sandbox container: {str(exc)}",
                 },
             ) from exc
+        if self._idle_tracker is not None:
+            self._idle_tracker.mark_resumed(sandbox_id)
+            self._idle_tracker.record_activity(sandbox_id)
 
     def renew_expiration(
         self,
@@ -1133,8 +1569,9 @@ class DockerSandboxService(SandboxService):
         Raises:
             HTTPException: If sandbox not found or renewal fails
         """
-        container = self._get_container_by_sandbox_id(sandbox_id)
+        container = self._get_active_container(sandbox_id)
         new_expiration = ensure_future_expiration(request.expires_at)
+        self._wake_if_idle_paused(sandbox_id)
 
         labels = container.attrs.get("Config", {}).get("Labels") or {}
 
@@ -1175,18 +1612,108 @@ class DockerSandboxService(SandboxService):
                 },
             ) from exc
 
+        self._wake_if_idle_paused(sandbox_id)
+
+        cached = self._endpoint_cache.get(sandbox_id, port, resolve_internal)
+        if cached is not None:
+            return cached
+
         if resolve_internal:
-            container = self._get_container_by_sandbox_id(sandbox_id)
-            return self._resolve_internal_endpoint(container, port)
+            container = self._get_active_container(sandbox_id)
+            endpoint = self._resolve_internal_endpoint(container, port)
+        elif self.network_mode == BRIDGE_NETWORK_MODE:
+            container = self._get_active_container(sandbox_id)
+            labels = container.attrs.get("Config", {}).get("Labels") or {}
+            endpoint = self._public_endpoint(port, labels)
+        else:
+            endpoint = self._public_endpoint(port, {})
+        self._endpoint_cache.put(sandbox_id, port, endpoint, resolve_internal)
+        return endpoint
 
+    def get_endpoints(self, sandbox_ids: list[str], ports: list[int]) -> BatchEndpointsResponse:
+        """
+        Resolve public endpoints for many sandboxes with at most one container listing.
+
+        Args:
+            sandbox_ids: Sandboxes to resolve
+            ports: Ports to resolve in every sandbox
+
+        Returns:
+            BatchEndpointsResponse: One entry per sandbox, in request order
+
+        Raises:
+            HTTPException: If a port is invalid or containers cannot be listed
+        """
+        for port in ports:
+            try:
+                self.validate_port(port)
+            except ValueError as exc:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail={
+                        "code": SandboxErrorCodes.INVALID_PORT,
+                        "message": str(exc),
+                    },
+                ) from exc
+
+        items: list[SandboxEndpoints] = []
+        unresolved: list[SandboxEndpoints] = []
+        for sandbox_id in sandbox_ids:
+            item = SandboxEndpoints(sandbox_id=sandbox_id)
+            items.append(item)
+            try:
+                self._wake_if_idle_paused(sandbox_id)
+            except HTTPException as exc:
+                item.error = self._error_from_exception(exc)
+                continue
+            cached = {port: self._endpoint_cache.get(sandbox_id, port) for port in ports}
+            if all(endpoint is not None for endpoint in cached.values()):
+                item.endpoints = {str(port): endpoint for port, endpoint in cached.items()}
+            else:
+                unresolved.append(item)
+
+        if not unresolved:
+            return BatchEndpointsResponse(items=items)
+
+        labels_by_id: Dict[str, Dict[str, str]] = {}
+        if self.network_mode == BRIDGE_NETWORK_MODE:
+            try:
+                summaries = self._list_container_summaries({"label": [SANDBOX_ID_LABEL]})
+            except DockerException as exc:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail={
+                        "code": SandboxErrorCodes.CONTAINER_QUERY_FAILED,
+                        "message": f"Failed to query sandbox containers: {str(exc)}",
+                    },
+                ) from exc
+            for summary in summaries:
+                labels = summary.get("Labels") or {}
+                labels_by_id.setdefault(labels.get(SANDBOX_ID_LABEL), labels)
+
+        for item in unresolved:
+            try:
+                labels = labels_by_id.get(item.sandbox_id)
+                if self.network_mode == BRIDGE_NETWORK_MODE and labels is None:
+                    # Raises the same error as a single lookup (hibernated or not found).
+                    self._get_active_container(item.sandbox_id)
+                for port in ports:
+                    endpoint = self._public_endpoint(port, labels or {})
+                    self._endpoint_cache.put(item.sandbox_id, port, endpoint)
+                    item.endpoints[str(port)] = endpoint
+            except HTTPException as exc:
+                item.endpoints = {}
+                item.error = self._error_from_exception(exc)
+        return BatchEndpointsResponse(items=items)
+
+    def _public_endpoint(self, port: int, labels: Dict[str, str]) -> Endpoint:
+        """Build the public endpoint of a port; bridge mode reads host ports from the sandbox labels."""
         public_host = self._resolve_public_host()
 
         if self.network_mode == HOST_NETWORK_MODE:
             return Endpoint(endpoint=f"{public_host}:{port}")
 
         if self.network_mode == BRIDGE_NETWORK_MODE:
-            container = self._get_container_by_sandbox_id(sandbox_id)
-            labels = container.attrs.get("Config", {}).get("Labels") or {}
             execd_host_port = self._parse_host_port_label(
                 labels.get(SANDBOX_EMBEDDING_PROXY_PORT_LABEL),
                 SANDBOX_EMBEDDING_PROXY_PORT_LABEL,
@@ -1228,12 +1755,663 @@ class DockerSandboxService(SandboxService):
             },
         )
 
+    def hibernate_sandbox(self, sandbox_id: str) -> None:
+        """
+        Commit a sandbox container to a local image and remove the container.
+
+        The image keeps the sandbox ID, labels, expiration, resource limits and
+        host port mapping so resume_sandbox can recreate the sandbox in place.
+        Returns once the sandbox is marked Hibernating; the commit and removal
+        run on the teardown pool.
+
+        Args:
+            sandbox_id: Unique sandbox identifier
+
+        Raises:
+            HTTPException: If sandbox not found, not running, or the snapshot fails
+        """
+        container = self._get_active_container(sandbox_id)
+        state = container.attrs.get("State", {})
+        if not state.get("Running", False):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "code": SandboxErrorCodes.SANDBOX_NOT_RUNNING,
+                    "message": "Sandbox is not in a running state.",
+                },
+            )
+        with self._stopping_lock:
+            if sandbox_id in self._stopping:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail={
+                        "code": SandboxErrorCodes.SANDBOX_NOT_RUNNING,
+                        "message": f"Sandbox {sandbox_id} is being deleted.",
+                    },
+                )
+            self._hibernating[sandbox_id] = datetime.now(timezone.utc)
+        self._teardown_executor.submit(self._hibernate_worker, container, sandbox_id)
+
+    def _hibernate_worker(self, container, sandbox_id: str, idle: bool = False) -> None:
+        """Teardown worker: commit and remove a container, then run a delete accepted meanwhile."""
+        try:
+            self._hibernate_container(container, sandbox_id)
+            if idle:
+                self._idle_tracker.mark_hibernated(sandbox_id)
+        except HTTPException as exc:
+            logger.warning("sandbox=%s | hibernate failed: %s", sandbox_id, exc.detail)
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Unexpected error hibernating sandbox %s: %s", sandbox_id, exc)
+        finally:
+            with self._stopping_lock:
+                self._hibernating.pop(sandbox_id, None)
+                trigger = self._delete_after_hibernate.pop(sandbox_id, None)
+                if trigger is not None:
+                    self._stopping.pop(sandbox_id, None)
+        if trigger is not None:
+            try:
+                self._begin_teardown(sandbox_id, trigger=trigger)
+            except HTTPException as exc:
+                logger.warning("sandbox=%s | delete after hibernate failed: %s", sandbox_id, exc.detail)
+
+    def _snapshot_image_ref(self, sandbox_id: str) -> str:
+        return f"{self.app_config.docker.snapshot_repository}:{sandbox_id}"
+
+    @staticmethod
+    def _image_labels(image) -> Dict[str, str]:
+        return image.attrs.get("Config", {}).get("Labels") or {}
+
+    @staticmethod
+    def _uses_snapshot_image(container) -> bool:
+        """True for containers created from a hibernation or clone snapshot tagged with their ID."""
+        labels = container.attrs.get("Config", {}).get("Labels") or {}
+        return bool(labels.get(SANDBOX_HIBERNATED_AT_LABEL) or labels.get(SANDBOX_CLONED_FROM_LABEL))
+
+    @staticmethod
+    def _resource_limits_from_host_config(host_config: Dict[str, Any]) -> Dict[str, str]:
+        resource_limits: Dict[str, str] = {}
+        if host_config.get("Memory"):
+            resource_limits["memory"] = str(host_config["Memory"])
+        if host_config.get("NanoCpus"):
+            resource_limits["cpu"] = f"{host_config['NanoCpus'] // 1_000_000}m"
+        return resource_limits
+
+    def _find_hibernated_image(self, sandbox_id: str):
+        """Return the snapshot image of a sandbox, or None if it was never hibernated."""
+        try:
+            image = self.docker_client.images.get(self._snapshot_image_ref(sandbox_id))
+        except ImageNotFound:
+            return None
+        except DockerException as exc:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail={
+                    "code": SandboxErrorCodes.CONTAINER_QUERY_FAILED,
+                    "message": f"Failed to query hibernated sandbox image: {str(exc)}",
+                },
+            ) from exc
+        labels = self._image_labels(image)
+        if labels.get(SANDBOX_ID_LABEL) != sandbox_id or not labels.get(SANDBOX_HIBERNATED_AT_LABEL):
+            return None
+        return image
+
+    def _list_hibernated_summaries(self, exclude_ids: set) -> list[dict]:
+        """
+        List snapshot images of hibernated sandboxes.
+
+        Images of sandboxes that were restored stay around as the base of the
+        new container, so sandboxes that currently own a container are skipped.
+        """
+        repository = self.app_config.docker.snapshot_repository
+        summaries = self.docker_client.api.images(filters={"label": SANDBOX_HIBERNATED_AT_LABEL}) or []
+        hibernated: list[dict] = []
+        for summary in summaries:
+            labels = summary.get("Labels") or {}
+            sandbox_id = labels.get(SANDBOX_ID_LABEL)
+            if not sandbox_id or sandbox_id in exclude_ids or not labels.get(SANDBOX_HIBERNATED_AT_LABEL):
+                continue
+            if f"{repository}:{sandbox_id}" not in (summary.get("RepoTags") or []):
+                continue
+            hibernated.append(summary)
+        return hibernated
+
+    def _hibernated_labels_to_sandbox(self, sandbox_id: str, labels: Dict[str, str]) -> Sandbox:
+        hibernated_at = parse_timestamp(labels.get(SANDBOX_HIBERNATED_AT_LABEL))
+        try:
+            entrypoint = json.loads(labels.get(SANDBOX_ENTRYPOINT_LABEL) or "[]")
+        except ValueError:
+            entrypoint = []
+        return Sandbox(
+            id=sandbox_id,
+            image=ImageSpec(uri=labels.get(SANDBOX_SOURCE_IMAGE_LABEL) or self._snapshot_image_ref(sandbox_id)),
+            status=SandboxStatus(
+                state="Hibernated",
+                reason="SNAPSHOT_COMMITTED",
+                message="Sandbox was committed to an image and its container removed; resume to restore it.",
+                last_transition_at=hibernated_at,
+            ),
+            metadata=self._labels_to_metadata(labels),
+            entrypoint=entrypoint,
+            expiresAt=self._get_tracked_expiration(sandbox_id, labels, hibernated_at),
+            createdAt=parse_timestamp(labels.get(SANDBOX_CREATED_AT_LABEL) or labels.get(SANDBOX_HIBERNATED_AT_LABEL)),
+        )
+
+    def _hibernate_container(self, container, sandbox_id: str) -> None:
+        config = container.attrs.get("Config", {})
+        labels = config.get("Labels") or {}
+        resource_limits = self._resource_limits_from_host_config(container.attrs.get("HostConfig", {}))
+        expires_at = self._get_tracked_expiration(sandbox_id, labels, datetime.now(timezone.utc))
+        # Commit merges these with the container labels (user metadata, ports, entrypoint).
+        snapshot_labels = {
+            SANDBOX_HIBERNATED_AT_LABEL: datetime.now(timezone.utc).isoformat(),
+            SANDBOX_SOURCE_IMAGE_LABEL: labels.get(SANDBOX_SOURCE_IMAGE_LABEL) or config.get("Image") or "",
+            SANDBOX_CREATED_AT_LABEL: labels.get(SANDBOX_CREATED_AT_LABEL) or container.attrs.get("Created") or "",
+            SANDBOX_RESOURCE_LIMITS_LABEL: json.dumps(resource_limits),
+            SANDBOX_EXPIRES_AT_LABEL: expires_at.isoformat(),
+        }
+        try:
+            with self._docker_operation("commit sandbox container", sandbox_id):
+                self._transfer_container(container).commit(
+                    repository=self.app_config.docker.snapshot_repository,
+                    tag=sandbox_id,
+                    conf={"Labels": snapshot_labels},
+                )
+            with self._docker_operation("remove hibernated sandbox container", sandbox_id):
+                container.remove(force=True)
+        except DockerException as exc:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail={
+                    "code": SandboxErrorCodes.SANDBOX_HIBERNATE_FAILED,
+                    "message": f"Failed to hibernate sandbox container: {str(exc)}",
+                },
+            ) from exc
+        finally:
+            self._endpoint_cache.invalidate(sandbox_id)
+        if self._idle_tracker is not None:
+            self._idle_tracker.forget(sandbox_id)
+
+    def _begin_restore(self, sandbox_id: str, image) -> None:
+        """
+        Report a hibernated sandbox as Pending and restore it on a background thread.
+
+        Resuming a sandbox whose restore is still running is a no-op.
+
+        Raises:
+            HTTPException: If the snapshot image carries invalid metadata
+        """
+        request, created_at, expires_at, preferred_host_ports = self._restore_request(sandbox_id, image)
+        with self._pending_lock:
+            pending = self._pending_sandboxes.get(sandbox_id)
+            if pending is not None and pending.status.state == "Pending":
+                return
+            timer = self._pending_cleanup_timers.pop(sandbox_id, None)
+            if timer:
+                timer.cancel()
+            self._pending_sandboxes[sandbox_id] = PendingSandbox(
+                request=request,
+                created_at=created_at,
+                expires_at=expires_at,
+                status=SandboxStatus(
+                    state="Pending",
+                    reason="RESTORING",
+                    message="Sandbox is being restored from its hibernation snapshot.",
+                    last_transition_at=datetime.now(timezone.utc),
+                ),
+            )
+        Thread(
+            target=self._async_restore_worker,
+            args=(sandbox_id, request, created_at, expires_at, preferred_host_ports),
+            name=f"sandbox-resume-{sandbox_id}",
+            daemon=True,
+        ).start()
+
+    def _async_restore_worker(
+        self,
+        sandbox_id: str,
+        request: CreateSandboxRequest,
+        created_at: datetime,
+        expires_at: datetime,
+        preferred_host_ports: tuple[Optional[int], Optional[int]],
+    ) -> None:
+        try:
+            self._restore_hibernated_sandbox(sandbox_id, request, created_at, expires_at, preferred_host_ports)
+        except HTTPException as exc:
+            message = exc.detail.get("message") if isinstance(exc.detail, dict) else str(exc)
+            self._mark_pending_failed(sandbox_id, message or "Sandbox restore failed.")
+            self._schedule_pending_cleanup(sandbox_id)
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Unexpected error restoring sandbox %s: %s", sandbox_id, exc)
+            self._mark_pending_failed(sandbox_id, str(exc))
+            self._cleanup_failed_containers(sandbox_id)
+            self._schedule_pending_cleanup(sandbox_id)
+        else:
+            self._remove_pending_sandbox(sandbox_id)
+
+    def _restore_request(
+        self, sandbox_id: str, image
+    ) -> tuple[CreateSandboxRequest, datetime, datetime, tuple[Optional[int], Optional[int]]]:
+        """Rebuild the creation request, timestamps and host ports of a hibernated sandbox."""
+        labels = self._image_labels(image)
+        try:
+            entrypoint = json.loads(labels.get(SANDBOX_ENTRYPOINT_LABEL) or "")
+            resource_limits = json.loads(labels.get(SANDBOX_RESOURCE_LIMITS_LABEL) or "{}")
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail={
+                    "code": SandboxErrorCodes.SANDBOX_RESUME_FAILED,
+                    "message": f"Hibernated sandbox image has invalid metadata: {str(exc)}",
+                },
+            ) from exc
+        now = datetime.now(timezone.utc)
+        created_at = parse_timestamp(labels.get(SANDBOX_CREATED_AT_LABEL) or labels.get(SANDBOX_HIBERNATED_AT_LABEL))
+        expires_at = self._get_tracked_expiration(sandbox_id, labels, now)
+        remaining = int((expires_at - now).total_seconds())
+        request = CreateSandboxRequest(
+            image=ImageSpec(uri=self._snapshot_image_ref(sandbox_id)),
+            timeout=min(max(remaining, 60), 86400),
+            resource_limits=ResourceLimits(resource_limits),
+            entrypoint=entrypoint,
+            metadata=self._user_metadata(labels),
+        )
+        preferred_host_ports = (
+            self._parse_host_port_label(
+                labels.get(SANDBOX_EMBEDDING_PROXY_PORT_LABEL),
+                SANDBOX_EMBEDDING_PROXY_PORT_LABEL,
+            ),
+            self._parse_host_port_label(labels.get(SANDBOX_HTTP_PORT_LABEL), SANDBOX_HTTP_PORT_LABEL),
+        )
+        return request, created_at, expires_at, preferred_host_ports
+
+    def _restore_hibernated_sandbox(
+        self,
+        sandbox_id: str,
+        request: CreateSandboxRequest,
+        created_at: datetime,
+        expires_at: datetime,
+        preferred_host_ports: tuple[Optional[int], Optional[int]],
+    ) -> None:
+        """Recreate a hibernated sandbox from its snapshot through the normal provisioning path."""
+        self._endpoint_cache.invalidate(sandbox_id)
+        try:
+            self._provision_sandbox(sandbox_id, request, created_at, expires_at, preferred_host_ports)
+        except HTTPException as exc:
+            self._cleanup_failed_containers(sandbox_id)
+            message = exc.detail.get("message") if isinstance(exc.detail, dict) else str(exc.detail)
+            raise HTTPException(
+                status_code=exc.status_code,
+                detail={
+                    "code": SandboxErrorCodes.SANDBOX_RESUME_FAILED,
+                    "message": f"Failed to restore hibernated sandbox: {message}",
+                },
+            ) from exc
+        if self._idle_tracker is not None:
+            self._idle_tracker.record_activity(sandbox_id)
+
+    def _delete_hibernated_sandbox(self, sandbox_id: str) -> None:
+        try:
+            with self._docker_operation("remove hibernated sandbox image", sandbox_id):
+                self.docker_client.images.remove(self._snapshot_image_ref(sandbox_id))
+        except ImageNotFound:
+            pass
+        except DockerException as exc:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail={
+                    "code": SandboxErrorCodes.SANDBOX_DELETE_FAILED,
+                    "message": f"Failed to delete hibernated sandbox image: {str(exc)}",
+                },
+            ) from exc
+        finally:
+            self._remove_expiration_tracking(sandbox_id)
+
+    def _remove_snapshot_image_quietly(self, sandbox_id: str) -> None:
+        try:
+            self.docker_client.images.remove(self._snapshot_image_ref(sandbox_id))
+        except ImageNotFound:
+            pass
+        except DockerException as exc:
+            logger.warning("sandbox=%s | failed to remove hibernated image: %s", sandbox_id, exc)
+
+    def clone_sandbox(
+        self,
+        sandbox_id: str,
+        count: int,
+        request: Optional[CloneSandboxRequest] = None,
+    ) -> Iterator[CloneSandboxResult]:
+        """
+        Clone a running sandbox by committing it once and provisioning N containers in parallel.
+
+        The snapshot is tagged once per clone (<snapshot_repository>:<clone id>)
+        so each clone releases its own tag on deletion and the image is
+        garbage-collected with the last clone.
+
+        Args:
+            sandbox_id: Unique identifier of the source sandbox
+            count: Number of clones to create
+            request: Optional timeout and metadata overrides for the clones
+
+        Returns:
+            Iterator[CloneSandboxResult]: Clone results in completion order
+
+        Raises:
+            HTTPException: If the source is not found, not running, or cannot be committed
+        """
+        request = request or CloneSandboxRequest()
+        container = self._get_active_container(sandbox_id)
+        if not container.attrs.get("State", {}).get("Running", False):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "code": SandboxErrorCodes.SANDBOX_NOT_RUNNING,
+                    "message": "Sandbox is not in a running state.",
+                },
+            )
+        config = container.attrs.get("Config", {})
+        labels = config.get("Labels") or {}
+        try:
+            entrypoint = json.loads(labels[SANDBOX_ENTRYPOINT_LABEL])
+        except (KeyError, ValueError):
+            entrypoint = config.get("Cmd") or []
+        image_labels = None
+        if SANDBOX_METADATA_KEYS_LABEL not in labels:
+            image_labels = self._source_image_labels(container, sandbox_id)
+        metadata = {**(self._user_metadata(labels, image_labels) or {}), **(request.metadata or {})} or None
+        ensure_metadata_labels(metadata)
+        timeout = request.timeout
+        if timeout is None:
+            now = datetime.now(timezone.utc)
+            remaining = self._get_tracked_expiration(sandbox_id, labels, now) - now
+            timeout = min(max(int(remaining.total_seconds()), 60), 86400)
+
+        repository = self.app_config.docker.snapshot_repository
+        clone_ids = [self.generate_sandbox_id() for _ in range(count)]
+        # Commit merges these over the source labels; blank values reset bookkeeping
+        # inherited from a source that was itself restored from a snapshot.
+        snapshot_labels = {
+            SANDBOX_CLONED_FROM_LABEL: sandbox_id,
+            SANDBOX_SOURCE_IMAGE_LABEL: labels.get(SANDBOX_SOURCE_IMAGE_LABEL) or config.get("Image") or "",
+            SANDBOX_CREATED_AT_LABEL: "",
+            SANDBOX_HIBERNATED_AT_LABEL: "",
+        }
+        try:
+            with self._docker_operation("commit sandbox container for clone", sandbox_id):
+                image = self._transfer_container(container).commit(
+                    repository=repository,
+                    tag=clone_ids[0],
+                    conf={"Labels": snapshot_labels},
+                )
+            for clone_id in clone_ids[1:]:
+                image.tag(repository, tag=clone_id)
+        except DockerException as exc:
+            for clone_id in clone_ids:
+                self._remove_snapshot_image_quietly(clone_id)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail={
+                    "code": SandboxErrorCodes.SANDBOX_CLONE_FAILED,
+                    "message": f"Failed to snapshot sandbox for cloning: {str(exc)}",
+                },
+            ) from exc
+
+        resource_limits = ResourceLimits(self._resource_limits_from_host_config(container.attrs.get("HostConfig", {})))
+        clone_requests = [
+            CreateSandboxRequest(
+                image=ImageSpec(uri=self._snapshot_image_ref(clone_id)),
+                timeout=timeout,
+                resource_limits=resource_limits,
+                entrypoint=entrypoint,
+                metadata=metadata,
+            )
+            for clone_id in clone_ids
+        ]
+        return self._provision_clones(clone_ids, clone_requests)
+
+    def _source_image_labels(self, container, sandbox_id: str) -> Dict[str, str]:
+        """Labels of the image a container runs, or an empty dict if it cannot be inspected."""
+        try:
+            return self._image_labels(self.docker_client.images.get(container.attrs.get("Image")))
+        except DockerException as exc:
+            logger.warning("sandbox=%s | failed to inspect source image labels: %s", sandbox_id, exc)
+            return {}
+
+    def _provision_clones(
+        self,
+        clone_ids: list[str],
+        requests: list[CreateSandboxRequest],
+    ) -> Iterator[CloneSandboxResult]:
+        workers = min(len(clone_ids), self.app_config.docker.clone_parallelism)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sandbox-clone") as executor:
+            futures = [
+                executor.submit(self._provision_clone, index, clone_id, clone_request)
+                for index, (clone_id, clone_request) in enumerate(zip(clone_ids, requests))
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def _provision_clone(self, index: int, clone_id: str, request: CreateSandboxRequest) -> CloneSandboxResult:
+        created_at = datetime.now(timezone.utc)
+        expires_at = created_at + timedelta(seconds=request.timeout)
+        try:
+            response = self._provision_sandbox(clone_id, request, created_at, expires_at)
+        except Exception as exc:  # noqa: BLE001
+            if isinstance(exc, HTTPException) and isinstance(exc.detail, dict):
+                error = ErrorResponse(**exc.detail)
+            else:
+                logger.exception("sandbox=%s | unexpected error provisioning clone", clone_id)
+                error = ErrorResponse(code=SandboxErrorCodes.UNKNOWN_ERROR, message=str(exc))
+            self._cleanup_failed_containers(clone_id)
+            self._remove_snapshot_image_quietly(clone_id)
+            return CloneSandboxResult(index=index, error=error)
+        return CloneSandboxResult(index=index, sandbox=response)
+
+    def _apply_idle_policy(self, latest: Dict[str, ResourceSample]) -> None:
+        """Stats listener: pause or reclaim sandboxes that stayed idle past the timeout."""
+        if self._idle_tracker is None:
+            return
+        idle_action = self.app_config.docker.idle_action
+        for sandbox_id in self._idle_tracker.observe(latest):
+            if idle_action == "delete":
+                logger.info("sandbox=%s | reclaiming idle sandbox", sandbox_id)
+                self._expire_sandbox(sandbox_id)
+                self._idle_tracker.mark_reclaimed(sandbox_id)
+            elif idle_action == "hibernate":
+                self._hibernate_idle_sandbox(sandbox_id)
+            else:
+                self._pause_idle_sandbox(sandbox_id)
+
+    def _pause_idle_sandbox(self, sandbox_id: str) -> None:
+        try:
+            container = self._get_container_by_sandbox_id(sandbox_id)
+            state = container.attrs.get("State", {})
+            if not state.get("Running", False) or state.get("Paused", False):
+                # Stopped or paused by the user; restart the idle clock instead of acting.
+                self._idle_tracker.record_activity(sandbox_id)
+                return
+            with self._docker_operation("idle pause sandbox container", sandbox_id):
+                container.pause()
+        except (HTTPException, DockerException) as exc:
+            detail = exc.detail if isinstance(exc, HTTPException) else exc
+            logger.warning("sandbox=%s | failed to pause idle sandbox: %s", sandbox_id, detail)
+            return
+        self._idle_tracker.mark_auto_paused(sandbox_id)
+
+    def _hibernate_idle_sandbox(self, sandbox_id: str) -> None:
+        try:
+            container = self._get_container_by_sandbox_id(sandbox_id)
+        except HTTPException as exc:
+            logger.warning("sandbox=%s | failed to hibernate idle sandbox: %s", sandbox_id, exc.detail)
+            return
+        if not container.attrs.get("State", {}).get("Running", False):
+            self._idle_tracker.record_activity(sandbox_id)
+            return
+        with self._stopping_lock:
+            if sandbox_id in self._stopping or sandbox_id in self._hibernating:
+                return
+            self._hibernating[sandbox_id] = datetime.now(timezone.utc)
+        logger.info("sandbox=%s | hibernating idle sandbox", sandbox_id)
+        # Same path as hibernate_sandbox, so the commit does not hold up the stats sweep.
+        self._teardown_executor.submit(self._hibernate_worker, container, sandbox_id, idle=True)
+
+    def _wake_if_idle_paused(self, sandbox_id: str) -> None:
+        """Record API activity and transparently unpause sandboxes frozen by the idle policy."""
+        if self._idle_tracker is None:
+            return
+        if self._idle_tracker.is_auto_paused(sandbox_id):
+            container = self._get_container_by_sandbox_id(sandbox_id)
+            if container.attrs.get("State", {}).get("Paused", False):
+                try:
+                    with self._docker_operation("idle resume sandbox container", sandbox_id):
+                        container.unpause()
+                except DockerException as exc:
+                    raise HTTPException(
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        detail={
+                            "code": SandboxErrorCodes.SANDBOX_RESUME_FAILED,
+                            "message": f"Failed to resume idle sandbox container: {str(exc)}",
+                        },
+                    ) from exc
+            self._idle_tracker.mark_resumed(sandbox_id)
+        self._idle_tracker.record_activity(sandbox_id)
+
+    def _apply_tracked_status(self, sandbox: Sandbox) -> Sandbox:
+        """Overlay states only tracked in memory: pending deletions, hibernations and idle-policy pauses."""
+        with self._stopping_lock:
+            stopping_since = self._stopping.get(sandbox.id)
+            hibernating_since = self._hibernating.get(sandbox.id)
+        if stopping_since is not None:
+            sandbox.status = SandboxStatus(
+                state="Stopping",
+                reason="DELETE_REQUESTED",
+                message="Sandbox deletion was accepted; the container is being removed.",
+                last_transition_at=stopping_since,
+            )
+            return sandbox
+        if hibernating_since is not None:
+            sandbox.status = SandboxStatus(
+                state="Hibernating",
+                reason="HIBERNATE_REQUESTED",
+                message="Sandbox is being committed to a snapshot image; its container is removed afterwards.",
+                last_transition_at=hibernating_since,
+            )
+            return sandbox
+        if (
+            self._idle_tracker is not None
+            and sandbox.status.state == "Paused"
+            and self._idle_tracker.is_auto_paused(sandbox.id)
+        ):
+            sandbox.status.reason = "IDLE_PAUSED"
+            sandbox.status.message = "Sandbox was paused after being idle; it resumes on the next access."
+        return sandbox
+
+    def _list_stats_targets(self) -> Dict[str, str]:
+        """Map sandbox IDs to container IDs for every live sandbox container."""
+        summaries = self._list_container_summaries(
+            {"label": [SANDBOX_ID_LABEL], "status": ["running", "paused"]}
+        )
+        targets: Dict[str, str] = {}
+        for summary in summaries:
+            sandbox_id = (summary.get("Labels") or {}).get(SANDBOX_ID_LABEL)
+            container_id = summary.get("Id")
+            if sandbox_id and container_id:
+                targets[sandbox_id] = container_id
+        return targets
+
+    def _require_stats_collector(self) -> SandboxStatsCollector:
+        if self._stats_collector is None:
+            raise HTTPException(
+                status_code=status.HTTP_501_NOT_IMPLEMENTED,
+                detail={
+                    "code": SandboxErrorCodes.API_NOT_SUPPORTED,
+                    "message": "Resource stats collection is disabled (docker.stats_enabled = false).",
+                },
+            )
+        return self._stats_collector
+
+    @staticmethod
+    def _sample_to_schema(sample: ResourceSample) -> SandboxResourceSample:
+        return SandboxResourceSample(
+            collected_at=sample.collected_at,
+            cpu_percent=sample.cpu_percent,
+            cpu_usage_usec=sample.cpu_usage_usec,
+            memory_bytes=sample.memory_bytes,
+            io_read_bytes=sample.io_read_bytes,
+            io_write_bytes=sample.io_write_bytes,
+            pids=sample.pids,
+        )
+
+    def get_sandbox_stats(self, sandbox_id: str) -> SandboxStatsResponse:
+        """
+        Return the cgroup sample history recorded for a sandbox.
+
+        Args:
+            sandbox_id: Unique sandbox identifier
+
+        Returns:
+            SandboxStatsResponse: Sampled resource usage, oldest first
+
+        Raises:
+            HTTPException: If stats collection is disabled or the sandbox has no samples
+        """
+        samples = self._require_stats_collector().get_samples(sandbox_id)
+        if samples is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "code": SandboxErrorCodes.SANDBOX_NOT_FOUND,
+                    "message": f"No resource stats recorded for sandbox {sandbox_id}.",
+                },
+            )
+        return SandboxStatsResponse(
+            sandbox_id=sandbox_id,
+            samples=[self._sample_to_schema(sample) for sample in samples],
+        )
+
+    def get_fleet_stats(self) -> FleetStatsResponse:
+        """
+        Aggregate the latest cgroup sample of every tracked sandbox.
+
+        Returns:
+            FleetStatsResponse: Fleet-wide resource usage totals
+
+        Raises:
+            HTTPException: If stats collection is disabled
+        """
+        latest = self._require_stats_collector().latest_samples().values()
+        idle_stats = None
+        if self._idle_tracker is not None:
+            snapshot = self._idle_tracker.snapshot()
+            idle_stats = IdleStats(
+                active=snapshot.active,
+                idle=snapshot.idle,
+                auto_paused=snapshot.auto_paused,
+                auto_pause_total=snapshot.auto_pause_total,
+                auto_resume_total=snapshot.auto_resume_total,
+                hibernate_total=snapshot.hibernate_total,
+                reclaim_total=snapshot.reclaim_total,
+            )
+        return FleetStatsResponse(
+            sandbox_count=len(latest),
+            cpu_percent=sum(sample.cpu_percent or 0.0 for sample in latest),
+            memory_bytes=sum(sample.memory_bytes for sample in latest),
+            io_read_bytes=sum(sample.io_read_bytes for sample in latest),
+            io_write_bytes=sum(sample.io_write_bytes for sample in latest),
+            pids=sum(sample.pids for sample in latest),
+            collected_at=max((sample.collected_at for sample in latest), default=None),
+            idle=idle_stats,
+        )
+
     def _resolve_public_host(self) -> str:
-        host_cfg = (self.app_config.server.host or "").strip()
-        host_key = host_cfg.lower()
-        if host_key in {"", "0.0.0.0", "::"}:
-            return self._resolve_bind_ip(socket.AF_INET)
-        return host_cfg
+        # The bind IP lookup opens a socket; the answer does not change while the server runs.
+        if self._public_host is None:
+            host_cfg = (self.app_config.server.host or "").strip()
+            host_key = host_cfg.lower()
+            if host_key in {"", "0.0.0.0", "::"}:
+                self._public_host = self._resolve_bind_ip(socket.AF_INET)
+            else:
+                self._public_host = host_cfg
+        return self._public_host
 
     def _resolve_internal_endpoint(self, container, port: int) -> Endpoint:
         """Return the internal endpoint used when bypassing host mapping."""
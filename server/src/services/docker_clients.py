@@ -0,0 +1,71 @@
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Bounded, instrumented connection pools for Docker clients.
+
+docker-py keeps a small HTTP connection pool per client (10 by default) and
+does not block when it is exhausted: extra requests open throwaway connections
+to dockerd. The service therefore uses two clients, one for short control calls
+(inspect, list, create, kill, remove) and one for long transfers (image pulls,
+archive copies, commits), so a burst of transfers cannot starve control calls.
+Each client is gated by a semaphore sized like its pool; time spent waiting for
+a slot is reported as ``docker_client_pool_wait_seconds``.
+"""
+
+from __future__ import annotations
+
+import time
+from threading import BoundedSemaphore
+
+from src.services.metrics import metrics
+
+CONTROL_POOL = "control"
+TRANSFER_POOL = "transfer"
+
+
+def instrument_client_pool(client, pool: str, size: int) -> None:
+    """
+    Bound concurrent requests on ``client`` to ``size`` and record pool metrics.
+
+    Wraps the client's ``send`` so every Docker API request first acquires a
+    pool slot. Streaming responses release the slot once headers arrive.
+
+    Args:
+        client: Docker client to instrument in place
+        pool: Pool name used as the metrics label
+        size: Number of concurrent requests allowed
+    """
+    slots = BoundedSemaphore(size)
+    original_send = client.api.send
+    metrics.set_gauge("docker_client_pool_size", size, pool=pool)
+
+    def send(request, **kwargs):
+        waiting_since = time.perf_counter()
+        with slots:
+            metrics.observe("docker_client_pool_wait_seconds", time.perf_counter() - waiting_since, pool=pool)
+            metrics.add_gauge("docker_client_pool_in_use", 1, pool=pool)
+            try:
+                return original_send(request, **kwargs)
+            finally:
+                metrics.add_gauge("docker_client_pool_in_use", -1, pool=pool)
+
+    client.api.send = send
+
+
+__all__ = [
+    "CONTROL_POOL",
+    "TRANSFER_POOL",
+    "instrument_client_pool",
+]
@@ -0,0 +1,94 @@
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cache of resolved sandbox endpoints.
+
+Resolving an endpoint costs a runtime lookup (a container listing on Docker,
+a workload and pod read on Kubernetes), while the SDK resolves endpoints on
+every create/connect and proxies do so per session. Entries are keyed by
+(sandbox, port, internal) and grouped per sandbox so that lifecycle changes
+(delete, pause, hibernate, container restart) drop all of a sandbox's entries
+at once. The TTL bounds staleness for changes the service does not observe.
+"""
+
+from __future__ import annotations
+
+import time
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from src.api.schema import Endpoint
+from src.services.metrics import metrics
+
+_EntryKey = Tuple[int, bool]
+
+
+class EndpointCache:
+    """Thread-safe TTL cache of endpoints, invalidated per sandbox."""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Dict[_EntryKey, Tuple[Endpoint, float]]] = {}
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, sandbox_id: str, port: int, internal: bool = False) -> Optional[Endpoint]:
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entries = self._entries.get(sandbox_id)
+            cached = entries.get((port, internal)) if entries else None
+            if cached is not None and cached[1] <= now:
+                entries.pop((port, internal), None)
+                cached = None
+        if cached is None:
+            metrics.inc("endpoint_cache_misses_total")
+            return None
+        metrics.inc("endpoint_cache_hits_total")
+        # Callers may mutate the response model; hand out a copy.
+        return cached[0].model_copy(deep=True)
+
+    def put(self, sandbox_id: str, port: int, endpoint: Endpoint, internal: bool = False) -> None:
+        if not self.enabled:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries.setdefault(sandbox_id, {})[(port, internal)] = (
+                endpoint.model_copy(deep=True),
+                expires_at,
+            )
+
+    def invalidate(self, sandbox_id: str) -> None:
+        with self._lock:
+            dropped = self._entries.pop(sandbox_id, None)
+        if dropped:
+            metrics.inc("endpoint_cache_invalidations_total")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(entries) for entries in self._entries.values())
+
+
+__all__ = [
+    "EndpointCache",
+]
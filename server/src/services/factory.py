@@ -24,6 +24,7 @@ from typing import Optional
 
 from src.config import AppConfig, get_config
 from src.services.docker import DockerSandboxService
+from src.services.fake import FakeSandboxService
 from src.services.k8s import KubernetesSandboxService
 from src.services.sandbox_service import SandboxService
 
@@ -57,6 +58,7 @@ def create_sandbox_service(
     implementations: dict[str, type[SandboxService]] = {
         "docker": DockerSandboxService,
         "kubernetes": KubernetesSandboxService,
+        "fake": FakeSandboxService,
         # Future implementations can be added here:
         # "containerd": ContainerdSandboxService,
     }
@@ -0,0 +1,328 @@
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+In-memory fake sandbox runtime.
+
+Selected with ``runtime.type = "fake"``. Sandboxes only exist in a dict, so the
+API layer (routing, auth, validation, serialisation) can be load tested without
+Docker or Kubernetes. Simulated latencies are spent in the calling thread, the
+same way the real runtimes block on their daemon calls.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+from typing import Dict, Optional
+
+from fastapi import HTTPException, status
+
+from src.api.schema import (
+    CreateSandboxRequest,
+    CreateSandboxResponse,
+    Endpoint,
+    ListSandboxesRequest,
+    ListSandboxesResponse,
+    PaginationInfo,
+    RenewSandboxExpirationRequest,
+    RenewSandboxExpirationResponse,
+    Sandbox,
+    SandboxStatus,
+)
+from src.config import AppConfig, FakeRuntimeConfig, get_config
+from src.services.constants import SandboxErrorCodes
+from src.services.helpers import matches_filter
+from src.services.sandbox_service import SandboxService
+from src.services.validators import ensure_entrypoint, ensure_future_expiration, ensure_metadata_labels
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _FakeSandbox:
+    request: CreateSandboxRequest
+    created_at: datetime
+    expires_at: datetime
+    ready_at: float
+    paused: bool = False
+    transitioned_at: Optional[datetime] = None
+
+
+class FakeSandboxService(SandboxService):
+    """SandboxService that keeps sandboxes in memory with simulated latencies and failures."""
+
+    def __init__(self, config: Optional[AppConfig] = None):
+        self.app_config = config or get_config()
+        if self.app_config.runtime.type != "fake":
+            raise ValueError("FakeSandboxService requires runtime.type = 'fake'.")
+        self.fake_config: FakeRuntimeConfig = self.app_config.fake or FakeRuntimeConfig()
+        self._random = random.Random(self.fake_config.seed)
+        self._lock = Lock()
+        self._sandboxes: Dict[str, _FakeSandbox] = {}
+        self._pulled_images: set[str] = set()
+        logger.info("Fake sandbox service initialized (no container runtime is used).")
+
+    def _simulate(self, latency_ms: float) -> None:
+        if latency_ms <= 0:
+            return
+        jitter = self.fake_config.latency_jitter
+        with self._lock:
+            factor = 1 + self._random.uniform(-jitter, jitter) if jitter else 1
+        time.sleep(latency_ms * factor / 1000)
+
+    def _maybe_fail(self, rate: float, action: str) -> None:
+        if rate <= 0:
+            return
+        with self._lock:
+            failed = self._random.random() < rate
+        if failed:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail={
+                    "code": SandboxErrorCodes.FAKE_INJECTED_FAILURE,
+                    "message": f"Injected {action} failure.",
+                },
+            )
+
+    def _get_record(self, sandbox_id: str) -> _FakeSandbox:
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            record = self._sandboxes.get(sandbox_id)
+            if record is not None and record.expires_at <= now:
+                self._sandboxes.pop(sandbox_id, None)
+                record = None
+        if record is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "code": SandboxErrorCodes.FAKE_SANDBOX_NOT_FOUND,
+                    "message": f"Sandbox {sandbox_id} not found.",
+                },
+            )
+        return record
+
+    @staticmethod
+    def _status(record: _FakeSandbox) -> SandboxStatus:
+        if time.monotonic() < record.ready_at:
+            return SandboxStatus(
+                state="Pending",
+                reason="SIMULATED_STARTING",
+                message="Fake sandbox is starting.",
+                last_transition_at=record.created_at,
+            )
+        if record.paused:
+            return SandboxStatus(
+                state="Paused",
+                reason="SIMULATED_PAUSED",
+                message="Fake sandbox is paused.",
+                last_transition_at=record.transitioned_at,
+            )
+        return SandboxStatus(
+            state="Running",
+            reason="SIMULATED_RUNNING",
+            message="Fake sandbox is running.",
+            last_transition_at=record.transitioned_at or record.created_at,
+        )
+
+    def _to_sandbox(self, sandbox_id: str, record: _FakeSandbox) -> Sandbox:
+        return Sandbox(
+            id=sandbox_id,
+            image=record.request.image,
+            status=self._status(record),
+            metadata=record.request.metadata,
+            entrypoint=record.request.entrypoint,
+            expiresAt=record.expires_at,
+            createdAt=record.created_at,
+        )
+
+    def create_sandbox(self, request: CreateSandboxRequest) -> CreateSandboxResponse:
+        """
+        Create a fake sandbox after the simulated pull and create latencies.
+
+        Args:
+            request: Sandbox creation request
+
+        Returns:
+            CreateSandboxResponse: Created sandbox information
+
+        Raises:
+            HTTPException: If validation fails or a failure is injected
+        """
+        ensure_entrypoint(request.entrypoint)
+        ensure_metadata_labels(request.metadata)
+        with self._lock:
+            needs_pull = request.image.uri not in self._pulled_images
+            self._pulled_images.add(request.image.uri)
+        if needs_pull:
+            self._simulate(self.fake_config.pull_latency_ms)
+        self._simulate(self.fake_config.create_latency_ms)
+        self._maybe_fail(self.fake_config.create_failure_rate, "create")
+
+        sandbox_id = self.generate_sandbox_id()
+        created_at = datetime.now(timezone.utc)
+        record = _FakeSandbox(
+            request=request,
+            created_at=created_at,
+            expires_at=created_at + timedelta(seconds=request.timeout),
+            ready_at=time.monotonic() + self.fake_config.ready_latency_ms / 1000,
+        )
+        with self._lock:
+            self._sandboxes[sandbox_id] = record
+        return CreateSandboxResponse(
+            id=sandbox_id,
+            status=self._status(record),
+            metadata=request.metadata,
+            expiresAt=record.expires_at,
+            createdAt=created_at,
+            entrypoint=request.entrypoint,
+        )
+
+    def list_sandboxes(self, request: ListSandboxesRequest) -> ListSandboxesResponse:
+        """
+        List fake sandboxes with optional filtering and pagination.
+        """
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            for sandbox_id in [sid for sid, rec in self._sandboxes.items() if rec.expires_at <= now]:
+                self._sandboxes.pop(sandbox_id, None)
+            records = list(self._sandboxes.items())
+
+        sandboxes = [self._to_sandbox(sandbox_id, record) for sandbox_id, record in records]
+        sandboxes = [sandbox for sandbox in sandboxes if matches_filter(sandbox, request.filter)]
+        sandboxes.sort(key=lambda s: s.created_at or datetime.min, reverse=True)
+
+        if request.pagination:
+            page = request.pagination.page
+            page_size = request.pagination.page_size
+        else:
+            page = 1
+            page_size = 20
+
+        total_items = len(sandboxes)
+        total_pages = math.ceil(total_items / page_size) if total_items else 0
+        start_index = (page - 1) * page_size
+        items = sandboxes[start_index:start_index + page_size]
+
+        return ListSandboxesResponse(
+            items=items,
+            pagination=PaginationInfo(
+                page=page,
+                page_size=page_size,
+                total_items=total_items,
+                total_pages=total_pages,
+                has_next_page=page < total_pages,
+            ),
+        )
+
+    def get_sandbox(self, sandbox_id: str) -> Sandbox:
+        """
+        Fetch a fake sandbox by id.
+
+        Raises:
+            HTTPException: If sandbox not found
+        """
+        return self._to_sandbox(sandbox_id, self._get_record(sandbox_id))
+
+    def delete_sandbox(self, sandbox_id: str) -> None:
+        """
+        Delete a fake sandbox after the simulated delete latency.
+
+        Raises:
+            HTTPException: If sandbox not found or a failure is injected
+        """
+        self._get_record(sandbox_id)
+        self._simulate(self.fake_config.delete_latency_ms)
+        self._maybe_fail(self.fake_config.delete_failure_rate, "delete")
+        with self._lock:
+            self._sandboxes.pop(sandbox_id, None)
+
+    def _transition(self, sandbox_id: str, paused: bool) -> None:
+        record = self._get_record(sandbox_id)
+        with self._lock:
+            if record.paused == paused or time.monotonic() < record.ready_at:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail={
+                        "code": SandboxErrorCodes.FAKE_INVALID_STATE,
+                        "message": f"Sandbox is not in a {'running' if paused else 'paused'} state.",
+                    },
+                )
+            record.paused = paused
+            record.transitioned_at = datetime.now(timezone.utc)
+
+    def pause_sandbox(self, sandbox_id: str) -> None:
+        """
+        Mark a running fake sandbox as paused.
+
+        Raises:
+            HTTPException: If sandbox not found or not running
+        """
+        self._transition(sandbox_id, paused=True)
+
+    def resume_sandbox(self, sandbox_id: str) -> None:
+        """
+        Mark a paused fake sandbox as running.
+
+        Raises:
+            HTTPException: If sandbox not found or not paused
+        """
+        self._transition(sandbox_id, paused=False)
+
+    def renew_expiration(
+        self,
+        sandbox_id: str,
+        request: RenewSandboxExpirationRequest,
+    ) -> RenewSandboxExpirationResponse:
+        """
+        Renew fake sandbox expiration time.
+
+        Raises:
+            HTTPException: If sandbox not found or the expiration is invalid
+        """
+        record = self._get_record(sandbox_id)
+        new_expiration = ensure_future_expiration(request.expires_at)
+        with self._lock:
+            record.expires_at = new_expiration
+        return RenewSandboxExpirationResponse(expires_at=new_expiration)
+
+    def get_endpoint(self, sandbox_id: str, port: int, resolve_internal: bool = False) -> Endpoint:
+        """
+        Return a placeholder endpoint; fake sandboxes do not serve traffic.
+
+        Raises:
+            HTTPException: If sandbox not found or the port is invalid
+        """
+        try:
+            self.validate_port(port)
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "code": SandboxErrorCodes.INVALID_PORT,
+                    "message": str(exc),
+                },
+            ) from exc
+        self._get_record(sandbox_id)
+        return Endpoint(endpoint=f"{sandbox_id}.fake.invalid:{port}")
+
+
+__all__ = [
+    "FakeSandboxService",
+]
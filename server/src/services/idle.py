@@ -0,0 +1,167 @@
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Idle detection for sandboxes.
+
+A sandbox counts as active while it burns CPU above a threshold (execd serving
+commands, user processes running) or while the lifecycle API is touching it
+(endpoint lookups, renewals). Once it has been quiet for the configured period
+the service applies the idle action (pause or reclaim).
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, Mapping
+
+from src.services.cgroup_stats import ResourceSample
+
+
+@dataclass
+class _IdleState:
+    last_active: float
+    below_threshold: bool = False
+    auto_paused: bool = False
+
+
+@dataclass
+class IdleSnapshot:
+    """Point-in-time idle/active counters."""
+
+    active: int = 0
+    idle: int = 0
+    auto_paused: int = 0
+    auto_pause_total: int = 0
+    auto_resume_total: int = 0
+    hibernate_total: int = 0
+    reclaim_total: int = 0
+
+
+class IdleTracker:
+    """Track per-sandbox activity and report sandboxes idle for too long."""
+
+    def __init__(self, idle_timeout_seconds: float, cpu_threshold_percent: float):
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.cpu_threshold_percent = cpu_threshold_percent
+        self._states: Dict[str, _IdleState] = {}
+        self._lock = Lock()
+        self._auto_pause_total = 0
+        self._auto_resume_total = 0
+        self._hibernate_total = 0
+        self._reclaim_total = 0
+
+    def record_activity(self, sandbox_id: str) -> None:
+        """Mark the sandbox as active now (API access or observed work)."""
+        now = time.monotonic()
+        with self._lock:
+            state = self._states.get(sandbox_id)
+            if state is None:
+                self._states[sandbox_id] = _IdleState(last_active=now)
+            else:
+                state.last_active = now
+                state.below_threshold = False
+
+    def observe(self, samples: Mapping[str, ResourceSample]) -> list[str]:
+        """
+        Fold a stats sweep into the tracker.
+
+        Returns sandbox IDs that have been idle for at least the timeout and
+        have not already been acted on.
+        """
+        now = time.monotonic()
+        candidates: list[str] = []
+        with self._lock:
+            for sandbox_id, state in list(self._states.items()):
+                # A missed sample may be a transient read failure; auto-paused sandboxes
+                # keep their flag so the next access still unpauses them. Deleted and
+                # hibernated sandboxes are dropped through forget/mark_hibernated.
+                if sandbox_id not in samples and not state.auto_paused:
+                    del self._states[sandbox_id]
+            for sandbox_id, sample in samples.items():
+                state = self._states.get(sandbox_id)
+                if state is None:
+                    state = _IdleState(last_active=now)
+                    self._states[sandbox_id] = state
+                if state.auto_paused:
+                    continue
+                busy = sample.cpu_percent is None or sample.cpu_percent >= self.cpu_threshold_percent
+                state.below_threshold = not busy
+                if busy:
+                    state.last_active = now
+                elif now - state.last_active >= self.idle_timeout_seconds:
+                    candidates.append(sandbox_id)
+        return candidates
+
+    def mark_auto_paused(self, sandbox_id: str) -> None:
+        with self._lock:
+            state = self._states.setdefault(sandbox_id, _IdleState(last_active=time.monotonic()))
+            state.auto_paused = True
+            self._auto_pause_total += 1
+
+    def is_auto_paused(self, sandbox_id: str) -> bool:
+        with self._lock:
+            state = self._states.get(sandbox_id)
+            return bool(state and state.auto_paused)
+
+    def mark_resumed(self, sandbox_id: str) -> None:
+        """Clear the auto-pause flag after the sandbox was woken up."""
+        now = time.monotonic()
+        with self._lock:
+            state = self._states.get(sandbox_id)
+            if state is None or not state.auto_paused:
+                return
+            state.auto_paused = False
+            state.below_threshold = False
+            state.last_active = now
+            self._auto_resume_total += 1
+
+    def mark_hibernated(self, sandbox_id: str) -> None:
+        with self._lock:
+            self._states.pop(sandbox_id, None)
+            self._hibernate_total += 1
+
+    def mark_reclaimed(self, sandbox_id: str) -> None:
+        with self._lock:
+            self._states.pop(sandbox_id, None)
+            self._reclaim_total += 1
+
+    def forget(self, sandbox_id: str) -> None:
+        with self._lock:
+            self._states.pop(sandbox_id, None)
+
+    def snapshot(self) -> IdleSnapshot:
+        with self._lock:
+            snapshot = IdleSnapshot(
+                auto_pause_total=self._auto_pause_total,
+                auto_resume_total=self._auto_resume_total,
+                hibernate_total=self._hibernate_total,
+                reclaim_total=self._reclaim_total,
+            )
+            for state in self._states.values():
+                if state.auto_paused:
+                    snapshot.auto_paused += 1
+                elif state.below_threshold:
+                    snapshot.idle += 1
+                else:
+                    snapshot.active += 1
+            return snapshot
+
+
+__all__ = [
+    "IdleSnapshot",
+    "IdleTracker",
+]
@@ -18,24 +18,27 @@ Agent-sandbox workload provider implementation.
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-
-from kubernetes.client import (
-    V1Container,
-    V1EnvVar,
-    V1ResourceRequirements,
-    V1VolumeMount,
-    ApiException,
-)
+from typing import Any, Callable, Dict, List, Optional
+
+from kubernetes.client import ApiException
 
 from src.api.schema import ImageSpec
 from src.services.constants import SANDBOX_ID_LABEL
 from src.services.k8s.agent_sandbox_template import AgentSandboxTemplateManager
 from src.services.k8s.client import K8sClient
+from src.services.k8s.template_manager import CompiledManifest, Slot
 from src.services.k8s.workload_provider import WorkloadProvider
 
 logger = logging.getLogger(__name__)
 
+_EXECD_INSTALL_SCRIPT = (
+    "cp ./execd /opt/opensandbox/bin/execd && "
+    "cp ./bootstrap.sh /opt/opensandbox/bin/bootstrap.sh && "
+    "chmod +x /opt/opensandbox/bin/execd && "
+    "chmod +x /opt/opensandbox/bin/bootstrap.sh"
+)
+_EXECD_VOLUME_MOUNT = {"name": "opensandbox-bin", "mountPath": "/opt/opensandbox/bin"}
+
 
 class AgentSandboxProvider(WorkloadProvider):
     """
@@ -60,8 +63,10 @@ class AgentSandboxProvider(WorkloadProvider):
         self.shutdown_policy = shutdown_policy
         self.service_account = service_account
         self.template_manager = AgentSandboxTemplateManager(template_file_path)
+        # Template merged once; creates only fill in the per-request slots.
+        self._compiled_manifest = self._compile_manifest()
 
-    def create_workload(
+    def _build_workload_manifest(
         self,
         sandbox_id: str,
         namespace: str,
@@ -74,41 +79,82 @@ class AgentSandboxProvider(WorkloadProvider):
         execd_image: str,
         extensions: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
-        sandbox_name = f"sandbox-{sandbox_id}"
-
-        pod_spec = self._build_pod_spec(
-            image_spec=image_spec,
-            entrypoint=entrypoint,
-            env=env,
-            resource_limits=resource_limits,
-            execd_image=execd_image,
+        return self._compiled_manifest.render(
+            name=f"sandbox-{sandbox_id}",
+            namespace=namespace,
+            labels=labels,
+            shutdown_time=expires_at.isoformat(),
+            init_containers=[self._build_execd_init_container(execd_image)],
+            containers=[
+                self._build_main_container(
+                    image_spec=image_spec,
+                    entrypoint=entrypoint,
+                    env=env,
+                    resource_limits=resource_limits,
+                )
+            ],
         )
 
+    def _compile_manifest(self) -> CompiledManifest:
+        pod_spec: Dict[str, Any] = {
+            "initContainers": Slot("init_containers"),
+            "containers": Slot("containers"),
+            "volumes": [
+                {
+                    "name": "opensandbox-bin",
+                    "emptyDir": {},
+                }
+            ],
+        }
         if self.service_account:
             pod_spec["serviceAccountName"] = self.service_account
 
-        runtime_manifest = {
+        return self.template_manager.compile({
             "apiVersion": f"{self.group}/{self.version}",
             "kind": "Sandbox",
             "metadata": {
-                "name": sandbox_name,
-                "namespace": namespace,
-                "labels": labels,
+                "name": Slot("name"),
+                "namespace": Slot("namespace"),
+                "labels": Slot("labels"),
             },
             "spec": {
                 "replicas": 1,
-                "shutdownTime": expires_at.isoformat(),
+                "shutdownTime": Slot("shutdown_time"),
                 "shutdownPolicy": self.shutdown_policy,
                 "podTemplate": {
                     "metadata": {
-                        "labels": labels,
+                        "labels": Slot("labels"),
                     },
                     "spec": pod_spec,
                 },
             },
-        }
+        })
 
-        sandbox = self.template_manager.merge_with_runtime_values(runtime_manifest)
+    def create_workload(
+        self,
+        sandbox_id: str,
+        namespace: str,
+        image_spec: ImageSpec,
+        entrypoint: List[str],
+        env: Dict[str, str],
+        resource_limits: Dict[str, str],
+        labels: Dict[str, str],
+        expires_at: datetime,
+        execd_image: str,
+        extensions: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        sandbox = self._build_workload_manifest(
+            sandbox_id=sandbox_id,
+            namespace=namespace,
+            image_spec=image_spec,
+            entrypoint=entrypoint,
+            env=env,
+            resource_limits=resource_limits,
+            labels=labels,
+            expires_at=expires_at,
+            execd_image=execd_image,
+            extensions=extensions,
+        )
 
         created = self.custom_api.create_namespaced_custom_object(
             group=self.group,
@@ -123,117 +169,36 @@ class AgentSandboxProvider(WorkloadProvider):
             "uid": created["metadata"]["uid"],
         }
 
-    def _build_pod_spec(
-        self,
-        image_spec: ImageSpec,
-        entrypoint: List[str],
-        env: Dict[str, str],
-        resource_limits: Dict[str, str],
-        execd_image: str,
-    ) -> Dict[str, Any]:
-        init_container = self._build_execd_init_container(execd_image)
-        main_container = self._build_main_container(
-            image_spec=image_spec,
-            entrypoint=entrypoint,
-            env=env,
-            resource_limits=resource_limits,
-            include_execd_volume=True,
-        )
+    def _build_execd_init_container(self, execd_image: str) -> Dict[str, Any]:
         return {
-            "initContainers": [self._container_to_dict(init_container)],
-            "containers": [self._container_to_dict(main_container)],
-            "volumes": [
-                {
-                    "name": "opensandbox-bin",
-                    "emptyDir": {},
-                }
-            ],
+            "name": "execd-installer",
+            "image": execd_image,
+            "command": ["/bin/sh", "-c"],
+            "args": [_EXECD_INSTALL_SCRIPT],
+            "volumeMounts": [dict(_EXECD_VOLUME_MOUNT)],
         }
 
-    def _build_execd_init_container(self, execd_image: str) -> V1Container:
-        script = (
-            "cp ./execd /opt/opensandbox/bin/execd && "
-            "cp ./bootstrap.sh /opt/opensandbox/bin/bootstrap.sh && "
-            "chmod +x /opt/opensandbox/bin/execd && "
-            "chmod +x /opt/opensandbox/bin/bootstrap.sh"
-        )
-
-        return V1Container(
-            name="execd-installer",
-            image=execd_image,
-            command=["/bin/sh", "-c"],
-            args=[script],
-            volume_mounts=[
-                V1VolumeMount(
-                    name="opensandbox-bin",
-                    mount_path="/opt/opensandbox/bin",
-                )
-            ],
-        )
-
     def _build_main_container(
         self,
         image_spec: ImageSpec,
         entrypoint: List[str],
         env: Dict[str, str],
         resource_limits: Dict[str, str],
-        include_execd_volume: bool,
-    ) -> V1Container:
-        env_vars = [V1EnvVar(name=k, value=v) for k, v in env.items()]
-        env_vars.append(V1EnvVar(name="EXECD", value="/opt/opensandbox/bin/execd"))
-
-        resources = None
-        if resource_limits:
-            resources = V1ResourceRequirements(
-                limits=resource_limits,
-                requests=resource_limits,
-            )
-
-        wrapped_command = ["/opt/opensandbox/bin/bootstrap.sh"] + entrypoint
-
-        volume_mounts = None
-        if include_execd_volume:
-            volume_mounts = [
-                V1VolumeMount(
-                    name="opensandbox-bin",
-                    mount_path="/opt/opensandbox/bin",
-                )
-            ]
-
-        return V1Container(
-            name="sandbox",
-            image=image_spec.uri,
-            command=wrapped_command,
-            env=env_vars if env_vars else None,
-            resources=resources,
-            volume_mounts=volume_mounts,
-        )
-
-    def _container_to_dict(self, container: V1Container) -> Dict[str, Any]:
-        result: Dict[str, Any] = {
-            "name": container.name,
-            "image": container.image,
+    ) -> Dict[str, Any]:
+        container: Dict[str, Any] = {
+            "name": "sandbox",
+            "image": image_spec.uri,
+            "command": ["/opt/opensandbox/bin/bootstrap.sh"] + entrypoint,
+            "env": [{"name": k, "value": v} for k, v in env.items()]
+            + [{"name": "EXECD", "value": "/opt/opensandbox/bin/execd"}],
         }
-
-        if container.command:
-            result["command"] = container.command
-        if container.args:
-            result["args"] = container.args
-        if container.env:
-            result["env"] = [{"name": e.name, "value": e.value} for e in container.env]
-        if container.resources:
-            result["resources"] = {}
-            if container.resources.limits:
-                result["resources"]["limits"] = container.resources.limits
-            if container.resources.requests:
-                result["resources"]["requests"] = container.resources.requests
-        if container.volume_mounts:
-            result["volumeMounts"] = [
-                {"name": vm.name, "mountPath": vm.mount_path}
-                for vm in container.volume_mounts
-            ]
-
-        return result
+        if resource_limits:
+            container["resources"] = {
+                "limits": resource_limits,
+                "requests": resource_limits,
+            }
+        container["volumeMounts"] = [dict(_EXECD_VOLUME_MOUNT)]
+        return container
 
     def get_workload(self, sandbox_id: str, namespace: str) -> Optional[Dict[str, Any]]:
         label_selector = f"{SANDBOX_ID_LABEL}={sandbox_id}"
@@ -308,6 +273,69 @@ class AgentSandboxProvider(WorkloadProvider):
             body=body,
         )
 
+    async def create_workload_async(self, **kwargs: Any) -> Dict[str, Any]:
+        if self.async_api is None:
+            return await super().create_workload_async(**kwargs)
+        created = await self.async_api.create_namespaced_custom_object(
+            group=self.group,
+            version=self.version,
+            namespace=kwargs["namespace"],
+            plural=self.plural,
+            body=self._build_workload_manifest(**kwargs),
+        )
+        return {
+            "name": created["metadata"]["name"],
+            "uid": created["metadata"]["uid"],
+        }
+
+    async def get_workload_async(self, sandbox_id: str, namespace: str) -> Optional[Dict[str, Any]]:
+        if self.async_api is None:
+            return await super().get_workload_async(sandbox_id, namespace)
+        try:
+            sandbox_list = await self.async_api.list_namespaced_custom_object(
+                group=self.group,
+                version=self.version,
+                namespace=namespace,
+                plural=self.plural,
+                label_selector=f"{SANDBOX_ID_LABEL}={sandbox_id}",
+            )
+        except ApiException as e:
+            if e.status == 404:
+                return None
+            raise
+        items = sandbox_list.get("items")
+        return items[0] if items else None
+
+    async def delete_workload_async(self, sandbox_id: str, namespace: str) -> None:
+        if self.async_api is None:
+            return await super().delete_workload_async(sandbox_id, namespace)
+        sandbox = await self.get_workload_async(sandbox_id, namespace)
+        if not sandbox:
+            raise Exception(f"Sandbox for sandbox {sandbox_id} not found")
+        await self.async_api.delete_namespaced_custom_object(
+            group=self.group,
+            version=self.version,
+            namespace=namespace,
+            plural=self.plural,
+            name=sandbox["metadata"]["name"],
+            grace_period_seconds=0,
+        )
+
+    async def update_expiration_async(self, sandbox_id: str, namespace: str, expires_at: datetime) -> None:
+        if self.async_api is None:
+            return await super().update_expiration_async(sandbox_id, namespace, expires_at)
+        sandbox = await self.get_workload_async(sandbox_id, namespace)
+        if not sandbox:
+            raise Exception(f"Sandbox for sandbox {sandbox_id} not found")
+        await self.async_api.patch_namespaced_custom_object(
+            group=self.group,
+            version=self.version,
+            namespace=namespace,
+            plural=self.plural,
+            name=sandbox["metadata"]["name"],
+            body={"spec": {"shutdownTime": expires_at.isoformat()}},
+        )
+
     def get_expiration(self, workload: Dict[str, Any]) -> Optional[datetime]:
         spec = workload.get("spec", {})
         shutdown_time_str = spec.get("shutdownTime")
@@ -322,19 +350,73 @@ class AgentSandboxProvider(WorkloadProvider):
             return None
 
     def get_status(self, workload: Dict[str, Any]) -> Dict[str, Any]:
-        status = workload.get("status", {})
-        conditions = status.get("conditions", [])
+        return self._status_from_workload(workload, self._list_selector_pods)
+
+    def get_statuses(self, workloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Get status for a listing of Sandbox workloads.
+
+        Workloads without a Ready condition (typically most of them during a
+        scale-up) need their pods to tell Running from Pending. Instead of one
+        pod list per workload, pods are listed once per namespace and joined to
+        workloads by their selector in memory.
+        """
+        pods_by_namespace: Dict[str, Optional[List[Any]]] = {}
+        for workload in workloads:
+            namespace = workload.get("metadata", {}).get("namespace")
+            if (
+                namespace
+                and namespace not in pods_by_namespace
+                and self._ready_condition(workload) is None
+                and workload.get("status", {}).get("selector")
+            ):
+                pods_by_namespace[namespace] = self._list_sandbox_pods(namespace)
+
+        def _joined_pods(workload: Dict[str, Any]) -> Optional[List[Any]]:
+            namespace = workload.get("metadata", {}).get("namespace")
+            pods = pods_by_namespace.get(namespace)
+            selector = _parse_selector(workload.get("status", {}).get("selector"))
+            if pods is None or selector is None:
+                # Namespace listing failed or the selector is set-based; ask the API server.
+                return self._list_selector_pods(workload)
+            return [pod for pod in pods if _labels_match(pod, selector)]
+
+        return [self._status_from_workload(workload, _joined_pods) for workload in workloads]
+
+    async def get_status_async(self, workload: Dict[str, Any]) -> Dict[str, Any]:
+        if self.async_api is None or self._ready_condition(workload) is not None:
+            return await super().get_status_async(workload)
+
+        pods = None
+        selector = workload.get("status", {}).get("selector")
+        namespace = workload.get("metadata", {}).get("namespace")
+        if selector and namespace:
+            try:
+                pods = (await self.async_api.list_namespaced_pod(
+                    namespace=namespace,
+                    label_selector=selector,
+                )).get("items", [])
+            except Exception as e:
+                logger.warning("Failed to list pods for selector %s: %s", selector, e)
+        return self._status_from_workload(workload, lambda _: pods)
 
-        ready_condition = None
-        for condition in conditions:
+    @staticmethod
+    def _ready_condition(workload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        for condition in workload.get("status", {}).get("conditions", []):
             if condition.get("type") == "Ready":
-                ready_condition = condition
-                break
+                return condition
+        return None
 
+    def _status_from_workload(
+        self,
+        workload: Dict[str, Any],
+        pods_for: Callable[[Dict[str, Any]], Optional[List[Any]]],
+    ) -> Dict[str, Any]:
+        ready_condition = self._ready_condition(workload)
         creation_timestamp = workload.get("metadata", {}).get("creationTimestamp")
 
         if not ready_condition:
-            pod_state = self._pod_state_from_selector(workload)
+            pod_state = self._pod_state(pods_for(workload))
             if pod_state:
                 state, reason, message = pod_state
                 return {
@@ -371,7 +453,7 @@ class AgentSandboxProvider(WorkloadProvider):
             "last_transition_at": last_transition_at,
         }
 
-    def _pod_state_from_selector(self, workload: Dict[str, Any]) -> Optional[tuple[str, str, str]]:
+    def _list_selector_pods(self, workload: Dict[str, Any]) -> Optional[List[Any]]:
         status = workload.get("status", {})
         selector = status.get("selector")
         namespace = workload.get("metadata", {}).get("namespace")
@@ -379,16 +461,34 @@ class AgentSandboxProvider(WorkloadProvider):
             return None
 
         try:
-            pods = self.core_api.list_namespaced_pod(
+            return self.core_api.list_namespaced_pod(
                 namespace=namespace,
                 label_selector=selector,
             ).items
-        except Exception:
+        except Exception as e:
+            logger.warning("Failed to list pods for selector %s: %s", selector, e)
+            return None
+
+    def _list_sandbox_pods(self, namespace: str) -> Optional[List[Any]]:
+        # Sandbox pods carry the sandbox ID label from the pod template.
+        try:
+            return self.core_api.list_namespaced_pod(
+                namespace=namespace,
+                label_selector=SANDBOX_ID_LABEL,
+            ).items
+        except Exception as e:
+            logger.warning("Failed to list sandbox pods in %s: %s", namespace, e)
+            return None
+
+    @staticmethod
+    def _pod_state(pods: Optional[List[Any]]) -> Optional[tuple[str, str, str]]:
+        if not pods:
             return None
 
         for pod in pods:
-            if pod.status and pod.status.phase == "Running":
-                if pod.status.pod_ip:
+            phase, pod_ip = _pod_phase_and_ip(pod)
+            if phase == "Running":
+                if pod_ip:
                     return (
                         "Running",
                         "POD_READY",
@@ -400,29 +500,48 @@ class AgentSandboxProvider(WorkloadProvider):
                     "Pod is running but waiting for IP assignment",
                 )
 
-        if pods:
-            return ("Pending", "POD_PENDING", "Pod is pending")
-
-        return None
+        return ("Pending", "POD_PENDING", "Pod is pending")
 
     def get_endpoint_info(self, workload: Dict[str, Any], port: int) -> Optional[str]:
-        status = workload.get("status", {})
-        selector = status.get("selector")
-        namespace = workload.get("metadata", {}).get("namespace")
-        if selector and namespace:
-            try:
-                pods = self.core_api.list_namespaced_pod(
-                    namespace=namespace,
-                    label_selector=selector,
-                ).items
-                for pod in pods:
-                    if pod.status and pod.status.pod_ip and pod.status.phase == "Running":
-                        return f"{pod.status.pod_ip}:{port}"
-            except Exception as e:
-                logger.warning("Failed to resolve pod endpoint: %s", e)
+        return self.get_endpoint_infos(workload, [port])[port]
+
+    def get_endpoint_infos(self, workload: Dict[str, Any], ports: List[int]) -> Dict[int, Optional[str]]:
+        host = None
+        for pod in self._list_selector_pods(workload) or []:
+            if pod.status and pod.status.pod_ip and pod.status.phase == "Running":
+                host = pod.status.pod_ip
+                break
 
-        service_fqdn = status.get("serviceFQDN")
-        if service_fqdn:
-            return f"{service_fqdn}:{port}"
+        if host is None:
+            host = workload.get("status", {}).get("serviceFQDN")
+        return {port: f"{host}:{port}" if host else None for port in ports}
 
+
+def _parse_selector(selector: Optional[str]) -> Optional[Dict[str, str]]:
+    """Parse an equality-based label selector (``a=b,c==d``); None for anything else."""
+    if not selector:
         return None
+    required: Dict[str, str] = {}
+    for term in selector.split(","):
+        key, sep, value = term.partition("=")
+        value = value[1:] if value.startswith("=") else value
+        key = key.strip()
+        if not sep or not key or key.endswith("!") or any(c in key for c in " ()"):
+            return None
+        required[key] = value.strip()
+    return required
+
+
+def _pod_phase_and_ip(pod: Any) -> tuple[Optional[str], Optional[str]]:
+    # Pods are V1Pod models from the sync client and plain dicts from the asyncio client.
+    if isinstance(pod, dict):
+        status = pod.get("status") or {}
+        return status.get("phase"), status.get("podIP")
+    if not pod.status:
+        return None, None
+    return pod.status.phase, pod.status.pod_ip
+
+
+def _labels_match(pod: Any, required: Dict[str, str]) -> bool:
+    labels = (pod.metadata.labels if pod.metadata else None) or {}
+    return all(labels.get(key) == value for key, value in required.items())
@@ -21,22 +21,25 @@ import shlex
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-from kubernetes.client import (
-    V1Container,
-    V1EnvVar,
-    V1ResourceRequirements,
-    V1VolumeMount,
-    ApiException,
-)
+from kubernetes.client import ApiException
 
 from src.api.schema import ImageSpec
 from src.services.constants import SANDBOX_ID_LABEL
 from src.services.k8s.batchsandbox_template import BatchSandboxTemplateManager
 from src.services.k8s.client import K8sClient
+from src.services.k8s.template_manager import CompiledManifest, Slot
 from src.services.k8s.workload_provider import WorkloadProvider
 
 logger = logging.getLogger(__name__)
 
+_EXECD_INSTALL_SCRIPT = (
+    "cp ./execd /opt/opensandbox/bin/execd && "
+    "cp ./bootstrap.sh /opt/opensandbox/bin/bootstrap.sh && "
+    "chmod +x /opt/opensandbox/bin/execd && "
+    "chmod +x /opt/opensandbox/bin/bootstrap.sh"
+)
+_EXECD_VOLUME_MOUNT = {"name": "opensandbox-bin", "mountPath": "/opt/opensandbox/bin"}
+
 
 class BatchSandboxProvider(WorkloadProvider):
     """
@@ -64,6 +67,9 @@ class BatchSandboxProvider(WorkloadProvider):
         
         # Template manager
         self.template_manager = BatchSandboxTemplateManager(template_file_path)
+        # Template merged once; creates only fill in the per-request slots.
+        self._main_volume_mounts: List[Dict[str, Any]] = []
+        self._compiled_manifest = self._compile_manifest()
     
     def create_workload(
         self,
@@ -102,13 +108,54 @@ class BatchSandboxProvider(WorkloadProvider):
         Returns:
             Dict with 'name' and 'uid' of created BatchSandbox
         """
+        batchsandbox = self._build_workload_manifest(
+            sandbox_id=sandbox_id,
+            namespace=namespace,
+            image_spec=image_spec,
+            entrypoint=entrypoint,
+            env=env,
+            resource_limits=resource_limits,
+            labels=labels,
+            expires_at=expires_at,
+            execd_image=execd_image,
+            extensions=extensions,
+        )
+        
+        # Create BatchSandbox
+        created = self.custom_api.create_namespaced_custom_object(
+            group=self.group,
+            version=self.version,
+            namespace=namespace,
+            plural=self.plural,
+            body=batchsandbox,
+        )
+        
+        return {
+            "name": created["metadata"]["name"],
+            "uid": created["metadata"]["uid"],
+        }
+    
+    def _build_workload_manifest(
+        self,
+        sandbox_id: str,
+        namespace: str,
+        image_spec: ImageSpec,
+        entrypoint: List[str],
+        env: Dict[str, str],
+        resource_limits: Dict[str, str],
+        labels: Dict[str, str],
+        expires_at: datetime,
+        execd_image: str,
+        extensions: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Build the BatchSandbox manifest for ``create_workload`` (template or pool mode)."""
         batchsandbox_name = f"sandbox-{sandbox_id}"
         extensions = extensions or {}
         
         # If poolRef is provided and not empty, create workload from pool
         if extensions.get("poolRef"):
             # When using pool, only entrypoint and env can be customized
-            return self._create_workload_from_pool(
+            return self._build_pool_manifest(
                 batchsandbox_name=batchsandbox_name,
                 namespace=namespace,
                 labels=labels,
@@ -118,70 +165,74 @@ class BatchSandboxProvider(WorkloadProvider):
                 env=env,
             )
         
-        # Extract extra pod spec fragments from template (volumes/volumeMounts only).
-        extra_volumes, extra_mounts = self._extract_template_pod_extras()
-
-        # Build init container for execd installation
-        init_container = self._build_execd_init_container(execd_image)
-        
-        # Build main container with execd support
-        main_container = self._build_main_container(
-            image_spec=image_spec,
-            entrypoint=entrypoint,
-            env=env,
-            resource_limits=resource_limits,
+        return self._compiled_manifest.render(
+            name=batchsandbox_name,
+            namespace=namespace,
+            labels=labels,
+            expire_time=expires_at.isoformat(),
+            init_containers=[self._build_execd_init_container(execd_image)],
+            containers=[
+                self._build_main_container(
+                    image_spec=image_spec,
+                    entrypoint=entrypoint,
+                    env=env,
+                    resource_limits=resource_limits,
+                )
+            ],
         )
+    
+    def _compile_manifest(self) -> CompiledManifest:
+        """
+        Merge the template with the runtime BatchSandbox manifest once.
         
-        # Build shared volume for execd
-        volumes = [
-            {
-                "name": "opensandbox-bin",
-                "emptyDir": {}
+        Volumes and the main container's volume mounts do not vary per request,
+        so template extras are merged into them here rather than on every create.
+        
+        Returns:
+            CompiledManifest: Skeleton with slots for name, namespace, labels,
+            expireTime and containers
+        """
+        # Extract extra pod spec fragments from template (volumes/volumeMounts only).
+        extra_volumes, extra_mounts = self._extract_template_pod_extras()
+        pod_spec_extras = {
+            "spec": {
+                "template": {
+                    "spec": {
+                        # Build shared volume for execd
+                        "volumes": [{"name": "opensandbox-bin", "emptyDir": {}}],
+                        "containers": [{"volumeMounts": [dict(_EXECD_VOLUME_MOUNT)]}],
+                    }
+                }
             }
-        ]
+        }
+        self._merge_pod_spec_extras(pod_spec_extras, extra_volumes, extra_mounts)
+        pod_spec = pod_spec_extras["spec"]["template"]["spec"]
+        self._main_volume_mounts = pod_spec["containers"][0]["volumeMounts"]
         
-        # Build runtime-generated BatchSandbox manifest
+        # Runtime-generated BatchSandbox manifest
         # This contains only the essential runtime fields
-        runtime_manifest = {
+        return self.template_manager.compile({
             "apiVersion": f"{self.group}/{self.version}",
             "kind": "BatchSandbox",
             "metadata": {
-                "name": batchsandbox_name,
-                "namespace": namespace,
-                "labels": labels,
+                "name": Slot("name"),
+                "namespace": Slot("namespace"),
+                "labels": Slot("labels"),
             },
             "spec": {
                 "replicas": 1,
-                "expireTime": expires_at.isoformat(),
+                "expireTime": Slot("expire_time"),
                 "template": {
                     "spec": {
-                        "initContainers": [self._container_to_dict(init_container)],
-                        "containers": [self._container_to_dict(main_container)],
-                        "volumes": volumes,
+                        "initContainers": Slot("init_containers"),
+                        "containers": Slot("containers"),
+                        "volumes": pod_spec["volumes"],
                     }
                 },
             },
-        }
-        
-        # Merge with template to get final manifest
-        batchsandbox = self.template_manager.merge_with_runtime_values(runtime_manifest)
-        self._merge_pod_spec_extras(batchsandbox, extra_volumes, extra_mounts)
-        
-        # Create BatchSandbox
-        created = self.custom_api.create_namespaced_custom_object(
-            group=self.group,
-            version=self.version,
-            namespace=namespace,
-            plural=self.plural,
-            body=batchsandbox,
-        )
-        
-        return {
-            "name": created["metadata"]["name"],
-            "uid": created["metadata"]["uid"],
-        }
+        })
     
-    def _create_workload_from_pool(
+    def _build_pool_manifest(
         self,
         batchsandbox_name: str,
         namespace: str,
@@ -192,7 +243,7 @@ class BatchSandboxProvider(WorkloadProvider):
         env: Dict[str, str],
     ) -> Dict[str, Any]:
         """
-        Create BatchSandbox workload from a pre-warmed resource pool.
+        Build a BatchSandbox manifest that claims a pre-warmed resource pool.
         
         Pool-based creation uses poolRef to reference an existing pool.
         The pool already defines the pod template, so no additional template is needed.
@@ -208,7 +259,7 @@ class BatchSandboxProvider(WorkloadProvider):
             env: Environment variables (can be customized)
             
         Returns:
-            Dict with 'name' and 'uid' of created BatchSandbox
+            BatchSandbox manifest
             
         Raises:
             SandboxError: If required parameters are invalid
@@ -230,19 +281,7 @@ class BatchSandboxProvider(WorkloadProvider):
         }
         
         # Pool-based creation does not need template merging
-        # Create BatchSandbox directly
-        created = self.custom_api.create_namespaced_custom_object(
-            group=self.group,
-            version=self.version,
-            namespace=namespace,
-            plural=self.plural,
-            body=runtime_manifest,
-        )
-        
-        return {
-            "name": created["metadata"]["name"],
-            "uid": created["metadata"]["uid"],
-        }
+        return runtime_manifest
 
     def _extract_template_pod_extras(self) -> tuple[list[Dict[str, Any]], list[Dict[str, Any]]]:
         """
@@ -368,7 +407,7 @@ class BatchSandboxProvider(WorkloadProvider):
             }
         }
     
-    def _build_execd_init_container(self, execd_image: str) -> V1Container:
+    def _build_execd_init_container(self, execd_image: str) -> Dict[str, Any]:
         """
         Build init container for execd installation.
         
@@ -383,28 +422,16 @@ class BatchSandboxProvider(WorkloadProvider):
             execd_image: execd container image
             
         Returns:
-            V1Container: Init container spec
+            Dict: Init container spec
         """
-        # Copy execd binary and bootstrap.sh from image to shared volume
-        script = (
-            "cp ./execd /opt/opensandbox/bin/execd && "
-            "cp ./bootstrap.sh /opt/opensandbox/bin/bootstrap.sh && "
-            "chmod +x /opt/opensandbox/bin/execd && "
-            "chmod +x /opt/opensandbox/bin/bootstrap.sh"
-        )
-        
-        return V1Container(
-            name="execd-installer",
-            image=execd_image,
-            command=["/bin/sh", "-c"],
-            args=[script],
-            volume_mounts=[
-                V1VolumeMount(
-                    name="opensandbox-bin",
-                    mount_path="/opt/opensandbox/bin"
-                )
-            ],
-        )
+        return {
+            "name": "execd-installer",
+            "image": execd_image,
+            "command": ["/bin/sh", "-c"],
+            # Copy execd binary and bootstrap.sh from image to shared volume
+            "args": [_EXECD_INSTALL_SCRIPT],
+            "volumeMounts": [dict(_EXECD_VOLUME_MOUNT)],
+        }
     
     def _build_main_container(
         self,
@@ -412,7 +439,7 @@ class BatchSandboxProvider(WorkloadProvider):
         entrypoint: List[str],
         env: Dict[str, str],
         resource_limits: Dict[str, str],
-    ) -> V1Container:
+    ) -> Dict[str, Any]:
         """
         Build main container spec with execd support.
         
@@ -426,79 +453,24 @@ class BatchSandboxProvider(WorkloadProvider):
             resource_limits: Resource limits
             
         Returns:
-            V1Container: Main container spec
+            Dict: Main container spec
         """
-        # Convert env dict to V1EnvVar list and inject EXECD path
-        env_vars = [V1EnvVar(name=k, value=v) for k, v in env.items()]
-        # Add EXECD environment variable to specify execd binary path
-        env_vars.append(V1EnvVar(name="EXECD", value="/opt/opensandbox/bin/execd"))
-        
-        # Build resource requirements
-        resources = None
-        if resource_limits:
-            resources = V1ResourceRequirements(
-                limits=resource_limits,
-                requests=resource_limits,  # Set requests = limits for guaranteed QoS
-            )
-        
-        # Wrap entrypoint with bootstrap script to start execd
-        wrapped_command = ["/opt/opensandbox/bin/bootstrap.sh"] + entrypoint
-        
-        return V1Container(
-            name="sandbox",
-            image=image_spec.uri,
-            command=wrapped_command,
-            env=env_vars if env_vars else None,
-            resources=resources,
-            volume_mounts=[
-                V1VolumeMount(
-                    name="opensandbox-bin",
-                    mount_path="/opt/opensandbox/bin"
-                )
-            ],
-        )
-    
-    def _container_to_dict(self, container: V1Container) -> Dict[str, Any]:
-        """
-        Convert V1Container to dict for CRD.
-        
-        Args:
-            container: V1Container object
-            
-        Returns:
-            Dict representation of container
-        """
-        result = {
-            "name": container.name,
-            "image": container.image,
+        container: Dict[str, Any] = {
+            "name": "sandbox",
+            "image": image_spec.uri,
+            # Wrap entrypoint with bootstrap script to start execd
+            "command": ["/opt/opensandbox/bin/bootstrap.sh"] + entrypoint,
+            # Inject EXECD to specify the execd binary path
+            "env": [{"name": k, "value": v} for k, v in env.items()]
+            + [{"name": "EXECD", "value": "/opt/opensandbox/bin/execd"}],
         }
-        
-        if container.command:
-            result["command"] = container.command
-        
-        if container.args:
-            result["args"] = container.args
-        
-        if container.env:
-            result["env"] = [
-                {"name": e.name, "value": e.value}
-                for e in container.env
-            ]
-        
-        if container.resources:
-            result["resources"] = {}
-            if container.resources.limits:
-                result["resources"]["limits"] = container.resources.limits
-            if container.resources.requests:
-                result["resources"]["requests"] = container.resources.requests
-        
-        if container.volume_mounts:
-            result["volumeMounts"] = [
-                {"name": vm.name, "mountPath": vm.mount_path}
-                for vm in container.volume_mounts
-            ]
-        
-        return result
+        if resource_limits:
+            container["resources"] = {
+                "limits": resource_limits,
+                "requests": resource_limits,  # Set requests = limits for guaranteed QoS
+            }
+        container["volumeMounts"] = self._main_volume_mounts
+        return container
     
     def get_workload(self, sandbox_id: str, namespace: str) -> Optional[Dict[str, Any]]:
         """Get BatchSandbox by sandbox ID."""
@@ -595,6 +567,69 @@ class BatchSandboxProvider(WorkloadProvider):
             body=body,
         )
     
+    async def create_workload_async(self, **kwargs: Any) -> Dict[str, Any]:
+        if self.async_api is None:
+            return await super().create_workload_async(**kwargs)
+        created = await self.async_api.create_namespaced_custom_object(
+            group=self.group,
+            version=self.version,
+            namespace=kwargs["namespace"],
+            plural=self.plural,
+            body=self._build_workload_manifest(**kwargs),
+        )
+        return {
+            "name": created["metadata"]["name"],
+            "uid": created["metadata"]["uid"],
+        }
+    
+    async def get_workload_async(self, sandbox_id: str, namespace: str) -> Optional[Dict[str, Any]]:
+        if self.async_api is None:
+            return await super().get_workload_async(sandbox_id, namespace)
+        try:
+            batchsandbox_list = await self.async_api.list_namespaced_custom_object(
+                group=self.group,
+                version=self.version,
+                namespace=namespace,
+                plural=self.plural,
+                label_selector=f"{SANDBOX_ID_LABEL}={sandbox_id}",
+            )
+        except ApiException as e:
+            if e.status == 404:
+                return None
+            raise
+        items = batchsandbox_list.get("items")
+        return items[0] if items else None
+    
+    async def delete_workload_async(self, sandbox_id: str, namespace: str) -> None:
+        if self.async_api is None:
+            return await super().delete_workload_async(sandbox_id, namespace)
+        batchsandbox = await self.get_workload_async(sandbox_id, namespace)
+        if not batchsandbox:
+            raise Exception(f"BatchSandbox for sandbox {sandbox_id} not found")
+        await self.async_api.delete_namespaced_custom_object(
+            group=self.group,
+            version=self.version,
+            namespace=namespace,
+            plural=self.plural,
+            name=batchsandbox["metadata"]["name"],
+            grace_period_seconds=0,
+        )
+    
+    async def update_expiration_async(self, sandbox_id: str, namespace: str, expires_at: datetime) -> None:
+        if self.async_api is None:
+            return await super().update_expiration_async(sandbox_id, namespace, expires_at)
+        batchsandbox = await self.get_workload_async(sandbox_id, namespace)
+        if not batchsandbox:
+            raise Exception(f"BatchSandbox for sandbox {sandbox_id} not found")
+        await self.async_api.patch_namespaced_custom_object(
+            group=self.group,
+            version=self.version,
+            namespace=namespace,
+            plural=self.plural,
+            name=batchsandbox["metadata"]["name"],
+            body={"spec": {"expireTime": expires_at.isoformat()}},
+        )
+    
     def get_expiration(self, workload: Dict[str, Any]) -> Optional[datetime]:
         """Get expiration time from BatchSandbox.
         
@@ -21,6 +21,7 @@ from kubernetes import client, config
 from kubernetes.client import CoreV1Api, CustomObjectsApi
 
 from src.config import KubernetesRuntimeConfig
+from src.services.k8s.async_client import AsyncK8sApi
 
 
 class K8sClient:
@@ -44,6 +45,7 @@ class K8sClient:
         self._load_config()
         self._core_v1_api: Optional[CoreV1Api] = None
         self._custom_objects_api: Optional[CustomObjectsApi] = None
+        self._async_api: Optional[AsyncK8sApi] = None
     
     def _load_config(self) -> None:
         """
@@ -83,3 +85,20 @@ class K8sClient:
         if self._custom_objects_api is None:
             self._custom_objects_api = client.CustomObjectsApi()
         return self._custom_objects_api
+    
+    def get_async_api(self) -> AsyncK8sApi:
+        """
+        Get the asyncio API client sharing this client's host and credentials.
+        
+        Returns:
+            AsyncK8sApi: Pooled asyncio client for custom objects and pods
+        """
+        if self._async_api is None:
+            self._async_api = AsyncK8sApi.from_configuration(
+                client.Configuration.get_default_copy(),
+                pool_size=self.config.api_pool_size,
+                http2=self.config.api_http2,
+                timeout_seconds=self.config.api_timeout_seconds,
+            )
+        return self._async_api
+
@@ -19,6 +19,7 @@ This module provides a Kubernetes implementation of the sandbox service interfac
 using Kubernetes resources for sandbox lifecycle management.
 """
 
+import asyncio
 import logging
 import time
 from datetime import datetime, timedelta, timezone
@@ -27,6 +28,7 @@ from typing import Optional, Dict, Any
 from fastapi import HTTPException, status
 
 from src.api.schema import (
+    BatchEndpointsResponse,
     CreateSandboxRequest,
     CreateSandboxResponse,
     Endpoint,
@@ -36,6 +38,7 @@ from src.api.schema import (
     RenewSandboxExpirationRequest,
     RenewSandboxExpirationResponse,
     Sandbox,
+    SandboxEndpoints,
     SandboxStatus,
 )
 from src.config import AppConfig, get_config
@@ -43,6 +46,7 @@ from src.services.constants import (
     SANDBOX_ID_LABEL,
     SandboxErrorCodes,
 )
+from src.services.endpoint_cache import EndpointCache
 from src.services.helpers import matches_filter
 from src.services.sandbox_service import SandboxService
 from src.services.validators import (
@@ -50,7 +54,10 @@ from src.services.validators import (
     ensure_future_expiration,
     ensure_metadata_labels,
 )
+from src.services.k8s.batchsandbox_provider import BatchSandboxProvider
 from src.services.k8s.client import K8sClient
+from src.services.k8s.pool_autoscaler import PoolAutoscaler
+from src.services.k8s.pool_registry import PoolRegistry
 from src.services.k8s.provider_factory import create_workload_provider
 
 logger = logging.getLogger(__name__)
@@ -85,6 +92,8 @@ class KubernetesSandboxService(SandboxService):
         self.namespace = self.app_config.kubernetes.namespace
         self.execd_image = runtime_config.execd_image
         self.service_account = self.app_config.kubernetes.service_account
+        # Pod IP changes are not watched; the TTL bounds how long a stale IP can be served.
+        self._endpoint_cache = EndpointCache(runtime_config.endpoint_cache_ttl_seconds)
         
         # Initialize Kubernetes client
         try:
@@ -122,12 +131,42 @@ class KubernetesSandboxService(SandboxService):
                 },
             ) from e
         
+        if self.app_config.kubernetes.async_api:
+            self.workload_provider.async_api = self.k8s_client.get_async_api()
+        
+        self.pool_routing = self.app_config.kubernetes.pool_routing
+        autoscaler_config = self.app_config.pool_autoscaler
+        autoscale = autoscaler_config is not None and autoscaler_config.enabled
+        self.pool_registry: Optional[PoolRegistry] = None
+        self.pool_autoscaler: Optional[PoolAutoscaler] = None
+        if self.pool_routing or autoscale:
+            if isinstance(self.workload_provider, BatchSandboxProvider):
+                self.pool_registry = PoolRegistry(
+                    self.k8s_client.get_custom_objects_api(),
+                    self.namespace,
+                    refresh_interval_seconds=self.app_config.kubernetes.pool_refresh_interval_seconds,
+                )
+                if autoscale:
+                    self.pool_autoscaler = PoolAutoscaler(self.pool_registry, autoscaler_config)
+            else:
+                logger.warning(
+                    "Pool routing and autoscaling are only supported by the batchsandbox provider; ignoring them"
+                )
+                self.pool_routing = False
+        
         logger.info(
             "KubernetesSandboxService initialized: namespace=%s, execd_image=%s",
             self.namespace,
             self.execd_image,
         )
     
+    def start(self) -> None:
+        """Start discovering Pools for routing and the pool autoscaler, if enabled."""
+        if self.pool_registry is not None:
+            self.pool_registry.start()
+        if self.pool_autoscaler is not None:
+            self.pool_autoscaler.start()
+    
     def _wait_for_sandbox_ready(
         self,
         sandbox_id: str,
@@ -208,8 +247,53 @@ class KubernetesSandboxService(SandboxService):
             time.sleep(poll_interval_seconds)
         
         # Timeout
-        elapsed = time.time() - start_time
-        raise HTTPException(
+        raise self._ready_timeout_error(sandbox_id, time.time() - start_time, last_state)
+    
+    async def _wait_for_sandbox_ready_async(
+        self,
+        sandbox_id: str,
+        timeout_seconds: int = 60,
+        poll_interval_seconds: float = 1.0,
+    ) -> Dict[str, Any]:
+        """Asyncio variant of ``_wait_for_sandbox_ready``; polls without holding a thread."""
+        start_time = time.monotonic()
+        last_state = None
+        
+        while time.monotonic() - start_time < timeout_seconds:
+            try:
+                workload = await self.workload_provider.get_workload_async(
+                    sandbox_id=sandbox_id,
+                    namespace=self.namespace,
+                )
+                if workload:
+                    status_info = await self.workload_provider.get_status_async(workload)
+                    if status_info["state"] != last_state:
+                        logger.info(
+                            f"Sandbox {sandbox_id} state: {status_info['state']} - {status_info['message']}"
+                        )
+                        last_state = status_info["state"]
+                    if last_state == "Failed":
+                        raise HTTPException(
+                            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                            detail={
+                                "code": SandboxErrorCodes.K8S_POD_FAILED,
+                                "message": f"Pod failed: {status_info['message']}",
+                            },
+                        )
+                    if last_state == "Running":
+                        return workload
+            except HTTPException:
+                raise
+            except Exception as e:
+                logger.warning(f"Error checking sandbox {sandbox_id} status: {e}", exc_info=True)
+            
+            await asyncio.sleep(poll_interval_seconds)
+        
+        raise self._ready_timeout_error(sandbox_id, time.monotonic() - start_time, last_state)
+    
+    @staticmethod
+    def _ready_timeout_error(sandbox_id: str, elapsed: float, last_state: Optional[str]) -> HTTPException:
+        return HTTPException(
             status_code=status.HTTP_504_GATEWAY_TIMEOUT,
             detail={
                 "code": SandboxErrorCodes.K8S_POD_READY_TIMEOUT,
@@ -235,45 +319,12 @@ class KubernetesSandboxService(SandboxService):
         Raises:
             HTTPException: If creation fails, timeout, or invalid parameters
         """
-        # Validate request
-        ensure_entrypoint(request.entrypoint)
-        ensure_metadata_labels(request.metadata)
-        
-        # Generate sandbox ID
-        sandbox_id = self.generate_sandbox_id()
-        
-        # Calculate expiration time
-        created_at = datetime.now(timezone.utc)
-        expires_at = created_at + timedelta(seconds=request.timeout)
-        
-        # Build labels
-        labels = {
-            SANDBOX_ID_LABEL: sandbox_id,
-        }
-        
-        # Add user metadata as labels
-        if request.metadata:
-            labels.update(request.metadata)
-        
-        # Extract resource limits
-        resource_limits = {}
-        if request.resource_limits and request.resource_limits.root:
-            resource_limits = request.resource_limits.root
+        created_at, workload_spec = self._prepare_workload_spec(request)
+        sandbox_id = workload_spec["sandbox_id"]
         
         try:
             # Create workload
-            workload_info = self.workload_provider.create_workload(
-                sandbox_id=sandbox_id,
-                namespace=self.namespace,
-                image_spec=request.image,
-                entrypoint=request.entrypoint,
-                env=request.env or {},
-                resource_limits=resource_limits,
-                labels=labels,
-                expires_at=expires_at,
-                execd_image=self.execd_image,
-                extensions=request.extensions,
-            )
+            workload_info = self.workload_provider.create_workload(**workload_spec)
             
             logger.info(
                 "Created sandbox: id=%s, workload=%s",
@@ -291,22 +342,7 @@ class KubernetesSandboxService(SandboxService):
                 
                 # Get final status
                 status_info = self.workload_provider.get_status(workload)
-                
-                # Build and return response with Running state
-                return CreateSandboxResponse(
-                    id=sandbox_id,
-                    status=SandboxStatus(
-                        state=status_info["state"],
-                        reason=status_info["reason"],
-                        message=status_info["message"],
-                        last_transition_at=status_info["last_transition_at"],
-                    ),
-                    created_at=created_at,
-                    expires_at=expires_at,
-                    metadata=request.metadata,
-                    image=request.image,
-                    entrypoint=request.entrypoint,
-                )
+                return self._build_create_response(request, workload_spec, created_at, status_info)
                 
             except HTTPException:
                 # Clean up on failure
@@ -319,25 +355,155 @@ class KubernetesSandboxService(SandboxService):
             
         except HTTPException:
             raise
-        except ValueError as e:
+        except Exception as e:
+            raise self._create_error(e) from e
+    
+    async def create_sandbox_async(self, request: CreateSandboxRequest) -> CreateSandboxResponse:
+        """
+        Asyncio variant of ``create_sandbox``.
+        
+        With ``kubernetes.async_api`` enabled the create call and the readiness
+        polling run on the event loop instead of blocking it for up to a minute.
+        
+        Args:
+            request: Sandbox creation request.
+            
+        Returns:
+            CreateSandboxResponse: Created sandbox information with Running state
+            
+        Raises:
+            HTTPException: If creation fails, timeout, or invalid parameters
+        """
+        if self.workload_provider.async_api is None:
+            return self.create_sandbox(request)
+        
+        created_at, workload_spec = self._prepare_workload_spec(request)
+        sandbox_id = workload_spec["sandbox_id"]
+        
+        try:
+            workload_info = await self.workload_provider.create_workload_async(**workload_spec)
+            logger.info(
+                "Created sandbox: id=%s, workload=%s",
+                sandbox_id,
+                workload_info.get("name"),
+            )
+            
+            try:
+                workload = await self._wait_for_sandbox_ready_async(
+                    sandbox_id=sandbox_id,
+                    timeout_seconds=60,
+                    poll_interval_seconds=1.0,
+                )
+                status_info = await self.workload_provider.get_status_async(workload)
+                return self._build_create_response(request, workload_spec, created_at, status_info)
+                
+            except HTTPException:
+                try:
+                    logger.warning(f"Creation failed, cleaning up sandbox: {sandbox_id}")
+                    await self.workload_provider.delete_workload_async(sandbox_id, self.namespace)
+                except Exception as cleanup_ex:
+                    logger.error(f"Failed to cleanup sandbox {sandbox_id}", exc_info=cleanup_ex)
+                raise
+            
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise self._create_error(e) from e
+    
+    def _prepare_workload_spec(self, request: CreateSandboxRequest) -> tuple[datetime, Dict[str, Any]]:
+        """Validate a create request; return the creation time and create_workload arguments."""
+        # Validate request
+        ensure_entrypoint(request.entrypoint)
+        ensure_metadata_labels(request.metadata)
+        
+        # Generate sandbox ID
+        sandbox_id = self.generate_sandbox_id()
+        
+        # Calculate expiration time
+        created_at = datetime.now(timezone.utc)
+        expires_at = created_at + timedelta(seconds=request.timeout)
+        
+        # Build labels
+        labels = {
+            SANDBOX_ID_LABEL: sandbox_id,
+        }
+        
+        # Add user metadata as labels
+        if request.metadata:
+            labels.update(request.metadata)
+        
+        # Extract resource limits
+        resource_limits = {}
+        if request.resource_limits and request.resource_limits.root:
+            resource_limits = request.resource_limits.root
+        
+        # Send creates that match a pre-warmed Pool with idle pods there
+        extensions = request.extensions
+        pool_ref = (extensions or {}).get("poolRef")
+        if self.pool_registry is not None:
+            if pool_ref:
+                self.pool_registry.record_create(pool_ref)
+            elif self.pool_routing:
+                pool_name = self.pool_registry.route(request.image.uri, resource_limits)
+                if pool_name:
+                    logger.info("Routing sandbox %s to pool %s", sandbox_id, pool_name)
+                    extensions = {**(extensions or {}), "poolRef": pool_name}
+        
+        return created_at, {
+            "sandbox_id": sandbox_id,
+            "namespace": self.namespace,
+            "image_spec": request.image,
+            "entrypoint": request.entrypoint,
+            "env": request.env or {},
+            "resource_limits": resource_limits,
+            "labels": labels,
+            "expires_at": expires_at,
+            "execd_image": self.execd_image,
+            "extensions": extensions,
+        }
+    
+    @staticmethod
+    def _build_create_response(
+        request: CreateSandboxRequest,
+        workload_spec: Dict[str, Any],
+        created_at: datetime,
+        status_info: Dict[str, Any],
+    ) -> CreateSandboxResponse:
+        return CreateSandboxResponse(
+            id=workload_spec["sandbox_id"],
+            status=SandboxStatus(
+                state=status_info["state"],
+                reason=status_info["reason"],
+                message=status_info["message"],
+                last_transition_at=status_info["last_transition_at"],
+            ),
+            created_at=created_at,
+            expires_at=workload_spec["expires_at"],
+            metadata=request.metadata,
+            image=request.image,
+            entrypoint=request.entrypoint,
+        )
+    
+    @staticmethod
+    def _create_error(e: Exception) -> HTTPException:
+        if isinstance(e, ValueError):
             # Handle parameter validation errors from provider
             logger.error(f"Invalid parameters for sandbox creation: {e}")
-            raise HTTPException(
+            return HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
                     "code": SandboxErrorCodes.INVALID_PARAMETER,
                     "message": str(e),
                 },
-            ) from e
-        except Exception as e:
-            logger.error(f"Error creating sandbox: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={
-                    "code": SandboxErrorCodes.K8S_API_ERROR,
-                    "message": f"Failed to create sandbox: {str(e)}",
-                },
-            ) from e
+            )
+        logger.error(f"Error creating sandbox: {e}")
+        return HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "code": SandboxErrorCodes.K8S_API_ERROR,
+                "message": f"Failed to create sandbox: {str(e)}",
+            },
+        )
     
     def get_sandbox(self, sandbox_id: str) -> Sandbox:
         """
@@ -401,9 +567,11 @@ class KubernetesSandboxService(SandboxService):
                 label_selector=label_selector,
             )
             
-            # Convert to Sandbox objects
+            # Convert to Sandbox objects; statuses are resolved in one batch
+            statuses = self.workload_provider.get_statuses(workloads)
             sandboxes = [
-                self._build_sandbox_from_workload(w) for w in workloads
+                self._build_sandbox_from_workload(w, status_info=s)
+                for w, s in zip(workloads, statuses)
             ]
             
             # Apply filters
@@ -455,6 +623,7 @@ class KubernetesSandboxService(SandboxService):
         Raises:
             HTTPException: If deletion fails
         """
+        self._endpoint_cache.invalidate(sandbox_id)
         try:
             self.workload_provider.delete_workload(
                 sandbox_id=sandbox_id,
@@ -584,6 +753,61 @@ class KubernetesSandboxService(SandboxService):
                 },
             ) from e
     
+    async def renew_expiration_async(
+        self,
+        sandbox_id: str,
+        request: RenewSandboxExpirationRequest,
+    ) -> RenewSandboxExpirationResponse:
+        """
+        Asyncio variant of ``renew_expiration``.
+        
+        Args:
+            sandbox_id: Unique sandbox identifier
+            request: Renewal request with new expiration time
+            
+        Returns:
+            RenewSandboxExpirationResponse: Updated expiration time
+            
+        Raises:
+            HTTPException: If renewal fails
+        """
+        if self.workload_provider.async_api is None:
+            return self.renew_expiration(sandbox_id, request)
+        
+        new_expiration = ensure_future_expiration(request.expires_at)
+        try:
+            workload = await self.workload_provider.get_workload_async(
+                sandbox_id=sandbox_id,
+                namespace=self.namespace,
+            )
+            if not workload:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail={
+                        "code": SandboxErrorCodes.K8S_SANDBOX_NOT_FOUND,
+                        "message": f"Sandbox '{sandbox_id}' not found",
+                    },
+                )
+            await self.workload_provider.update_expiration_async(
+                sandbox_id=sandbox_id,
+                namespace=self.namespace,
+                expires_at=new_expiration,
+            )
+            logger.info(f"Renewed sandbox {sandbox_id} expiration to {new_expiration}")
+            return RenewSandboxExpirationResponse(expires_at=new_expiration)
+            
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error renewing expiration for {sandbox_id}: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail={
+                    "code": SandboxErrorCodes.K8S_API_ERROR,
+                    "message": f"Failed to renew expiration: {str(e)}",
+                },
+            ) from e
+    
     def get_endpoint(
         self,
         sandbox_id: str,
@@ -605,7 +829,48 @@ class KubernetesSandboxService(SandboxService):
             HTTPException: If endpoint not available
         """
         self.validate_port(port)
-        
+
+        cached = self._endpoint_cache.get(sandbox_id, port)
+        if cached is not None:
+            return cached
+        endpoint = self._resolve_endpoints(sandbox_id, [port])[str(port)]
+        self._endpoint_cache.put(sandbox_id, port, endpoint)
+        return endpoint
+
+    def get_endpoints(self, sandbox_ids: list[str], ports: list[int]) -> BatchEndpointsResponse:
+        """
+        Resolve endpoints for many sandboxes, reading each workload at most once.
+
+        Args:
+            sandbox_ids: Sandboxes to resolve
+            ports: Ports to resolve in every sandbox
+
+        Returns:
+            BatchEndpointsResponse: One entry per sandbox, in request order
+        """
+        for port in ports:
+            self.validate_port(port)
+
+        items = []
+        for sandbox_id in sandbox_ids:
+            item = SandboxEndpoints(sandbox_id=sandbox_id)
+            cached = {port: self._endpoint_cache.get(sandbox_id, port) for port in ports}
+            missing = [port for port, endpoint in cached.items() if endpoint is None]
+            try:
+                resolved = self._resolve_endpoints(sandbox_id, missing) if missing else {}
+            except HTTPException as exc:
+                item.error = self._error_from_exception(exc)
+            else:
+                for port in missing:
+                    self._endpoint_cache.put(sandbox_id, port, resolved[str(port)])
+                item.endpoints = {
+                    str(port): cached[port] or resolved[str(port)] for port in ports
+                }
+            items.append(item)
+        return BatchEndpointsResponse(items=items)
+
+    def _resolve_endpoints(self, sandbox_id: str, ports: list[int]) -> Dict[str, Endpoint]:
+        """Read the workload once and build the endpoint of each port."""
         try:
             workload = self.workload_provider.get_workload(
                 sandbox_id=sandbox_id,
@@ -621,23 +886,26 @@ class KubernetesSandboxService(SandboxService):
                     },
                 )
             
-            endpoint_str = self.workload_provider.get_endpoint_info(workload, port)
-            
-            if not endpoint_str:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail={
-                        "code": SandboxErrorCodes.K8S_POD_IP_NOT_AVAILABLE,
-                        "message": "Pod IP is not yet available. The Pod may still be starting.",
-                    },
-                )
-            
-            return Endpoint(endpoint=endpoint_str)
+            endpoint_infos = self.workload_provider.get_endpoint_infos(workload, ports)
+            endpoints: Dict[str, Endpoint] = {}
+            for port in ports:
+                endpoint_str = endpoint_infos.get(port)
+                
+                if not endpoint_str:
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail={
+                            "code": SandboxErrorCodes.K8S_POD_IP_NOT_AVAILABLE,
+                            "message": "Pod IP is not yet available. The Pod may still be starting.",
+                        },
+                    )
+                endpoints[str(port)] = Endpoint(endpoint=endpoint_str)
+            return endpoints
             
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error getting endpoint for {sandbox_id}:{port}: {e}")
+            logger.error(f"Error getting endpoint for {sandbox_id}:{ports}: {e}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail={
@@ -646,12 +914,17 @@ class KubernetesSandboxService(SandboxService):
                 },
             ) from e
     
-    def _build_sandbox_from_workload(self, workload: Any) -> Sandbox:
+    def _build_sandbox_from_workload(
+        self,
+        workload: Any,
+        status_info: Optional[Dict[str, Any]] = None,
+    ) -> Sandbox:
         """
         Build Sandbox object from Kubernetes workload.
         
         Args:
             workload: Kubernetes workload object (V1Pod or dict for CRD)
+            status_info: Status already resolved by the provider, if any
             
         Returns:
             Sandbox: Sandbox object
@@ -674,7 +947,8 @@ class KubernetesSandboxService(SandboxService):
         expires_at = self.workload_provider.get_expiration(workload)
         
         # Get status
-        status_info = self.workload_provider.get_status(workload)
+        if status_info is None:
+            status_info = self.workload_provider.get_status(workload)
         
         # Extract metadata (filter out system labels)
         user_metadata = {
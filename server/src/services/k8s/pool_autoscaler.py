@@ -0,0 +1,214 @@
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Demand-driven sizing of Pool buffers.
+
+A Pool keeps between ``bufferMin`` and ``bufferMax`` idle pods. Static values
+either keep warm pods around through quiet hours or run dry during bursts.
+The autoscaler samples per-pool creates and misses (creates that found no idle
+pod) from the ``PoolRegistry`` every interval, forecasts the create rate with
+an EWMA and, optionally, a daily profile learned per time slot, and sizes the
+buffer to cover the forecast demand while a new pod warms up::
+
+    bufferMin = ceil((forecast + miss_rate) * warmup_seconds * headroom)
+    bufferMax = ceil(bufferMin * buffer_max_ratio)
+
+Both are clamped to ``[min_buffer, max_buffer]`` and to the Pool's
+``poolMax``. Decreases wait for ``scale_down_cooldown_seconds`` after the last
+increase so a burst that pauses briefly keeps its warm pods. In dry-run mode
+decisions are only logged and reported as metrics.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from threading import Event, Thread
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.config import PoolAutoscalerConfig
+from src.services.k8s.pool_registry import POOL_GROUP, POOL_PLURAL, POOL_VERSION, PoolInfo, PoolRegistry
+from src.services.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 86400
+
+
+@dataclass
+class PoolDemand:
+    """Demand state of one pool."""
+
+    rate: Optional[float] = None
+    seasonal: Dict[int, float] = field(default_factory=dict)
+    last_increase_at: float = float("-inf")
+    applied: Optional[Tuple[int, int]] = None
+
+
+class PoolAutoscaler:
+    """Periodically patches Pool buffer sizes from forecast create demand."""
+
+    def __init__(
+        self,
+        registry: PoolRegistry,
+        config: PoolAutoscalerConfig,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the autoscaler.
+
+        Args:
+            registry: Pool registry providing pools and per-pool demand
+            config: Autoscaler settings
+            clock: Wall-clock source in epoch seconds (daily slots use it)
+        """
+        self.registry = registry
+        self.config = config
+        self._clock = clock
+        self._state: Dict[str, PoolDemand] = {}
+        self._last_tick: Optional[float] = None
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="sandbox-pool-autoscaler", daemon=True)
+        self._thread.start()
+        logger.info(
+            "Started pool autoscaler (interval=%.1fs, dry_run=%s).",
+            self.config.interval_seconds,
+            self.config.dry_run,
+        )
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.config.interval_seconds)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.config.interval_seconds):
+            try:
+                self.tick()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Pool autoscaler tick failed: %s", exc)
+
+    def tick(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Sample demand and resize every managed pool once.
+
+        Returns:
+            Dict[str, Tuple[int, int]]: Target (bufferMin, bufferMax) per pool
+        """
+        now = self._clock()
+        elapsed = now - self._last_tick if self._last_tick is not None else self.config.interval_seconds
+        self._last_tick = now
+        demand = self.registry.take_demand()
+        if elapsed <= 0:
+            return {}
+
+        targets: Dict[str, Tuple[int, int]] = {}
+        for pool in self._managed_pools():
+            creates, misses = demand.get(pool.name, (0, 0))
+            # A newly seen pool keeps its buffers for one cooldown while demand is learned.
+            state = self._state.setdefault(pool.name, PoolDemand(last_increase_at=now))
+            forecast = self._forecast(state, creates / elapsed, now)
+            miss_rate = misses / elapsed
+            metrics.set_gauge("pool_autoscaler_create_rate", creates / elapsed, pool=pool.name)
+            metrics.set_gauge("pool_autoscaler_miss_rate", miss_rate, pool=pool.name)
+            metrics.set_gauge("pool_autoscaler_forecast_rate", forecast, pool=pool.name)
+
+            target = self._target(pool, state, forecast + miss_rate, now)
+            targets[pool.name] = target
+            metrics.set_gauge("pool_autoscaler_target_buffer_min", target[0], pool=pool.name)
+            metrics.set_gauge("pool_autoscaler_target_buffer_max", target[1], pool=pool.name)
+            self._apply(pool, state, target)
+        return targets
+
+    def _managed_pools(self) -> List[PoolInfo]:
+        pools = self.registry.pools()
+        if self.config.pools:
+            return [pools[name] for name in self.config.pools if name in pools]
+        return list(pools.values())
+
+    def _forecast(self, state: PoolDemand, rate: float, now: float) -> float:
+        alpha = self.config.smoothing
+        state.rate = rate if state.rate is None else alpha * rate + (1 - alpha) * state.rate
+        if not self.config.seasonal:
+            return state.rate
+
+        # Each slot is smoothed across days; the slot a new pod would serve is looked up ahead.
+        slot_seconds = self.config.season_bucket_seconds
+        slot = int(now % SECONDS_PER_DAY) // slot_seconds
+        previous = state.seasonal.get(slot)
+        state.seasonal[slot] = rate if previous is None else alpha * rate + (1 - alpha) * previous
+        upcoming = int((now + self.config.warmup_seconds) % SECONDS_PER_DAY) // slot_seconds
+        return max(state.rate, state.seasonal.get(upcoming, 0.0))
+
+    def _target(self, pool: PoolInfo, state: PoolDemand, rate: float, now: float) -> Tuple[int, int]:
+        config = self.config
+        upper = config.max_buffer
+        if pool.capacity.get("poolMax"):
+            upper = min(upper, pool.capacity["poolMax"])
+        lower = min(config.min_buffer, upper)
+
+        buffer_min = math.ceil(rate * config.warmup_seconds * config.headroom)
+        buffer_min = max(lower, min(upper, buffer_min))
+        buffer_max = max(buffer_min, min(upper, math.ceil(buffer_min * config.buffer_max_ratio)))
+
+        current = state.applied or (pool.capacity.get("bufferMin", 0), pool.capacity.get("bufferMax", 0))
+        if buffer_min > current[0]:
+            state.last_increase_at = now
+        elif buffer_min < current[0] and now - state.last_increase_at < config.scale_down_cooldown_seconds:
+            return current
+        return buffer_min, buffer_max
+
+    def _apply(self, pool: PoolInfo, state: PoolDemand, target: Tuple[int, int]) -> None:
+        current = (pool.capacity.get("bufferMin"), pool.capacity.get("bufferMax"))
+        # Applied targets are remembered so the next tick does not re-patch before the registry refreshes.
+        if target in (current, state.applied):
+            return
+        buffer_min, buffer_max = target
+        dry_run = self.config.dry_run
+        logger.info(
+            "%sResizing pool %s buffer: bufferMin %s -> %d, bufferMax %s -> %d",
+            "[dry-run] " if dry_run else "",
+            pool.name,
+            current[0],
+            buffer_min,
+            current[1],
+            buffer_max,
+        )
+        if not dry_run:
+            self.registry.custom_api.patch_namespaced_custom_object(
+                group=POOL_GROUP,
+                version=POOL_VERSION,
+                namespace=self.registry.namespace,
+                plural=POOL_PLURAL,
+                name=pool.name,
+                body={"spec": {"capacitySpec": {"bufferMin": buffer_min, "bufferMax": buffer_max}}},
+            )
+        state.applied = target
+        metrics.inc("pool_autoscaler_resizes_total", pool=pool.name, dry_run=str(dry_run).lower())
+
+
+__all__ = [
+    "PoolAutoscaler",
+    "PoolDemand",
+]
@@ -0,0 +1,295 @@
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Registry of pre-warmed Pools used to route creates automatically.
+
+A create from a Pool only patches entrypoint and env into an already running
+pod, so it skips scheduling, image pulls and init containers. Without routing
+that path is only taken when the client names a pool in
+``extensions={"poolRef": ...}``. The registry lists the namespace's Pool CRs
+on a background thread and indexes them by the image and resource limits of
+their main container; a create whose image and limits match a Pool with idle
+pods is sent there, anything else is created cold.
+
+``status.available`` is only as fresh as the last refresh, so each routed
+create reserves one idle pod locally until the next listing replaces the
+counts. Creates and misses are also tallied per pool for the autoscaler.
+Routing outcomes are reported as ``pool_route_hits_total{pool}``,
+``pool_route_misses_total{reason}`` and, for matching pools without idle
+pods, ``pool_route_exhausted_total{pool}``.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from threading import Event, Lock, Thread
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from src.services.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+POOL_GROUP = "sandbox.opensandbox.io"
+POOL_VERSION = "v1alpha1"
+POOL_PLURAL = "pools"
+
+# Name of the main container in BatchSandbox and Pool pod templates.
+MAIN_CONTAINER_NAME = "sandbox"
+
+_QUANTITY_SUFFIXES = {
+    "n": Decimal("1e-9"),
+    "u": Decimal("1e-6"),
+    "m": Decimal("1e-3"),
+    "": Decimal(1),
+    "k": Decimal(10) ** 3,
+    "M": Decimal(10) ** 6,
+    "G": Decimal(10) ** 9,
+    "T": Decimal(10) ** 12,
+    "P": Decimal(10) ** 15,
+    "E": Decimal(10) ** 18,
+    "Ki": Decimal(2) ** 10,
+    "Mi": Decimal(2) ** 20,
+    "Gi": Decimal(2) ** 30,
+    "Ti": Decimal(2) ** 40,
+    "Pi": Decimal(2) ** 50,
+    "Ei": Decimal(2) ** 60,
+}
+_QUANTITY_RE = re.compile(r"^([+-]?[0-9.]+(?:[eE][+-]?[0-9]+)?)([a-zA-Z]*)$")
+
+ShapeKey = Tuple[str, FrozenSet[Tuple[str, Decimal]]]
+
+
+def parse_quantity(value: Any) -> Decimal:
+    """
+    Parse a Kubernetes resource quantity ("500m", "0.5", "512Mi", "1G").
+
+    Raises:
+        ValueError: If the value is not a valid quantity
+    """
+    match = _QUANTITY_RE.match(str(value).strip())
+    if not match or match.group(2) not in _QUANTITY_SUFFIXES:
+        raise ValueError(f"Invalid resource quantity: {value!r}")
+    try:
+        number = Decimal(match.group(1))
+    except InvalidOperation as e:
+        raise ValueError(f"Invalid resource quantity: {value!r}") from e
+    return (number * _QUANTITY_SUFFIXES[match.group(2)]).normalize()
+
+
+def shape_key(image: str, resource_limits: Optional[Dict[str, Any]]) -> Optional[ShapeKey]:
+    """
+    Return the routing key for an image and its resource limits.
+
+    Quantities are compared by value, so "500m" and "0.5" CPUs match. Returns
+    None when a quantity cannot be parsed; such shapes are never routed.
+    """
+    try:
+        resources = frozenset(
+            (name, parse_quantity(quantity)) for name, quantity in (resource_limits or {}).items()
+        )
+    except ValueError:
+        return None
+    return image, resources
+
+
+@dataclass
+class PoolInfo:
+    """Routing view of one Pool CR."""
+
+    name: str
+    image: str
+    resource_limits: Dict[str, str]
+    available: int = 0
+    total: int = 0
+    allocated: int = 0
+    capacity: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_resource(cls, pool: Dict[str, Any]) -> Optional["PoolInfo"]:
+        """Build from a Pool CR; returns None if it has no usable main container."""
+        spec = pool.get("spec") or {}
+        containers = ((spec.get("template") or {}).get("spec") or {}).get("containers") or []
+        main = next((c for c in containers if c.get("name") == MAIN_CONTAINER_NAME), None)
+        if main is None and containers:
+            main = containers[0]
+        if not main or not main.get("image"):
+            return None
+        resources = main.get("resources") or {}
+        status = pool.get("status") or {}
+        return cls(
+            name=pool["metadata"]["name"],
+            image=main["image"],
+            # The server sets requests = limits on cold creates; a pool that only
+            # declares requests is still the same shape.
+            resource_limits=dict(resources.get("limits") or resources.get("requests") or {}),
+            available=int(status.get("available") or 0),
+            total=int(status.get("total") or 0),
+            allocated=int(status.get("allocated") or 0),
+            capacity={key: int(value) for key, value in (spec.get("capacitySpec") or {}).items()},
+        )
+
+
+class PoolRegistry:
+    """Periodically refreshed index of Pools by image and resource shape."""
+
+    def __init__(
+        self,
+        custom_api: Any,
+        namespace: str,
+        refresh_interval_seconds: float = 10.0,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            custom_api: ``CustomObjectsApi`` used to list Pool CRs
+            namespace: Namespace holding the Pools and sandboxes
+            refresh_interval_seconds: Time between Pool listings
+        """
+        self.custom_api = custom_api
+        self.namespace = namespace
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self._pools: Dict[str, PoolInfo] = {}
+        self._by_shape: Dict[ShapeKey, List[str]] = {}
+        # Creates and misses per pool since the last take_demand().
+        self._demand: Dict[str, List[int]] = {}
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="sandbox-pool-registry", daemon=True)
+        self._thread.start()
+        logger.info(
+            "Started pool registry (namespace=%s, interval=%.1fs).",
+            self.namespace,
+            self.refresh_interval_seconds,
+        )
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.refresh_interval_seconds)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Pool refresh failed: %s", exc)
+            self._stop.wait(self.refresh_interval_seconds)
+
+    def refresh(self) -> Dict[str, PoolInfo]:
+        """List Pool CRs and rebuild the index; returns pools by name."""
+        listing = self.custom_api.list_namespaced_custom_object(
+            group=POOL_GROUP,
+            version=POOL_VERSION,
+            namespace=self.namespace,
+            plural=POOL_PLURAL,
+        )
+        pools: Dict[str, PoolInfo] = {}
+        by_shape: Dict[ShapeKey, List[str]] = {}
+        for item in listing.get("items", []):
+            info = PoolInfo.from_resource(item)
+            if info is None:
+                continue
+            key = shape_key(info.image, info.resource_limits)
+            if key is None:
+                logger.warning("Pool %s has unparseable resources; not routing to it", info.name)
+                continue
+            pools[info.name] = info
+            by_shape.setdefault(key, []).append(info.name)
+            metrics.set_gauge("pool_available", info.available, pool=info.name)
+
+        with self._lock:
+            for name in self._pools.keys() - pools.keys():
+                metrics.set_gauge("pool_available", 0, pool=name)
+            self._pools = pools
+            self._by_shape = by_shape
+        return pools
+
+    def pools(self) -> Dict[str, PoolInfo]:
+        """Return a snapshot of the known pools by name."""
+        with self._lock:
+            return dict(self._pools)
+
+    def route(self, image: str, resource_limits: Optional[Dict[str, Any]]) -> Optional[str]:
+        """
+        Pick a Pool with idle pods for a create, reserving one of them.
+
+        Args:
+            image: Image URI of the create request
+            resource_limits: Resource limits of the create request
+
+        Returns:
+            Optional[str]: Pool name, or None to create cold
+        """
+        key = shape_key(image, resource_limits)
+        with self._lock:
+            candidates = [self._pools[name] for name in self._by_shape.get(key, [])] if key else []
+            chosen = max(candidates, key=lambda pool: pool.available, default=None)
+            hit = chosen is not None and self._reserve_locked(chosen)
+
+        if chosen is None:
+            metrics.inc("pool_route_misses_total", reason="no_match")
+            return None
+        if not hit:
+            # Matching pool without idle pods: counted per pool so buffers can be sized.
+            metrics.inc("pool_route_misses_total", reason="no_capacity")
+            metrics.inc("pool_route_exhausted_total", pool=chosen.name)
+            return None
+        metrics.inc("pool_route_hits_total", pool=chosen.name)
+        return chosen.name
+
+    def record_create(self, pool_name: str) -> None:
+        """Account for a create that named its pool explicitly, reserving an idle pod if one is known."""
+        with self._lock:
+            pool = self._pools.get(pool_name)
+            if pool is not None:
+                self._reserve_locked(pool)
+
+    def take_demand(self) -> Dict[str, Tuple[int, int]]:
+        """Return (creates, misses) per pool since the previous call and reset the counts."""
+        with self._lock:
+            demand, self._demand = self._demand, {}
+        return {name: (creates, misses) for name, (creates, misses) in demand.items()}
+
+    def _reserve_locked(self, pool: PoolInfo) -> bool:
+        counts = self._demand.setdefault(pool.name, [0, 0])
+        counts[0] += 1
+        if pool.available > 0:
+            pool.available -= 1
+            return True
+        counts[1] += 1
+        return False
+
+
+__all__ = [
+    "MAIN_CONTAINER_NAME",
+    "POOL_GROUP",
+    "POOL_PLURAL",
+    "POOL_VERSION",
+    "PoolInfo",
+    "PoolRegistry",
+    "parse_quantity",
+    "shape_key",
+]
@@ -18,13 +18,74 @@ Shared template loader and merger for Kubernetes Sandbox CR manifests.
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import yaml
 
 logger = logging.getLogger(__name__)
 
 
+PathKey = Union[str, int]
+
+
+class Slot:
+    """Placeholder for a per-request value in a manifest skeleton."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"Slot({self.name!r})"
+
+
+class CompiledManifest:
+    """
+    Template merged once with a runtime manifest skeleton.
+
+    ``render`` fills the skeleton's slots with per-request values. Only the
+    dicts and lists on the path to a slot are copied; every other subtree is
+    shared between rendered manifests, so callers must treat them as read-only.
+    The result equals merging the filled-in runtime manifest into the template
+    with ``merge_with_runtime_values``.
+    """
+
+    def __init__(
+        self,
+        skeleton: Dict[str, Any],
+        slots: List[Tuple[str, Tuple[PathKey, ...], Any]],
+    ):
+        self._skeleton = skeleton
+        # (slot name, path, template value the slot overrides or None)
+        self._slots = slots
+
+    def render(self, **values: Any) -> Dict[str, Any]:
+        result = dict(self._skeleton)
+        copied = {id(result)}
+        for name, path, base in self._slots:
+            value = values[name]
+            if isinstance(base, dict) and isinstance(value, dict):
+                value = BaseSandboxTemplateManager._deep_merge(base, value)
+            elif value is None:
+                # A None runtime value keeps the template value, as in _deep_merge.
+                value = base
+
+            parent = result
+            for key in path[:-1]:
+                child = parent[key]
+                if id(child) not in copied:
+                    child = child.copy()
+                    parent[key] = child
+                    copied.add(id(child))
+                parent = child
+            if value is None and isinstance(parent, dict):
+                parent.pop(path[-1], None)
+            else:
+                parent[path[-1]] = value
+        return result
+
+
 class BaseSandboxTemplateManager:
     """
     Shared manager for loading YAML templates and merging runtime manifests.
@@ -80,6 +141,59 @@ class BaseSandboxTemplateManager:
 
         return self._deep_merge(base, runtime_manifest)
 
+    def compile(self, runtime_skeleton: Dict[str, Any]) -> CompiledManifest:
+        """
+        Merge the template with a runtime manifest whose per-request values are Slots.
+
+        Args:
+            runtime_skeleton: Runtime manifest with ``Slot`` placeholders
+
+        Returns:
+            CompiledManifest: Skeleton ready to render per request
+        """
+        slots: List[Tuple[str, Tuple[PathKey, ...], Any]] = []
+        skeleton = self._merge_skeleton(self._template or {}, runtime_skeleton, (), slots)
+        return CompiledManifest(skeleton, slots)
+
+    @staticmethod
+    def _merge_skeleton(
+        base: Dict[str, Any],
+        override: Dict[str, Any],
+        path: Tuple[PathKey, ...],
+        slots: List[Tuple[str, Tuple[PathKey, ...], Any]],
+    ) -> Dict[str, Any]:
+        # Same semantics as _deep_merge, recording where each Slot lands.
+        result = BaseSandboxTemplateManager._deep_copy(base)
+        for key, override_value in override.items():
+            if override_value is None:
+                continue
+            if isinstance(override_value, Slot):
+                slots.append((override_value.name, path + (key,), result.get(key)))
+                result[key] = result.get(key)
+            elif isinstance(result.get(key), dict) and isinstance(override_value, dict):
+                result[key] = BaseSandboxTemplateManager._merge_skeleton(
+                    result[key], override_value, path + (key,), slots
+                )
+            elif isinstance(override_value, dict):
+                result[key] = BaseSandboxTemplateManager._merge_skeleton(
+                    {}, override_value, path + (key,), slots
+                )
+            else:
+                BaseSandboxTemplateManager._reject_nested_slots(override_value)
+                result[key] = BaseSandboxTemplateManager._deep_copy(override_value)
+        return result
+
+    @staticmethod
+    def _reject_nested_slots(value: Any) -> None:
+        if isinstance(value, Slot):
+            raise ValueError(f"{value!r} inside a list is not supported; make the whole list a slot")
+        if isinstance(value, list):
+            for item in value:
+                BaseSandboxTemplateManager._reject_nested_slots(item)
+        elif isinstance(value, dict):
+            for item in value.values():
+                BaseSandboxTemplateManager._reject_nested_slots(item)
+
     @staticmethod
     def _deep_copy(obj: Any) -> Any:
         if isinstance(obj, dict):
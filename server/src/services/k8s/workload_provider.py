@@ -18,10 +18,13 @@ Abstract workload provider interface for Kubernetes resources.
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from src.api.schema import ImageSpec
 
+if TYPE_CHECKING:
+    from src.services.k8s.async_client import AsyncK8sApi
+
 
 class WorkloadProvider(ABC):
     """
@@ -29,8 +32,14 @@ class WorkloadProvider(ABC):
     
     This abstraction allows supporting different K8s resource types
     (Pod, Job, StatefulSet, etc.) with a unified interface.
+    
+    The ``*_async`` methods back the asyncio request path. By default they run
+    the synchronous implementation inline; providers override them to use
+    ``async_api`` when the service has configured one.
     """
     
+    async_api: Optional["AsyncK8sApi"] = None
+    
     @abstractmethod
     def create_workload(
         self,
@@ -165,3 +174,52 @@ class WorkloadProvider(ABC):
             Endpoint string (e.g., "10.244.0.5:8080") or None if not available
         """
         pass
+    
+    def get_statuses(self, workloads: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Get status for several workloads, e.g. for a listing.
+        
+        Providers whose status needs extra API reads should override this to
+        fetch shared state once for the whole batch.
+        
+        Args:
+            workloads: Workload objects
+            
+        Returns:
+            Status dicts in the same order as ``workloads``
+        """
+        return [self.get_status(workload) for workload in workloads]
+    
+    def get_endpoint_infos(self, workload: Any, ports: List[int]) -> Dict[int, Optional[str]]:
+        """
+        Get endpoint information for several ports of one workload.
+        
+        Args:
+            workload: Workload object
+            ports: Port numbers
+            
+        Returns:
+            Endpoint string or None per port
+        """
+        return {port: self.get_endpoint_info(workload, port) for port in ports}
+    
+    async def create_workload_async(self, **kwargs: Any) -> Dict[str, Any]:
+        """Asyncio variant of ``create_workload`` (same keyword arguments)."""
+        return self.create_workload(**kwargs)
+    
+    async def get_workload_async(self, sandbox_id: str, namespace: str) -> Optional[Any]:
+        """Asyncio variant of ``get_workload``."""
+        return self.get_workload(sandbox_id, namespace)
+    
+    async def delete_workload_async(self, sandbox_id: str, namespace: str) -> None:
+        """Asyncio variant of ``delete_workload``."""
+        self.delete_workload(sandbox_id, namespace)
+    
+    async def update_expiration_async(self, sandbox_id: str, namespace: str, expires_at: datetime) -> None:
+        """Asyncio variant of ``update_expiration``."""
+        self.update_expiration(sandbox_id, namespace, expires_at)
+    
+    async def get_status_async(self, workload: Any) -> Dict[str, Any]:
+        """Asyncio variant of ``get_status`` for providers whose status needs API reads."""
+        return self.get_status(workload)
+
@@ -0,0 +1,154 @@
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+In-process server metrics.
+
+A small thread-safe registry of counters, gauges and summaries (count, sum
+and max of observed values) keyed by name and labels. ``GET /metrics`` renders
+it in the Prometheus text exposition format, so no client library is needed.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, Iterator, Tuple
+
+LabelSet = Tuple[Tuple[str, str], ...]
+MetricKey = Tuple[str, LabelSet]
+
+
+@dataclass
+class SummaryValue:
+    """Aggregate of observed values."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+
+def _key(name: str, labels: Dict[str, object]) -> MetricKey:
+    return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+
+def _format_labels(labels: LabelSet, extra: str = "") -> str:
+    parts = [f'{name}="{value}"' for name, value in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class MetricsRegistry:
+    """Thread-safe store of counters, gauges and summaries."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self._counters: Dict[MetricKey, float] = {}
+        self._gauges: Dict[MetricKey, float] = {}
+        self._summaries: Dict[MetricKey, SummaryValue] = {}
+
+    def inc(self, name: str, amount: float = 1.0, **labels: object) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + amount
+
+    def set_gauge(self, name: str, value: float, **labels: object) -> None:
+        with self._lock:
+            self._gauges[_key(name, labels)] = value
+
+    def add_gauge(self, name: str, delta: float, **labels: object) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            self._gauges[key] = self._gauges.get(key, 0.0) + delta
+
+    def observe(self, name: str, value: float, **labels: object) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            summary = self._summaries.setdefault(key, SummaryValue())
+            summary.count += 1
+            summary.total += value
+            summary.max = max(summary.max, value)
+
+    @contextmanager
+    def timer(self, name: str, **labels: object) -> Iterator[None]:
+        """Observe the wall-clock seconds spent in the block, also when it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def counter_value(self, name: str, **labels: object) -> float:
+        with self._lock:
+            return self._counters.get(_key(name, labels), 0.0)
+
+    def gauge_value(self, name: str, **labels: object) -> float:
+        with self._lock:
+            return self._gauges.get(_key(name, labels), 0.0)
+
+    def summary_value(self, name: str, **labels: object) -> SummaryValue:
+        with self._lock:
+            summary = self._summaries.get(_key(name, labels))
+            return SummaryValue(summary.count, summary.total, summary.max) if summary else SummaryValue()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._summaries.clear()
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            gauges = sorted(self._gauges.items())
+            summaries = sorted(
+                (key, SummaryValue(value.count, value.total, value.max)) for key, value in self._summaries.items()
+            )
+
+        lines: list[str] = []
+        typed: set[str] = set()
+
+        def _type(name: str, kind: str) -> None:
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} {kind}")
+
+        for (name, labels), value in counters:
+            _type(name, "counter")
+            lines.append(f"{name}{_format_labels(labels)} {value:g}")
+        for (name, labels), value in gauges:
+            _type(name, "gauge")
+            lines.append(f"{name}{_format_labels(labels)} {value:g}")
+        for (name, labels), summary in summaries:
+            _type(name, "summary")
+            lines.append(f"{name}_count{_format_labels(labels)} {summary.count}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {summary.total:g}")
+        # Samples of one family must be contiguous, so maxima go in a second pass.
+        for (name, labels), summary in summaries:
+            _type(f"{name}_max", "gauge")
+            lines.append(f"{name}_max{_format_labels(labels)} {summary.max:g}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+metrics = MetricsRegistry()
+
+__all__ = [
+    "MetricsRegistry",
+    "SummaryValue",
+    "metrics",
+]
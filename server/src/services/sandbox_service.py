@@ -20,21 +20,37 @@ This module defines the abstract interface for sandbox services.
 """
 
 from abc import ABC, abstractmethod
+import asyncio
 import socket
+from typing import Iterator, List, Optional
 from uuid import uuid4
 
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+
 from src.api.schema import (
+    BatchEndpointsResponse,
+    CloneSandboxRequest,
+    CloneSandboxResult,
     CreateSandboxRequest,
     CreateSandboxResponse,
     Endpoint,
+    ErrorResponse,
+    FleetStatsResponse,
     ListSandboxesRequest,
     ListSandboxesResponse,
     RenewSandboxExpirationRequest,
     RenewSandboxExpirationResponse,
     Sandbox,
+    SandboxEndpoints,
+    SandboxStatsResponse,
 )
+from src.services.constants import SandboxErrorCodes
 from src.services.validators import ensure_valid_port
 
+# States a sandbox never leaves on its own; a wait stops there.
+TERMINAL_STATES = frozenset({"Failed", "Terminated"})
+
 
 class SandboxService(ABC):
     """
@@ -100,6 +116,23 @@ class SandboxService(ABC):
         """
         ensure_valid_port(port)
 
+    def start(self) -> None:
+        """
+        Start background startup work, such as restoring state for existing sandboxes.
+
+        Called once when the server starts. Must return promptly; requests are
+        served while the work runs and is_ready reports its completion.
+        """
+
+    def is_ready(self) -> bool:
+        """
+        Report whether startup work has finished.
+
+        Returns:
+            bool: True once the service has fully restored its state
+        """
+        return True
+
     @abstractmethod
     def create_sandbox(self, request: CreateSandboxRequest) -> CreateSandboxResponse:
         """
@@ -116,6 +149,21 @@ class SandboxService(ABC):
         """
         pass
 
+    async def create_sandbox_async(self, request: CreateSandboxRequest) -> CreateSandboxResponse:
+        """
+        Create a sandbox from the event loop.
+
+        Runtimes with an asyncio client override this; the default runs
+        create_sandbox inline.
+
+        Args:
+            request: Sandbox creation request
+
+        Returns:
+            CreateSandboxResponse: Created sandbox information
+        """
+        return self.create_sandbox(request)
+
     @abstractmethod
     def list_sandboxes(self, request: ListSandboxesRequest) -> ListSandboxesResponse:
         """
@@ -145,6 +193,43 @@ class SandboxService(ABC):
         """
         pass
 
+    async def wait_for_state_async(
+        self,
+        sandbox_id: str,
+        states: List[str],
+        timeout: float,
+    ) -> Sandbox:
+        """
+        Wait until a sandbox reaches one of the given states.
+
+        Returns the sandbox as last observed once it is in one of ``states``
+        or in a terminal state, or when ``timeout`` expires. The default polls
+        get_sandbox with a delay growing from 50ms to 1s; runtimes with a
+        change feed can override it.
+
+        Args:
+            sandbox_id: Unique sandbox identifier
+            states: Lifecycle states to wait for
+            timeout: Maximum time to wait, in seconds
+
+        Returns:
+            Sandbox: Sandbox information at the end of the wait
+
+        Raises:
+            HTTPException: If sandbox not found
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = 0.05
+        while True:
+            sandbox = await run_in_threadpool(self.get_sandbox, sandbox_id)
+            state = sandbox.status.state
+            remaining = deadline - loop.time()
+            if state in states or state in TERMINAL_STATES or remaining <= 0:
+                return sandbox
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, 1.0)
+
     @abstractmethod
     def delete_sandbox(self, sandbox_id: str) -> None:
         """
@@ -205,6 +290,26 @@ class SandboxService(ABC):
         """
         pass
 
+    async def renew_expiration_async(
+        self,
+        sandbox_id: str,
+        request: RenewSandboxExpirationRequest,
+    ) -> RenewSandboxExpirationResponse:
+        """
+        Renew sandbox expiration from the event loop.
+
+        Runtimes with an asyncio client override this; the default runs
+        renew_expiration inline.
+
+        Args:
+            sandbox_id: Unique sandbox identifier
+            request: Renewal request with new expiration time
+
+        Returns:
+            RenewSandboxExpirationResponse: Updated expiration time
+        """
+        return self.renew_expiration(sandbox_id, request)
+
     @abstractmethod
     def get_endpoint(self, sandbox_id: str, port: int, resolve_internal: bool = False) -> Endpoint:
         """
@@ -222,3 +327,127 @@ class SandboxService(ABC):
             HTTPException: If sandbox not found or endpoint not available
         """
         pass
+
+    def get_endpoints(self, sandbox_ids: List[str], ports: List[int]) -> BatchEndpointsResponse:
+        """
+        Resolve endpoints for several ports of several sandboxes.
+
+        The default implementation calls get_endpoint per pair; runtimes that
+        can resolve many sandboxes with one lookup override it. Per-sandbox
+        failures are reported in the item instead of failing the batch.
+
+        Args:
+            sandbox_ids: Sandboxes to resolve
+            ports: Ports to resolve in every sandbox
+
+        Returns:
+            BatchEndpointsResponse: One entry per sandbox, in request order
+        """
+        items = []
+        for sandbox_id in sandbox_ids:
+            item = SandboxEndpoints(sandbox_id=sandbox_id)
+            try:
+                for port in ports:
+                    item.endpoints[str(port)] = self.get_endpoint(sandbox_id, port)
+            except HTTPException as exc:
+                item = SandboxEndpoints(sandbox_id=sandbox_id, error=self._error_from_exception(exc))
+            items.append(item)
+        return BatchEndpointsResponse(items=items)
+
+    @staticmethod
+    def _error_from_exception(exc: HTTPException) -> ErrorResponse:
+        detail = exc.detail if isinstance(exc.detail, dict) else {}
+        return ErrorResponse(
+            code=detail.get("code") or SandboxErrorCodes.UNKNOWN_ERROR,
+            message=detail.get("message") or str(exc.detail),
+        )
+
+    def hibernate_sandbox(self, sandbox_id: str) -> None:
+        """
+        Snapshot a sandbox and release its runtime resources.
+
+        The sandbox keeps its ID and is restored by resume_sandbox.
+
+        Args:
+            sandbox_id: Unique sandbox identifier
+
+        Raises:
+            HTTPException: If hibernation is not supported by this runtime or fails
+        """
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail={
+                "code": SandboxErrorCodes.API_NOT_SUPPORTED,
+                "message": "Hibernation is not supported by this runtime.",
+            },
+        )
+
+    def clone_sandbox(
+        self,
+        sandbox_id: str,
+        count: int,
+        request: Optional[CloneSandboxRequest] = None,
+    ) -> Iterator[CloneSandboxResult]:
+        """
+        Create copies of a running sandbox, including its filesystem state.
+
+        Validation and snapshotting happen before this method returns; the
+        returned iterator yields one result per clone as each becomes ready.
+
+        Args:
+            sandbox_id: Unique identifier of the source sandbox
+            count: Number of clones to create
+            request: Optional timeout and metadata overrides for the clones
+
+        Returns:
+            Iterator[CloneSandboxResult]: Clone results in completion order
+
+        Raises:
+            HTTPException: If cloning is not supported, or the source cannot be snapshotted
+        """
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail={
+                "code": SandboxErrorCodes.API_NOT_SUPPORTED,
+                "message": "Cloning is not supported by this runtime.",
+            },
+        )
+
+    def get_sandbox_stats(self, sandbox_id: str) -> SandboxStatsResponse:
+        """
+        Get recent resource usage samples for a sandbox.
+
+        Args:
+            sandbox_id: Unique sandbox identifier
+
+        Returns:
+            SandboxStatsResponse: Sampled resource usage history
+
+        Raises:
+            HTTPException: If stats are not collected by this runtime or the sandbox is unknown
+        """
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail={
+                "code": SandboxErrorCodes.API_NOT_SUPPORTED,
+                "message": "Resource stats are not supported by this runtime.",
+            },
+        )
+
+    def get_fleet_stats(self) -> FleetStatsResponse:
+        """
+        Get aggregated resource usage across all sandboxes.
+
+        Returns:
+            FleetStatsResponse: Sum of the latest samples
+
+        Raises:
+            HTTPException: If stats are not collected by this runtime
+        """
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail={
+                "code": SandboxErrorCodes.API_NOT_SUPPORTED,
+                "message": "Resource stats are not supported by this runtime.",
+            },
+        )
@@ -0,0 +1,263 @@
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Lifecycle API load generator.
+
+Each iteration runs one sandbox lifecycle (create, get, list, delete) and
+records per-operation latency. Two workload models are supported:
+
+- closed loop: ``concurrency`` workers each run lifecycles back to back, so
+  throughput is bounded by latency;
+- open loop: lifecycles start at a fixed ``rate`` regardless of completions;
+  create latency is measured from the scheduled start so queueing delay is
+  not hidden (coordinated omission).
+
+Run against a live server, or in-process with ``runtime.type = "fake"`` to
+measure the API layer alone::
+
+    python -m src.tools.loadtest --url http://127.0.0.1:8080 --api-key KEY
+    SANDBOX_CONFIG_PATH=fake.toml python -m src.tools.loadtest --in-process
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Literal, Optional
+
+import httpx
+
+OPERATIONS = ("create", "get", "list", "delete")
+
+
+@dataclass
+class LoadTestOptions:
+    """Workload shape for a load test run."""
+
+    mode: Literal["closed", "open"] = "closed"
+    concurrency: int = 16
+    duration_seconds: float = 10.0
+    rate: float = 50.0
+    image: str = "python:3.11"
+    sandbox_timeout_seconds: int = 600
+    list_page_size: int = 20
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list (0.0 for an empty list)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+@dataclass
+class OperationStats:
+    """Latency samples and error count for one operation type."""
+
+    latencies_ms: List[float] = field(default_factory=list)
+    errors: int = 0
+
+    def summary(self, elapsed_seconds: float) -> Dict[str, float]:
+        ordered = sorted(self.latencies_ms)
+        count = len(ordered)
+        return {
+            "count": count,
+            "errors": self.errors,
+            "throughput_per_s": count / elapsed_seconds if elapsed_seconds > 0 else 0.0,
+            "mean_ms": sum(ordered) / count if count else 0.0,
+            "p50_ms": percentile(ordered, 50),
+            "p95_ms": percentile(ordered, 95),
+            "p99_ms": percentile(ordered, 99),
+            "max_ms": ordered[-1] if ordered else 0.0,
+        }
+
+
+@dataclass
+class LoadTestReport:
+    """Result of a load test run."""
+
+    options: LoadTestOptions
+    elapsed_seconds: float
+    operations: Dict[str, OperationStats]
+
+    def to_dict(self) -> dict:
+        return {
+            "mode": self.options.mode,
+            "concurrency": self.options.concurrency,
+            "rate": self.options.rate if self.options.mode == "open" else None,
+            "elapsed_seconds": self.elapsed_seconds,
+            "operations": {
+                name: stats.summary(self.elapsed_seconds) for name, stats in self.operations.items()
+            },
+        }
+
+    def format_table(self) -> str:
+        header = f"{'op':<8}{'count':>8}{'errors':>8}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+        lines = [header, "-" * len(header)]
+        for name, stats in self.operations.items():
+            row = stats.summary(self.elapsed_seconds)
+            lines.append(
+                f"{name:<8}{row['count']:>8}{row['errors']:>8}{row['throughput_per_s']:>10.1f}"
+                f"{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}{row['p99_ms']:>10.2f}{row['max_ms']:>10.2f}"
+            )
+        return "\n".join(lines)
+
+
+class _LifecycleRunner:
+    def __init__(self, client: httpx.AsyncClient, options: LoadTestOptions):
+        self.client = client
+        self.options = options
+        self.operations = {name: OperationStats() for name in OPERATIONS}
+        self._create_body = {
+            "image": {"uri": options.image},
+            "timeout": options.sandbox_timeout_seconds,
+            "resourceLimits": {"cpu": "500m", "memory": "512Mi"},
+            "entrypoint": ["sleep", "infinity"],
+            "metadata": {"loadtest": "true"},
+        }
+
+    async def _timed(self, name: str, request, started: Optional[float] = None) -> Optional[httpx.Response]:
+        start = started if started is not None else time.perf_counter()
+        try:
+            response = await request
+        except httpx.HTTPError:
+            self.operations[name].errors += 1
+            return None
+        self.operations[name].latencies_ms.append((time.perf_counter() - start) * 1000)
+        if response.is_error:
+            self.operations[name].errors += 1
+            return None
+        return response
+
+    async def run_once(self, scheduled_at: Optional[float] = None) -> None:
+        created = await self._timed(
+            "create",
+            self.client.post("/v1/sandboxes", json=self._create_body),
+            started=scheduled_at,
+        )
+        if created is None:
+            return
+        sandbox_id = created.json()["id"]
+        await self._timed("get", self.client.get(f"/v1/sandboxes/{sandbox_id}"))
+        await self._timed(
+            "list",
+            self.client.get("/v1/sandboxes", params={"pageSize": self.options.list_page_size}),
+        )
+        await self._timed("delete", self.client.delete(f"/v1/sandboxes/{sandbox_id}"))
+
+
+async def run_load_test(client: httpx.AsyncClient, options: LoadTestOptions) -> LoadTestReport:
+    """
+    Drive lifecycle traffic through ``client`` and collect latency statistics.
+
+    Args:
+        client: HTTP client with base URL and authentication headers configured
+        options: Workload shape
+
+    Returns:
+        LoadTestReport: Per-operation throughput and latency percentiles
+    """
+    runner = _LifecycleRunner(client, options)
+    started = time.perf_counter()
+    deadline = started + options.duration_seconds
+
+    if options.mode == "closed":
+        async def _worker() -> None:
+            while time.perf_counter() < deadline:
+                await runner.run_once()
+
+        await asyncio.gather(*(_worker() for _ in range(options.concurrency)))
+    else:
+        # Concurrency caps in-flight lifecycles so a stalled server cannot exhaust the client.
+        in_flight = asyncio.Semaphore(options.concurrency)
+        interval = 1 / options.rate
+
+        async def _scheduled(scheduled_at: float) -> None:
+            async with in_flight:
+                await runner.run_once(scheduled_at=scheduled_at)
+
+        tasks = []
+        next_start = started
+        while next_start < deadline:
+            delay = next_start - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(_scheduled(next_start)))
+            next_start += interval
+        await asyncio.gather(*tasks)
+
+    return LoadTestReport(
+        options=options,
+        elapsed_seconds=time.perf_counter() - started,
+        operations=runner.operations,
+    )
+
+
+def _build_in_process_client(headers: Dict[str, str]) -> httpx.AsyncClient:
+    from src.main import app
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://loadtest", headers=headers)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Load test the OpenSandbox lifecycle API.")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--url", help="Base URL of a running server, e.g. http://127.0.0.1:8080")
+    target.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Serve the app in-process (config from SANDBOX_CONFIG_PATH; use runtime.type = 'fake')",
+    )
+    parser.add_argument("--api-key", default=None, help="Value for the OPEN-SANDBOX-API-KEY header")
+    parser.add_argument("--mode", choices=("closed", "open"), default="closed")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="Run time in seconds")
+    parser.add_argument("--rate", type=float, default=50.0, help="Open loop: lifecycles started per second")
+    parser.add_argument("--image", default="python:3.11")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    options = LoadTestOptions(
+        mode=args.mode,
+        concurrency=args.concurrency,
+        duration_seconds=args.duration,
+        rate=args.rate,
+        image=args.image,
+    )
+    headers = {"OPEN-SANDBOX-API-KEY": args.api_key} if args.api_key else {}
+
+    async def _run() -> LoadTestReport:
+        if args.in_process:
+            client = _build_in_process_client(headers)
+        else:
+            limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+            client = httpx.AsyncClient(base_url=args.url, headers=headers, limits=limits, timeout=60.0)
+        async with client:
+            return await run_load_test(client, options)
+
+    report = asyncio.run(_run())
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print(report.format_table())
+
+
+if __name__ == "__main__":
+    main()
@@ -33,7 +33,8 @@ import docker  # noqa: E402
 
 _mock_docker_client = MagicMock()
 _mock_docker_client.containers.list.return_value = []
-docker.from_env = lambda: _mock_docker_client  # type: ignore
+_mock_docker_client.api.containers.return_value = []
+docker.from_env = lambda **kwargs: _mock_docker_client  # type: ignore
 
 from src.main import app  # noqa: E402
 
@@ -294,6 +294,13 @@ def k8s_service(k8s_app_config):
         
         # Mock WorkloadProvider instance
         mock_provider = MagicMock()
+        # Batch helpers keep the base-class behaviour of delegating per item.
+        mock_provider.get_statuses.side_effect = lambda workloads: [
+            mock_provider.get_status(w) for w in workloads
+        ]
+        mock_provider.get_endpoint_infos.side_effect = lambda workload, ports: {
+            port: mock_provider.get_endpoint_info(workload, port) for port in ports
+        }
         mock_create_provider.return_value = mock_provider
         
         from src.services.k8s.kubernetes_service import KubernetesSandboxService
@@ -16,9 +16,10 @@
 Unit tests for AgentSandboxProvider.
 """
 
+import asyncio
 from datetime import datetime, timezone
 from types import SimpleNamespace
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from kubernetes.client import ApiException
@@ -248,3 +249,122 @@ class TestAgentSandboxProvider:
         endpoint = provider.get_endpoint_info(workload, 9000)
 
         assert endpoint == "svc.example.com:9000"
+
+    def test_get_statuses_lists_pods_once_per_namespace(self, mock_k8s_client):
+        """
+        Test case: Verify listing N pending sandboxes costs one pod list, not N
+        """
+        provider = AgentSandboxProvider(mock_k8s_client)
+        core_api = mock_k8s_client.get_core_v1_api()
+        sandbox_count = 20
+
+        def _pod(index, phase, pod_ip=None):
+            return SimpleNamespace(
+                metadata=SimpleNamespace(labels={"sandbox-hash": f"h{index}"}),
+                status=SimpleNamespace(phase=phase, pod_ip=pod_ip),
+            )
+
+        core_api.list_namespaced_pod.return_value = MagicMock(
+            items=[_pod(i, "Running", f"10.0.0.{i}") for i in range(0, sandbox_count, 2)]
+            + [_pod(i, "Pending") for i in range(1, sandbox_count, 4)]
+        )
+        workloads = [
+            {
+                "status": {"conditions": [], "selector": f"sandbox-hash=h{i}"},
+                "metadata": {"creationTimestamp": "2025-12-31T09:00:00Z", "namespace": "test-ns"},
+            }
+            for i in range(sandbox_count)
+        ]
+        workloads.append(
+            {
+                "status": {"conditions": [{"type": "Ready", "status": "True"}]},
+                "metadata": {"namespace": "test-ns"},
+            }
+        )
+
+        statuses = provider.get_statuses(workloads)
+
+        assert core_api.list_namespaced_pod.call_count == 1
+        assert [s["reason"] for s in statuses[:4]] == [
+            "POD_READY",
+            "POD_PENDING",
+            "POD_READY",
+            "SANDBOX_PENDING",
+        ]
+        assert statuses[-1]["state"] == "Running"
+        assert sum(s["reason"] == "POD_READY" for s in statuses) == sandbox_count // 2
+
+    def test_get_statuses_falls_back_for_set_based_selectors(self, mock_k8s_client):
+        """
+        Test case: Verify selectors that cannot be matched in memory are queried directly
+        """
+        provider = AgentSandboxProvider(mock_k8s_client)
+        core_api = mock_k8s_client.get_core_v1_api()
+        core_api.list_namespaced_pod.return_value = MagicMock(items=[])
+        workload = {
+            "status": {"conditions": [], "selector": "tier in (sandbox)"},
+            "metadata": {"namespace": "test-ns"},
+        }
+
+        statuses = provider.get_statuses([workload])
+
+        assert statuses[0]["reason"] == "SANDBOX_PENDING"
+        assert [c.kwargs["label_selector"] for c in core_api.list_namespaced_pod.call_args_list] == [
+            "opensandbox.io/id",
+            "tier in (sandbox)",
+        ]
+
+    def test_get_endpoint_infos_lists_pods_once(self, mock_k8s_client):
+        """
+        Test case: Verify resolving several ports reads the pods once
+        """
+        provider = AgentSandboxProvider(mock_k8s_client)
+        core_api = mock_k8s_client.get_core_v1_api()
+        core_api.list_namespaced_pod.return_value = MagicMock(
+            items=[SimpleNamespace(status=SimpleNamespace(phase="Running", pod_ip="10.0.0.9"))]
+        )
+        workload = {
+            "status": {"selector": "app=sandbox"},
+            "metadata": {"namespace": "test-ns"},
+        }
+
+        endpoints = provider.get_endpoint_infos(workload, [8080, 44772])
+
+        assert endpoints == {8080: "10.0.0.9:8080", 44772: "10.0.0.9:44772"}
+        assert core_api.list_namespaced_pod.call_count == 1
+
+    def test_async_api_create_and_status(self, mock_k8s_client):
+        """
+        Test case: Verify the asyncio path creates the same manifest and reads dict pods
+        """
+        provider = AgentSandboxProvider(mock_k8s_client)
+        provider.async_api = MagicMock()
+        provider.async_api.create_namespaced_custom_object = AsyncMock(
+            return_value={"metadata": {"name": "sandbox-test-id", "uid": "u1"}}
+        )
+        provider.async_api.list_namespaced_pod = AsyncMock(
+            return_value={"items": [{"status": {"phase": "Running", "podIP": "10.0.0.3"}}]}
+        )
+        kwargs = dict(
+            sandbox_id="test-id",
+            namespace="test-ns",
+            image_spec=ImageSpec(uri="python:3.11"),
+            entrypoint=["python", "app.py"],
+            env={},
+            resource_limits={},
+            labels={"opensandbox.io/id": "test-id"},
+            expires_at=datetime(2030, 1, 1, tzinfo=timezone.utc),
+            execd_image="execd:latest",
+        )
+
+        result = asyncio.run(provider.create_workload_async(**kwargs))
+        status = asyncio.run(provider.get_status_async({
+            "status": {"conditions": [], "selector": "app=sandbox"},
+            "metadata": {"namespace": "test-ns"},
+        }))
+
+        assert result == {"name": "sandbox-test-id", "uid": "u1"}
+        body = provider.async_api.create_namespaced_custom_object.await_args.kwargs["body"]
+        assert body == provider._build_workload_manifest(**kwargs)
+        assert status["reason"] == "POD_READY"
+        mock_k8s_client.get_custom_objects_api().create_namespaced_custom_object.assert_not_called()
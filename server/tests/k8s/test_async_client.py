@@ -0,0 +1,105 @@
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for AsyncK8sApi.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from kubernetes.client import ApiException
+
+from src.services.k8s.async_client import MERGE_PATCH_CONTENT_TYPE, AsyncK8sApi
+
+
+def _api(handler, token="Bearer t0ken"):
+    return AsyncK8sApi(
+        host="https://k8s.example:6443/",
+        auth_header=lambda: token,
+        http2=False,
+        transport=httpx.MockTransport(handler),
+    )
+
+
+class TestAsyncK8sApi:
+
+    def test_custom_object_verbs_map_to_rest_paths(self):
+        """
+        Test case: Verify CRD verbs build the same requests as CustomObjectsApi
+        """
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"metadata": {"name": "sandbox-1", "uid": "u1"}, "items": []})
+
+        async def _run():
+            api = _api(handler)
+            created = await api.create_namespaced_custom_object(
+                group="agents.x-k8s.io", version="v1alpha1", namespace="ns", plural="sandboxes",
+                body={"kind": "Sandbox"},
+            )
+            await api.list_namespaced_custom_object(
+                group="agents.x-k8s.io", version="v1alpha1", namespace="ns", plural="sandboxes",
+                label_selector="opensandbox.io/id=1",
+            )
+            await api.patch_namespaced_custom_object(
+                group="agents.x-k8s.io", version="v1alpha1", namespace="ns", plural="sandboxes",
+                name="sandbox-1", body={"spec": {"shutdownTime": "t"}},
+            )
+            await api.delete_namespaced_custom_object(
+                group="agents.x-k8s.io", version="v1alpha1", namespace="ns", plural="sandboxes",
+                name="sandbox-1", grace_period_seconds=0,
+            )
+            await api.aclose()
+            return created
+
+        created = asyncio.run(_run())
+
+        assert created["metadata"]["uid"] == "u1"
+        base = "https://k8s.example:6443/apis/agents.x-k8s.io/v1alpha1/namespaces/ns/sandboxes"
+        assert [(r.method, str(r.url)) for r in seen] == [
+            ("POST", base),
+            ("GET", f"{base}?labelSelector=opensandbox.io%2Fid%3D1"),
+            ("PATCH", f"{base}/sandbox-1"),
+            ("DELETE", f"{base}/sandbox-1?gracePeriodSeconds=0"),
+        ]
+        assert all(r.headers["Authorization"] == "Bearer t0ken" for r in seen)
+        assert json.loads(seen[0].content) == {"kind": "Sandbox"}
+        assert seen[2].headers["Content-Type"] == MERGE_PATCH_CONTENT_TYPE
+
+    def test_error_status_raises_api_exception(self):
+        """
+        Test case: Verify HTTP errors surface as ApiException with the status code
+        """
+        api = _api(lambda request: httpx.Response(404, text='{"reason":"NotFound"}'), token=None)
+
+        with pytest.raises(ApiException) as exc_info:
+            asyncio.run(api.list_namespaced_pod(namespace="ns", label_selector="app=x"))
+
+        assert exc_info.value.status == 404
+        assert "NotFound" in exc_info.value.body
+
+    def test_http2_falls_back_without_h2(self, monkeypatch):
+        """
+        Test case: Verify HTTP/2 is only enabled when the h2 package is importable
+        """
+        monkeypatch.setattr("src.services.k8s.async_client.importlib.util.find_spec", lambda name: None)
+
+        api = AsyncK8sApi(host="https://k8s.example", http2=True)
+
+        assert api._client._transport._pool._http2 is False
@@ -20,6 +20,7 @@ import pytest
 import yaml
 
 from src.services.k8s.batchsandbox_template import BatchSandboxTemplateManager
+from src.services.k8s.template_manager import Slot
 
 
 class TestBatchSandboxTemplateManager:
@@ -255,3 +256,78 @@ class TestBatchSandboxTemplateManager:
         assert result["spec"]["replicas"] == 1
         assert result["spec"]["template"]["spec"]["containers"] == [{"name": "test"}]
         assert result["spec"]["template"]["spec"]["volumes"] == [{"name": "vol"}]
+
+    def test_compiled_manifest_matches_merge(self, tmp_path):
+        """
+        Test case: Verify rendering a compiled skeleton equals merging the filled-in manifest
+        """
+        template_file = tmp_path / "template.yaml"
+        template_file.write_text(yaml.dump({
+            "metadata": {"labels": {"team": "template", "tier": "sandbox"}, "name": "ignored"},
+            "spec": {
+                "expireTime": "template-default",
+                "template": {"spec": {"nodeSelector": {"pool": "a"}, "containers": [{"name": "t"}]}},
+            },
+        }))
+        manager = BatchSandboxTemplateManager(str(template_file))
+
+        def _runtime(name, labels, expire_time, containers):
+            return {
+                "metadata": {"name": name, "labels": labels},
+                "spec": {
+                    "replicas": 1,
+                    "expireTime": expire_time,
+                    "template": {"spec": {"containers": containers, "volumes": [{"name": "bin"}]}},
+                },
+            }
+
+        compiled = manager.compile(_runtime(
+            Slot("name"), Slot("labels"), Slot("expire_time"), Slot("containers")
+        ))
+        for values in (
+            {"name": "sandbox-1", "labels": {"team": "a", "id": "1"}, "expire_time": "t1",
+             "containers": [{"name": "sandbox"}]},
+            {"name": "sandbox-2", "labels": {}, "expire_time": None, "containers": [{"name": "x"}]},
+        ):
+            expected = manager.merge_with_runtime_values(_runtime(**values))
+            assert compiled.render(**values) == expected
+
+    def test_compiled_manifest_renders_are_independent(self):
+        """
+        Test case: Verify per-request values never leak into the skeleton or other renders
+        """
+        manager = BatchSandboxTemplateManager(None)
+        compiled = manager.compile({"metadata": {"name": Slot("name"), "namespace": "ns"}})
+
+        first = compiled.render(name="a")
+        second = compiled.render(name="b")
+
+        assert first == {"metadata": {"name": "a", "namespace": "ns"}}
+        assert second["metadata"]["name"] == "b"
+        assert compiled.render(name=None) == {"metadata": {"namespace": "ns"}}
+
+    def test_compile_rejects_slots_inside_lists(self):
+        """
+        Test case: Verify slots are only allowed where a whole value is replaced
+        """
+        manager = BatchSandboxTemplateManager(None)
+
+        with pytest.raises(ValueError):
+            manager.compile({"spec": {"containers": [Slot("container")]}})
+
+
+def test_manifest_bench_runs_every_case():
+    """
+    Test case: Verify the manifest benchmark builds manifests for each provider and mode
+    """
+    from src.tools.manifest_bench import run
+
+    results = run(iterations=3, templates={"batchsandbox": None, "agent-sandbox": None})
+
+    assert [case for case, _ in results] == [
+        "batchsandbox (no template)",
+        "batchsandbox (template)",
+        "agent-sandbox (no template)",
+        "agent-sandbox (template)",
+    ]
+    assert all(micros > 0 for _, micros in results)
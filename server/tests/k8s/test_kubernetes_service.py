@@ -16,13 +16,15 @@
 Unit tests for KubernetesSandboxService.
 """
 
+import asyncio
+
 import pytest
 from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi import HTTPException
 
 from src.services.k8s.kubernetes_service import KubernetesSandboxService
-from src.services.constants import SandboxErrorCodes
+from src.services.constants import SANDBOX_ID_LABEL, SandboxErrorCodes
 from src.api.schema import ListSandboxesRequest
 
 
@@ -462,3 +464,134 @@ class TestRenewExpiration:
             k8s_service.renew_expiration("test-sandbox-id", request)
         
         assert exc_info.value.status_code == 400
+
+
+class TestGetEndpoints:
+    """Endpoint cache and batch resolution tests"""
+
+    def test_get_endpoint_is_cached_until_delete(self, k8s_service, mock_workload):
+        """
+        Test case: Repeated endpoint lookups reuse the cached result
+
+        Purpose: Verify the workload is read once and deletion drops the cached entry
+        """
+        k8s_service.workload_provider.get_workload.return_value = mock_workload
+        k8s_service.workload_provider.get_endpoint_info.return_value = "10.0.0.1:8080"
+
+        first = k8s_service.get_endpoint("test-sandbox-123", 8080)
+        second = k8s_service.get_endpoint("test-sandbox-123", 8080)
+
+        assert first.endpoint == second.endpoint == "10.0.0.1:8080"
+        assert k8s_service.workload_provider.get_workload.call_count == 1
+
+        k8s_service.delete_sandbox("test-sandbox-123")
+        k8s_service.get_endpoint("test-sandbox-123", 8080)
+        assert k8s_service.workload_provider.get_workload.call_count == 2
+
+    def test_get_endpoints_reads_each_workload_once(self, k8s_service, mock_workload):
+        """
+        Test case: Batch resolution covers all ports with one workload read per sandbox
+
+        Purpose: Verify per-sandbox errors are reported without failing the batch
+        """
+        k8s_service.workload_provider.get_workload.side_effect = (
+            lambda sandbox_id, namespace: mock_workload if sandbox_id == "sbx-a" else None
+        )
+        k8s_service.workload_provider.get_endpoint_info.side_effect = (
+            lambda workload, port: f"10.0.0.1:{port}"
+        )
+
+        response = k8s_service.get_endpoints(["sbx-a", "sbx-missing"], [8080, 44772])
+
+        assert [item.sandbox_id for item in response.items] == ["sbx-a", "sbx-missing"]
+        assert response.items[0].endpoints["44772"].endpoint == "10.0.0.1:44772"
+        assert response.items[0].error is None
+        assert response.items[1].error.code == SandboxErrorCodes.K8S_SANDBOX_NOT_FOUND
+        assert k8s_service.workload_provider.get_workload.call_count == 2
+
+
+class TestAsyncApiPath:
+    """Asyncio create/renew path tests"""
+
+    def _use_async_provider(self, k8s_service, mock_workload):
+        provider = k8s_service.workload_provider
+        provider.create_workload_async = AsyncMock(return_value={"name": "sandbox-x", "uid": "u"})
+        provider.get_workload_async = AsyncMock(return_value=mock_workload)
+        provider.get_status_async = AsyncMock(return_value={
+            "state": "Running",
+            "reason": "POD_READY",
+            "message": "Pod is running",
+            "last_transition_at": datetime.now(timezone.utc),
+        })
+        provider.update_expiration_async = AsyncMock()
+        provider.delete_workload_async = AsyncMock()
+        return provider
+
+    def test_create_sandbox_async_uses_async_provider(self, k8s_service, mock_workload, create_sandbox_request):
+        """
+        Test case: Verify the async create never calls the blocking provider methods
+        """
+        provider = self._use_async_provider(k8s_service, mock_workload)
+
+        response = asyncio.run(k8s_service.create_sandbox_async(create_sandbox_request))
+
+        assert response.status.state == "Running"
+        kwargs = provider.create_workload_async.await_args.kwargs
+        assert kwargs["sandbox_id"] == response.id
+        assert kwargs["labels"][SANDBOX_ID_LABEL] == response.id
+        assert kwargs["expires_at"] == response.expires_at
+        provider.create_workload.assert_not_called()
+        provider.get_workload.assert_not_called()
+
+    def test_create_sandbox_async_cleans_up_failed_pod(self, k8s_service, mock_workload, create_sandbox_request):
+        """
+        Test case: Verify a failed pod is deleted through the async provider
+        """
+        provider = self._use_async_provider(k8s_service, mock_workload)
+        provider.get_status_async.return_value = {
+            "state": "Failed",
+            "reason": "POD_FAILED",
+            "message": "crash",
+            "last_transition_at": None,
+        }
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(k8s_service.create_sandbox_async(create_sandbox_request))
+
+        assert exc_info.value.detail["code"] == SandboxErrorCodes.K8S_POD_FAILED
+        provider.delete_workload_async.assert_awaited_once()
+
+    def test_renew_expiration_async(self, k8s_service, mock_workload):
+        """
+        Test case: Verify the async renew patches through the async provider
+        """
+        provider = self._use_async_provider(k8s_service, mock_workload)
+        new_expiration = datetime.now(timezone.utc) + timedelta(hours=2)
+        from src.api.schema import RenewSandboxExpirationRequest
+
+        response = asyncio.run(k8s_service.renew_expiration_async(
+            "test-sandbox-id", RenewSandboxExpirationRequest(expires_at=new_expiration)
+        ))
+
+        assert response.expires_at == new_expiration
+        provider.update_expiration_async.assert_awaited_once_with(
+            sandbox_id="test-sandbox-id",
+            namespace=k8s_service.namespace,
+            expires_at=new_expiration,
+        )
+        provider.update_expiration.assert_not_called()
+
+    def test_async_methods_fall_back_without_async_api(self, k8s_service, mock_workload):
+        """
+        Test case: Verify the sync implementation is used when async_api is disabled
+        """
+        k8s_service.workload_provider.async_api = None
+        k8s_service.workload_provider.get_workload.return_value = mock_workload
+        new_expiration = datetime.now(timezone.utc) + timedelta(hours=2)
+        from src.api.schema import RenewSandboxExpirationRequest
+
+        asyncio.run(k8s_service.renew_expiration_async(
+            "test-sandbox-id", RenewSandboxExpirationRequest(expires_at=new_expiration)
+        ))
+
+        k8s_service.workload_provider.update_expiration.assert_called_once()
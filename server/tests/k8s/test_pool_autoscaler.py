@@ -0,0 +1,183 @@
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for PoolAutoscaler.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.config import PoolAutoscalerConfig
+from src.services.k8s.pool_autoscaler import PoolAutoscaler
+from src.services.k8s.pool_registry import PoolRegistry
+from src.services.metrics import metrics
+
+
+class _Clock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _pool(name, buffer_min=1, buffer_max=3, pool_max=200):
+    return {
+        "metadata": {"name": name},
+        "spec": {
+            "template": {"spec": {"containers": [{"name": "sandbox", "image": "python:3.9"}]}},
+            "capacitySpec": {"bufferMin": buffer_min, "bufferMax": buffer_max, "poolMin": 0, "poolMax": pool_max},
+        },
+        "status": {"available": 0},
+    }
+
+
+def _autoscaler(*pools, **config):
+    api = MagicMock()
+    api.list_namespaced_custom_object.return_value = {"items": list(pools) or [_pool("p1")]}
+    registry = PoolRegistry(api, "sandboxes")
+    registry.refresh()
+    settings = {
+        "enabled": True,
+        "dry_run": False,
+        "interval_seconds": 10,
+        "max_buffer": 100,
+        "scale_down_cooldown_seconds": 0,
+    }
+    settings.update(config)
+    clock = _Clock()
+    return PoolAutoscaler(registry, PoolAutoscalerConfig(**settings), clock=clock), clock
+
+
+def _demand(autoscaler, pool, creates):
+    for _ in range(creates):
+        autoscaler.registry.record_create(pool)
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    metrics.reset()
+
+
+def test_buffers_follow_create_rate():
+    autoscaler, clock = _autoscaler(smoothing=1.0, warmup_seconds=10, headroom=1.0)
+
+    _demand(autoscaler, "p1", 20)  # 2 creates/s, all of them misses
+    clock.now = 10
+    targets = autoscaler.tick()
+
+    # (2 creates/s + 2 misses/s) * 10s warmup
+    assert targets == {"p1": (40, 80)}
+    autoscaler.registry.custom_api.patch_namespaced_custom_object.assert_called_once_with(
+        group="sandbox.opensandbox.io",
+        version="v1alpha1",
+        namespace="sandboxes",
+        plural="pools",
+        name="p1",
+        body={"spec": {"capacitySpec": {"bufferMin": 40, "bufferMax": 80}}},
+    )
+    assert metrics.gauge_value("pool_autoscaler_miss_rate", pool="p1") == 2
+    assert metrics.counter_value("pool_autoscaler_resizes_total", pool="p1", dry_run="false") == 1
+
+
+def test_targets_are_clamped_to_bounds_and_pool_max():
+    autoscaler, clock = _autoscaler(_pool("p1", pool_max=8), max_buffer=20, min_buffer=2)
+
+    _demand(autoscaler, "p1", 1000)
+    clock.now = 10
+    assert autoscaler.tick() == {"p1": (8, 8)}
+
+    autoscaler, clock = _autoscaler(min_buffer=2)
+    clock.now = 10
+    assert autoscaler.tick() == {"p1": (2, 4)}
+
+
+def test_ewma_smooths_bursts():
+    autoscaler, clock = _autoscaler(smoothing=0.5, warmup_seconds=10, headroom=1.0, buffer_max_ratio=1.0)
+    autoscaler.registry._pools["p1"].available = 10_000  # no misses
+
+    _demand(autoscaler, "p1", 40)
+    clock.now = 10
+    assert autoscaler.tick()["p1"][0] == 40
+    clock.now = 20
+    assert autoscaler.tick()["p1"][0] == 20
+    clock.now = 30
+    assert autoscaler.tick()["p1"][0] == 10
+
+
+def test_dry_run_reports_without_patching():
+    autoscaler, clock = _autoscaler(dry_run=True, min_buffer=5)
+
+    clock.now = 10
+    autoscaler.tick()
+    clock.now = 20
+    autoscaler.tick()
+
+    autoscaler.registry.custom_api.patch_namespaced_custom_object.assert_not_called()
+    assert metrics.gauge_value("pool_autoscaler_target_buffer_min", pool="p1") == 5
+    assert metrics.counter_value("pool_autoscaler_resizes_total", pool="p1", dry_run="true") == 1
+
+
+def test_scale_down_waits_for_cooldown():
+    autoscaler, clock = _autoscaler(
+        smoothing=1.0, warmup_seconds=10, headroom=1.0, scale_down_cooldown_seconds=60
+    )
+    autoscaler.registry._pools["p1"].available = 10_000
+
+    clock.now = 10
+    assert autoscaler.tick() == {"p1": (1, 3)}  # new pool: held during the cooldown
+    clock.now = 71
+    assert autoscaler.tick() == {"p1": (0, 0)}
+    _demand(autoscaler, "p1", 10)
+    clock.now = 81
+    assert autoscaler.tick() == {"p1": (10, 20)}
+    clock.now = 91
+    assert autoscaler.tick() == {"p1": (10, 20)}
+    clock.now = 142
+    assert autoscaler.tick() == {"p1": (0, 0)}
+
+
+def test_seasonal_profile_prewarms_upcoming_slot():
+    autoscaler, clock = _autoscaler(
+        smoothing=1.0, seasonal=True, season_bucket_seconds=600, warmup_seconds=60, headroom=1.0
+    )
+    autoscaler.registry._pools["p1"].available = 10_000
+    nine_am = 9 * 3600
+
+    # Day one: a burst in the 9:00 slot is learned.
+    clock.now = nine_am
+    autoscaler.tick()
+    _demand(autoscaler, "p1", 60)
+    clock.now = nine_am + 60
+    autoscaler.tick()
+    clock.now = nine_am + 1200
+    autoscaler.tick()
+
+    # Day two: a minute before 9:00 the 9:00 slot's rate sizes the buffer.
+    clock.now = 86400 + nine_am - 30
+    assert autoscaler.tick()["p1"][0] == 60
+
+
+def test_only_configured_pools_are_managed():
+    autoscaler, clock = _autoscaler(_pool("p1"), _pool("p2"), pools=["p2", "missing"])
+
+    clock.now = 10
+    assert set(autoscaler.tick()) == {"p2"}
+
+
+def test_config_rejects_inverted_bounds():
+    with pytest.raises(ValueError):
+        PoolAutoscalerConfig(min_buffer=5, max_buffer=1)
@@ -0,0 +1,180 @@
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for PoolRegistry and automatic pool routing.
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services.k8s.pool_registry import PoolRegistry, parse_quantity
+from src.services.metrics import metrics
+
+
+def _pool(name, image="python:3.9", limits=None, available=2, container="sandbox"):
+    container_spec = {"name": container, "image": image}
+    if limits is not None:
+        container_spec["resources"] = {"limits": limits}
+    return {
+        "metadata": {"name": name},
+        "spec": {
+            "template": {"spec": {"containers": [container_spec]}},
+            "capacitySpec": {"bufferMin": 1, "bufferMax": 3, "poolMin": 0, "poolMax": 5},
+        },
+        "status": {"total": 3, "allocated": 3 - available, "available": available},
+    }
+
+
+def _registry(*pools):
+    api = MagicMock()
+    api.list_namespaced_custom_object.return_value = {"items": list(pools)}
+    registry = PoolRegistry(api, "sandboxes")
+    registry.refresh()
+    return registry
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    metrics.reset()
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("500m", Decimal("0.5")),
+        ("0.5", Decimal("0.5")),
+        ("1Gi", Decimal(2**30)),
+        ("2", Decimal(2)),
+        ("1k", Decimal(1000)),
+    ],
+)
+def test_parse_quantity(value, expected):
+    assert parse_quantity(value) == expected
+
+
+def test_parse_quantity_rejects_garbage():
+    with pytest.raises(ValueError):
+        parse_quantity("lots")
+
+
+def test_refresh_lists_pools_in_namespace():
+    registry = _registry(_pool("p1", limits={"cpu": "1"}))
+
+    registry.custom_api.list_namespaced_custom_object.assert_called_once_with(
+        group="sandbox.opensandbox.io", version="v1alpha1", namespace="sandboxes", plural="pools"
+    )
+    pools = registry.pools()
+    assert pools["p1"].image == "python:3.9"
+    assert pools["p1"].capacity["bufferMax"] == 3
+    assert metrics.gauge_value("pool_available", pool="p1") == 2
+
+
+def test_route_matches_image_and_equivalent_resources():
+    registry = _registry(_pool("p1", limits={"cpu": "1000m", "memory": "1Gi"}))
+
+    assert registry.route("python:3.9", {"cpu": "1", "memory": "1024Mi"}) == "p1"
+    assert metrics.counter_value("pool_route_hits_total", pool="p1") == 1
+
+
+def test_route_misses_on_other_image_or_shape():
+    registry = _registry(_pool("p1", limits={"cpu": "1"}))
+
+    assert registry.route("python:3.11", {"cpu": "1"}) is None
+    assert registry.route("python:3.9", {"cpu": "2"}) is None
+    assert registry.route("python:3.9", {}) is None
+    assert metrics.counter_value("pool_route_misses_total", reason="no_match") == 3
+
+
+def test_route_reserves_idle_pods_until_refresh():
+    registry = _registry(_pool("p1", limits={"cpu": "1"}, available=1))
+
+    assert registry.route("python:3.9", {"cpu": "1"}) == "p1"
+    assert registry.route("python:3.9", {"cpu": "1"}) is None
+    assert metrics.counter_value("pool_route_misses_total", reason="no_capacity") == 1
+    assert metrics.counter_value("pool_route_exhausted_total", pool="p1") == 1
+
+    registry.refresh()
+    assert registry.route("python:3.9", {"cpu": "1"}) == "p1"
+
+
+def test_route_prefers_pool_with_most_idle_pods():
+    registry = _registry(
+        _pool("small", limits={"cpu": "1"}, available=1),
+        _pool("large", limits={"cpu": "1"}, available=4),
+    )
+
+    assert registry.route("python:3.9", {"cpu": "1"}) == "large"
+
+
+def test_refresh_falls_back_to_first_container_and_skips_empty_pools():
+    registry = _registry(_pool("p1", container="main"), {"metadata": {"name": "broken"}, "spec": {}})
+
+    assert set(registry.pools()) == {"p1"}
+    assert registry.route("python:3.9", None) == "p1"
+
+
+class TestServiceRouting:
+    """Automatic routing in KubernetesSandboxService."""
+
+    @pytest.fixture
+    def routed_service(self, k8s_service, mock_workload):
+        k8s_service.pool_registry = _registry(_pool("warm", limits={"cpu": "1", "memory": "1Gi"}))
+        k8s_service.pool_routing = True
+        provider = k8s_service.workload_provider
+        provider.create_workload.return_value = {"name": "sandbox-x", "uid": "u"}
+        provider.get_workload.return_value = mock_workload
+        provider.get_status.return_value = {
+            "state": "Running",
+            "reason": "",
+            "message": "Pod is running",
+            "last_transition_at": datetime.now(timezone.utc),
+        }
+        return k8s_service
+
+    def test_matching_create_is_sent_to_pool(self, routed_service, create_sandbox_request):
+        routed_service.create_sandbox(create_sandbox_request)
+
+        kwargs = routed_service.workload_provider.create_workload.call_args.kwargs
+        assert kwargs["extensions"] == {"poolRef": "warm"}
+
+    def test_unmatched_create_is_cold(self, routed_service, create_sandbox_request):
+        create_sandbox_request.image.uri = "node:20"
+
+        routed_service.create_sandbox(create_sandbox_request)
+
+        kwargs = routed_service.workload_provider.create_workload.call_args.kwargs
+        assert kwargs["extensions"] is None
+
+    def test_explicit_pool_ref_is_kept(self, routed_service, create_sandbox_request):
+        create_sandbox_request.extensions = {"poolRef": "chosen"}
+
+        routed_service.create_sandbox(create_sandbox_request)
+
+        kwargs = routed_service.workload_provider.create_workload.call_args.kwargs
+        assert kwargs["extensions"] == {"poolRef": "chosen"}
+        assert metrics.counter_value("pool_route_hits_total", pool="warm") == 0
+
+    def test_creates_are_tallied_per_pool(self, routed_service, create_sandbox_request):
+        routed_service.create_sandbox(create_sandbox_request)
+        create_sandbox_request.extensions = {"poolRef": "warm"}
+        routed_service.create_sandbox(create_sandbox_request)
+        routed_service.create_sandbox(create_sandbox_request)
+
+        # Two idle pods: the third create misses.
+        assert routed_service.pool_registry.take_demand() == {"warm": (3, 1)}
+        assert routed_service.pool_registry.take_demand() == {}
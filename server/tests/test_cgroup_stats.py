@@ -0,0 +1,141 @@
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException, status
+
+from src.config import AppConfig, DockerConfig, RuntimeConfig, ServerConfig
+from src.services.cgroup_stats import CgroupStatsReader, SandboxStatsCollector
+from src.services.docker import DockerSandboxService
+
+
+def _write_cgroup(root, container_id, usage_usec=1000, memory=4096, pids=3, layout="system.slice/docker-{}.scope"):
+    path = root / layout.format(container_id)
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "cpu.stat").write_text(f"usage_usec {usage_usec}\nuser_usec 10\nsystem_usec 5\n")
+    (path / "memory.current").write_text(f"{memory}\n")
+    (path / "pids.current").write_text(f"{pids}\n")
+    (path / "io.stat").write_text(
+        "8:0 rbytes=100 wbytes=200 rios=1 wios=2 dbytes=0 dios=0\n"
+        "8:16 rbytes=10 wbytes=20 rios=1 wios=1 dbytes=0 dios=0\n"
+    )
+    return path
+
+
+def test_reader_parses_cgroup_files(tmp_path):
+    _write_cgroup(tmp_path, "abc", usage_usec=5000, memory=1024, pids=7)
+    reader = CgroupStatsReader(str(tmp_path))
+
+    sample = reader.read("abc")
+
+    assert sample is not None
+    assert sample.cpu_usage_usec == 5000
+    assert sample.cpu_percent is None
+    assert sample.memory_bytes == 1024
+    assert sample.pids == 7
+    assert sample.io_read_bytes == 110
+    assert sample.io_write_bytes == 220
+
+
+def test_reader_supports_cgroupfs_layout_and_missing_container(tmp_path):
+    _write_cgroup(tmp_path, "def", layout="docker/{}")
+    reader = CgroupStatsReader(str(tmp_path))
+
+    assert reader.read("def") is not None
+    assert reader.read("missing") is None
+
+
+def test_collector_keeps_bounded_history_and_computes_cpu(tmp_path):
+    path = _write_cgroup(tmp_path, "c1", usage_usec=1_000)
+    collector = SandboxStatsCollector(
+        list_targets=lambda: {"sbx-1": "c1"},
+        reader=CgroupStatsReader(str(tmp_path)),
+        history_size=2,
+    )
+
+    collector.sweep()
+    (path / "cpu.stat").write_text("usage_usec 501000\n")
+    collector.sweep()
+    collector.sweep()
+
+    samples = collector.get_samples("sbx-1")
+    assert len(samples) == 2
+    assert samples[0].cpu_percent is not None and samples[0].cpu_percent > 0
+    assert samples[1].cpu_percent == 0
+
+
+def test_collector_drops_sandboxes_that_disappear(tmp_path):
+    _write_cgroup(tmp_path, "c1")
+    _write_cgroup(tmp_path, "c2")
+    targets = {"sbx-1": "c1", "sbx-2": "c2"}
+    collector = SandboxStatsCollector(list_targets=lambda: dict(targets), reader=CgroupStatsReader(str(tmp_path)))
+
+    collector.sweep()
+    targets.pop("sbx-2")
+    collector.sweep()
+
+    assert collector.get_samples("sbx-2") is None
+    assert set(collector.latest_samples()) == {"sbx-1"}
+
+
+@patch("src.services.docker.docker")
+def test_docker_service_fleet_stats_aggregates_latest_samples(mock_docker, tmp_path):
+    _write_cgroup(tmp_path, "c1", memory=100, pids=2)
+    _write_cgroup(tmp_path, "c2", memory=300, pids=5)
+    mock_client = MagicMock()
+    mock_client.api.containers.return_value = [
+        {"Id": "c1", "Labels": {"opensandbox.io/id": "sbx-1"}},
+        {"Id": "c2", "Labels": {"opensandbox.io/id": "sbx-2"}},
+    ]
+    mock_docker.from_env.return_value = mock_client
+    config = AppConfig(
+        server=ServerConfig(),
+        runtime=RuntimeConfig(type="docker", execd_image="ghcr.io/opensandbox/platform:latest"),
+        docker=DockerConfig(stats_enabled=True, cgroup_root=str(tmp_path), stats_interval_seconds=3600),
+    )
+
+    service = DockerSandboxService(config=config)
+    try:
+        service._stats_collector.sweep()
+        fleet = service.get_fleet_stats()
+        stats = service.get_sandbox_stats("sbx-2")
+    finally:
+        service._stats_collector.stop()
+
+    assert fleet.sandbox_count == 2
+    assert fleet.memory_bytes == 400
+    assert fleet.pids == 7
+    assert stats.samples[-1].memory_bytes == 300
+    with pytest.raises(HTTPException) as exc:
+        service.get_sandbox_stats("unknown")
+    assert exc.value.status_code == status.HTTP_404_NOT_FOUND
+
+
+@patch("src.services.docker.docker")
+def test_docker_service_stats_disabled_returns_not_implemented(mock_docker):
+    mock_client = MagicMock()
+    mock_client.api.containers.return_value = []
+    mock_docker.from_env.return_value = mock_client
+    config = AppConfig(
+        server=ServerConfig(),
+        runtime=RuntimeConfig(type="docker", execd_image="ghcr.io/opensandbox/platform:latest"),
+    )
+
+    service = DockerSandboxService(config=config)
+
+    with pytest.raises(HTTPException) as exc:
+        service.get_fleet_stats()
+    assert exc.value.status_code == status.HTTP_501_NOT_IMPLEMENTED
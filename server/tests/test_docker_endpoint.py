@@ -15,6 +15,9 @@
 import pytest
 from unittest.mock import MagicMock, patch
 
+from docker.errors import ImageNotFound
+
+from src.services.constants import SandboxErrorCodes
 from src.services.docker import DockerSandboxService
 from src.config import AppConfig, RuntimeConfig, DockerConfig, ServerConfig
 
@@ -117,3 +120,75 @@ def test_get_endpoint_bridge_internal_resolution(mock_docker_service):
 
     endpoint = service.get_endpoint("sbx-123", 8080, resolve_internal=True)
     assert endpoint.endpoint == "10.0.0.5:8080"
+
+
+def _bridge_container(http_port="50001", proxy_port="50002"):
+    container = MagicMock()
+    container.attrs = {
+        "State": {"Running": True},
+        "Config": {
+            "Labels": {
+                "opensandbox.io/embedding-proxy-port": proxy_port,
+                "opensandbox.io/http-port": http_port,
+            }
+        },
+        "NetworkSettings": {"IPAddress": "172.17.0.5"},
+    }
+    return container
+
+
+def test_get_endpoint_bridge_is_cached_until_container_event(mock_docker_service):
+    service, mock_client = mock_docker_service
+    mock_client.containers.list.return_value = [_bridge_container()]
+
+    with patch("src.services.sandbox_service.SandboxService._resolve_bind_ip", return_value="192.168.1.100") as bind:
+        first = service.get_endpoint("sbx-123", 8080)
+        second = service.get_endpoint("sbx-123", 8080)
+        assert first.endpoint == second.endpoint == "192.168.1.100:50001"
+        assert mock_client.containers.list.call_count == 1
+        assert bind.call_count == 1
+
+        # A restart event for the sandbox drops its cached endpoints.
+        service.transfer_client = MagicMock()
+
+        def _events(**kwargs):
+            service._events_stop.set()
+            return iter([{"Action": "restart", "Actor": {"Attributes": {"opensandbox.io/id": "sbx-123"}}}])
+
+        service.transfer_client.events.side_effect = _events
+        service._watch_container_events()
+        mock_client.containers.list.return_value = [_bridge_container(http_port="50011")]
+
+        assert service.get_endpoint("sbx-123", 8080).endpoint == "192.168.1.100:50011"
+        assert mock_client.containers.list.call_count == 2
+
+
+def test_get_endpoints_bridge_lists_containers_once(mock_docker_service):
+    service, mock_client = mock_docker_service
+    mock_client.api.containers.return_value = [
+        {"Id": "cid-a", "Labels": {"opensandbox.io/id": "sbx-a", **_bridge_container().attrs["Config"]["Labels"]}},
+        {
+            "Id": "cid-b",
+            "Labels": {
+                "opensandbox.io/id": "sbx-b",
+                **_bridge_container("50011", "50012").attrs["Config"]["Labels"],
+            },
+        },
+    ]
+    mock_client.containers.list.return_value = []
+    mock_client.images.get.side_effect = ImageNotFound("missing")
+
+    with patch("src.services.sandbox_service.SandboxService._resolve_bind_ip", return_value="192.168.1.100"):
+        response = service.get_endpoints(["sbx-a", "sbx-b", "sbx-gone"], [8080, 6000])
+        again = service.get_endpoints(["sbx-a", "sbx-b"], [8080, 6000])
+
+    by_id = {item.sandbox_id: item for item in response.items}
+    assert by_id["sbx-a"].endpoints["8080"].endpoint == "192.168.1.100:50001"
+    assert by_id["sbx-b"].endpoints["6000"].endpoint == "192.168.1.100:50012/proxy/6000"
+    assert by_id["sbx-gone"].endpoints == {}
+    assert by_id["sbx-gone"].error.code == SandboxErrorCodes.SANDBOX_NOT_FOUND
+    assert mock_client.api.containers.call_count == 1
+    assert [item.endpoints["8080"].endpoint for item in again.items] == [
+        "192.168.1.100:50001",
+        "192.168.1.100:50011",
+    ]
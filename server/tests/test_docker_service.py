@@ -12,17 +12,34 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
+from docker import DockerClient
+from docker.errors import DockerException, ImageNotFound
 from fastapi import HTTPException, status
 
 from src.config import AppConfig, RouterConfig, RuntimeConfig, ServerConfig
-from src.services.constants import SANDBOX_ID_LABEL, SandboxErrorCodes
+from src.services.constants import (
+    SANDBOX_CLONED_FROM_LABEL,
+    SANDBOX_CREATED_AT_LABEL,
+    SANDBOX_ENTRYPOINT_LABEL,
+    SANDBOX_EXPIRES_AT_LABEL,
+    SANDBOX_HIBERNATED_AT_LABEL,
+    SANDBOX_HTTP_PORT_LABEL,
+    SANDBOX_ID_LABEL,
+    SANDBOX_METADATA_KEYS_LABEL,
+    SANDBOX_RESOURCE_LIMITS_LABEL,
+    SANDBOX_SOURCE_IMAGE_LABEL,
+    SandboxErrorCodes,
+)
 from src.services.docker import DockerSandboxService, PendingSandbox
+from src.services.metrics import metrics
 from src.services.helpers import parse_memory_limit, parse_nano_cpus, parse_timestamp
 from src.api.schema import (
+    CloneSandboxRequest,
     CreateSandboxRequest,
     CreateSandboxResponse,
     ImageSpec,
@@ -117,6 +134,7 @@ def test_create_sandbox_applies_security_defaults(mock_docker):
     assert host_kwargs["cap_drop"] == service.app_config.docker.drop_capabilities
     assert host_kwargs["pids_limit"] == service.app_config.docker.pids_limit
     assert mock_client.api.create_container.call_args.kwargs["host_config"] == {"host": "cfg"}
+    assert mock_client.api.create_container.call_args.kwargs["labels"][SANDBOX_METADATA_KEYS_LABEL] == "[]"
 
 
 @patch("src.services.docker.docker")
@@ -247,22 +265,17 @@ def test_get_sandbox_returns_pending_state(mock_docker):
 
 @patch("src.services.docker.docker")
 def test_list_sandboxes_deduplicates_container_and_pending(mock_docker):
-    # Build a realistic container mock to avoid parse_timestamp errors.
-    container = MagicMock()
-    container.attrs = {
-        "Config": {"Labels": {SANDBOX_ID_LABEL: "sandbox-123"}},
-        "Created": "2025-01-01T00:00:00Z",
-        "State": {
-            "Status": "running",
-            "Running": True,
-            "FinishedAt": "0001-01-01T00:00:00Z",
-            "ExitCode": 0,
-        },
+    summary = {
+        "Id": "cid-123",
+        "Labels": {SANDBOX_ID_LABEL: "sandbox-123"},
+        "Created": 1735689600,
+        "State": "running",
+        "Image": "image:latest",
     }
-    container.image = MagicMock(tags=["image:latest"], short_id="sha-image")
 
     mock_client = MagicMock()
-    mock_client.containers.list.return_value = [container]
+    mock_client.containers.list.return_value = []
+    mock_client.api.containers.return_value = [summary]
     mock_docker.from_env.return_value = mock_client
 
     service = DockerSandboxService(config=_app_config())
@@ -284,7 +297,7 @@ def test_list_sandboxes_deduplicates_container_and_pending(mock_docker):
         createdAt=datetime.now(timezone.utc),
     )
     # Force container state to be returned
-    service._container_to_sandbox = MagicMock(return_value=container_sandbox)
+    service._container_summary_to_sandbox = MagicMock(return_value=container_sandbox)
 
     response = service.list_sandboxes(ListSandboxesRequest(filter=SandboxFilter(), pagination=None))
 
@@ -379,3 +392,513 @@ def test_async_worker_cleans_up_leftover_container_on_failure(mock_docker):
 
     service._cleanup_failed_containers.assert_called_once_with(sandbox_id)
     assert service._pending_sandboxes[sandbox_id].status.state == "Failed"
+
+
+@patch("src.services.docker.docker")
+def test_list_sandboxes_uses_container_summaries_without_inspect(mock_docker):
+    summaries = [
+        {
+            "Id": f"cid-{idx}",
+            "Labels": {
+                SANDBOX_ID_LABEL: f"sandbox-{idx}",
+                SANDBOX_EXPIRES_AT_LABEL: "2030-01-01T00:00:00+00:00",
+                SANDBOX_ENTRYPOINT_LABEL: '["python", "app.py"]',
+                "team": "eval",
+            },
+            "Created": 1735689600 + idx,
+            "State": "paused" if idx == 0 else "running",
+            "Image": "python:3.11",
+        }
+        for idx in range(3)
+    ]
+    mock_client = MagicMock()
+    mock_client.api.containers.return_value = summaries
+    mock_docker.from_env.return_value = mock_client
+
+    service = DockerSandboxService(config=_app_config())
+    mock_client.containers.list.reset_mock()
+
+    response = service.list_sandboxes(ListSandboxesRequest(filter=SandboxFilter(), pagination=None))
+
+    assert len(response.items) == 3
+    mock_client.containers.list.assert_not_called()
+    mock_client.containers.get.assert_not_called()
+    by_id = {item.id: item for item in response.items}
+    assert by_id["sandbox-0"].status.state == "Paused"
+    assert by_id["sandbox-1"].status.state == "Running"
+    assert by_id["sandbox-1"].entrypoint == ["python", "app.py"]
+    assert by_id["sandbox-1"].metadata == {"team": "eval"}
+    assert by_id["sandbox-1"].image.uri == "python:3.11"
+    assert by_id["sandbox-1"].expires_at == datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+@patch("src.services.docker.docker")
+def test_container_summary_falls_back_to_inspect_without_entrypoint_label(mock_docker):
+    mock_client = MagicMock()
+    mock_client.api.containers.return_value = []
+    mock_docker.from_env.return_value = mock_client
+
+    service = DockerSandboxService(config=_app_config())
+    inspected = MagicMock()
+    mock_client.containers.get.return_value = inspected
+    service._container_to_sandbox = MagicMock()
+
+    service._container_summary_to_sandbox(
+        {"Id": "cid-legacy", "Labels": {SANDBOX_ID_LABEL: "sandbox-legacy"}, "State": "running"},
+        "sandbox-legacy",
+    )
+
+    mock_client.containers.get.assert_called_once_with("cid-legacy")
+    service._container_to_sandbox.assert_called_once_with(inspected, "sandbox-legacy")
+
+
+def _hibernated_image(sandbox_id: str) -> MagicMock:
+    image = MagicMock()
+    image.attrs = {
+        "Config": {
+            "Labels": {
+                SANDBOX_ID_LABEL: sandbox_id,
+                SANDBOX_EXPIRES_AT_LABEL: "2030-01-01T00:00:00+00:00",
+                SANDBOX_ENTRYPOINT_LABEL: '["python", "app.py"]',
+                SANDBOX_HIBERNATED_AT_LABEL: "2029-12-31T00:00:00+00:00",
+                SANDBOX_SOURCE_IMAGE_LABEL: "python:3.11",
+                SANDBOX_CREATED_AT_LABEL: "2029-12-30T00:00:00+00:00",
+                SANDBOX_RESOURCE_LIMITS_LABEL: '{"memory": "536870912", "cpu": "500m"}',
+                SANDBOX_HTTP_PORT_LABEL: "41000",
+                "team": "eval",
+            }
+        }
+    }
+    return image
+
+
+@patch("src.services.docker.docker")
+def test_hibernate_sandbox_commits_and_removes_container(mock_docker):
+    container = MagicMock()
+    container.attrs = {
+        "Created": "2029-12-30T00:00:00Z",
+        "State": {"Running": True, "Paused": True},
+        "Config": {
+            "Image": "python:3.11",
+            "Labels": {SANDBOX_ID_LABEL: "sbx", SANDBOX_EXPIRES_AT_LABEL: "2030-01-01T00:00:00+00:00"},
+        },
+        "HostConfig": {"Memory": 536870912, "NanoCpus": 500_000_000},
+    }
+    mock_client = MagicMock()
+    mock_client.api.containers.return_value = []
+    mock_client.containers.list.return_value = [container]
+    mock_docker.from_env.return_value = mock_client
+    service = DockerSandboxService(config=_app_config())
+
+    service.hibernate_sandbox("sbx")
+    service._teardown_executor.shutdown(wait=True)
+
+    kwargs = container.commit.call_args.kwargs
+    assert kwargs["repository"] == "opensandbox-snapshots"
+    assert kwargs["tag"] == "sbx"
+    snapshot_labels = kwargs["conf"]["Labels"]
+    assert snapshot_labels[SANDBOX_SOURCE_IMAGE_LABEL] == "python:3.11"
+    assert snapshot_labels[SANDBOX_CREATED_AT_LABEL] == "2029-12-30T00:00:00Z"
+    assert snapshot_labels[SANDBOX_RESOURCE_LIMITS_LABEL] == '{"memory": "536870912", "cpu": "500m"}'
+    assert snapshot_labels[SANDBOX_EXPIRES_AT_LABEL] == "2030-01-01T00:00:00+00:00"
+    container.remove.assert_called_once_with(force=True)
+    assert "sbx" not in service._hibernating
+
+
+@patch("src.services.docker.docker")
+def test_hibernate_returns_before_commit_and_defers_delete(mock_docker):
+    summary = {
+        "Id": "cid-1",
+        "Labels": {
+            SANDBOX_ID_LABEL: "sbx",
+            SANDBOX_EXPIRES_AT_LABEL: "2030-01-01T00:00:00+00:00",
+            SANDBOX_ENTRYPOINT_LABEL: '["sleep", "infinity"]',
+        },
+        "Created": 1735689600,
+        "State": "running",
+        "Image": "python:3.11",
+    }
+    container = MagicMock()
+    container.attrs = {
+        "State": {"Running": True},
+        "Config": {"Image": "python:3.11", "Labels": dict(summary["Labels"])},
+        "HostConfig": {},
+    }
+    release = threading.Event()
+    container.commit.side_effect = lambda **kwargs: release.wait(5)
+    mock_client = MagicMock()
+    mock_client.api.containers.return_value = [summary]
+    mock_client.containers.list.return_value = [container]
+    mock_client.images.get.return_value = _hibernated_image("sbx")
+    mock_docker.from_env.return_value = mock_client
+    service = DockerSandboxService(config=_app_config())
+
+    service.hibernate_sandbox("sbx")
+
+    listed = service.list_sandboxes(ListSandboxesRequest(filter=SandboxFilter(), pagination=None))
+    assert listed.items[0].status.state == "Hibernating"
+    with pytest.raises(HTTPException) as exc_info:
+        service.pause_sandbox("sbx")
+    assert exc_info.value.status_code == status.HTTP_409_CONFLICT
+
+    service.delete_sandbox("sbx")
+    listed = service.list_sandboxes(ListSandboxesRequest(filter=SandboxFilter(), pagination=None))
+    assert listed.items[0].status.state == "Stopping"
+    mock_client.api.remove_container.assert_not_called()
+
+    # Once the snapshot settles the container is gone and the delete drops the image.
+    mock_client.api.containers.return_value = []
+    release.set()
+    service._teardown_executor.shutdown(wait=True)
+
+    container.remove.assert_called_once_with(force=True)
+    mock_client.images.remove.assert_called_once_with("opensandbox-snapshots:sbx")
+    assert not service._hibernating and not service._stopping
+
+
+@patch("src.services.docker.docker")
+def test_get_sandbox_reports_hibernated_state(mock_docker):
+    mock_client = MagicMock()
+    mock_client.api.containers.return_value = []
+    mock_client.containers.list.return_value = []
+    mock_client.images.get.return_value = _hibernated_image("sbx")
+    mock_docker.from_env.return_value = mock_client
+    service = DockerSandboxService(config=_app_config())
+
+    sandbox = service.get_sandbox("sbx")
+
+    mock_client.images.get.assert_called_with("opensandbox-snapshots:sbx")
+    assert sandbox.status.state == "Hibernated"
+    assert sandbox.image.uri == "python:3.11"
+    assert sandbox.entrypoint == ["python", "app.py"]
+    assert sandbox.created_at == datetime(2029, 12, 30, tzinfo=timezone.utc)
+    assert sandbox.metadata == {SANDBOX_HTTP_PORT_LABEL: "41000", "team": "eval"}
+    with pytest.raises(HTTPException) as exc:
+        service.pause_sandbox("sbx")
+    assert exc.value.status_code == status.HTTP_409_CONFLICT
+    assert exc.value.detail["code"] == SandboxErrorCodes.SANDBOX_HIBERNATED
+
+
+@patch("src.services.docker.docker")
+def test_resume_restores_hibernated_sandbox_with_same_id(mock_docker):
+    mock_client = MagicMock()
+    mock_client.api.containers.return_value = []
+    mock_client.containers.list.return_value = []
+    mock_client.images.get.return_value = _hibernated_image("sbx")
+    mock_docker.from_env.return_value = mock_client
+    service = DockerSandboxService(config=_app_config())
+    release = threading.Event()
+    service._provision_sandbox = MagicMock(side_effect=lambda *args: release.wait(5))
+
+    service.resume_sandbox("sbx")
+
+    assert service.get_sandbox("sbx").status.state == "Pending"
+    # Resuming while the restore runs is a no-op.
+    service.resume_sandbox("sbx")
+    release.set()
+    for thread in threading.enumerate():
+        if thread.name == "sandbox-resume-sbx":
+            thread.join(5)
+
+    assert service._get_pending_sandbox("sbx") is None
+    service._provision_sandbox.assert_called_once()
+    sandbox_id, request, created_at, expires_at, preferred_ports = service._provision_sandbox.call_args.args
+    assert sandbox_id == "sbx"
+    assert request.image.uri == "opensandbox-snapshots:sbx"
+    assert request.entrypoint == ["python", "app.py"]
+    assert request.resource_limits.root == {"memory": "536870912", "cpu": "500m"}
+    assert created_at == datetime(2029, 12, 30, tzinfo=timezone.utc)
+    assert expires_at == datetime(2030, 1, 1, tzinfo=timezone.utc)
+    assert preferred_ports == (None, 41000)
+
+
+@patch("src.services.docker.docker")
+def test_delete_hibernated_sandbox_removes_image(mock_docker):
+    mock_client = MagicMock()
+    mock_client.api.containers.return_value = []
+    mock_client.containers.list.return_value = []
+    mock_client.images.get.return_value = _hibernated_image("sbx")
+    mock_docker.from_env.return_value = mock_client
+    service = DockerSandboxService(config=_app_config())
+
+    service.delete_sandbox("sbx")
+
+    mock_client.images.remove.assert_called_once_with("opensandbox-snapshots:sbx")
+
+
+@patch("src.services.docker.docker")
+def test_clone_sandbox_commits_once_and_streams_each_clone(mock_docker):
+    container = MagicMock()
+    container.attrs = {
+        "State": {"Running": True},
+        "Config": {
+            "Image": "python:3.11",
+            "Labels": {
+                SANDBOX_ID_LABEL: "source",
+                SANDBOX_ENTRYPOINT_LABEL: '["python", "app.py"]',
+                SANDBOX_EXPIRES_AT_LABEL: "2030-01-01T00:00:00+00:00",
+                "team": "eval",
+            },
+        },
+        "HostConfig": {"Memory": 536870912},
+    }
+    snapshot = MagicMock()
+    container.commit.return_value = snapshot
+    mock_client = MagicMock()
+    mock_client.api.containers.return_value = []
+    mock_client.containers.list.return_value = [container]
+    mock_docker.from_env.return_value = mock_client
+    service = DockerSandboxService(config=_app_config())
+
+    def _provision(sandbox_id, request, created_at, expires_at):
+        if request.image.uri.endswith(failing_id[0]):
+            raise HTTPException(
+                status_code=500,
+                detail={"code": SandboxErrorCodes.CONTAINER_START_FAILED, "message": "boom"},
+            )
+        return CreateSandboxResponse(
+            id=sandbox_id,
+            status=SandboxStatus(state="Running", reason="CONTAINER_RUNNING", message="ok"),
+            metadata=request.metadata,
+            expiresAt=expires_at,
+            createdAt=created_at,
+            entrypoint=request.entrypoint,
+        )
+
+    failing_id = [""]
+    service._provision_sandbox = MagicMock(side_effect=_provision)
+    results_iter = service.clone_sandbox("source", 3, CloneSandboxRequest(timeout=600, metadata={"branch": "a"}))
+
+    container.commit.assert_called_once()
+    commit_kwargs = container.commit.call_args.kwargs
+    assert commit_kwargs["repository"] == "opensandbox-snapshots"
+    assert commit_kwargs["conf"]["Labels"][SANDBOX_CLONED_FROM_LABEL] == "source"
+    assert snapshot.tag.call_count == 2
+    failing_id[0] = snapshot.tag.call_args_list[-1].kwargs["tag"]
+
+    results = sorted(results_iter, key=lambda result: result.index)
+
+    assert [result.index for result in results] == [0, 1, 2]
+    succeeded = [result for result in results if result.sandbox is not None]
+    assert len(succeeded) == 2
+    assert len({result.sandbox.id for result in succeeded}) == 2
+    assert all(result.sandbox.id != "source" for result in succeeded)
+    assert succeeded[0].sandbox.metadata == {"team": "eval", "branch": "a"}
+    assert succeeded[0].sandbox.entrypoint == ["python", "app.py"]
+    request = service._provision_sandbox.call_args_list[0].args[1]
+    assert request.resource_limits.root == {"memory": "536870912"}
+    assert results[2].error.code == SandboxErrorCodes.CONTAINER_START_FAILED
+    mock_client.images.remove.assert_called_once_with(f"opensandbox-snapshots:{failing_id[0]}")
+
+
+@pytest.mark.parametrize("recorded_keys", [True, False])
+@patch("src.services.docker.docker")
+def test_clone_metadata_excludes_image_and_port_labels(mock_docker, recorded_keys):
+    labels = {
+        SANDBOX_ID_LABEL: "source",
+        SANDBOX_ENTRYPOINT_LABEL: '["nginx"]',
+        SANDBOX_EXPIRES_AT_LABEL: "2030-01-01T00:00:00+00:00",
+        SANDBOX_HTTP_PORT_LABEL: "41000",
+        "maintainer": "NGINX Docker Maintainers <docker-maint@nginx.com>",
+        "team": "eval",
+    }
+    if recorded_keys:
+        labels[SANDBOX_METADATA_KEYS_LABEL] = '["team"]'
+    container = MagicMock()
+    container.attrs = {
+        "Image": "sha256:nginx",
+        "State": {"Running": True},
+        "Config": {"Image": "nginx:latest", "Labels": labels},
+        "HostConfig": {},
+    }
+    source_image = MagicMock()
+    source_image.attrs = {"Config": {"Labels": {"maintainer": labels["maintainer"]}}}
+    mock_client = MagicMock()
+    mock_client.api.containers.return_value = []
+    mock_client.containers.list.return_value = [container]
+    mock_client.images.get.return_value = source_image
+    mock_docker.from_env.return_value = mock_client
+    service = DockerSandboxService(config=_app_config())
+    service._provision_sandbox = MagicMock(side_effect=HTTPException(status_code=500, detail="stop"))
+
+    list(service.clone_sandbox("source", 1, CloneSandboxRequest(metadata={"branch": "a"})))
+
+    request = service._provision_sandbox.call_args.args[1]
+    assert request.metadata == {"team": "eval", "branch": "a"}
+    if recorded_keys:
+        mock_client.images.get.assert_not_called()
+    else:
+        mock_client.images.get.assert_called_once_with("sha256:nginx")
+
+
+@patch("src.services.docker.docker")
+def test_restore_runs_in_background_and_reaps_expired_sandboxes(mock_docker):
+    summaries = [
+        {
+            "Id": "cid-live",
+            "Labels": {SANDBOX_ID_LABEL: "live", SANDBOX_EXPIRES_AT_LABEL: "2030-01-01T00:00:00+00:00"},
+        },
+        {
+            "Id": "cid-expired",
+            "Labels": {SANDBOX_ID_LABEL: "expired", SANDBOX_EXPIRES_AT_LABEL: "2000-01-01T00:00:00+00:00"},
+        },
+        {
+            "Id": "cid-expired-clone",
+            "Labels": {
+                SANDBOX_ID_LABEL: "expired-clone",
+                SANDBOX_EXPIRES_AT_LABEL: "2000-01-01T00:00:00+00:00",
+                SANDBOX_CLONED_FROM_LABEL: "live",
+            },
+        },
+    ]
+    mock_client = MagicMock()
+    mock_client.api.containers.return_value = summaries
+    mock_client.api.images.return_value = []
+    mock_docker.from_env.return_value = mock_client
+
+    service = DockerSandboxService(config=_app_config())
+    # Construction no longer blocks on restoration.
+    mock_client.api.containers.assert_not_called()
+    assert service.is_ready() is False
+
+    service.start()
+    assert service._restore_done.wait(timeout=5)
+    assert service.is_ready() is True
+
+    assert set(service._expiration_timers) == {"live"}
+    removed = {call.args[0] for call in mock_client.api.remove_container.call_args_list}
+    assert removed == {"cid-expired", "cid-expired-clone"}
+    assert all(call.kwargs == {"force": True} for call in mock_client.api.remove_container.call_args_list)
+    # Per-sandbox lookups of _expire_sandbox are skipped for containers already listed.
+    mock_client.containers.list.assert_not_called()
+    mock_client.images.remove.assert_called_once_with(service._snapshot_image_ref("expired-clone"))
+    service._remove_expiration_tracking("live")
+
+
+@patch("src.services.docker.docker")
+def test_restore_does_not_override_timer_scheduled_during_startup(mock_docker):
+    mock_client = MagicMock()
+    mock_client.api.containers.return_value = [
+        {
+            "Id": "cid-1",
+            "Labels": {SANDBOX_ID_LABEL: "sandbox-1", SANDBOX_EXPIRES_AT_LABEL: "2030-01-01T00:00:00+00:00"},
+        }
+    ]
+    mock_client.api.images.return_value = []
+    mock_docker.from_env.return_value = mock_client
+
+    service = DockerSandboxService(config=_app_config())
+    renewed = datetime(2030, 6, 1, tzinfo=timezone.utc)
+    service._schedule_expiration("sandbox-1", renewed)
+
+    service._restore_existing_sandboxes()
+
+    assert service._sandbox_expirations["sandbox-1"] == renewed
+    service._remove_expiration_tracking("sandbox-1")
+
+
+@patch("src.services.docker.docker.from_env", DockerClient.from_env)
+@patch("docker.client.APIClient")
+def test_transfers_use_separate_client_pool(mock_api_client):
+    # Only the low-level API client is replaced, so the options go through the real docker.from_env.
+    control_api = MagicMock()
+    transfer_api = MagicMock()
+    transfer_api.inspect_image.return_value = {"Id": "sha256:abc"}
+    mock_api_client.side_effect = [control_api, transfer_api]
+
+    service = DockerSandboxService(config=_app_config())
+    control_kwargs, transfer_kwargs = (call.kwargs for call in mock_api_client.call_args_list)
+    assert control_kwargs["max_pool_size"] == 32
+    assert transfer_kwargs["max_pool_size"] == 8
+    assert control_kwargs["timeout"] == transfer_kwargs["timeout"] == 180
+    assert service.docker_client.api is control_api
+    assert service.transfer_client.api is transfer_api
+    assert metrics.gauge_value("docker_client_pool_size", pool="control") == 32
+    assert metrics.gauge_value("docker_client_pool_size", pool="transfer") == 8
+
+    service._pull_image("python:3.11", None, "sandbox-1")
+    assert transfer_api.pull.call_args.args[0] == "python"
+    control_api.pull.assert_not_called()
+
+    container = MagicMock()
+    container.attrs = {"Id": "cid-1"}
+    service._install_bootstrap_script(container, "sandbox-1")
+    assert transfer_api.put_archive.call_args.args[0] == "cid-1"
+    control_api.put_archive.assert_not_called()
+    container.put_archive.assert_not_called()
+
+
+@patch("src.services.docker.docker")
+def test_delete_sandbox_returns_before_teardown_and_reports_stopping(mock_docker):
+    metrics.reset()
+    summary = {
+        "Id": "cid-1",
+        "Labels": {
+            SANDBOX_ID_LABEL: "sbx-1",
+            SANDBOX_EXPIRES_AT_LABEL: "2030-01-01T00:00:00+00:00",
+            SANDBOX_ENTRYPOINT_LABEL: '["sleep", "infinity"]',
+        },
+        "Created": 1735689600,
+        "State": "running",
+        "Image": "python:3.11",
+    }
+    mock_client = MagicMock()
+    mock_client.api.containers.return_value = [summary]
+    release = threading.Event()
+    mock_client.api.remove_container.side_effect = lambda *args, **kwargs: release.wait(5)
+    mock_docker.from_env.return_value = mock_client
+    service = DockerSandboxService(config=_app_config())
+
+    service.delete_sandbox("sbx-1")
+    # A second delete while the first is queued is a no-op.
+    service.delete_sandbox("sbx-1")
+
+    listed = service.list_sandboxes(ListSandboxesRequest(filter=SandboxFilter(), pagination=None))
+    assert listed.items[0].status.state == "Stopping"
+    assert metrics.gauge_value("sandbox_delete_backlog") == 1
+
+    release.set()
+    service._teardown_executor.shutdown(wait=True)
+
+    mock_client.api.remove_container.assert_called_once_with("cid-1", force=True)
+    mock_client.containers.list.assert_not_called()
+    assert "sbx-1" not in service._stopping
+    assert metrics.gauge_value("sandbox_delete_backlog") == 0
+    assert metrics.counter_value("sandbox_deleted_total", trigger="api") == 1
+    assert metrics.summary_value("sandbox_delete_seconds", trigger="api").count == 1
+
+
+@patch("src.services.docker.docker")
+def test_expiration_queues_teardown_and_counts_failures(mock_docker):
+    metrics.reset()
+    mock_client = MagicMock()
+    mock_client.api.containers.return_value = [
+        {"Id": "cid-2", "Labels": {SANDBOX_ID_LABEL: "sbx-2", SANDBOX_CLONED_FROM_LABEL: "src"}}
+    ]
+    mock_client.api.remove_container.side_effect = DockerException("daemon busy")
+    mock_docker.from_env.return_value = mock_client
+    service = DockerSandboxService(config=_app_config())
+
+    service._expire_sandbox("sbx-2")
+    service._teardown_executor.shutdown(wait=True)
+
+    mock_client.api.remove_container.assert_called_once_with("cid-2", force=True)
+    # The snapshot image is kept while the container still exists.
+    mock_client.images.remove.assert_not_called()
+    assert metrics.counter_value("sandbox_delete_failures_total", trigger="expiry") == 1
+    assert "sbx-2" not in service._stopping
+
+
+@patch("src.services.docker.docker")
+def test_delete_unknown_sandbox_returns_not_found(mock_docker):
+    mock_client = MagicMock()
+    mock_client.api.containers.return_value = []
+    mock_client.images.get.side_effect = ImageNotFound("missing")
+    mock_docker.from_env.return_value = mock_client
+    service = DockerSandboxService(config=_app_config())
+
+    with pytest.raises(HTTPException) as exc_info:
+        service.delete_sandbox("missing")
+
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+    mock_client.api.remove_container.assert_not_called()
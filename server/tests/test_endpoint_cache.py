@@ -0,0 +1,53 @@
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import patch
+
+from src.api.schema import Endpoint
+from src.services.endpoint_cache import EndpointCache
+from src.services.metrics import metrics
+
+
+def test_cache_hits_until_ttl_or_invalidation():
+    metrics.reset()
+    cache = EndpointCache(ttl_seconds=30)
+    with patch("src.services.endpoint_cache.time.monotonic", return_value=100.0):
+        cache.put("sbx", 8080, Endpoint(endpoint="10.0.0.1:8080"))
+        cache.put("sbx", 8080, Endpoint(endpoint="10.0.0.5:8080"), internal=True)
+        assert cache.get("sbx", 8080).endpoint == "10.0.0.1:8080"
+        assert cache.get("sbx", 8080, internal=True).endpoint == "10.0.0.5:8080"
+        assert cache.get("sbx", 9000) is None
+
+    with patch("src.services.endpoint_cache.time.monotonic", return_value=131.0):
+        assert cache.get("sbx", 8080) is None
+
+    cache.put("other", 8080, Endpoint(endpoint="10.0.0.2:8080"))
+    cache.invalidate("other")
+    assert cache.get("other", 8080) is None
+
+    assert metrics.counter_value("endpoint_cache_hits_total") == 2
+    assert metrics.counter_value("endpoint_cache_misses_total") == 3
+    assert metrics.counter_value("endpoint_cache_invalidations_total") == 1
+
+
+def test_cache_returns_copies_and_can_be_disabled():
+    cache = EndpointCache(ttl_seconds=30)
+    cache.put("sbx", 8080, Endpoint(endpoint="10.0.0.1:8080"))
+    cache.get("sbx", 8080).endpoint = "mutated"
+    assert cache.get("sbx", 8080).endpoint == "10.0.0.1:8080"
+
+    disabled = EndpointCache(ttl_seconds=0)
+    disabled.put("sbx", 8080, Endpoint(endpoint="10.0.0.1:8080"))
+    assert disabled.get("sbx", 8080) is None
+    assert len(disabled) == 0
@@ -0,0 +1,156 @@
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+
+from src.api.schema import CreateSandboxRequest, ImageSpec, ListSandboxesRequest, ResourceLimits, SandboxFilter
+from src.config import AppConfig, FakeRuntimeConfig, RuntimeConfig, ServerConfig
+from src.services.constants import SandboxErrorCodes
+from src.services.factory import create_sandbox_service
+from src.services.fake import FakeSandboxService
+
+
+def _fake_config(**kwargs) -> AppConfig:
+    return AppConfig(
+        server=ServerConfig(),
+        runtime=RuntimeConfig(type="fake", execd_image="ghcr.io/opensandbox/platform:latest"),
+        fake=FakeRuntimeConfig(**kwargs),
+    )
+
+
+def _request(**kwargs) -> CreateSandboxRequest:
+    return CreateSandboxRequest(
+        image=ImageSpec(uri="python:3.11"),
+        timeout=600,
+        resource_limits=ResourceLimits({}),
+        entrypoint=["python", "app.py"],
+        **kwargs,
+    )
+
+
+def test_factory_builds_fake_service():
+    service = create_sandbox_service(config=_fake_config())
+
+    assert isinstance(service, FakeSandboxService)
+
+
+def test_fake_block_requires_fake_runtime():
+    with pytest.raises(ValidationError):
+        AppConfig(
+            runtime=RuntimeConfig(type="docker", execd_image="ghcr.io/opensandbox/platform:latest"),
+            fake=FakeRuntimeConfig(),
+        )
+
+
+def test_fake_lifecycle_round_trip():
+    service = FakeSandboxService(config=_fake_config())
+
+    created = service.create_sandbox(_request(metadata={"team": "eval"}))
+    assert created.status.state == "Running"
+
+    service.pause_sandbox(created.id)
+    assert service.get_sandbox(created.id).status.state == "Paused"
+    service.resume_sandbox(created.id)
+
+    listed = service.list_sandboxes(
+        ListSandboxesRequest(filter=SandboxFilter(metadata={"team": "eval"}), pagination=None)
+    )
+    assert [item.id for item in listed.items] == [created.id]
+
+    service.delete_sandbox(created.id)
+    with pytest.raises(HTTPException) as exc:
+        service.get_sandbox(created.id)
+    assert exc.value.status_code == status.HTTP_404_NOT_FOUND
+    assert exc.value.detail["code"] == SandboxErrorCodes.FAKE_SANDBOX_NOT_FOUND
+
+
+def test_fake_ready_latency_reports_pending_without_blocking():
+    service = FakeSandboxService(config=_fake_config(ready_latency_ms=50))
+
+    started = time.perf_counter()
+    created = service.create_sandbox(_request())
+
+    assert time.perf_counter() - started < 0.05
+    assert created.status.state == "Pending"
+    time.sleep(0.06)
+    assert service.get_sandbox(created.id).status.state == "Running"
+
+
+def test_wait_for_state_returns_once_running():
+    service = FakeSandboxService(config=_fake_config(ready_latency_ms=80))
+    created = service.create_sandbox(_request())
+
+    started = time.perf_counter()
+    sandbox = asyncio.run(service.wait_for_state_async(created.id, ["Running"], timeout=5))
+
+    assert sandbox.status.state == "Running"
+    assert time.perf_counter() - started < 1
+
+
+def test_wait_for_state_returns_last_state_on_timeout():
+    service = FakeSandboxService(config=_fake_config(ready_latency_ms=10_000))
+    created = service.create_sandbox(_request())
+
+    sandbox = asyncio.run(service.wait_for_state_async(created.id, ["Running"], timeout=0.1))
+
+    assert sandbox.status.state == "Pending"
+
+
+def test_wait_for_state_polls_off_the_event_loop():
+    service = FakeSandboxService(config=_fake_config(ready_latency_ms=80))
+    created = service.create_sandbox(_request())
+    get_sandbox = service.get_sandbox
+    on_loop = []
+
+    def _tracking_get_sandbox(sandbox_id):
+        try:
+            asyncio.get_running_loop()
+            on_loop.append(True)
+        except RuntimeError:
+            on_loop.append(False)
+        return get_sandbox(sandbox_id)
+
+    service.get_sandbox = _tracking_get_sandbox
+    asyncio.run(service.wait_for_state_async(created.id, ["Running"], timeout=5))
+
+    assert on_loop and not any(on_loop)
+
+
+def test_fake_pull_latency_paid_once_per_image():
+    service = FakeSandboxService(config=_fake_config(pull_latency_ms=30))
+
+    started = time.perf_counter()
+    service.create_sandbox(_request())
+    first = time.perf_counter() - started
+    started = time.perf_counter()
+    service.create_sandbox(_request())
+    second = time.perf_counter() - started
+
+    assert first >= 0.03
+    assert second < 0.03
+
+
+def test_fake_failure_injection():
+    service = FakeSandboxService(config=_fake_config(create_failure_rate=1.0, seed=7))
+
+    with pytest.raises(HTTPException) as exc:
+        service.create_sandbox(_request())
+
+    assert exc.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert exc.value.detail["code"] == SandboxErrorCodes.FAKE_INJECTED_FAILURE
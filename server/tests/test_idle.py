@@ -0,0 +1,194 @@
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from src.config import AppConfig, DockerConfig, RuntimeConfig, ServerConfig
+from src.services.cgroup_stats import ResourceSample
+from src.services.docker import DockerSandboxService
+from src.services.idle import IdleTracker
+
+
+def _sample(cpu_percent):
+    return ResourceSample(
+        collected_at=datetime.now(timezone.utc),
+        monotonic=0.0,
+        cpu_usage_usec=0,
+        cpu_percent=cpu_percent,
+        memory_bytes=0,
+        io_read_bytes=0,
+        io_write_bytes=0,
+        pids=1,
+    )
+
+
+def test_tracker_reports_sandboxes_below_threshold_after_timeout():
+    tracker = IdleTracker(idle_timeout_seconds=0, cpu_threshold_percent=1.0)
+
+    candidates = tracker.observe({"busy": _sample(50.0), "quiet": _sample(0.1)})
+
+    # Busy sandboxes reset their idle clock; with a zero timeout only quiet ones qualify.
+    assert candidates == ["quiet"]
+    snapshot = tracker.snapshot()
+    assert snapshot.active == 1
+    assert snapshot.idle == 1
+
+
+def test_tracker_skips_auto_paused_until_resumed():
+    tracker = IdleTracker(idle_timeout_seconds=0, cpu_threshold_percent=1.0)
+    tracker.observe({"sbx": _sample(0.0)})
+    tracker.mark_auto_paused("sbx")
+
+    assert tracker.observe({"sbx": _sample(0.0)}) == []
+    assert tracker.is_auto_paused("sbx")
+
+    tracker.mark_resumed("sbx")
+    snapshot = tracker.snapshot()
+    assert not tracker.is_auto_paused("sbx")
+    assert snapshot.auto_pause_total == 1
+    assert snapshot.auto_resume_total == 1
+
+
+def test_tracker_waits_for_timeout():
+    tracker = IdleTracker(idle_timeout_seconds=3600, cpu_threshold_percent=1.0)
+
+    assert tracker.observe({"sbx": _sample(0.0)}) == []
+    tracker.record_activity("sbx")
+    assert tracker.observe({"sbx": _sample(0.0)}) == []
+
+
+def test_idle_action_requires_stats():
+    with pytest.raises(ValidationError):
+        DockerConfig(idle_action="pause")
+
+    assert DockerConfig(idle_action="pause", stats_enabled=True).idle_timeout_seconds == 900
+
+
+def _idle_service(mock_docker, tmp_path, action):
+    config = AppConfig(
+        server=ServerConfig(),
+        runtime=RuntimeConfig(type="docker", execd_image="ghcr.io/opensandbox/platform:latest"),
+        docker=DockerConfig(
+            stats_enabled=True,
+            cgroup_root=str(tmp_path),
+            stats_interval_seconds=3600,
+            idle_action=action,
+        ),
+    )
+    service = DockerSandboxService(config=config)
+    service._stats_collector.stop()
+    service._idle_tracker.idle_timeout_seconds = 0
+    return service
+
+
+@patch("src.services.docker.docker")
+def test_idle_pause_and_wake_on_endpoint(mock_docker, tmp_path):
+    container = MagicMock()
+    container.attrs = {"State": {"Running": True, "Paused": False}}
+    mock_client = MagicMock()
+    mock_client.containers.list.return_value = [container]
+    mock_docker.from_env.return_value = mock_client
+    service = _idle_service(mock_docker, tmp_path, "pause")
+
+    service._apply_idle_policy({"sbx-1": _sample(0.0)})
+
+    container.pause.assert_called_once()
+    assert service._idle_tracker.is_auto_paused("sbx-1")
+
+    container.attrs = {"State": {"Running": True, "Paused": True}}
+    service._wake_if_idle_paused("sbx-1")
+
+    container.unpause.assert_called_once()
+    assert not service._idle_tracker.is_auto_paused("sbx-1")
+    assert service.get_fleet_stats().idle.auto_resume_total == 1
+
+
+@patch("src.services.docker.docker")
+def test_auto_paused_sandbox_survives_a_missed_sample(mock_docker, tmp_path):
+    container = MagicMock()
+    container.attrs = {"State": {"Running": True, "Paused": False}}
+    mock_client = MagicMock()
+    mock_client.containers.list.return_value = [container]
+    mock_docker.from_env.return_value = mock_client
+    service = _idle_service(mock_docker, tmp_path, "pause")
+    service._apply_idle_policy({"sbx-1": _sample(0.0)})
+    container.attrs = {"State": {"Running": True, "Paused": True}}
+
+    # A sweep whose cgroup read failed for sbx-1 carries no sample for it.
+    service._apply_idle_policy({})
+    service._wake_if_idle_paused("sbx-1")
+
+    container.unpause.assert_called_once()
+    assert not service._idle_tracker.is_auto_paused("sbx-1")
+
+
+@patch("src.services.docker.docker")
+def test_idle_pause_skips_user_paused_sandbox(mock_docker, tmp_path):
+    container = MagicMock()
+    container.attrs = {"State": {"Running": True, "Paused": True}}
+    mock_client = MagicMock()
+    mock_client.containers.list.return_value = [container]
+    mock_docker.from_env.return_value = mock_client
+    service = _idle_service(mock_docker, tmp_path, "pause")
+
+    service._apply_idle_policy({"sbx-1": _sample(0.0)})
+
+    container.pause.assert_not_called()
+    assert not service._idle_tracker.is_auto_paused("sbx-1")
+
+
+@patch("src.services.docker.docker")
+def test_idle_delete_reclaims_sandbox(mock_docker, tmp_path):
+    mock_docker.from_env.return_value = MagicMock()
+    service = _idle_service(mock_docker, tmp_path, "delete")
+
+    with patch.object(service, "_expire_sandbox") as expire:
+        service._apply_idle_policy({"sbx-1": _sample(0.0)})
+
+    expire.assert_called_once_with("sbx-1")
+    assert service._idle_tracker.snapshot().reclaim_total == 1
+
+
+@patch("src.services.docker.docker")
+def test_idle_hibernate_runs_off_the_stats_sweep(mock_docker, tmp_path):
+    container = MagicMock()
+    container.attrs = {
+        "State": {"Running": True},
+        "Config": {"Image": "python:3.11", "Labels": {}},
+        "HostConfig": {},
+    }
+    release = threading.Event()
+    container.commit.side_effect = lambda **kwargs: release.wait(5)
+    mock_client = MagicMock()
+    mock_client.containers.list.return_value = [container]
+    mock_docker.from_env.return_value = mock_client
+    service = _idle_service(mock_docker, tmp_path, "hibernate")
+
+    service._apply_idle_policy({"sbx-1": _sample(0.0)})
+    # The sweep returned while the commit is still running; a second sweep does not start another.
+    assert "sbx-1" in service._hibernating
+    service._apply_idle_policy({"sbx-1": _sample(0.0)})
+
+    release.set()
+    service._teardown_executor.shutdown(wait=True)
+
+    container.commit.assert_called_once()
+    container.remove.assert_called_once_with(force=True)
+    assert not service._hibernating
+    assert service._idle_tracker.snapshot().hibernate_total == 1
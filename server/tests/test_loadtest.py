@@ -0,0 +1,76 @@
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.api import lifecycle
+from src.config import AppConfig, FakeRuntimeConfig, RuntimeConfig, ServerConfig
+from src.main import app
+from src.services.fake import FakeSandboxService
+from src.tools.loadtest import LoadTestOptions, percentile, run_load_test
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 95) == 0.0
+    assert percentile([3.0], 99) == 3.0
+
+
+@pytest.fixture
+def fake_service(monkeypatch) -> FakeSandboxService:
+    service = FakeSandboxService(
+        config=AppConfig(
+            server=ServerConfig(),
+            runtime=RuntimeConfig(type="fake", execd_image="ghcr.io/opensandbox/platform:latest"),
+            fake=FakeRuntimeConfig(delete_failure_rate=0.0, seed=1),
+        )
+    )
+    monkeypatch.setattr(lifecycle, "sandbox_service", service)
+    return service
+
+
+@pytest.mark.parametrize("mode", ["closed", "open"])
+def test_load_test_against_fake_runtime(fake_service, auth_headers, mode):
+    async def _run():
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://loadtest",
+            headers=auth_headers,
+        )
+        async with client:
+            return await run_load_test(
+                client,
+                LoadTestOptions(mode=mode, concurrency=4, duration_seconds=0.2, rate=40),
+            )
+
+    report = asyncio.run(_run())
+
+    summary = report.to_dict()["operations"]
+    assert set(summary) == {"create", "get", "list", "delete"}
+    for row in summary.values():
+        assert row["count"] > 0
+        assert row["errors"] == 0
+        assert row["p50_ms"] <= row["p95_ms"] <= row["p99_ms"] <= row["max_ms"]
+    assert summary["create"]["count"] == summary["delete"]["count"]
+    assert "p99 ms" in report.format_table()
+    # Every lifecycle deletes its sandbox.
+    assert fake_service.list_sandboxes(
+        lifecycle.ListSandboxesRequest(filter=lifecycle.SandboxFilter(), pagination=None)
+    ).items == []
@@ -0,0 +1,83 @@
+# Copyright 2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from types import SimpleNamespace
+
+from src.services.docker_clients import instrument_client_pool
+from src.services.metrics import MetricsRegistry, metrics
+
+
+def test_registry_renders_prometheus_text():
+    registry = MetricsRegistry()
+    registry.inc("requests_total", pool="control")
+    registry.inc("requests_total", 2, pool="control")
+    registry.set_gauge("backlog", 3)
+    registry.observe("wait_seconds", 0.5, pool="a")
+    registry.observe("wait_seconds", 1.5, pool="a")
+    registry.observe("wait_seconds", 0.25, pool="b")
+
+    text = registry.render_prometheus()
+
+    assert '# TYPE requests_total counter\nrequests_total{pool="control"} 3\n' in text
+    assert "# TYPE backlog gauge\nbacklog 3\n" in text
+    assert 'wait_seconds_count{pool="a"} 2\nwait_seconds_sum{pool="a"} 2\n' in text
+    assert text.index('wait_seconds_sum{pool="b"}') < text.index("# TYPE wait_seconds_max gauge")
+    assert 'wait_seconds_max{pool="a"} 1.5' in text
+    assert registry.summary_value("wait_seconds", pool="b").count == 1
+
+
+def test_instrumented_pool_bounds_concurrency_and_records_wait():
+    metrics.reset()
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def send(request, **kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return request
+
+    client = SimpleNamespace(api=SimpleNamespace(send=send))
+    instrument_client_pool(client, "control", 2)
+
+    threads = [threading.Thread(target=client.api.send, args=(idx,)) for idx in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 2
+    wait = metrics.summary_value("docker_client_pool_wait_seconds", pool="control")
+    assert wait.count == 6
+    assert wait.max > 0.01
+    assert metrics.gauge_value("docker_client_pool_in_use", pool="control") == 0
+    assert metrics.gauge_value("docker_client_pool_size", pool="control") == 2
+
+
+def test_metrics_endpoint_serves_text(client, auth_headers):
+    metrics.reset()
+    metrics.inc("example_total")
+
+    response = client.get("/metrics", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "example_total 1" in response.text
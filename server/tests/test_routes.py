@@ -19,12 +19,35 @@ This module contains test cases for all API endpoints.
 Most test bodies are placeholders that will be implemented as features mature.
 """
 
+import asyncio
+import json
 from datetime import datetime, timezone
 
 from fastapi.testclient import TestClient
 
 from src.api import lifecycle
-from src.api.schema import ImageSpec, Sandbox, SandboxStatus
+from src.api.schema import (
+    BatchEndpointsResponse,
+    CloneSandboxResult,
+    CreateSandboxResponse,
+    Endpoint,
+    ErrorResponse,
+    FleetStatsResponse,
+    ImageSpec,
+    Sandbox,
+    SandboxEndpoints,
+    SandboxResourceSample,
+    SandboxStatsResponse,
+    SandboxStatus,
+)
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
 
 
 class TestHealthCheck:
@@ -39,6 +62,29 @@ class TestHealthCheck:
         assert response.json() == {"status": "healthy"}
 
 
+class TestReadinessCheck:
+    """Test cases for the readiness endpoint."""
+
+    def test_ready_reports_starting_until_service_is_ready(self, client: TestClient, monkeypatch):
+        class StubService:
+            ready = False
+
+            def is_ready(self):
+                return self.ready
+
+        stub = StubService()
+        monkeypatch.setattr(lifecycle, "sandbox_service", stub)
+
+        response = client.get("/ready")
+        assert response.status_code == 503
+        assert response.json() == {"status": "starting"}
+
+        stub.ready = True
+        response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.json() == {"status": "ready"}
+
+
 class TestAuthentication:
     """Test cases for authentication middleware."""
 
@@ -223,11 +269,25 @@ class TestDeleteSandbox:
         self,
         client: TestClient,
         auth_headers: dict,
+        monkeypatch,
     ):
         """
-        Test successful sandbox deletion.
+        Test successful sandbox deletion is accepted asynchronously.
         """
-        pass
+        calls = []
+
+        class StubService:
+            @staticmethod
+            def delete_sandbox(sandbox_id):
+                calls.append(sandbox_id)
+
+        monkeypatch.setattr(lifecycle, "sandbox_service", StubService())
+
+        response = client.delete("/v1/sandboxes/sbx-1", headers=auth_headers)
+
+        assert response.status_code == 202
+        assert response.content == b""
+        assert calls == ["sbx-1"]
 
     def test_delete_sandbox_not_found(
         self,
@@ -274,6 +334,98 @@ class TestPauseResumeSandbox:
         pass
 
 
+class TestHibernateSandbox:
+    """Test cases for hibernate endpoint."""
+
+    def test_hibernate_sandbox_accepted(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        monkeypatch,
+    ):
+        """
+        Test hibernate delegates to the service and returns 202.
+        """
+        calls = []
+
+        class StubService:
+            @staticmethod
+            def hibernate_sandbox(sandbox_id: str) -> None:
+                calls.append(sandbox_id)
+
+        monkeypatch.setattr(lifecycle, "sandbox_service", StubService())
+
+        response = client.post("/v1/sandboxes/sandbox-123/hibernate", headers=auth_headers)
+        assert response.status_code == 202
+        assert calls == ["sandbox-123"]
+
+
+class TestCloneSandbox:
+    """Test cases for clone endpoint."""
+
+    def test_clone_streams_ndjson_results(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        monkeypatch,
+    ):
+        """
+        Test clone results are streamed one JSON document per line.
+        """
+        now = datetime.now(timezone.utc)
+        calls = []
+
+        class StubService:
+            @staticmethod
+            def clone_sandbox(sandbox_id: str, count: int, request):
+                calls.append((sandbox_id, count, request.timeout, _on_event_loop()))
+                return iter(
+                    [
+                        CloneSandboxResult(
+                            index=1,
+                            sandbox=CreateSandboxResponse(
+                                id="clone-1",
+                                status=SandboxStatus(state="Running"),
+                                expiresAt=now,
+                                createdAt=now,
+                                entrypoint=["python"],
+                            ),
+                        ),
+                        CloneSandboxResult(
+                            index=0,
+                            error=ErrorResponse(code="DOCKER::SANDBOX_START_FAILED", message="boom"),
+                        ),
+                    ]
+                )
+
+        monkeypatch.setattr(lifecycle, "sandbox_service", StubService())
+
+        response = client.post(
+            "/v1/sandboxes/sandbox-123/clone?count=2",
+            headers=auth_headers,
+            json={"timeout": 600},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[0]["sandbox"]["id"] == "clone-1"
+        assert "expiresAt" in lines[0]["sandbox"]
+        assert lines[1] == {"index": 0, "error": {"code": "DOCKER::SANDBOX_START_FAILED", "message": "boom"}}
+        # The snapshot is taken off the event loop.
+        assert calls == [("sandbox-123", 2, 600, False)]
+
+    def test_clone_rejects_invalid_count(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+    ):
+        """
+        Test clone count is validated.
+        """
+        response = client.post("/v1/sandboxes/sandbox-123/clone?count=0", headers=auth_headers)
+        assert response.status_code == 422
+
+
 class TestRenewExpiration:
     """Test cases for renew expiration endpoint."""
 
@@ -320,3 +472,165 @@ class TestGetEndpoint:
         Test get endpoint with invalid port.
         """
         pass
+
+
+class TestSandboxStats:
+    """Test cases for resource stats endpoints."""
+
+    def test_get_sandbox_stats(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        monkeypatch,
+    ):
+        """
+        Test per-sandbox stats are serialized with camelCase fields.
+        """
+        now = datetime.now(timezone.utc)
+
+        class StubService:
+            @staticmethod
+            def get_sandbox_stats(sandbox_id: str) -> SandboxStatsResponse:
+                return SandboxStatsResponse(
+                    sandbox_id=sandbox_id,
+                    samples=[
+                        SandboxResourceSample(
+                            collected_at=now,
+                            cpu_usage_usec=10,
+                            memory_bytes=2048,
+                            io_read_bytes=0,
+                            io_write_bytes=0,
+                            pids=1,
+                        )
+                    ],
+                )
+
+        monkeypatch.setattr(lifecycle, "sandbox_service", StubService())
+
+        response = client.get("/sandboxes/sandbox-123/stats", headers=auth_headers)
+        assert response.status_code == 200
+        payload = response.json()
+        assert payload["sandboxId"] == "sandbox-123"
+        assert payload["samples"][0]["memoryBytes"] == 2048
+        assert "cpuPercent" not in payload["samples"][0]
+
+    def test_get_fleet_stats_not_captured_by_sandbox_route(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        monkeypatch,
+    ):
+        """
+        Test /sandboxes/stats resolves to the fleet aggregate, not get_sandbox.
+        """
+
+        class StubService:
+            @staticmethod
+            def get_fleet_stats() -> FleetStatsResponse:
+                return FleetStatsResponse(
+                    sandbox_count=2,
+                    cpu_percent=12.5,
+                    memory_bytes=4096,
+                    io_read_bytes=0,
+                    io_write_bytes=0,
+                    pids=4,
+                )
+
+        monkeypatch.setattr(lifecycle, "sandbox_service", StubService())
+
+        response = client.get("/v1/sandboxes/stats", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["sandboxCount"] == 2
+
+
+class TestBatchEndpoints:
+    """Test cases for the batch endpoint resolution route."""
+
+    def test_batch_endpoints_returns_items_in_request_order(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        monkeypatch,
+    ):
+        class StubService:
+            @staticmethod
+            def get_endpoints(sandbox_ids, ports):
+                assert ports == [8080]
+                return BatchEndpointsResponse(
+                    items=[
+                        SandboxEndpoints(
+                            sandbox_id=sandbox_ids[0],
+                            endpoints={"8080": Endpoint(endpoint="10.0.0.1:8080")},
+                        ),
+                        SandboxEndpoints(
+                            sandbox_id=sandbox_ids[1],
+                            error=ErrorResponse(code="SANDBOX::NOT_FOUND", message="missing"),
+                        ),
+                    ]
+                )
+
+        monkeypatch.setattr(lifecycle, "sandbox_service", StubService())
+
+        response = client.post(
+            "/v1/sandboxes/endpoints",
+            headers=auth_headers,
+            json={"sandboxIds": ["sbx-a", "sbx-b"], "ports": [8080]},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "items": [
+                {"sandboxId": "sbx-a", "endpoints": {"8080": {"endpoint": "10.0.0.1:8080"}}},
+                {"sandboxId": "sbx-b", "endpoints": {}, "error": {"code": "SANDBOX::NOT_FOUND", "message": "missing"}},
+            ]
+        }
+
+    def test_batch_endpoints_rejects_empty_request(self, client: TestClient, auth_headers: dict):
+        response = client.post(
+            "/v1/sandboxes/endpoints",
+            headers=auth_headers,
+            json={"sandboxIds": [], "ports": [8080]},
+        )
+        assert response.status_code == 422
+
+
+class TestWaitForSandbox:
+    """Test cases for the sandbox state long-poll route."""
+
+    def test_wait_passes_states_and_timeout(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        monkeypatch,
+    ):
+        calls = []
+
+        class StubService:
+            @staticmethod
+            async def wait_for_state_async(sandbox_id, states, timeout):
+                calls.append((sandbox_id, states, timeout))
+                return Sandbox(
+                    id=sandbox_id,
+                    image=ImageSpec(uri="python:3.11"),
+                    status=SandboxStatus(state="Running"),
+                    entrypoint=["python"],
+                    expiresAt=datetime.now(timezone.utc),
+                    createdAt=datetime.now(timezone.utc),
+                )
+
+        monkeypatch.setattr(lifecycle, "sandbox_service", StubService())
+
+        response = client.get(
+            "/v1/sandboxes/sbx-1/wait",
+            headers=auth_headers,
+            params=[("state", "Running"), ("state", "Paused"), ("timeout", "5")],
+        )
+
+        assert response.status_code == 200
+        assert response.json()["status"]["state"] == "Running"
+        assert calls == [("sbx-1", ["Running", "Paused"], 5.0)]
+
+    def test_wait_rejects_timeout_above_limit(self, client: TestClient, auth_headers: dict):
+        response = client.get("/v1/sandboxes/sbx-1/wait?timeout=600", headers=auth_headers)
+        assert response.status_code == 422
+